@@ -6,6 +6,8 @@ Measures key performance metrics:
 - Tool loading time (target: <50ms)
 - Provider switch time (target: <100ms)
 - Ticket CRUD operations
+- Ticket decoding: full decode vs lazy summary views at 10k tickets
+- Store serializers: save/load times per installed backend
 - Memory footprint (target: <100MB)
 
 Usage:
@@ -486,6 +488,110 @@ def benchmark_ticket_search():
     store.search("keyword5")
 
 
+# Ticket decoding: 10k tickets with long histories
+LARGE_TICKET_COUNT = 10_000
+LARGE_TICKET_HISTORY = 100
+LARGE_TICKET_COMMENTS = 10
+_large_ticket_data: Optional[List[Dict[str, Any]]] = None
+_large_ticket_store = None
+
+
+def large_ticket_data() -> List[Dict[str, Any]]:
+    """Stored data for LARGE_TICKET_COUNT tickets (built once)."""
+    global _large_ticket_data
+    if _large_ticket_data is None:
+        from fastband.tickets.models import Ticket, TicketComment, TicketHistory, TicketStatus
+
+        history = [
+            TicketHistory(action="status_changed", actor="Agent1", message=f"Step {i}").to_dict()
+            for i in range(LARGE_TICKET_HISTORY)
+        ]
+        comments = [
+            TicketComment(author="Agent1", content=f"Note {i}").to_dict()
+            for i in range(LARGE_TICKET_COMMENTS)
+        ]
+        statuses = list(TicketStatus)
+        _large_ticket_data = []
+        for i in range(LARGE_TICKET_COUNT):
+            data = Ticket(
+                title=f"Ticket {i}",
+                ticket_number=f"FB-{i + 1:05d}",
+                status=statuses[i % len(statuses)],
+                labels=["bench"],
+            ).to_dict()
+            # Shared lists: decoding cost is per ticket, memory is not
+            data["history"] = history
+            data["comments"] = comments
+            _large_ticket_data.append(data)
+    return _large_ticket_data
+
+
+def large_ticket_store():
+    """JSON ticket store holding the large ticket set (built once)."""
+    global _large_ticket_store
+    if _large_ticket_store is None:
+        from fastband.tickets.storage import JSONTicketStore
+
+        path = Path(tempfile.mkdtemp()) / "tickets.json"
+        tickets = {data["id"]: data for data in large_ticket_data()}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"tickets": tickets, "agents": {}, "metadata": {"next_id": 1}}, f)
+        _large_ticket_store = JSONTicketStore(path)
+    return _large_ticket_store
+
+
+def benchmark_ticket_full_decode():
+    """Benchmark decoding every ticket with Ticket.from_dict."""
+    from fastband.tickets.models import Ticket
+
+    for data in large_ticket_data():
+        Ticket.from_dict(data)
+
+
+def benchmark_ticket_view_summary():
+    """Benchmark projecting every ticket to a summary through a lazy view."""
+    from fastband.tickets.models import TicketView
+
+    for data in large_ticket_data():
+        TicketView(data).summary()
+
+
+def benchmark_ticket_list_large():
+    """Benchmark listing a page of 50 from the large store."""
+    large_ticket_store().list(limit=50)
+
+
+def benchmark_ticket_list_summaries_large():
+    """Benchmark listing every ticket's summary from the large store."""
+    large_ticket_store().list_summaries(limit=LARGE_TICKET_COUNT)
+
+
+# Serializers: save and load a ticket file of realistic size
+SERIALIZER_TICKET_COUNT = 1_000
+
+
+def serializer_benchmarks(name: str):
+    """Build save and load benchmarks for one serializer."""
+    from fastband.core.serialization import load_file, save_file
+
+    path = Path(tempfile.mkdtemp()) / "tickets.json"
+    tickets = large_ticket_data()[:SERIALIZER_TICKET_COUNT]
+    document = {
+        "tickets": {data["id"]: data for data in tickets},
+        "agents": {},
+        "metadata": {"next_id": SERIALIZER_TICKET_COUNT + 1},
+    }
+
+    def save():
+        save_file(path, document, name)
+
+    def load():
+        load_file(path)
+
+    save()
+    return save, load, path.stat().st_size
+
+
 def benchmark_memory_full_import():
     """Benchmark memory usage of full fastband import."""
     import sys
@@ -596,6 +702,45 @@ def run_all_benchmarks(iterations: int = 10, verbose: bool = False) -> Benchmark
         target_ms=100,
     )
 
+    # Ticket Decoding Benchmarks
+    print(f"\n--- TICKET DECODING ({LARGE_TICKET_COUNT} tickets) ---")
+    large_ticket_store()
+
+    full = bench.run_benchmark(
+        f"Full Decode ({LARGE_TICKET_COUNT} tickets)",
+        benchmark_ticket_full_decode,
+    )
+
+    lazy = bench.run_benchmark(
+        f"Lazy View Summary ({LARGE_TICKET_COUNT} tickets)",
+        benchmark_ticket_view_summary,
+    )
+
+    if lazy.mean_ms:
+        print(f"\n  Summary projection speedup: {full.mean_ms / lazy.mean_ms:.1f}x")
+
+    bench.run_benchmark(
+        f"Ticket List ({LARGE_TICKET_COUNT} tickets, fetch 50)",
+        benchmark_ticket_list_large,
+        target_ms=500,
+    )
+
+    bench.run_benchmark(
+        f"Ticket List Summaries ({LARGE_TICKET_COUNT} tickets, fetch all)",
+        benchmark_ticket_list_summaries_large,
+    )
+
+    # Serializer Benchmarks
+    from fastband.core.serialization import available_serializers
+
+    print(f"\n--- SERIALIZERS ({SERIALIZER_TICKET_COUNT} tickets) ---")
+
+    for name in available_serializers():
+        save, load, size = serializer_benchmarks(name)
+        print(f"\n  {name}: {size / (1024 * 1024):.1f}MB")
+        bench.run_benchmark(f"Save ({name})", save)
+        bench.run_benchmark(f"Load ({name})", load)
+
     # Memory Benchmarks
     print("\n--- MEMORY USAGE ---")
 
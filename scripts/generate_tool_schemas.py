@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Regenerate the static schemas of the built-in tools.
+
+The tool registry describes lazily registered built-in tools from
+src/fastband/tools/builtin_schemas.json instead of importing them. Run
+this after changing a built-in tool's definition (name, description,
+parameters or metadata); tests/test_tools.py fails while the file is out
+of date.
+
+Usage:
+    python scripts/generate_tool_schemas.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fastband.tools import BUILTIN_SCHEMAS_FILE, _build_builtin_schemas  # noqa: E402
+
+
+def main() -> None:
+    schemas = _build_builtin_schemas()
+    target = Path(__file__).parent.parent / "src" / "fastband" / "tools" / BUILTIN_SCHEMAS_FILE
+    target.write_text(json.dumps(schemas, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    print(f"Wrote {len(schemas)} tool schemas to {target}")
+
+
+if __name__ == "__main__":
+    main()
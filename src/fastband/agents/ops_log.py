@@ -9,7 +9,6 @@ Provides a structured logging system for agent communication and coordination:
 - Conflict detection
 """
 
-import json
 import shutil
 import threading
 import uuid
@@ -19,6 +18,15 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from fastband.core.ratelimit import SlidingWindow
+from fastband.core.serialization import (
+    SerializationError,
+    Serializer,
+    get_serializer,
+    load_file,
+    save_file,
+)
+
 
 class EventType(str, Enum):
     """Types of events that can be logged."""
@@ -123,7 +131,7 @@ class OpsLog:
     Agent Operations Log.
 
     Thread-safe logging system for multi-agent coordination with:
-    - JSON-based persistence
+    - JSON-based persistence (or another serializer, see fastband.core.serialization)
     - Log rotation (by size and age)
     - Entry expiration (TTL)
     - Conflict detection
@@ -148,6 +156,7 @@ class OpsLog:
         archive_dir: Path | None = None,
         auto_rotate: bool = True,
         auto_expire: bool = True,
+        serializer: str | Serializer | None = None,
     ):
         """
         Initialize the operations log.
@@ -157,11 +166,13 @@ class OpsLog:
             archive_dir: Path for archived logs (default: .fastband/ops_log_archive/)
             auto_rotate: Automatically rotate logs when thresholds are met
             auto_expire: Automatically remove expired entries on read
+            serializer: Serializer for the log file (default: FASTBAND_SERIALIZER)
         """
         self.log_path = log_path or Path(".fastband/ops_log.json")
         self.archive_dir = archive_dir or Path(".fastband/ops_log_archive")
         self.auto_rotate = auto_rotate
         self.auto_expire = auto_expire
+        self.serializer = get_serializer(serializer)
 
         self._lock = threading.RLock()
         self._entries: list[LogEntry] = []
@@ -172,9 +183,10 @@ class OpsLog:
             "last_rotation": None,
         }
 
-        # P1 Security: Rate limiting tracking per agent
-        # Maps agent_name -> list of timestamps of recent writes
-        self._rate_limit_tracker: dict[str, list[datetime]] = {}
+        # P1 Security: Rate limiting of writes per agent
+        self._rate_limiter = SlidingWindow(
+            limit=self.RATE_LIMIT_ENTRIES, period=self.RATE_LIMIT_WINDOW_SECONDS
+        )
 
         # Load existing log
         self._load()
@@ -185,8 +197,7 @@ class OpsLog:
             return
 
         try:
-            with open(self.log_path) as f:
-                data = json.load(f)
+            data = load_file(self.log_path)
 
             self._metadata = data.get("metadata", self._metadata)
             entries_data = data.get("entries", [])
@@ -202,7 +213,7 @@ class OpsLog:
             if self.auto_expire:
                 self._expire_entries()
 
-        except (json.JSONDecodeError, KeyError, TypeError):
+        except (SerializationError, KeyError, TypeError):
             # Corrupted file - start fresh
             self._entries = []
 
@@ -215,8 +226,7 @@ class OpsLog:
             "entries": [e.to_dict() for e in self._entries],
         }
 
-        with open(self.log_path, "w") as f:
-            json.dump(data, f, indent=2)
+        save_file(self.log_path, data, self.serializer)
 
     def _expire_entries(self) -> int:
         """Remove expired entries. Returns count of removed entries."""
@@ -300,21 +310,7 @@ class OpsLog:
         Returns:
             Tuple of (is_allowed, error_message)
         """
-        now = datetime.utcnow()
-        window_start = now - timedelta(seconds=self.RATE_LIMIT_WINDOW_SECONDS)
-
-        # Get agent's recent writes
-        if agent not in self._rate_limit_tracker:
-            self._rate_limit_tracker[agent] = []
-
-        # Clean old entries
-        self._rate_limit_tracker[agent] = [
-            ts for ts in self._rate_limit_tracker[agent]
-            if ts > window_start
-        ]
-
-        # Check limit
-        if len(self._rate_limit_tracker[agent]) >= self.RATE_LIMIT_ENTRIES:
+        if not self._rate_limiter.peek(agent).allowed:
             return False, (
                 f"RATE LIMIT EXCEEDED: Agent '{agent}' has exceeded "
                 f"{self.RATE_LIMIT_ENTRIES} entries per {self.RATE_LIMIT_WINDOW_SECONDS} seconds. "
@@ -369,7 +365,7 @@ class OpsLog:
             self._entries.append(entry)
 
             # Track this write for rate limiting
-            self._rate_limit_tracker.setdefault(agent, []).append(datetime.utcnow())
+            self._rate_limiter.hit(agent)
 
             self._save()
 
@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any
 
 from fastband.core.config import BackupConfig, get_config
+from fastband.core.inventory import get_file_inventory
 
 # Import alerts (lazy to avoid circular imports)
 _alerts_module = None
@@ -229,9 +230,11 @@ class BackupManager:
         for dir_name in self.BACKUP_DIRS:
             dir_path = self.project_path / dir_name
             if dir_path.exists() and dir_path.is_dir():
-                for file_path in sorted(dir_path.rglob("*")):
-                    if file_path.is_file():
-                        checksums.append(self._calculate_checksum(file_path))
+                # Backups cover gitignored state too, so bypass .gitignore
+                inventory = get_file_inventory(dir_path, respect_gitignore=False)
+                # Sort by path components to match Path ordering
+                for rel_path in sorted(inventory.files(), key=lambda p: p.split("/")):
+                    checksums.append(self._calculate_checksum(dir_path / rel_path))
 
         return hashlib.md5("".join(checksums).encode()).hexdigest()
 
@@ -363,6 +363,11 @@ def tool_info(
         stats_table.add_row("Average Time", f"{stats['average_time_ms']:.2f}ms")
         stats_table.add_row("Min Time", f"{stats['min_time_ms']:.2f}ms")
         stats_table.add_row("Max Time", f"{stats['max_time_ms']:.2f}ms")
+        stats_table.add_row(
+            "p50 / p95 / p99",
+            f"{stats['p50_ms']:.2f} / {stats['p95_ms']:.2f} / {stats['p99_ms']:.2f}ms",
+        )
+        stats_table.add_row("Errors", str(stats["errors"]))
 
         console.print(stats_table)
 
@@ -43,6 +43,7 @@ from fastband.context.models import (
     PastIssue,
     Severity,
 )
+from fastband.tools.git.state import get_git_state_cache
 
 logger = logging.getLogger(__name__)
 
@@ -756,25 +757,15 @@ class CodebaseContext:
         # Get orphan files
         snapshot.orphan_files = self._graph.get_orphan_files()[:20]
 
-        # Git state
+        # Git state, from the shared cache (no git process on an unchanged repo)
         try:
-            result = subprocess.run(
-                ["git", "branch", "--show-current"],
-                cwd=str(self.project_root),
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                snapshot.git_branch = result.stdout.strip()
+            cache = get_git_state_cache()
+            branch = cache.branch(self.project_root)
+            if branch and branch != "HEAD":
+                snapshot.git_branch = branch
 
-            result = subprocess.run(
-                ["git", "rev-parse", "--short", "HEAD"],
-                cwd=str(self.project_root),
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                snapshot.git_commit = result.stdout.strip()
+            commit = await cache.run(self.project_root, ["rev-parse", "--short", "HEAD"])
+            snapshot.git_commit = commit.strip()
 
         except Exception:
             pass
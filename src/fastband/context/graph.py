@@ -28,6 +28,7 @@ from fastband.context.models import (
     ImpactLevel,
     ImportRelation,
 )
+from fastband.core.inventory import get_file_inventory
 
 logger = logging.getLogger(__name__)
 
@@ -343,20 +344,16 @@ class DependencyGraph:
 
         files_scanned = 0
 
-        for file_path in scan_dir.rglob("*"):
-            if not file_path.is_file():
-                continue
+        # Query the shared inventory instead of walking the tree again
+        inventory = get_file_inventory(self.project_root)
+        under = os.path.relpath(scan_dir.resolve(), inventory.root)
 
+        for rel_path in inventory.files(under=under, extensions=self._parsers):
             # Check exclusions
-            rel_path = str(file_path.relative_to(self.project_root))
             if self._should_exclude(rel_path, exclude_patterns):
                 continue
 
-            # Check if we have a parser for this file type
-            ext = file_path.suffix.lower()
-            if ext not in self._parsers:
-                continue
-
+            file_path = self.project_root / rel_path
             try:
                 self._scan_file(str(file_path))
                 files_scanned += 1
@@ -11,6 +11,7 @@ from fastband.core.detection import (
     ProjectDetector,
     ProjectInfo,
     ProjectType,
+    clear_detection_cache,
     detect_project,
 )
 from fastband.core.engine import FastbandEngine, create_engine, run_server
@@ -21,6 +22,12 @@ from fastband.core.events import (
     get_event_bus,
     reset_event_bus,
 )
+from fastband.core.inventory import (
+    FileEntry,
+    FileInventory,
+    get_file_inventory,
+    invalidate_file_inventory,
+)
 from fastband.core.logging import (
     LOG_LEVELS,
     ColoredFormatter,
@@ -47,6 +54,12 @@ from fastband.core.plugins import (
     get_plugin_manager,
     reset_plugin_manager,
 )
+from fastband.core.ratelimit import (
+    RateLimitResult,
+    RedisSlidingWindow,
+    SlidingWindow,
+    TokenBucket,
+)
 from fastband.core.security import (
     # Input sanitization
     InputSanitizer,
@@ -68,6 +81,15 @@ from fastband.core.security import (
     validate_path,
     validate_sql_identifier,
 )
+from fastband.core.serialization import (
+    SerializationError,
+    Serializer,
+    available_serializers,
+    get_serializer,
+    load_file,
+    save_file,
+)
+from fastband.core.timer_wheel import TimerWheel
 
 __all__ = [
     # Config
@@ -88,6 +110,12 @@ __all__ = [
     "PackageManager",
     "BuildTool",
     "detect_project",
+    "clear_detection_cache",
+    # File inventory
+    "FileInventory",
+    "FileEntry",
+    "get_file_inventory",
+    "invalidate_file_inventory",
     # Logging
     "LoggingConfig",
     "FastbandLogger",
@@ -133,4 +161,18 @@ __all__ = [
     "PluginManager",
     "get_plugin_manager",
     "reset_plugin_manager",
+    # Rate limiting
+    "RateLimitResult",
+    "TokenBucket",
+    "SlidingWindow",
+    "RedisSlidingWindow",
+    # Serialization
+    "Serializer",
+    "SerializationError",
+    "get_serializer",
+    "available_serializers",
+    "load_file",
+    "save_file",
+    # Timers
+    "TimerWheel",
 ]
@@ -5,11 +5,22 @@ Automatically detects project type, language, frameworks, and build tools
 based on directory contents.
 """
 
+import copy
+import fnmatch
 import json
 import logging
+import os
+import re
+import sys
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from typing import Any
+
+from fastband.core.inventory import FileInventory, get_file_inventory
 
 logger = logging.getLogger(__name__)
 
@@ -378,10 +389,204 @@ BUILD_TOOL_FILES: dict[str, BuildTool] = {
 }
 
 
+MONOREPO_FILES = ("pnpm-workspace.yaml", "lerna.json")
+
+
+# =============================================================================
+# COMPILED LOOKUP TABLES
+# =============================================================================
+
+
+def _build_language_tables() -> tuple[
+    dict[str, tuple[Language, ...]],
+    dict[str, tuple[Language, ...]],
+    dict[str, tuple[Language, ...]],
+]:
+    """Invert LANGUAGE_PATTERNS into extension, indicator-name and indicator-suffix tables."""
+    extensions: dict[str, list[Language]] = {}
+    indicator_files: dict[str, list[Language]] = {}
+    indicator_suffixes: dict[str, list[Language]] = {}
+
+    for lang, patterns in LANGUAGE_PATTERNS.items():
+        for ext in patterns.get("extensions", []):
+            extensions.setdefault(ext.lower(), []).append(lang)
+        for indicator in patterns.get("files", []):
+            if indicator.startswith("*."):
+                indicator_suffixes.setdefault(indicator[1:], []).append(lang)
+            else:
+                indicator_files.setdefault(indicator, []).append(lang)
+
+    def freeze(table: dict[str, list[Language]]) -> dict[str, tuple[Language, ...]]:
+        return {key: tuple(langs) for key, langs in table.items()}
+
+    return freeze(extensions), freeze(indicator_files), freeze(indicator_suffixes)
+
+
+# Built once at import: file extension -> languages, and root indicator -> languages
+EXTENSION_LANGUAGES, INDICATOR_FILES, INDICATOR_SUFFIXES = _build_language_tables()
+
+
+# =============================================================================
+# MANIFEST PARSING
+# =============================================================================
+
+
+def _load_toml(file_path: Path) -> dict:
+    """Parse a TOML manifest with tomllib (or the tomli dependency on Python 3.10)."""
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        import tomli as tomllib
+
+    with open(file_path, "rb") as f:
+        return tomllib.load(f)
+
+
+def _parse_package_json(file_path: Path) -> dict | None:
+    """Parse package.json."""
+    data = json.loads(file_path.read_text())
+    return data if isinstance(data, dict) else None
+
+
+def _parse_requirements(file_path: Path) -> dict[str, str | None]:
+    """Parse requirements.txt into a name -> version mapping."""
+    deps: dict[str, str | None] = {}
+    for line in file_path.read_text().split("\n"):
+        line = line.strip()
+        if line and not line.startswith("#"):
+            # Parse package==version or package>=version
+            for sep in ["==", ">=", "<=", ">", "<", "~="]:
+                if sep in line:
+                    name, version = line.split(sep, 1)
+                    deps[name.strip()] = version.strip()
+                    break
+            else:
+                deps[line.split("[")[0].strip()] = None
+    return deps
+
+
+def _parse_go_mod(file_path: Path) -> dict:
+    """Parse the module path, Go version and requirements from go.mod."""
+    data: dict = {"module": None, "go": None, "require": {}}
+    in_require = False
+
+    for line in file_path.read_text().split("\n"):
+        line = line.split("//")[0].strip()
+        if not line:
+            continue
+        if in_require:
+            if line == ")":
+                in_require = False
+            elif len(parts := line.split()) >= 2:
+                data["require"][parts[0]] = parts[1]
+            continue
+
+        parts = line.split()
+        if parts[0] == "module" and len(parts) > 1:
+            data["module"] = parts[1]
+        elif parts[0] == "go" and len(parts) > 1:
+            data["go"] = parts[1]
+        elif parts[0] == "require":
+            if parts[1:] == ["("]:
+                in_require = True
+            elif len(parts) >= 3:
+                data["require"][parts[1]] = parts[2]
+
+    return data
+
+
+# Manifest file name -> parser. Parsed concurrently, once per detection.
+MANIFEST_PARSERS: dict[str, Callable[[Path], Any]] = {
+    "package.json": _parse_package_json,
+    "pyproject.toml": _load_toml,
+    "requirements.txt": _parse_requirements,
+    "go.mod": _parse_go_mod,
+    "Cargo.toml": _load_toml,
+}
+
+_REQUIREMENT_RE = re.compile(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[[^\]]*\])?\s*([^;]*)")
+
+
+def _split_requirement(requirement: str) -> tuple[str, str | None] | None:
+    """Split a PEP 508 requirement string into (name, version spec)."""
+    match = _REQUIREMENT_RE.match(requirement)
+    if not match:
+        return None
+    return match.group(1).lower(), match.group(2).strip() or None
+
+
+def _as_str(value: Any) -> str | None:
+    """Return value if it is a string (manifests may use tables for inherited fields)."""
+    return value if isinstance(value, str) else None
+
+
+# =============================================================================
+# ROOT LISTING
+# =============================================================================
+
+
+def _list_root(path: Path) -> dict[str, bool]:
+    """Map each top-level entry name to whether it is a directory."""
+    entries: dict[str, bool] = {}
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                entries[entry.name] = entry.is_dir()
+            except OSError:
+                continue
+    return dict(sorted(entries.items()))
+
+
+def _root_matches(root: dict[str, bool], pattern: str) -> bool:
+    """Check whether a top-level entry matches a name or glob pattern."""
+    if "*" in pattern:
+        return any(fnmatch.fnmatchcase(name, pattern) for name in root)
+    return pattern in root
+
+
+# Top-level files whose mtimes key the detection cache
+MANIFEST_FILES = frozenset(
+    set(PACKAGE_MANAGER_FILES)
+    | set(BUILD_TOOL_FILES)
+    | set(INDICATOR_FILES)
+    | set(MANIFEST_PARSERS)
+    | set(MONOREPO_FILES)
+    | {
+        name
+        for patterns in FRAMEWORK_PATTERNS.values()
+        for name in patterns.get("files", [])
+        if "*" not in name
+    }
+)
+
+# Memoized results: (root, max_depth, max_files) -> (signature, inventory, info)
+_detection_cache: dict[tuple[Path, int, int], tuple[tuple, FileInventory, ProjectInfo]] = {}
+_detection_lock = threading.Lock()
+
+
+def clear_detection_cache(path: Path | None = None) -> None:
+    """
+    Drop memoized detection results.
+
+    Args:
+        path: Project root to forget (default: all roots)
+    """
+    with _detection_lock:
+        if path is None:
+            _detection_cache.clear()
+            return
+        root = Path(path).resolve()
+        for key in [key for key in _detection_cache if key[0] == root]:
+            del _detection_cache[key]
+
+
 class ProjectDetector:
     """
     Detects project type, language, frameworks, and tools.
 
+    Results are memoized per project root and reused until a top-level
+    manifest changes or the file inventory goes stale.
+
     Example:
         detector = ProjectDetector()
         info = detector.detect("/path/to/project")
@@ -403,12 +608,13 @@ class ProjectDetector:
         self.max_depth = max_depth
         self.max_files = max_files
 
-    def detect(self, path: Path | None = None) -> ProjectInfo:
+    def detect(self, path: Path | None = None, use_cache: bool = True) -> ProjectInfo:
         """
         Detect project information.
 
         Args:
             path: Project root path (default: current directory)
+            use_cache: Reuse a memoized result if the project is unchanged
 
         Returns:
             ProjectInfo with detection results
@@ -423,28 +629,54 @@ class ProjectDetector:
         if not path.is_dir():
             raise ValueError(f"Path is not a directory: {path}")
 
+        root = _list_root(path)
+        signature = self._manifest_signature(path, root)
+        inventory = get_file_inventory(
+            path,
+            max_depth=self.max_depth,
+            skip_names=self.SKIP_NAMES,
+            skip_hidden=True,
+            max_files=self.max_files,
+        )
+        key = (path, self.max_depth, self.max_files)
+
+        if use_cache:
+            with _detection_lock:
+                cached = _detection_cache.get(key)
+            if cached and cached[0] == signature and cached[1] is inventory:
+                return copy.deepcopy(cached[2])
+
+        info = self._detect(path, root, inventory)
+
+        with _detection_lock:
+            _detection_cache[key] = (signature, inventory, info)
+        return copy.deepcopy(info)
+
+    def _detect(self, path: Path, root: dict[str, bool], inventory: FileInventory) -> ProjectInfo:
+        """Run detection without consulting the cache."""
         logger.info(f"Detecting project at: {path}")
 
-        # Collect files
-        files = self._collect_files(path)
+        # Collect files and parse manifests
+        files = self._collect_files(path, inventory)
+        manifests = self._load_manifests(path, root)
 
         # Detect components
-        languages = self._detect_languages(path, files)
-        package_managers = self._detect_package_managers(path)
-        build_tools = self._detect_build_tools(path)
-        frameworks = self._detect_frameworks(path, files, package_managers)
+        languages = self._detect_languages(path, files, root)
+        package_managers = self._detect_package_managers(root, manifests)
+        build_tools = self._detect_build_tools(root)
+        frameworks = self._detect_frameworks(root, manifests)
 
         # Determine primary language and type
         primary_language, lang_confidence = self._get_primary_language(languages)
         primary_type, type_confidence = self._detect_project_type(
-            path, primary_language, frameworks, files
+            path, root, primary_language, frameworks
         )
 
         # Get project metadata
-        name, version, description = self._get_project_metadata(path, package_managers)
+        name, version, description = self._get_project_metadata(path, manifests)
 
         # Detect monorepo
-        is_monorepo, subprojects = self._detect_monorepo(path)
+        is_monorepo, subprojects = self._detect_monorepo(path, root, manifests)
 
         return ProjectInfo(
             path=path,
@@ -463,67 +695,79 @@ class ProjectDetector:
             subprojects=subprojects,
         )
 
-    def _collect_files(self, path: Path) -> list[Path]:
-        """Collect files up to max_depth and max_files."""
-        files = []
-        count = 0
+    def _manifest_signature(self, path: Path, root: dict[str, bool]) -> tuple:
+        """Build a cache key from the root directory and top-level manifest mtimes."""
+        stamps = [path.stat().st_mtime_ns]
+        for name in root:
+            if name in MANIFEST_FILES:
+                try:
+                    stat = (path / name).stat()
+                except OSError:
+                    continue
+                stamps.append((name, stat.st_mtime_ns, stat.st_size))
+        return tuple(stamps)
+
+    # Directory/file names skipped when collecting files
+    SKIP_NAMES = frozenset(
+        {
+            "node_modules",
+            "__pycache__",
+            "venv",
+            ".venv",
+            "env",
+            ".env",
+            "dist",
+            "build",
+            "target",
+            ".git",
+        }
+    )
+
+    def _collect_files(self, path: Path, inventory: FileInventory) -> list[Path]:
+        """Collect files up to max_depth and max_files.
 
-        def walk(current: Path, depth: int):
-            nonlocal count
-            if depth > self.max_depth or count >= self.max_files:
-                return
+        The inventory is bounded, so pruning happens during the walk.
+        """
+        return [path / rel_path for rel_path in inventory.files(limit=self.max_files)]
+
+    def _load_manifests(self, path: Path, root: dict[str, bool]) -> dict[str, Any]:
+        """Parse all top-level manifests concurrently."""
+        names = [name for name in MANIFEST_PARSERS if root.get(name) is False]
+        if not names:
+            return {}
 
+        def load(name: str) -> Any:
             try:
-                for item in current.iterdir():
-                    if count >= self.max_files:
-                        return
-
-                    # Skip hidden and common ignore patterns
-                    if item.name.startswith(".") or item.name in {
-                        "node_modules",
-                        "__pycache__",
-                        "venv",
-                        ".venv",
-                        "env",
-                        ".env",
-                        "dist",
-                        "build",
-                        "target",
-                        ".git",
-                    }:
-                        continue
-
-                    if item.is_file():
-                        files.append(item)
-                        count += 1
-                    elif item.is_dir():
-                        walk(item, depth + 1)
-            except PermissionError:
-                pass
-
-        walk(path, 0)
-        return files
-
-    def _detect_languages(self, path: Path, files: list[Path]) -> list[DetectedLanguage]:
+                return MANIFEST_PARSERS[name](path / name)
+            except Exception as e:
+                logger.debug(f"Failed to parse {name}: {e}")
+                return None
+
+        if len(names) == 1:
+            results = [load(names[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=len(names)) as pool:
+                results = list(pool.map(load, names))
+
+        return {name: data for name, data in zip(names, results, strict=True) if data is not None}
+
+    def _detect_languages(
+        self, path: Path, files: list[Path], root: dict[str, bool]
+    ) -> list[DetectedLanguage]:
         """Detect programming languages."""
         language_files: dict[Language, list[Path]] = {lang: [] for lang in Language}
 
         for file in files:
-            ext = file.suffix.lower()
-            for lang, patterns in LANGUAGE_PATTERNS.items():
-                if ext in patterns.get("extensions", []):
-                    language_files[lang].append(file)
+            for lang in EXTENSION_LANGUAGES.get(file.suffix.lower(), ()):
+                language_files[lang].append(file)
 
         # Also check for indicator files
-        for lang, patterns in LANGUAGE_PATTERNS.items():
-            for indicator in patterns.get("files", []):
-                if "*" in indicator:
-                    # Glob pattern
-                    matches = list(path.glob(indicator))
-                    if matches:
-                        language_files[lang].extend(matches)
-                elif (path / indicator).exists():
-                    language_files[lang].append(path / indicator)
+        for name in root:
+            langs = INDICATOR_FILES.get(name, ()) + INDICATOR_SUFFIXES.get(
+                os.path.splitext(name)[1], ()
+            )
+            for lang in langs:
+                language_files[lang].append(path / name)
 
         # Calculate confidence based on file count
         total_files = sum(len(f) for f in language_files.values()) or 1
@@ -546,51 +790,46 @@ class ProjectDetector:
         results.sort(key=lambda x: x.confidence, reverse=True)
         return results
 
-    def _detect_package_managers(self, path: Path) -> list[PackageManager]:
+    def _detect_package_managers(
+        self, root: dict[str, bool], manifests: dict[str, Any]
+    ) -> list[PackageManager]:
         """Detect package managers."""
         managers = []
 
         for filename, manager in PACKAGE_MANAGER_FILES.items():
-            if (path / filename).exists():
+            if filename in root:
                 if manager not in managers:
                     managers.append(manager)
 
         # Check pyproject.toml for poetry vs pip
-        pyproject = path / "pyproject.toml"
-        if pyproject.exists():
-            try:
-                content = pyproject.read_text()
-                if "[tool.poetry]" in content:
-                    if PackageManager.POETRY not in managers:
-                        managers.append(PackageManager.POETRY)
-                elif "[project]" in content or "[build-system]" in content:
-                    if PackageManager.PIP not in managers:
-                        managers.append(PackageManager.PIP)
-            except Exception:
-                pass
+        pyproject = manifests.get("pyproject.toml")
+        if pyproject:
+            if "poetry" in pyproject.get("tool", {}):
+                if PackageManager.POETRY not in managers:
+                    managers.append(PackageManager.POETRY)
+            elif "project" in pyproject or "build-system" in pyproject:
+                if PackageManager.PIP not in managers:
+                    managers.append(PackageManager.PIP)
 
         return managers
 
-    def _detect_build_tools(self, path: Path) -> list[BuildTool]:
+    def _detect_build_tools(self, root: dict[str, bool]) -> list[BuildTool]:
         """Detect build tools."""
         tools = []
 
         for filename, tool in BUILD_TOOL_FILES.items():
-            if (path / filename).exists():
+            if filename in root:
                 if tool not in tools:
                     tools.append(tool)
 
         return tools
 
     def _detect_frameworks(
-        self,
-        path: Path,
-        files: list[Path],
-        package_managers: list[PackageManager],
+        self, root: dict[str, bool], manifests: dict[str, Any]
     ) -> list[DetectedFramework]:
         """Detect frameworks."""
         frameworks = []
-        dependencies = self._get_dependencies(path, package_managers)
+        dependencies = self._get_dependencies(manifests)
 
         for framework, patterns in FRAMEWORK_PATTERNS.items():
             confidence = 0.0
@@ -607,20 +846,15 @@ class ProjectDetector:
                     break
 
             # Check files
-            file_patterns = patterns.get("files", [])
-            for pattern in file_patterns:
-                if "*" in pattern:
-                    if list(path.glob(pattern)):
-                        confidence += 0.2
-                        evidence.append(f"file pattern: {pattern}")
-                elif (path / pattern).exists():
+            for pattern in patterns.get("files", []):
+                if _root_matches(root, pattern):
                     confidence += 0.2
-                    evidence.append(f"file: {pattern}")
+                    kind = "file pattern" if "*" in pattern else "file"
+                    evidence.append(f"{kind}: {pattern}")
 
             # Check directories
-            dir_patterns = patterns.get("dirs", [])
-            for dir_name in dir_patterns:
-                if (path / dir_name).is_dir():
+            for dir_name in patterns.get("dirs", []):
+                if root.get(dir_name):
                     confidence += 0.1
                     evidence.append(f"directory: {dir_name}")
 
@@ -638,65 +872,51 @@ class ProjectDetector:
         frameworks.sort(key=lambda x: x.confidence, reverse=True)
         return frameworks
 
-    def _get_dependencies(
-        self, path: Path, package_managers: list[PackageManager]
-    ) -> dict[str, str | None]:
-        """Get project dependencies."""
+    def _get_dependencies(self, manifests: dict[str, Any]) -> dict[str, str | None]:
+        """Get project dependencies from parsed manifests."""
         deps: dict[str, str | None] = {}
 
         # package.json
-        pkg_json = path / "package.json"
-        if pkg_json.exists():
-            try:
-                data = json.loads(pkg_json.read_text())
-                for key in ["dependencies", "devDependencies", "peerDependencies"]:
-                    if key in data:
-                        for name, version in data[key].items():
-                            deps[name] = version
-            except Exception:
-                pass
-
-        # pyproject.toml (basic parsing)
-        pyproject = path / "pyproject.toml"
-        if pyproject.exists():
-            try:
-                content = pyproject.read_text()
-                # Simple extraction - look for dependencies
-                in_deps = False
-                for line in content.split("\n"):
-                    if "dependencies" in line.lower() and "=" in line:
-                        in_deps = True
-                        continue
-                    if in_deps:
-                        if line.startswith("["):
-                            in_deps = False
-                            continue
-                        if "=" in line or line.strip().startswith('"'):
-                            # Extract package name
-                            clean = line.strip().strip('",')
-                            if clean:
-                                parts = clean.split(">=")[0].split("==")[0].split("<")[0]
-                                deps[parts.strip()] = None
-            except Exception:
-                pass
+        pkg_json = manifests.get("package.json", {})
+        for key in ["dependencies", "devDependencies", "peerDependencies"]:
+            section = pkg_json.get(key)
+            if isinstance(section, dict):
+                for name, version in section.items():
+                    deps[name] = _as_str(version)
+
+        # pyproject.toml: PEP 621 and Poetry tables
+        pyproject = manifests.get("pyproject.toml", {})
+        try:
+            project = pyproject.get("project", {})
+            requirements = list(project.get("dependencies", []))
+            for group in project.get("optional-dependencies", {}).values():
+                requirements.extend(group)
+            for requirement in requirements:
+                parsed = _split_requirement(requirement)
+                if parsed:
+                    deps[parsed[0]] = parsed[1]
+
+            poetry = pyproject.get("tool", {}).get("poetry", {})
+            sections = [poetry.get("dependencies", {}), poetry.get("dev-dependencies", {})]
+            sections.extend(g.get("dependencies", {}) for g in poetry.get("group", {}).values())
+            for section in sections:
+                for name, spec in section.items():
+                    if name != "python":
+                        deps[name.lower()] = _as_str(spec)
+        except (AttributeError, TypeError) as e:
+            logger.debug(f"Unexpected pyproject.toml layout: {e}")
 
         # requirements.txt
-        req_txt = path / "requirements.txt"
-        if req_txt.exists():
-            try:
-                for line in req_txt.read_text().split("\n"):
-                    line = line.strip()
-                    if line and not line.startswith("#"):
-                        # Parse package==version or package>=version
-                        for sep in ["==", ">=", "<=", ">", "<", "~="]:
-                            if sep in line:
-                                name, version = line.split(sep, 1)
-                                deps[name.strip()] = version.strip()
-                                break
-                        else:
-                            deps[line.split("[")[0].strip()] = None
-            except Exception:
-                pass
+        deps.update(manifests.get("requirements.txt", {}))
+
+        # go.mod
+        deps.update(manifests.get("go.mod", {}).get("require", {}))
+
+        # Cargo.toml
+        cargo_deps = manifests.get("Cargo.toml", {}).get("dependencies", {})
+        if isinstance(cargo_deps, dict):
+            for name, spec in cargo_deps.items():
+                deps[name] = spec.get("version") if isinstance(spec, dict) else _as_str(spec)
 
         return deps
 
@@ -711,9 +931,9 @@ class ProjectDetector:
     def _detect_project_type(
         self,
         path: Path,
+        root: dict[str, bool],
         language: Language,
         frameworks: list[DetectedFramework],
-        files: list[Path],
     ) -> tuple[ProjectType, float]:
         """Detect project type."""
 
@@ -724,9 +944,9 @@ class ProjectDetector:
             return ProjectType.MOBILE_CROSS, 0.9
         if Framework.FLUTTER in framework_names:
             return ProjectType.MOBILE_CROSS, 0.9
-        if language == Language.SWIFT and (path / "*.xcodeproj").exists():
+        if language == Language.SWIFT and _root_matches(root, "*.xcodeproj"):
             return ProjectType.MOBILE_IOS, 0.8
-        if (path / "android").is_dir() and (path / "app/build.gradle").exists():
+        if root.get("android") and (path / "app/build.gradle").exists():
             return ProjectType.MOBILE_ANDROID, 0.8
 
         # Check for desktop
@@ -757,86 +977,50 @@ class ProjectDetector:
         }
         if framework_names & api_frameworks:
             # Could be web app or API
-            has_templates = (path / "templates").is_dir() or (path / "views").is_dir()
+            has_templates = root.get("templates") or root.get("views")
             if has_templates:
                 return ProjectType.WEB_APP, 0.7
             return ProjectType.API_SERVICE, 0.7
 
         # Check for CLI tool
-        if (path / "cli.py").exists() or (path / "bin").is_dir():
+        if "cli.py" in root or root.get("bin"):
             return ProjectType.CLI_TOOL, 0.6
 
         # Check for library
-        if (path / "src").is_dir() and (path / "tests").is_dir():
+        if root.get("src") and root.get("tests"):
             return ProjectType.LIBRARY, 0.5
 
         return ProjectType.UNKNOWN, 0.3
 
     def _get_project_metadata(
-        self, path: Path, package_managers: list[PackageManager]
+        self, path: Path, manifests: dict[str, Any]
     ) -> tuple[str | None, str | None, str | None]:
         """Get project name, version, description."""
-        name = None
-        version = None
-        description = None
-
-        # Try package.json
-        pkg_json = path / "package.json"
-        if pkg_json.exists():
-            try:
-                data = json.loads(pkg_json.read_text())
-                name = data.get("name")
-                version = data.get("version")
-                description = data.get("description")
-            except Exception:
-                pass
-
-        # Try pyproject.toml
-        if not name:
-            pyproject = path / "pyproject.toml"
-            if pyproject.exists():
-                try:
-                    content = pyproject.read_text()
-                    for line in content.split("\n"):
-                        if line.startswith("name ="):
-                            name = line.split("=")[1].strip().strip("\"'")
-                        elif line.startswith("version ="):
-                            version = line.split("=")[1].strip().strip("\"'")
-                        elif line.startswith("description ="):
-                            description = line.split("=")[1].strip().strip("\"'")
-                except Exception:
-                    pass
-
-        # Try Cargo.toml
-        if not name:
-            cargo = path / "Cargo.toml"
-            if cargo.exists():
-                try:
-                    content = cargo.read_text()
-                    in_package = False
-                    for line in content.split("\n"):
-                        if line.strip() == "[package]":
-                            in_package = True
-                            continue
-                        if in_package:
-                            if line.startswith("["):
-                                break
-                            if line.startswith("name ="):
-                                name = line.split("=")[1].strip().strip("\"'")
-                            elif line.startswith("version ="):
-                                version = line.split("=")[1].strip().strip("\"'")
-                            elif line.startswith("description ="):
-                                description = line.split("=")[1].strip().strip("\"'")
-                except Exception:
-                    pass
+        pyproject = manifests.get("pyproject.toml", {})
+        go_mod = manifests.get("go.mod", {})
+
+        # First manifest with a name wins
+        candidates = [
+            manifests.get("package.json", {}),
+            pyproject.get("project", {}),
+            pyproject.get("tool", {}).get("poetry", {}),
+            manifests.get("Cargo.toml", {}).get("package", {}),
+            {"name": go_mod.get("module")},
+        ]
+        for meta in candidates:
+            if isinstance(meta, dict) and _as_str(meta.get("name")):
+                return (
+                    meta["name"],
+                    _as_str(meta.get("version")),
+                    _as_str(meta.get("description")),
+                )
 
         # Fall back to directory name
-        if not name:
-            name = path.name
-
-        return name, version, description
+        return path.name, None, None
 
-    def _detect_monorepo(self, path: Path) -> tuple[bool, list[str]]:
+    def _detect_monorepo(
+        self, path: Path, root: dict[str, bool], manifests: dict[str, Any]
+    ) -> tuple[bool, list[str]]:
         """Detect if project is a monorepo."""
         subprojects = []
 
@@ -844,9 +1028,8 @@ class ProjectDetector:
         monorepo_dirs = ["packages", "apps", "libs", "modules", "services"]
 
         for dir_name in monorepo_dirs:
-            packages_dir = path / dir_name
-            if packages_dir.is_dir():
-                for item in packages_dir.iterdir():
+            if root.get(dir_name):
+                for item in sorted((path / dir_name).iterdir()):
                     if item.is_dir():
                         # Check if it looks like a package
                         if any(
@@ -862,19 +1045,11 @@ class ProjectDetector:
                             subprojects.append(f"{dir_name}/{item.name}")
 
         # Check for workspace files
-        if (path / "pnpm-workspace.yaml").exists():
-            return True, subprojects
-        if (path / "lerna.json").exists():
+        if any(name in root for name in MONOREPO_FILES):
             return True, subprojects
 
-        pkg_json = path / "package.json"
-        if pkg_json.exists():
-            try:
-                data = json.loads(pkg_json.read_text())
-                if "workspaces" in data:
-                    return True, subprojects
-            except Exception:
-                pass
+        if "workspaces" in manifests.get("package.json", {}):
+            return True, subprojects
 
         return len(subprojects) > 1, subprojects
 
@@ -884,6 +1059,9 @@ def detect_project(path: Path | None = None) -> ProjectInfo:
     """
     Detect project information.
 
+    Results are memoized per root, so repeated calls on an unchanged
+    project return immediately.
+
     Args:
         path: Project root path (default: current directory)
 
@@ -57,17 +57,14 @@ class FastbandEngine:
         @self.server.list_tools()
         async def list_tools() -> list[MCPTool]:
             """List all available tools."""
-            tools = []
-            for tool in self.registry.get_active_tools():
-                schema = tool.definition.to_mcp_schema()
-                tools.append(
-                    MCPTool(
-                        name=schema["name"],
-                        description=schema["description"],
-                        inputSchema=schema["inputSchema"],
-                    )
+            return [
+                MCPTool(
+                    name=schema["name"],
+                    description=schema["description"],
+                    inputSchema=schema["inputSchema"],
                 )
-            return tools
+                for schema in self.registry.get_mcp_tools()
+            ]
 
         @self.server.call_tool()
         async def call_tool(name: str, arguments: dict[str, Any]) -> CallToolResult:
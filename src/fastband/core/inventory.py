@@ -0,0 +1,510 @@
+"""
+Shared file inventory for project-wide scans.
+
+Project detection, the hub analyzer, the dependency graph, the secrets
+scanner, linters and backups all need "every file in the project". Rather
+than each walking the tree with its own ignore rules, they query a cached
+inventory built by a single os.scandir walk that honors .gitignore.
+
+Entries are stored column-wise (paths, sizes, mtimes, extension ids, flags)
+to keep memory small on large trees. An inventory is reused until any
+walked directory or .gitignore file changes its mtime, or until
+invalidate_file_inventory() is called (e.g. from a file watcher).
+
+Usage:
+    inventory = get_file_inventory(project_root)
+    py_files = inventory.files(extensions={".py"}, exclude_names={"venv"})
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Directories never walked, regardless of .gitignore
+ALWAYS_SKIP_DIRS = frozenset({".git", ".hg", ".svn"})
+
+# Directory mtimes this close to the walk start may hide same-tick changes
+# on filesystems with coarse timestamps, so such inventories are re-walked.
+_RACY_WINDOW_SECONDS = 2.0
+
+_FLAG_IGNORED = 1
+_FLAG_HIDDEN = 2
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    """A single file in the inventory."""
+
+    path: str  # Relative to the inventory root, "/"-separated
+    size: int
+    mtime: float
+    extension: str  # Lower-cased suffix including the dot, or ""
+    ignored: bool = False
+    hidden: bool = False
+
+    @property
+    def name(self) -> str:
+        return self.path.rsplit("/", 1)[-1]
+
+
+class _IgnoreRules:
+    """Compiled patterns from one .gitignore file."""
+
+    def __init__(self, base: str, lines: Iterable[str]):
+        self.base = base  # Directory of the .gitignore, relative to the root
+        self.rules: list[tuple[re.Pattern, bool, bool, bool]] = []
+        for raw in lines:
+            line = raw.rstrip("\n").rstrip("\r")
+            if not line or line.startswith("#"):
+                continue
+            line = line.rstrip()
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            elif line.startswith("\\"):
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+            anchored = "/" in line
+            line = line.lstrip("/")
+            try:
+                regex = re.compile(_translate_glob(line))
+            except re.error:
+                continue
+            self.rules.append((regex, negate, dir_only, anchored))
+
+    def match(self, rel_path: str, name: str, is_dir: bool) -> bool | None:
+        """Return True (ignored), False (re-included) or None (no rule matched)."""
+        if self.base:
+            rel_path = rel_path[len(self.base) + 1 :]
+        result = None
+        for regex, negate, dir_only, anchored in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.fullmatch(rel_path if anchored else name):
+                result = not negate
+        return result
+
+
+def _translate_glob(pattern: str) -> str:
+    """Translate a gitignore glob into a regular expression."""
+    out = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == n:
+            out.append("/.*")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif c == "*":
+            out.append("[^/]*")
+            i += 1
+        elif c == "?":
+            out.append("[^/]")
+            i += 1
+        elif c == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape(c))
+                i += 1
+            else:
+                body = pattern[i + 1 : end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end + 1
+        else:
+            out.append(re.escape(c))
+            i += 1
+    return "".join(out)
+
+
+class FileInventory:
+    """
+    Columnar snapshot of every file under a root directory.
+
+    Gitignored directories are not descended into; their paths are kept in
+    ignored_dirs. Gitignored files in walked directories are kept but
+    flagged, so consumers that care about them (e.g. secrets scanning of
+    local .env files) can still see them.
+
+    A bounded inventory (max_depth, skip_names, skip_hidden, max_files)
+    prunes during the walk instead of filtering afterwards, for callers
+    that only sample the top of a tree.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        respect_gitignore: bool = True,
+        max_depth: int | None = None,
+        skip_names: Iterable[str] | None = None,
+        skip_hidden: bool = False,
+        max_files: int | None = None,
+    ):
+        self.root = Path(root).resolve()
+        self.respect_gitignore = respect_gitignore
+        self.max_depth = max_depth
+        self.skip_names = frozenset(skip_names or ())
+        self.skip_hidden = skip_hidden
+        self.max_files = max_files
+
+        self.paths: list[str] = []
+        self.sizes = array("q")
+        self.mtimes = array("d")
+        self.ext_ids = array("H")
+        self.flags = array("B")
+        self.extensions: list[str] = []
+        self._ext_index: dict[str, int] = {}
+        self.ignored_dirs: list[str] = []  # Gitignored directories not walked
+        self.truncated = False  # Walk stopped at max_files
+
+        # Directory and .gitignore mtimes used for staleness checks
+        self._watched: dict[str, int] = {}
+        self._racy = False
+        self.built_at = 0.0
+        self.build_time_ms = 0
+
+        self._build()
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    # =========================================================================
+    # BUILDING
+    # =========================================================================
+
+    def _build(self) -> None:
+        start = time.time()
+        self._walk()
+        self.built_at = start
+        self.build_time_ms = int((time.time() - start) * 1000)
+        threshold_ns = int((start - _RACY_WINDOW_SECONDS) * 1e9)
+        self._racy = any(mtime >= threshold_ns for mtime in self._watched.values())
+        logger.debug(
+            f"Inventoried {len(self.paths)} files under {self.root} in {self.build_time_ms}ms"
+        )
+
+    def _ext_id(self, extension: str) -> int:
+        ext_id = self._ext_index.get(extension)
+        if ext_id is None:
+            ext_id = len(self.extensions)
+            self.extensions.append(extension)
+            self._ext_index[extension] = ext_id
+        return ext_id
+
+    def _load_rules(self, rel_dir: str, abs_dir: str) -> _IgnoreRules | None:
+        if not self.respect_gitignore:
+            return None
+        gitignore = os.path.join(abs_dir, ".gitignore")
+        try:
+            with open(gitignore, encoding="utf-8", errors="ignore") as f:
+                rules = _IgnoreRules(rel_dir, f)
+            self._watched[gitignore] = os.stat(gitignore).st_mtime_ns
+        except OSError:
+            return None
+        return rules if rules.rules else None
+
+    @staticmethod
+    def _is_ignored(
+        rules: list[_IgnoreRules],
+        rel_path: str,
+        name: str,
+        is_dir: bool,
+    ) -> bool:
+        ignored = False
+        for ruleset in rules:
+            result = ruleset.match(rel_path, name, is_dir)
+            if result is not None:
+                ignored = result
+        return ignored
+
+    def _walk(self) -> None:
+        # Stack of (absolute dir, relative dir, applicable rules, hidden parent, depth)
+        stack: list[tuple[str, str, list[_IgnoreRules], bool, int]] = [
+            (str(self.root), "", [], False, 0)
+        ]
+        skip_names = self.skip_names
+        max_files = self.max_files
+
+        while stack:
+            abs_dir, rel_dir, parent_rules, parent_hidden, depth = stack.pop()
+
+            try:
+                self._watched[abs_dir] = os.stat(abs_dir).st_mtime_ns
+                entries = list(os.scandir(abs_dir))
+            except OSError:
+                continue
+
+            rules = parent_rules
+            own_rules = self._load_rules(rel_dir, abs_dir)
+            if own_rules is not None:
+                rules = [*parent_rules, own_rules]
+
+            for entry in entries:
+                name = entry.name
+                rel_path = f"{rel_dir}/{name}" if rel_dir else name
+                hidden = parent_hidden or name.startswith(".")
+                if name in skip_names or (self.skip_hidden and name.startswith(".")):
+                    continue
+
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+
+                if is_dir:
+                    if name in ALWAYS_SKIP_DIRS:
+                        continue
+                    if self.max_depth is not None and depth >= self.max_depth:
+                        continue
+                    if rules and self._is_ignored(rules, rel_path, name, True):
+                        self.ignored_dirs.append(rel_path)
+                        continue
+                    stack.append((entry.path, rel_path, rules, hidden, depth + 1))
+                    continue
+
+                if max_files is not None and len(self.paths) >= max_files:
+                    self.truncated = True
+                    return
+
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue
+
+                flags = _FLAG_HIDDEN if hidden else 0
+                if rules and self._is_ignored(rules, rel_path, name, False):
+                    flags |= _FLAG_IGNORED
+
+                dot = name.rfind(".")
+                extension = name[dot:].lower() if dot > 0 else ""
+
+                self.paths.append(rel_path)
+                self.sizes.append(stat.st_size)
+                self.mtimes.append(stat.st_mtime)
+                self.ext_ids.append(self._ext_id(extension))
+                self.flags.append(flags)
+
+    # =========================================================================
+    # STALENESS
+    # =========================================================================
+
+    def is_stale(self) -> bool:
+        """
+        Check whether files were added, removed or re-ignored since the walk.
+
+        Only directory and .gitignore mtimes are compared, which is far
+        cheaper than a walk. Edits to existing files do not change directory
+        mtimes, so sizes and mtimes reflect the time of the walk.
+        """
+        if self._racy:
+            return True
+        for path, mtime_ns in self._watched.items():
+            try:
+                if os.stat(path).st_mtime_ns != mtime_ns:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    # =========================================================================
+    # QUERIES
+    # =========================================================================
+
+    def _select(
+        self,
+        under: str | None,
+        extensions: Iterable[str] | None,
+        exclude_names: Iterable[str] | None,
+        include_hidden: bool,
+        include_ignored: bool,
+        max_depth: int | None,
+        predicate: Callable[[str], bool] | None,
+    ) -> Iterator[int]:
+        prefix = ""
+        if under not in (None, "", "."):
+            prefix = Path(under).as_posix().strip("/") + "/"
+
+        ext_ids = None
+        if extensions is not None:
+            wanted = {e.lower() for e in extensions}
+            ext_ids = {i for i, ext in enumerate(self.extensions) if ext in wanted}
+
+        excluded = frozenset(exclude_names) if exclude_names else None
+        flag_mask = (0 if include_ignored else _FLAG_IGNORED) | (
+            0 if include_hidden else _FLAG_HIDDEN
+        )
+
+        for i, path in enumerate(self.paths):
+            if flag_mask and self.flags[i] & flag_mask:
+                continue
+            if ext_ids is not None and self.ext_ids[i] not in ext_ids:
+                continue
+            if prefix and not path.startswith(prefix):
+                continue
+            if max_depth is not None and path.count("/") > max_depth:
+                continue
+            if excluded and not excluded.isdisjoint(path.split("/")):
+                continue
+            if predicate is not None and not predicate(path):
+                continue
+            yield i
+
+    def entries(
+        self,
+        under: str | None = None,
+        extensions: Iterable[str] | None = None,
+        exclude_names: Iterable[str] | None = None,
+        include_hidden: bool = True,
+        include_ignored: bool = False,
+        max_depth: int | None = None,
+        predicate: Callable[[str], bool] | None = None,
+    ) -> Iterator[FileEntry]:
+        """
+        Iterate over matching files.
+
+        Args:
+            under: Only files below this directory (relative to the root)
+            extensions: Only files with these suffixes (e.g. {".py"})
+            exclude_names: Skip files with any path component in this set
+            include_hidden: Include files in or under dot-prefixed names
+            include_ignored: Include gitignored files in walked directories
+            max_depth: Maximum directory depth (0 = files in the root only)
+            predicate: Extra filter on the relative path
+        """
+        for i in self._select(
+            under, extensions, exclude_names, include_hidden, include_ignored, max_depth, predicate
+        ):
+            flags = self.flags[i]
+            yield FileEntry(
+                path=self.paths[i],
+                size=self.sizes[i],
+                mtime=self.mtimes[i],
+                extension=self.extensions[self.ext_ids[i]],
+                ignored=bool(flags & _FLAG_IGNORED),
+                hidden=bool(flags & _FLAG_HIDDEN),
+            )
+
+    def files(
+        self,
+        under: str | None = None,
+        extensions: Iterable[str] | None = None,
+        exclude_names: Iterable[str] | None = None,
+        include_hidden: bool = True,
+        include_ignored: bool = False,
+        max_depth: int | None = None,
+        predicate: Callable[[str], bool] | None = None,
+        limit: int | None = None,
+    ) -> list[str]:
+        """Relative paths of matching files (see entries() for filters)."""
+        paths = []
+        for i in self._select(
+            under, extensions, exclude_names, include_hidden, include_ignored, max_depth, predicate
+        ):
+            if limit is not None and len(paths) >= limit:
+                break
+            paths.append(self.paths[i])
+        return paths
+
+    def extension_counts(self, **filters) -> dict[str, int]:
+        """Count matching files by extension."""
+        counts: dict[str, int] = {}
+        for i in self._select(
+            filters.get("under"),
+            filters.get("extensions"),
+            filters.get("exclude_names"),
+            filters.get("include_hidden", True),
+            filters.get("include_ignored", False),
+            filters.get("max_depth"),
+            filters.get("predicate"),
+        ):
+            ext = self.extensions[self.ext_ids[i]]
+            counts[ext] = counts.get(ext, 0) + 1
+        return counts
+
+
+# =========================================================================
+# SHARED INSTANCES
+# =========================================================================
+
+_inventories: dict[tuple, FileInventory] = {}
+_inventories_lock = threading.Lock()
+
+
+def get_file_inventory(
+    root: str | Path,
+    respect_gitignore: bool = True,
+    max_depth: int | None = None,
+    skip_names: Iterable[str] | None = None,
+    skip_hidden: bool = False,
+    max_files: int | None = None,
+) -> FileInventory:
+    """
+    Get the shared inventory for a directory, re-walking it if stale.
+
+    Bounded inventories are cached separately from full ones.
+
+    Args:
+        root: Directory to inventory
+        respect_gitignore: Skip gitignored directories and flag ignored files
+        max_depth: Maximum directory depth walked (0 = the root only)
+        skip_names: File and directory names never walked
+        skip_hidden: Skip dot-prefixed files and directories
+        max_files: Stop the walk after this many files
+
+    Returns:
+        FileInventory for the directory
+    """
+    skip = frozenset(skip_names or ())
+    key = (str(Path(root).resolve()), respect_gitignore, max_depth, skip, skip_hidden, max_files)
+    with _inventories_lock:
+        inventory = _inventories.get(key)
+        if inventory is None or inventory.is_stale():
+            inventory = FileInventory(
+                key[0],
+                respect_gitignore=respect_gitignore,
+                max_depth=max_depth,
+                skip_names=skip,
+                skip_hidden=skip_hidden,
+                max_files=max_files,
+            )
+            _inventories[key] = inventory
+        return inventory
+
+
+def invalidate_file_inventory(path: str | Path | None = None) -> None:
+    """
+    Drop cached inventories so the next query re-walks.
+
+    Args:
+        path: A changed file or directory; inventories whose root contains
+            it are dropped. None drops every inventory.
+    """
+    with _inventories_lock:
+        if path is None:
+            _inventories.clear()
+            return
+        target = Path(path).resolve()
+        for key in list(_inventories):
+            root = Path(key[0])
+            if target == root or root in target.parents:
+                del _inventories[key]
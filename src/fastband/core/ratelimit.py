@@ -0,0 +1,354 @@
+"""
+Rate Limiting - Shared limiters for the hub and agents layers.
+
+Two algorithms, both with constant state per key:
+
+- TokenBucket: ``limit`` tokens per ``period`` refilled continuously, with
+  bursts up to ``burst`` (defaults to ``limit``). Good for smoothing work
+  such as API token budgets.
+- SlidingWindow: a sliding-window counter. It keeps the counts for the
+  current and previous fixed windows and weights the previous one by how
+  much of it still overlaps the sliding window. Unlike a plain fixed
+  window, a client can't send ``limit`` requests at the end of one window
+  and ``limit`` more at the start of the next.
+
+The in-process limiters are thread-safe, run on ``time.monotonic`` (so
+wall-clock jumps can't reset them) and keep at most ``max_keys`` keys,
+evicting the least recently used. RedisSlidingWindow shares one window
+across hub instances; it uses wall-clock time so every instance agrees on
+window boundaries.
+
+Example:
+    limiter = SlidingWindow(limit=100, period=60)
+    result = limiter.hit(client_id)
+    if not result.allowed:
+        raise TooManyRequests(retry_after=result.retry_after)
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+Clock = Callable[[], float]
+
+# Default bound on tracked keys for in-process limiters
+DEFAULT_MAX_KEYS = 10_000
+
+
+@dataclass(slots=True)
+class RateLimitResult:
+    """Outcome of a rate limit check.
+
+    Attributes:
+        allowed: Whether the request fits within the limit
+        limit: Limit applied to the key
+        remaining: Requests still available (after this one, if allowed)
+        retry_after: Seconds until a denied request would be allowed
+        reset_after: Seconds until the key is back to its full allowance
+    """
+
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float = 0.0
+    reset_after: float = 0.0
+
+
+# =============================================================================
+# IN-PROCESS LIMITERS
+# =============================================================================
+
+
+class _KeyedLimiter:
+    """Per-key state in an LRU-bounded dict, guarded by a lock."""
+
+    def __init__(self, max_keys: int, clock: Clock):
+        self.max_keys = max_keys
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state: OrderedDict[str, list[float]] = OrderedDict()
+
+    def _load(self, key: str, create: Callable[[], list[float]]) -> list[float]:
+        state = self._state.get(key)
+        if state is None:
+            state = self._state[key] = create()
+            if len(self._state) > self.max_keys:
+                self._state.popitem(last=False)
+        else:
+            self._state.move_to_end(key)
+        return state
+
+    def reset(self, key: str | None = None) -> None:
+        """Forget the usage of one key, or of all keys."""
+        with self._lock:
+            if key is None:
+                self._state.clear()
+            else:
+                self._state.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._state)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._state
+
+
+class TokenBucket(_KeyedLimiter):
+    """
+    Token bucket limiter.
+
+    Each key holds a bucket of up to ``burst`` tokens refilled at
+    ``limit / period`` tokens per second. State per key is the token count
+    and the time it was last refilled.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        period: float,
+        burst: int | None = None,
+        max_keys: int = DEFAULT_MAX_KEYS,
+        clock: Clock = time.monotonic,
+    ):
+        """
+        Args:
+            limit: Tokens added per period
+            period: Refill period in seconds
+            burst: Bucket capacity (default: limit)
+            max_keys: Max keys tracked before evicting the least recently used
+            clock: Monotonic time source in seconds
+        """
+        super().__init__(max_keys, clock)
+        self.limit = limit
+        self.period = period
+        self.capacity = float(burst if burst is not None else limit)
+        self.rate = limit / period
+
+    def hit(self, key: str, cost: float = 1) -> RateLimitResult:
+        """Take ``cost`` tokens if available."""
+        return self._check(key, cost, consume=True)
+
+    def peek(self, key: str, cost: float = 1) -> RateLimitResult:
+        """Check whether ``cost`` tokens are available without taking them."""
+        return self._check(key, cost, consume=False)
+
+    def _check(self, key: str, cost: float, consume: bool) -> RateLimitResult:
+        with self._lock:
+            now = self._clock()
+            state = self._load(key, lambda: [self.capacity, now])
+            tokens = min(self.capacity, state[0] + (now - state[1]) * self.rate)
+            allowed = tokens >= cost
+            if allowed and consume:
+                tokens -= cost
+            state[0], state[1] = tokens, now
+
+        pending = cost if allowed and not consume else 0
+        return RateLimitResult(
+            allowed=allowed,
+            limit=self.limit,
+            remaining=max(0, math.floor(tokens - pending)),
+            retry_after=0.0 if allowed else (cost - tokens) / self.rate,
+            reset_after=(self.capacity - tokens) / self.rate,
+        )
+
+
+class SlidingWindow(_KeyedLimiter):
+    """
+    Sliding-window counter limiter.
+
+    Allows ``limit`` hits per ``period`` seconds. State per key is the
+    current window index and the hit counts of the current and previous
+    windows. ``hit`` and ``peek`` accept a per-call ``limit`` for keys with
+    their own allowance, such as per-tier message limits.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        period: float,
+        max_keys: int = DEFAULT_MAX_KEYS,
+        clock: Clock = time.monotonic,
+    ):
+        """
+        Args:
+            limit: Hits allowed per period
+            period: Window length in seconds
+            max_keys: Max keys tracked before evicting the least recently used
+            clock: Monotonic time source in seconds
+        """
+        super().__init__(max_keys, clock)
+        self.limit = limit
+        self.period = period
+
+    def hit(self, key: str, cost: float = 1, limit: int | None = None) -> RateLimitResult:
+        """Count a hit of weight ``cost`` if it fits in the window."""
+        return self._check(key, cost, limit, consume=True)
+
+    def peek(self, key: str, cost: float = 1, limit: int | None = None) -> RateLimitResult:
+        """Check whether a hit would fit without counting it."""
+        return self._check(key, cost, limit, consume=False)
+
+    def count(self, key: str) -> float:
+        """Weighted number of hits in the sliding window ending now."""
+        with self._lock:
+            if key not in self._state:
+                return 0.0
+            now = self._clock()
+            state = self._advance(key, now)
+            return _weighted(state, now, self.period)
+
+    def _advance(self, key: str, now: float) -> list[float]:
+        window = now // self.period
+        state = self._load(key, lambda: [window, 0.0, 0.0])
+        if window != state[0]:
+            # Roll forward; anything older than the previous window is gone
+            state[1] = state[2] if window == state[0] + 1 else 0.0
+            state[2] = 0.0
+            state[0] = window
+        return state
+
+    def _check(self, key: str, cost: float, limit: int | None, consume: bool) -> RateLimitResult:
+        limit = limit if limit is not None else self.limit
+        with self._lock:
+            now = self._clock()
+            state = self._advance(key, now)
+            used = _weighted(state, now, self.period)
+            allowed = used + cost <= limit
+            if allowed and consume:
+                state[2] += cost
+                used += cost
+            return _window_result(state, now, self.period, limit, cost, used, allowed, consume)
+
+
+def _weighted(state: list[float], now: float, period: float) -> float:
+    """Sliding-window estimate from [window, previous, current]."""
+    overlap = 1.0 - (now - state[0] * period) / period
+    return state[1] * overlap + state[2]
+
+
+def _window_result(
+    state: list[float],
+    now: float,
+    period: float,
+    limit: int,
+    cost: float,
+    used: float,
+    allowed: bool,
+    consume: bool,
+) -> RateLimitResult:
+    window, previous, current = state
+    elapsed = now - window * period
+    until_next = period - elapsed
+
+    retry_after = 0.0
+    if not allowed:
+        if cost > limit:
+            retry_after = period
+        elif current + cost > limit:
+            # Wait for the next window, then for this window's hits to fade
+            retry_after = until_next + period * (1 - (limit - cost) / current)
+        else:
+            retry_after = period * (1 - (limit - cost - current) / previous) - elapsed
+
+    if current:
+        reset_after = until_next + period
+    elif previous:
+        reset_after = until_next
+    else:
+        reset_after = 0.0
+
+    pending = 0 if consume or not allowed else cost
+    return RateLimitResult(
+        allowed=allowed,
+        limit=limit,
+        remaining=max(0, math.floor(limit - used - pending)),
+        retry_after=max(0.0, retry_after),
+        reset_after=reset_after,
+    )
+
+
+# =============================================================================
+# REDIS LIMITER
+# =============================================================================
+
+
+class RedisSlidingWindow:
+    """
+    Sliding-window counter stored in Redis, shared by every hub instance.
+
+    Each key uses two counters, one per fixed window, that expire on their
+    own. A hit increments the current window first and gives the hit back
+    if that pushed the key over its limit, so concurrent instances never
+    admit more than the limit. Works with ``redis.asyncio`` clients.
+    """
+
+    def __init__(
+        self,
+        redis: Any,
+        limit: int,
+        period: float,
+        key_prefix: str = "fastband:ratelimit",
+        clock: Clock = time.time,
+    ):
+        """
+        Args:
+            redis: redis.asyncio client
+            limit: Hits allowed per period
+            period: Window length in seconds
+            key_prefix: Prefix for counter keys
+            clock: Wall-clock time source shared by all instances
+        """
+        self.redis = redis
+        self.limit = limit
+        self.period = period
+        self.key_prefix = key_prefix
+        self._clock = clock
+
+    def _window_key(self, key: str, window: int) -> str:
+        return f"{self.key_prefix}:{key}:{window}"
+
+    async def hit(self, key: str, cost: int = 1, limit: int | None = None) -> RateLimitResult:
+        """Count a hit of weight ``cost`` if it fits in the window."""
+        limit = limit if limit is not None else self.limit
+        now = self._clock()
+        window = int(now // self.period)
+        current_key = self._window_key(key, window)
+
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.incrby(current_key, cost)
+        pipe.expire(current_key, math.ceil(self.period * 2))
+        pipe.get(self._window_key(key, window - 1))
+        current, _, previous = await pipe.execute()
+
+        state = [window, float(previous or 0), float(current)]
+        used = _weighted(state, now, self.period)
+        allowed = used <= limit
+        if not allowed:
+            await self.redis.decrby(current_key, cost)
+            state[2] -= cost
+            used -= cost
+        return _window_result(state, now, self.period, limit, cost, used, allowed, True)
+
+    async def peek(self, key: str, cost: int = 1, limit: int | None = None) -> RateLimitResult:
+        """Check whether a hit would fit without counting it."""
+        limit = limit if limit is not None else self.limit
+        now = self._clock()
+        window = int(now // self.period)
+        current, previous = await self.redis.mget(
+            self._window_key(key, window), self._window_key(key, window - 1)
+        )
+
+        state = [window, float(previous or 0), float(current or 0)]
+        used = _weighted(state, now, self.period)
+        return _window_result(
+            state, now, self.period, limit, cost, used, used + cost <= limit, False
+        )
+
+    async def reset(self, key: str) -> None:
+        """Forget the usage of a key."""
+        window = int(self._clock() // self.period)
+        await self.redis.delete(self._window_key(key, window), self._window_key(key, window - 1))
@@ -0,0 +1,266 @@
+"""
+Serialization - Pluggable encoders for Fastband's file-backed stores.
+
+The ticket store, ops log, memory manager and handoff packets persist
+whole documents on every write. With stdlib ``json`` and ``indent=2``,
+encoding dominates write time once those files reach megabytes. The
+stores now encode through a Serializer chosen by name:
+
+- ``json``: stdlib JSON, indented (the default; files look as before)
+- ``json-compact``: stdlib JSON without indentation or spaces
+- ``orjson``: compact JSON via orjson (optional dependency)
+- ``msgpack``: binary MessagePack (optional dependency)
+- ``auto``: the fastest installed: orjson, else json-compact
+
+The default comes from the ``FASTBAND_SERIALIZER`` environment variable.
+A backend whose package isn't installed falls back to ``json`` with a
+warning.
+
+JSON backends write plain JSON, so their files stay readable by any JSON
+tool. Binary backends prefix a format header (a NUL byte, which can't
+start a JSON document, then ``fastband:<name>:<version>`` and a newline).
+``decode`` reads either, so switching backends migrates each file the
+next time it is saved. File names are unchanged.
+
+Example:
+    serializer = get_serializer("orjson")
+    save_file(path, data, serializer)
+    data = load_file(path)
+"""
+
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# Environment variable selecting the default serializer
+SERIALIZER_ENV = "FASTBAND_SERIALIZER"
+DEFAULT_SERIALIZER = "json"
+
+# Header prefix for binary formats
+HEADER_MAGIC = b"\x00fastband:"
+
+
+class SerializationError(ValueError):
+    """Raised when data can't be decoded."""
+
+
+class Serializer(ABC):
+    """Encodes documents to bytes and back."""
+
+    name = ""
+    version = 1
+    binary = False
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """Encode a document (without header)."""
+        pass
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """Decode a document (without header)."""
+        pass
+
+    @property
+    def header(self) -> bytes:
+        return HEADER_MAGIC + f"{self.name}:{self.version}\n".encode()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r})"
+
+
+class JSONSerializer(Serializer):
+    """Stdlib JSON, indented or compact."""
+
+    binary = False
+
+    def __init__(self, indent: int | None = 2):
+        self.indent = indent
+        self.name = "json" if indent else "json-compact"
+        self._separators = None if indent else (",", ":")
+
+    def dumps(self, obj: Any) -> bytes:
+        text = json.dumps(obj, indent=self.indent, separators=self._separators, ensure_ascii=False)
+        return text.encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonSerializer(Serializer):
+    """Compact JSON via orjson."""
+
+    name = "orjson"
+    binary = False
+
+    def dumps(self, obj: Any) -> bytes:
+        # Non-string keys are stringified, as stdlib json does
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgpackSerializer(Serializer):
+    """Binary MessagePack."""
+
+    name = "msgpack"
+    binary = True
+
+    def dumps(self, obj: Any) -> bytes:
+        return msgpack.packb(obj, use_bin_type=True)
+
+    def loads(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+def available_serializers() -> list[str]:
+    """Names of the serializers usable in this environment."""
+    names = ["json", "json-compact"]
+    if ORJSON_AVAILABLE:
+        names.append("orjson")
+    if MSGPACK_AVAILABLE:
+        names.append("msgpack")
+    return names
+
+
+_serializers: dict[str, Serializer] = {}
+
+
+def _create(name: str) -> Serializer | None:
+    if name == "json":
+        return JSONSerializer()
+    if name == "json-compact":
+        return JSONSerializer(indent=None)
+    if name == "orjson" and ORJSON_AVAILABLE:
+        return OrjsonSerializer()
+    if name == "msgpack" and MSGPACK_AVAILABLE:
+        return MsgpackSerializer()
+    return None
+
+
+def get_serializer(name: str | Serializer | None = None) -> Serializer:
+    """
+    Get a serializer by name.
+
+    Args:
+        name: Serializer name, an instance (returned as is), or None for
+            the FASTBAND_SERIALIZER default
+
+    Returns:
+        The serializer, or stdlib JSON if the named one isn't installed
+    """
+    if isinstance(name, Serializer):
+        return name
+    name = (name or os.environ.get(SERIALIZER_ENV) or DEFAULT_SERIALIZER).strip().lower()
+    if name == "auto":
+        name = "orjson" if ORJSON_AVAILABLE else "json-compact"
+
+    serializer = _serializers.get(name)
+    if serializer is None:
+        serializer = _create(name)
+        if serializer is None:
+            logger.warning(f"Serializer {name!r} is not available, using json")
+            return get_serializer(DEFAULT_SERIALIZER)
+        _serializers[name] = serializer
+    return serializer
+
+
+def reset_serializers() -> None:
+    """Forget created serializers (for testing)."""
+    _serializers.clear()
+
+
+# =============================================================================
+# ENCODING
+# =============================================================================
+
+
+def encode(obj: Any, serializer: str | Serializer | None = None) -> bytes:
+    """Encode a document, with a format header for binary formats."""
+    serializer = get_serializer(serializer)
+    data = serializer.dumps(obj)
+    return serializer.header + data if serializer.binary else data
+
+
+def decode(data: bytes) -> Any:
+    """
+    Decode a document written by any serializer.
+
+    Raises:
+        SerializationError: If the data is malformed or its format is unavailable
+    """
+    if data.startswith(HEADER_MAGIC):
+        header, _, data = data.partition(b"\n")
+        name = header[len(HEADER_MAGIC) :].decode("ascii", errors="replace").split(":")[0]
+        serializer = _serializers.get(name) or _create(name)
+        if serializer is None:
+            raise SerializationError(f"Unsupported or unavailable format: {name!r}")
+        candidates = [serializer]
+    else:
+        # Plain JSON; stdlib also reads what orjson rejects (NaN, Infinity)
+        candidates = [get_serializer("json")]
+        if ORJSON_AVAILABLE:
+            candidates.insert(0, get_serializer("orjson"))
+
+    for serializer in candidates:
+        try:
+            return serializer.loads(data)
+        except Exception as e:
+            error = e
+    raise SerializationError(f"Failed to decode {serializer.name} data: {error}") from error
+
+
+def load_file(path: str | Path) -> Any:
+    """
+    Read and decode a file written by any serializer.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        SerializationError: If the content can't be decoded
+    """
+    return decode(Path(path).read_bytes())
+
+
+def save_file(
+    path: str | Path,
+    obj: Any,
+    serializer: str | Serializer | None = None,
+    atomic: bool = True,
+) -> None:
+    """
+    Encode and write a document.
+
+    Args:
+        path: Destination file
+        obj: Document to write
+        serializer: Serializer name or instance (default: FASTBAND_SERIALIZER)
+        atomic: Write to a temporary file and rename it into place
+    """
+    path = Path(path)
+    data = encode(obj, serializer)
+    if not atomic:
+        path.write_bytes(data)
+        return
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
@@ -0,0 +1,136 @@
+"""
+Timer Wheel - Hierarchical timing wheel for expiring many keys cheaply.
+
+Each level is a ring of ``slots`` buckets. Level 0 buckets span one tick;
+each bucket on level ``n`` spans ``slots ** n`` ticks. Keys are filed in
+the lowest level whose range covers their deadline. As time advances,
+buckets on higher levels are cascaded down a level when their turn comes,
+and level-0 buckets fire.
+
+Scheduling and cancelling are O(1). Advancing costs O(1) per elapsed tick
+plus the keys that fire or cascade, so expiring sessions no longer means
+scanning every one of them.
+
+Deadlines are rounded down to whole ticks, so a key may fire up to one
+tick early. Callers that need exact expiry check the real deadline when a
+key fires and schedule it again if it isn't due yet.
+
+Example:
+    wheel = TimerWheel(tick_seconds=1.0)
+    wheel.schedule("session-1", time.monotonic() + 1800)
+    for key in wheel.advance(time.monotonic()):
+        ...
+"""
+
+import time
+from collections.abc import Hashable
+
+
+class TimerWheel:
+    """Hierarchical timing wheel (not thread-safe; callers hold a lock)."""
+
+    __slots__ = ("tick_seconds", "slots", "levels", "_current", "_wheels", "_where", "_due")
+
+    def __init__(
+        self,
+        tick_seconds: float = 1.0,
+        slots: int = 64,
+        levels: int = 4,
+        now: float | None = None,
+    ):
+        """
+        Args:
+            tick_seconds: Resolution of the wheel
+            slots: Buckets per level
+            levels: Number of levels; the wheel covers slots ** levels ticks,
+                later deadlines are parked on the top level and re-filed
+            now: Start time (default: time.monotonic())
+        """
+        self.tick_seconds = tick_seconds
+        self.slots = slots
+        self.levels = levels
+        self._current = self._tick(time.monotonic() if now is None else now)
+        self._wheels: list[list[dict[Hashable, int]]] = [
+            [{} for _ in range(slots)] for _ in range(levels)
+        ]
+        # key -> (level, slot); level -1 means already due
+        self._where: dict[Hashable, tuple[int, int]] = {}
+        self._due: dict[Hashable, int] = {}
+
+    def _tick(self, when: float) -> int:
+        return int(when // self.tick_seconds)
+
+    def schedule(self, key: Hashable, deadline: float) -> None:
+        """Schedule key to fire at deadline, replacing any earlier schedule."""
+        self.cancel(key)
+        self._place(key, self._tick(deadline))
+
+    def _place(self, key: Hashable, tick: int) -> None:
+        if tick <= self._current:
+            self._due[key] = tick
+            self._where[key] = (-1, 0)
+            return
+
+        for level in range(self.levels):
+            shift = self.slots**level
+            if tick // shift - self._current // shift < self.slots or level == self.levels - 1:
+                # Past the top level's range: park in its farthest bucket,
+                # keeping the real deadline for when it cascades
+                filed = min(tick, (self._current // shift + self.slots - 1) * shift)
+                slot = (filed // shift) % self.slots
+                self._wheels[level][slot][key] = tick
+                self._where[key] = (level, slot)
+                return
+
+    def cancel(self, key: Hashable) -> bool:
+        """Remove key from the wheel; returns True if it was scheduled."""
+        where = self._where.pop(key, None)
+        if where is None:
+            return False
+        level, slot = where
+        if level < 0:
+            del self._due[key]
+        else:
+            del self._wheels[level][slot][key]
+        return True
+
+    def advance(self, now: float | None = None) -> list[Hashable]:
+        """
+        Move the wheel forward to now.
+
+        Returns:
+            Keys whose deadlines have passed, removed from the wheel
+        """
+        target = self._tick(time.monotonic() if now is None else now)
+        fired = list(self._due)
+        self._due.clear()
+
+        while self._current < target:
+            self._current += 1
+            # Cascade higher levels first so their keys can land in level 0
+            for level in range(self.levels - 1, 0, -1):
+                shift = self.slots**level
+                if self._current % shift == 0:
+                    bucket = self._wheels[level][(self._current // shift) % self.slots]
+                    entries = list(bucket.items())
+                    bucket.clear()
+                    for key, tick in entries:
+                        self._place(key, tick)
+
+            bucket = self._wheels[0][self._current % self.slots]
+            fired.extend(bucket)
+            bucket.clear()
+            # Cascaded keys that were already due
+            if self._due:
+                fired.extend(self._due)
+                self._due.clear()
+
+        for key in fired:
+            self._where.pop(key, None)
+        return fired
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._where
@@ -30,6 +30,7 @@ from fastband.embeddings.base import (
     EmbeddingResult,
 )
 from fastband.embeddings.index import SemanticIndex
+from fastband.embeddings.scheduler import EmbeddingScheduler, SchedulerConfig
 
 __all__ = [
     "EmbeddingProvider",
@@ -37,4 +38,6 @@ __all__ = [
     "EmbeddingConfig",
     "ChunkMetadata",
     "SemanticIndex",
+    "EmbeddingScheduler",
+    "SchedulerConfig",
 ]
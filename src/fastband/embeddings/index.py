@@ -19,6 +19,7 @@ from fastband.embeddings.base import (
 )
 from fastband.embeddings.chunkers.base import Chunker
 from fastband.embeddings.chunkers.semantic import SemanticChunker
+from fastband.embeddings.scheduler import EmbeddingScheduler
 from fastband.embeddings.storage.base import IndexStats, SearchResult, VectorStore
 from fastband.embeddings.storage.sqlite import SQLiteVectorStore
 
@@ -98,6 +99,7 @@ class SemanticIndex:
         storage_path: Path | None = None,
         chunker: Chunker | None = None,
         store: VectorStore | None = None,
+        scheduler: EmbeddingScheduler | None = None,
     ):
         """
         Initialize the semantic index.
@@ -107,9 +109,12 @@ class SemanticIndex:
             storage_path: Path for the SQLite database (default: .fastband/semantic.db)
             chunker: Code chunker (default: SemanticChunker)
             store: Vector store (default: SQLiteVectorStore at storage_path)
+            scheduler: Batching/rate-limit scheduler for bulk embedding
+                (default: EmbeddingScheduler with provider limits)
         """
         self.provider = provider
         self.chunker = chunker or SemanticChunker()
+        self.scheduler = scheduler or EmbeddingScheduler(provider)
 
         if store:
             self.store = store
@@ -192,37 +197,25 @@ class SemanticIndex:
                     errors=[],
                 )
 
-            # Embed chunks in batches
+            # Embed chunks in token-packed, rate-limited batches
             logger.info(f"Embedding {len(chunks_to_index)} chunks")
-            batch_size = self.provider.config.batch_size
-            store_items = []
-
-            for i in range(0, len(chunks_to_index), batch_size):
-                batch = chunks_to_index[i : i + batch_size]
-                texts = [chunk.content for chunk in batch]
-
-                try:
-                    result = await self.provider.embed(texts)
-
-                    for chunk, embedding in zip(batch, result.embeddings, strict=False):
-                        store_items.append(
-                            (
-                                chunk.chunk_id,
-                                embedding,
-                                chunk.content,
-                                chunk.metadata,
-                            )
-                        )
-                        progress.embedded_chunks += 1
-
-                except Exception as e:
-                    error_msg = f"Embedding batch failed: {e}"
-                    logger.error(error_msg)
-                    progress.errors.append(error_msg)
 
+            def on_batch(start: int, count: int) -> None:
+                progress.embedded_chunks += count
                 if progress_callback:
                     progress_callback(progress)
 
+            outcome = await self.scheduler.embed(
+                [chunk.content for chunk in chunks_to_index], on_batch=on_batch
+            )
+            progress.errors.extend(outcome.errors)
+
+            store_items = [
+                (chunk.chunk_id, embedding, chunk.content, chunk.metadata)
+                for chunk, embedding in zip(chunks_to_index, outcome.embeddings, strict=True)
+                if embedding is not None
+            ]
+
             # Store all embeddings
             logger.info(f"Storing {len(store_items)} embeddings")
             self.store.store_batch(store_items)
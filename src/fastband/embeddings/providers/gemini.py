@@ -5,6 +5,7 @@ Uses Google's embedding models for generating embeddings.
 Supports embedding-001 and text-embedding-004.
 """
 
+import asyncio
 import logging
 import os
 from collections.abc import Sequence
@@ -115,8 +116,10 @@ class GeminiEmbeddings(EmbeddingProvider):
         for i in range(0, len(texts_list), batch_size):
             batch = texts_list[i : i + batch_size]
 
-            # Gemini embed_content supports batch embedding
-            result = genai.embed_content(
+            # Gemini embed_content supports batch embedding; the client is
+            # synchronous, so run it off the event loop
+            result = await asyncio.to_thread(
+                genai.embed_content,
                 model=f"models/{self.config.model}",
                 content=batch,
                 task_type="retrieval_document",
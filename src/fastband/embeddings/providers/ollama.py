@@ -3,12 +3,25 @@ Ollama embedding provider.
 
 Uses Ollama for local embedding generation.
 Supports nomic-embed-text, all-minilm, mxbai-embed-large, and other models.
+
+Requests go straight to Ollama's REST API over a shared keep-alive
+connection pool. Texts are sent in batches to ``/api/embed``; servers
+that predate it (404) fall back to concurrent single-text requests to
+``/api/embeddings``. The batch size adapts to observed latency.
+
+Tuning via ``EmbeddingConfig.extra``:
+    concurrency: Max requests in flight in fallback mode (default 4)
+    target_batch_seconds: Latency each batch should stay under (default 2.0)
 """
 
+import asyncio
 import logging
 import os
+import time
 from collections.abc import Sequence
 
+import httpx
+
 from fastband.embeddings.base import (
     EmbeddingConfig,
     EmbeddingProvider,
@@ -25,6 +38,9 @@ OLLAMA_MODELS = {
     "snowflake-arctic-embed": 1024,
 }
 
+# First batch size tried before latency feedback is available
+INITIAL_BATCH_SIZE = 16
+
 
 class OllamaEmbeddings(EmbeddingProvider):
     """
@@ -40,13 +56,18 @@ class OllamaEmbeddings(EmbeddingProvider):
         ))
 
         result = await provider.embed(["Hello, world!"])
+        await provider.aclose()
     """
 
     def __init__(self, config: EmbeddingConfig | None = None):
         if config is None:
             config = EmbeddingConfig()
         super().__init__(config)
-        self._client = None
+        self._client: httpx.AsyncClient | None = None
+        self.concurrency = int(self.config.extra.get("concurrency", 4))
+        self.target_batch_seconds = float(self.config.extra.get("target_batch_seconds", 2.0))
+        self.batch_size = min(INITIAL_BATCH_SIZE, self.config.batch_size)
+        self.supports_batch: bool | None = None  # Unknown until the first request
 
     def _validate_config(self) -> None:
         """Validate Ollama-specific configuration."""
@@ -70,20 +91,25 @@ class OllamaEmbeddings(EmbeddingProvider):
         return OLLAMA_MODELS.get(self.config.model, 768)
 
     @property
-    def client(self):
-        """Lazy-load the Ollama client."""
+    def client(self) -> httpx.AsyncClient:
+        """Lazy-create the pooled HTTP client."""
         if self._client is None:
-            try:
-                from ollama import AsyncClient
-
-                self._client = AsyncClient(host=self.config.base_url)
-            except ImportError:
-                raise ImportError(
-                    "ollama package is required for Ollama embeddings. "
-                    "Install with: pip install fastband-agent-control[ollama]"
-                )
+            self._client = httpx.AsyncClient(
+                base_url=self.config.base_url,
+                timeout=self.config.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.concurrency,
+                    max_keepalive_connections=self.concurrency,
+                ),
+            )
         return self._client
 
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     async def embed(self, texts: Sequence[str]) -> EmbeddingResult:
         """
         Generate embeddings for texts using Ollama.
@@ -98,24 +124,71 @@ class OllamaEmbeddings(EmbeddingProvider):
             return self._empty_result()
 
         texts_list = list(texts)
-        all_embeddings = []
-
-        # Ollama processes one at a time (as of current version)
-        for text in texts_list:
-            response = await self.client.embeddings(
-                model=self.config.model,
-                prompt=text,
+        all_embeddings: list[list[float]] = []
+        prompt_tokens = 0
+
+        i = 0
+        while i < len(texts_list) and self.supports_batch is not False:
+            batch = texts_list[i : i + self.batch_size]
+            start = time.perf_counter()
+            response = await self.client.post(
+                "/api/embed",
+                json={"model": self.config.model, "input": batch},
             )
-            all_embeddings.append(response["embedding"])
+            if response.status_code == 404 and self.supports_batch is None:
+                logger.info("Ollama server has no /api/embed; using per-text requests")
+                self.supports_batch = False
+                break
+            response.raise_for_status()
+            self.supports_batch = True
+
+            data = response.json()
+            all_embeddings.extend(data["embeddings"])
+            prompt_tokens += data.get("prompt_eval_count") or self._estimate_tokens(batch)
+            self._tune_batch_size(len(batch), time.perf_counter() - start)
+            i += len(batch)
+
+        if i < len(texts_list):
+            remaining = texts_list[i:]
+            all_embeddings.extend(await self._embed_each(remaining))
+            prompt_tokens += self._estimate_tokens(remaining)
 
-        estimated_tokens = self._estimate_tokens(texts_list)
         return EmbeddingResult(
             embeddings=all_embeddings,
             model=self.config.model,
             provider=self.name,
             dimensions=len(all_embeddings[0]) if all_embeddings else self.dimensions,
             usage={
-                "prompt_tokens": estimated_tokens,
-                "total_tokens": estimated_tokens,
+                "prompt_tokens": prompt_tokens,
+                "total_tokens": prompt_tokens,
             },
         )
+
+    async def _embed_each(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts one per request with bounded concurrency (legacy API)."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def embed_one(text: str) -> list[float]:
+            async with semaphore:
+                response = await self.client.post(
+                    "/api/embeddings",
+                    json={"model": self.config.model, "prompt": text},
+                )
+                response.raise_for_status()
+                return response.json()["embedding"]
+
+        return list(await asyncio.gather(*(embed_one(t) for t in texts)))
+
+    def _tune_batch_size(self, sent: int, elapsed: float) -> None:
+        """
+        Adjust the batch size from the latency of the last full batch.
+
+        Doubles while batches finish well under the target latency and
+        halves when they exceed it, within 1..config.batch_size.
+        """
+        if sent < self.batch_size:
+            return  # Short tail batch says little about throughput
+        if elapsed > self.target_batch_seconds:
+            self.batch_size = max(1, self.batch_size // 2)
+        elif elapsed < self.target_batch_seconds / 2:
+            self.batch_size = min(self.config.batch_size, self.batch_size * 2)
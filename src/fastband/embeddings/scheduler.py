@@ -0,0 +1,346 @@
+"""
+Embedding Scheduler - Rate-limit-aware batching for embedding providers.
+
+Large index builds send thousands of chunks to hosted embedding APIs. The
+scheduler:
+
+- packs texts into batches by estimated tokens, up to provider limits
+- runs several batches concurrently under a tokens-per-minute budget
+- backs off on rate limits, honoring Retry-After when the provider sends it,
+  and shrinks concurrency until requests succeed again
+- retries only the batches that failed, so one bad request doesn't drop
+  the chunks around it
+
+Example:
+    scheduler = EmbeddingScheduler(provider, SchedulerConfig(tokens_per_minute=1_000_000))
+    outcome = await scheduler.embed(texts)
+    for index in outcome.failed:
+        ...  # texts[index] could not be embedded
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+
+from fastband.core.ratelimit import TokenBucket
+from fastband.embeddings.base import EmbeddingProvider
+
+logger = logging.getLogger(__name__)
+
+# Per-request limits as (max inputs, max estimated tokens). Estimates come
+# from EmbeddingProvider._estimate_tokens (word counts), which run low, so
+# token caps leave headroom below the documented API limits.
+PROVIDER_LIMITS: dict[str, tuple[int, int]] = {
+    "openai": (2048, 100_000),
+    "gemini": (100, 15_000),
+    "ollama": (512, 50_000),
+}
+DEFAULT_LIMITS = (100, 8_000)
+
+# HTTP statuses worth retrying
+RETRYABLE_STATUS = {408, 409, 425, 429, 500, 502, 503, 504}
+
+
+@dataclass(slots=True)
+class SchedulerConfig:
+    """Configuration for an EmbeddingScheduler.
+
+    Attributes:
+        max_batch_items: Max texts per request (default: provider limit / batch_size)
+        max_batch_tokens: Max estimated tokens per request (default: provider limit)
+        max_concurrency: Max requests in flight
+        tokens_per_minute: Token budget; None for unlimited
+        max_retries: Retries per batch before giving up on it
+        base_backoff: First retry delay in seconds (doubles per attempt)
+        max_backoff: Cap on computed retry delays
+    """
+
+    max_batch_items: int | None = None
+    max_batch_tokens: int | None = None
+    max_concurrency: int = 4
+    tokens_per_minute: int | None = None
+    max_retries: int = 5
+    base_backoff: float = 1.0
+    max_backoff: float = 60.0
+
+
+@dataclass(slots=True)
+class EmbeddingOutcome:
+    """Result of a scheduled embedding run.
+
+    Attributes:
+        embeddings: One vector per input text, None where embedding failed
+        failed: Indices of texts that could not be embedded
+        errors: One message per batch that failed after retries
+        requests: Provider calls made, including retries
+        retries: Provider calls that were retries
+        tokens: Estimated tokens sent for successful batches
+    """
+
+    embeddings: list[list[float] | None]
+    failed: list[int] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    requests: int = 0
+    retries: int = 0
+    tokens: int = 0
+
+
+@dataclass(slots=True)
+class _Batch:
+    start: int
+    texts: list[str]
+    tokens: int
+    attempts: int = 0
+
+
+def retry_after(error: BaseException) -> float | None:
+    """
+    Extract a server-requested retry delay in seconds from an API error.
+
+    Understands a ``retry_after`` attribute and ``Retry-After`` /
+    ``retry-after-ms`` headers on ``error.response`` (openai, httpx).
+    """
+    value = getattr(error, "retry_after", None)
+    if value is not None:
+        return float(value)
+
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        return None  # HTTP-date form; fall back to exponential backoff
+    return None
+
+
+def _status_code(error: BaseException) -> int | None:
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether an embedding error is transient (rate limit, timeout, 5xx)."""
+    status = _status_code(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    # Client exceptions without a status: RateLimitError, APITimeoutError, ConnectError...
+    name = type(error).__name__.lower()
+    return any(word in name for word in ("rate", "timeout", "connect"))
+
+
+class EmbeddingScheduler:
+    """
+    Schedules embedding requests for one provider.
+
+    The concurrency limit adapts: it halves on each rate-limit response and
+    grows back by one after every few successful batches.
+    """
+
+    def __init__(self, provider: EmbeddingProvider, config: SchedulerConfig | None = None):
+        self.provider = provider
+        self.config = config or SchedulerConfig()
+
+        items, tokens = PROVIDER_LIMITS.get(provider.name, DEFAULT_LIMITS)
+        self.max_batch_items = self.config.max_batch_items or min(items, provider.config.batch_size)
+        self.max_batch_tokens = self.config.max_batch_tokens or tokens
+
+        self._budget = (
+            TokenBucket(self.config.tokens_per_minute, period=60)
+            if self.config.tokens_per_minute
+            else None
+        )
+        self._limit = self.config.max_concurrency
+        self._active = 0
+        self._successes = 0
+        self._slot_freed: asyncio.Condition | None = None
+        self._paused_until = 0.0
+
+    @property
+    def concurrency(self) -> int:
+        """Current adaptive concurrency limit."""
+        return self._limit
+
+    def pack(self, texts: Sequence[str]) -> list[_Batch]:
+        """Split texts, in order, into batches within the item and token limits."""
+        batches: list[_Batch] = []
+        current: list[str] = []
+        current_tokens = 0
+        start = 0
+
+        for i, text in enumerate(texts):
+            tokens = max(1, self.provider._estimate_tokens([text]))
+            if current and (
+                len(current) >= self.max_batch_items
+                or current_tokens + tokens > self.max_batch_tokens
+            ):
+                batches.append(_Batch(start, current, current_tokens))
+                current, current_tokens, start = [], 0, i
+            current.append(text)
+            current_tokens += tokens
+
+        if current:
+            batches.append(_Batch(start, current, current_tokens))
+        return batches
+
+    async def embed(
+        self,
+        texts: Sequence[str],
+        on_batch: Callable[[int, int], None] | None = None,
+    ) -> EmbeddingOutcome:
+        """
+        Embed texts, retrying failed batches.
+
+        Args:
+            texts: Texts to embed
+            on_batch: Optional callback(start, count) after each batch succeeds
+
+        Returns:
+            EmbeddingOutcome with one slot per input text
+        """
+        outcome = EmbeddingOutcome(embeddings=[None] * len(texts))
+        if not texts:
+            return outcome
+
+        self._slot_freed = asyncio.Condition()
+        queue: asyncio.Queue[_Batch] = asyncio.Queue()
+        batches = self.pack(texts)
+        for batch in batches:
+            queue.put_nowait(batch)
+
+        async def worker() -> None:
+            while True:
+                try:
+                    batch = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    if await self._run_batch(batch, outcome) and on_batch:
+                        on_batch(batch.start, len(batch.texts))
+                finally:
+                    queue.task_done()
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(self.config.max_concurrency, len(batches)))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+
+        logger.debug(
+            f"Embedded {len(texts) - len(outcome.failed)}/{len(texts)} texts in "
+            f"{len(batches)} batches ({outcome.requests} requests, {outcome.retries} retries)"
+        )
+        return outcome
+
+    async def _run_batch(self, batch: _Batch, outcome: EmbeddingOutcome) -> bool:
+        """Run one batch with retries; returns True on success."""
+        while True:
+            await self._wait_for_slot()
+            error = None
+            try:
+                await self._wait_for_pause()
+                await self._acquire_tokens(batch.tokens)
+
+                outcome.requests += 1
+                if batch.attempts:
+                    outcome.retries += 1
+                batch.attempts += 1
+                result = await self.provider.embed(batch.texts)
+                if len(result.embeddings) != len(batch.texts):
+                    raise ValueError(
+                        f"Provider returned {len(result.embeddings)} embeddings "
+                        f"for {len(batch.texts)} texts"
+                    )
+            except Exception as e:
+                error = e
+            finally:
+                await self._release_slot()
+
+            if error is None:
+                end = batch.start + len(batch.texts)
+                outcome.embeddings[batch.start : end] = result.embeddings
+                outcome.tokens += batch.tokens
+                self._on_success()
+                return True
+
+            delay = self._on_failure(batch, error)
+            if delay is None:
+                end = batch.start + len(batch.texts)
+                outcome.failed.extend(range(batch.start, end))
+                outcome.errors.append(
+                    f"Embedding batch {batch.start}-{end - 1} failed after "
+                    f"{batch.attempts} attempt(s): {error}"
+                )
+                logger.error(outcome.errors[-1])
+                return False
+
+            # Sleep without holding a slot so other batches keep going
+            logger.warning(f"Embedding batch failed ({error}); retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    def _on_failure(self, batch: _Batch, error: Exception) -> float | None:
+        """Adapt to a failure; returns the retry delay, or None to give up."""
+        if not is_retryable(error) or batch.attempts > self.config.max_retries:
+            return None
+
+        requested = retry_after(error)
+        if _status_code(error) == 429 or requested is not None:
+            # Rate limited: slow every worker down, not just this one
+            self._limit = max(1, self._limit // 2)
+            self._successes = 0
+
+        if requested is not None:
+            delay = requested
+        else:
+            delay = min(
+                self.config.max_backoff, self.config.base_backoff * 2 ** (batch.attempts - 1)
+            )
+            delay *= random.uniform(0.5, 1.0)  # Jitter so workers don't retry in lockstep
+
+        if _status_code(error) == 429 or requested is not None:
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        return delay
+
+    def _on_success(self) -> None:
+        self._successes += 1
+        if self._limit < self.config.max_concurrency and self._successes >= self._limit:
+            self._limit += 1
+            self._successes = 0
+
+    async def _acquire_tokens(self, tokens: int) -> None:
+        """Wait until the token budget covers a batch."""
+        if self._budget is None:
+            return
+        # Batches larger than the whole budget are let through once it is full
+        tokens = min(tokens, self._budget.capacity)
+        while not (result := self._budget.hit("tokens", tokens)).allowed:
+            await asyncio.sleep(result.retry_after)
+
+    async def _wait_for_pause(self) -> None:
+        delay = self._paused_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _wait_for_slot(self) -> None:
+        async with self._slot_freed:
+            await self._slot_freed.wait_for(lambda: self._active < self._limit)
+            self._active += 1
+
+    async def _release_slot(self) -> None:
+        async with self._slot_freed:
+            self._active -= 1
+            self._slot_freed.notify_all()
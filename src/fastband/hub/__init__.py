@@ -25,6 +25,7 @@ from fastband.hub.chat import (
     ChatManager,
     MessagePipeline,
     ToolExecutor,
+    ToolSelection,
 )
 from fastband.hub.memory import (
     MemoryStore,
@@ -74,6 +75,7 @@ __all__ = [
     "ChatManager",
     "MessagePipeline",
     "ToolExecutor",
+    "ToolSelection",
     # Memory
     "MemoryEntry",
     "MemoryContext",
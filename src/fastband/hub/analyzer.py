@@ -21,6 +21,8 @@ from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
+from fastband.core.inventory import get_file_inventory
+
 logger = logging.getLogger(__name__)
 
 
@@ -340,34 +342,27 @@ class PlatformAnalyzer:
         stats = FileStats()
         ignored_dirs = {".git", "node_modules", "__pycache__", ".venv", "venv", "dist", "build"}
 
-        for item in path.rglob("*"):
-            # Skip ignored directories
-            if any(ignored in item.parts for ignored in ignored_dirs):
-                continue
+        inventory = get_file_inventory(path)
+        for entry in inventory.entries(exclude_names=ignored_dirs):
+            stats.total_files += 1
 
-            if item.is_file():
-                stats.total_files += 1
+            # Count by extension
+            ext = entry.extension
+            if ext:
+                stats.by_extension[ext] = stats.by_extension.get(ext, 0) + 1
 
-                # Count by extension
-                ext = item.suffix.lower()
-                if ext:
-                    stats.by_extension[ext] = stats.by_extension.get(ext, 0) + 1
+            # Count by top-level directory
+            top_dir = entry.path.split("/", 1)[0] if "/" in entry.path else "."
+            stats.by_directory[top_dir] = stats.by_directory.get(top_dir, 0) + 1
 
-                # Count by top-level directory
+            # Count lines (for code files)
+            if ext in self.LANGUAGE_EXTENSIONS:
                 try:
-                    rel_path = item.relative_to(path)
-                    top_dir = rel_path.parts[0] if len(rel_path.parts) > 1 else "."
-                    stats.by_directory[top_dir] = stats.by_directory.get(top_dir, 0) + 1
-                except ValueError:
+                    with open(path / entry.path, errors="ignore") as f:
+                        stats.total_lines += sum(1 for _ in f)
+                except Exception:
                     pass
 
-                # Count lines (for code files)
-                if ext in self.LANGUAGE_EXTENSIONS:
-                    try:
-                        stats.total_lines += sum(1 for _ in item.open(errors="ignore"))
-                    except Exception:
-                        pass
-
         return stats
 
     async def _detect_tech_stack(self, path: Path, stats: FileStats) -> TechStack:
@@ -12,11 +12,11 @@ Security Features:
 """
 
 import logging
+import math
 import os
 import secrets
 import time
 import traceback
-from collections import defaultdict
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from typing import Callable
@@ -37,6 +37,7 @@ from fastband.core.logging import (
     audit_rate_limit,
     audit_security_event,
 )
+from fastband.core.ratelimit import SlidingWindow
 from fastband.hub.api.routes import router
 from fastband.hub.chat import ChatManager
 from fastband.hub.control_plane.routes import router as control_plane_router
@@ -140,15 +141,15 @@ RATE_LIMIT_WINDOW = 60  # seconds
 
 
 class RateLimiter:
-    """Simple in-memory token bucket rate limiter.
+    """Per-client sliding-window rate limiter for API requests.
 
-    For production, consider Redis-backed rate limiting.
+    State lives in this process; each Hub instance limits independently.
     """
 
     def __init__(self, requests_per_window: int = 100, window_seconds: int = 60):
         self.requests_per_window = requests_per_window
         self.window_seconds = window_seconds
-        self._buckets: dict[str, list[float]] = defaultdict(list)
+        self._limiter = SlidingWindow(limit=requests_per_window, period=window_seconds)
 
     def _get_client_id(self, request: Request) -> str:
         """Get client identifier from request."""
@@ -164,28 +165,16 @@ class RateLimiter:
         Returns:
             Tuple of (is_allowed, headers_dict with rate limit info)
         """
-        client_id = self._get_client_id(request)
-        now = time.time()
-        window_start = now - self.window_seconds
-
-        # Clean old entries and count recent requests
-        self._buckets[client_id] = [
-            t for t in self._buckets[client_id] if t > window_start
-        ]
-        request_count = len(self._buckets[client_id])
+        result = self._limiter.hit(self._get_client_id(request))
 
         headers = {
             "X-RateLimit-Limit": self.requests_per_window,
-            "X-RateLimit-Remaining": max(0, self.requests_per_window - request_count - 1),
-            "X-RateLimit-Reset": int(window_start + self.window_seconds),
+            "X-RateLimit-Remaining": result.remaining,
+            "X-RateLimit-Reset": math.ceil(time.time() + result.reset_after),
         }
-
-        if request_count >= self.requests_per_window:
-            return False, headers
-
-        # Record this request
-        self._buckets[client_id].append(now)
-        return True, headers
+        if not result.allowed:
+            headers["Retry-After"] = math.ceil(result.retry_after)
+        return result.allowed, headers
 
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
@@ -252,7 +241,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 error_code=ErrorCodes.RATE_LIMITED,
                 request=request,
                 details={
-                    "retry_after_seconds": headers.get("X-RateLimit-Reset", 60),
+                    "retry_after_seconds": headers.get("Retry-After", 60),
                     "limit": headers.get("X-RateLimit-Limit"),
                 },
             )
@@ -1106,6 +1106,11 @@ async def prometheus_metrics(
     except Exception:
         pass  # Memory module not available
 
+    # Add tool execution metrics (latency quantiles, errors, in-flight)
+    from fastband.tools import get_registry
+
+    lines.extend(get_registry().metrics.render_prometheus())
+
     return "\n".join(lines)
 
 
@@ -7,14 +7,16 @@ Performance Optimizations (Issue #38):
 - Streaming responses via SSE
 - Parallel tool execution where safe
 - Cached tool schemas
+- Relevance-ranked tool subsets per turn
 - Batched memory queries
 """
 
 import asyncio
 import json
 import logging
+import math
 import time
-from collections.abc import AsyncGenerator, Callable
+from collections.abc import AsyncGenerator, Callable, Iterable
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -23,12 +25,54 @@ from fastband.hub.models import (
     Conversation,
     HubSession,
     MemoryContext,
+    MessageRole,
     ModelMode,
     ToolCall,
 )
 
 logger = logging.getLogger(__name__)
 
+# Tools always offered to the model, regardless of relevance ranking.
+# Names missing from the registry are skipped.
+DEFAULT_PINNED_TOOLS = ("health_check", "list_files", "read_file", "search_code")
+
+# Recent conversation messages added to the tool ranking query, so short
+# follow-ups ("yes, go ahead") rank against the topic of the conversation
+TOOL_QUERY_HISTORY = 4
+
+
+@dataclass(slots=True)
+class ToolSelection:
+    """Tools offered to the model for one chat turn.
+
+    Attributes:
+        tools: OpenAI-format schemas to send (with precomputed Claude conversion)
+        names: Names of the selected tools
+        available: Number of tools in the catalog
+        schema_tokens: Estimated prompt tokens for the selected schemas
+        total_schema_tokens: Estimated prompt tokens for all schemas
+    """
+
+    tools: list[dict[str, Any]]
+    names: list[str]
+    available: int
+    schema_tokens: int
+    total_schema_tokens: int
+
+    @property
+    def tokens_saved(self) -> int:
+        """Estimated prompt tokens saved per completion call."""
+        return self.total_schema_tokens - self.schema_tokens
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "tools_offered": len(self.names),
+            "tools_available": self.available,
+            "schema_tokens": self.schema_tokens,
+            "tokens_saved": self.tokens_saved,
+        }
+
 
 @dataclass(slots=True)
 class PipelineContext:
@@ -43,6 +87,8 @@ class PipelineContext:
         response_content: Final response content
         tokens_used: Total tokens consumed
         processing_time_ms: Total processing time
+        time_to_first_token_ms: Time until the first response text was available
+        tool_selection: Tools offered this turn and estimated token savings
     """
 
     session: HubSession
@@ -53,6 +99,9 @@ class PipelineContext:
     response_content: str = ""
     tokens_used: int = 0
     processing_time_ms: int = 0
+    time_to_first_token_ms: int | None = None
+    tool_selection: dict[str, Any] | None = None
+    started_at: float = 0.0  # time.perf_counter() when processing began
 
 
 class ToolExecutor:
@@ -60,7 +109,8 @@ class ToolExecutor:
     Executes tools from the Fastband tool registry.
 
     Wraps tool execution with error handling, timeouts,
-    and result formatting.
+    and result formatting. Results of tools declared cacheable are
+    memoized per executor, and identical concurrent calls share one run.
 
     Example:
         executor = ToolExecutor()
@@ -71,16 +121,23 @@ class ToolExecutor:
         self,
         timeout_seconds: float = 30.0,
         max_parallel: int = 5,
+        cache_size: int = 256,
     ):
         """Initialize tool executor.
 
         Args:
             timeout_seconds: Max execution time per tool
             max_parallel: Max parallel tool executions
+            cache_size: Max cached results of cacheable tools (0 disables)
         """
         self.timeout = timeout_seconds
         self.max_parallel = max_parallel
+
+        from fastband.tools.result_cache import ToolResultCache
+
+        self.result_cache = ToolResultCache(max_entries=cache_size) if cache_size else None
         self._tool_registry = None
+        self._recommender = None
 
     def _get_registry(self):
         """Lazy load tool registry."""
@@ -90,6 +147,14 @@ class ToolExecutor:
             self._tool_registry = get_registry()
         return self._tool_registry
 
+    def _get_recommender(self):
+        """Lazy load tool recommender (source of usage statistics)."""
+        if self._recommender is None:
+            from fastband.tools import get_recommender
+
+            self._recommender = get_recommender()
+        return self._recommender
+
     async def execute(
         self,
         tool_name: str,
@@ -104,50 +169,78 @@ class ToolExecutor:
         Returns:
             Dict with success, result, and error fields
         """
-        start_time = time.time()
-
+        registry = self._get_registry()
         try:
-            registry = self._get_registry()
             # Use get_available instead of get - tools may be registered but not active
             tool = registry.get_available(tool_name)
+            definition = tool.definition if tool else None
+        except Exception as e:
+            logger.error(f"Tool execution error: {e}")
+            return {"success": False, "error": str(e), "duration_ms": 0}
 
-            if not tool:
-                return {
-                    "success": False,
-                    "error": f"Tool not found: {tool_name}",
-                    "duration_ms": int((time.time() - start_time) * 1000),
-                }
+        if not tool:
+            return {
+                "success": False,
+                "error": f"Tool not found: {tool_name}",
+                "duration_ms": 0,
+            }
+
+        metadata = definition.metadata
+        key = None
+        if self.result_cache is not None and metadata.cacheable:
+            key = self.result_cache.make_key(tool, definition, arguments)
+
+        if key is None:
+            response = await self._run(tool_name, tool, arguments)
+        else:
+            response, hit = await self.result_cache.get_or_run(
+                key, lambda: self._run(tool_name, tool, arguments), ttl=metadata.cache_ttl
+            )
+            registry.record_cache_lookup(tool_name, hit)
+            if hit:
+                response["cached"] = True
+
+        if response["success"]:
+            self._get_recommender().track_usage(tool_name)
+            if metadata.side_effects and self.result_cache is not None:
+                self.result_cache.invalidate()
 
+        return response
+
+    async def _run(self, tool_name: str, tool, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Run a tool with the executor timeout and format its result."""
+        metrics = self._get_registry().metrics
+        start = metrics.begin(tool_name)
+        response = {"success": False}
+
+        try:
             # Execute with timeout
             result = await asyncio.wait_for(
                 tool.safe_execute(**arguments),
                 timeout=self.timeout,
             )
-
-            duration_ms = int((time.time() - start_time) * 1000)
-
-            return {
+            response = {
                 "success": result.success,
                 "result": result.data if result.success else None,
                 "error": result.error if not result.success else None,
-                "duration_ms": duration_ms,
             }
 
         except asyncio.TimeoutError:
-            duration_ms = int((time.time() - start_time) * 1000)
-            return {
+            response = {
                 "success": False,
                 "error": f"Tool execution timed out after {self.timeout}s",
-                "duration_ms": duration_ms,
             }
         except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
             logger.error(f"Tool execution error: {e}")
-            return {
+            response = {
                 "success": False,
                 "error": str(e),
-                "duration_ms": duration_ms,
             }
+        finally:
+            duration_ms = metrics.end(tool_name, start, response["success"])
+
+        response["duration_ms"] = int(duration_ms)
+        return response
 
     async def execute_parallel(
         self,
@@ -166,30 +259,119 @@ class ToolExecutor:
 
         # Limit parallelism
         semaphore = asyncio.Semaphore(self.max_parallel)
+        tasks = [self.execute_call(tc, semaphore) for tc in tool_calls]
+        return await asyncio.gather(*tasks)
 
-        async def execute_with_semaphore(tc: ToolCall) -> dict[str, Any]:
-            async with semaphore:
-                result = await self.execute(tc.tool_name, tc.arguments)
-                result["tool_id"] = tc.tool_id
-                result["tool_name"] = tc.tool_name
-                return result
+    async def execute_call(
+        self,
+        tool_call: ToolCall,
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> dict[str, Any]:
+        """Execute a tool call, tagging the result with its call ID and name.
 
-        tasks = [execute_with_semaphore(tc) for tc in tool_calls]
-        return await asyncio.gather(*tasks)
+        Args:
+            tool_call: Tool call to execute
+            semaphore: Optional semaphore bounding concurrent executions
+
+        Returns:
+            Result dict from execute() with tool_id and tool_name added
+        """
+        if semaphore is None:
+            result = await self.execute(tool_call.tool_name, tool_call.arguments)
+        else:
+            async with semaphore:
+                result = await self.execute(tool_call.tool_name, tool_call.arguments)
+        result["tool_id"] = tool_call.tool_id
+        result["tool_name"] = tool_call.tool_name
+        return result
 
     def get_available_tools(self) -> list[dict[str, Any]]:
-        """Get list of available tools in OpenAI format."""
-        registry = self._get_registry()
-        tools = []
+        """Get list of available tools in OpenAI format.
 
-        for tool in registry.get_available_tools():
-            try:
-                schema = tool.definition.to_openai_schema()
-                tools.append(schema)
-            except Exception as e:
-                logger.warning(f"Failed to get schema for tool: {e}")
+        Served from the registry's schema catalog, which is rebuilt only
+        when tools are registered or unregistered. The returned list is
+        shared between turns and must not be mutated.
+        """
+        return self._get_registry().get_schema_catalog().openai
+
+    def select_tools(
+        self,
+        query: str,
+        max_tools: int | None = None,
+        pinned: Iterable[str] = (),
+        fallback: Iterable[str] = (),
+    ) -> ToolSelection:
+        """Select the tools most relevant to a query.
+
+        Ranks tools with the registry's keyword index, using recorded tool
+        usage as a prior, and always includes pinned tools that exist.
+        When no tool matches the query, the fallback tools (usually the
+        previous turn's selection) are offered instead, or every tool if
+        none of them exist.
+
+        Args:
+            query: Text to rank tools against (usually the user message)
+            max_tools: Maximum tools to offer (None offers every tool)
+            pinned: Tool names always included
+            fallback: Tool names offered when nothing matches the query
+
+        Returns:
+            ToolSelection with schemas and token estimates
+        """
+        catalog = self._get_registry().get_schema_catalog()
 
-        return tools
+        if max_tools is None or len(catalog) <= max_tools:
+            return self._full_selection(catalog)
+
+        names = list(dict.fromkeys(name for name in pinned if name in catalog.entries))
+        if catalog.index.search(query, limit=1):
+            ranked = catalog.index.search(
+                query,
+                limit=max_tools + len(names),
+                prior=self._usage_prior(),
+            )
+            candidates = [name for name, _score in ranked]
+        else:
+            candidates = [name for name in fallback if name in catalog.entries]
+            if not candidates:
+                return self._full_selection(catalog)
+
+        for name in candidates:
+            if len(names) >= max_tools:
+                break
+            if name not in names:
+                names.append(name)
+
+        return ToolSelection(
+            tools=catalog.subset(names),
+            names=names,
+            available=len(catalog),
+            schema_tokens=sum(catalog.entries[name].tokens for name in names),
+            total_schema_tokens=catalog.total_tokens,
+        )
+
+    @staticmethod
+    def _full_selection(catalog) -> ToolSelection:
+        """Offer every tool in the catalog."""
+        return ToolSelection(
+            tools=catalog.openai,
+            names=list(catalog.entries),
+            available=len(catalog),
+            schema_tokens=catalog.total_tokens,
+            total_schema_tokens=catalog.total_tokens,
+        )
+
+    def _usage_prior(self) -> dict[str, float]:
+        """Normalize usage counts to [0, 1] on a log scale."""
+        try:
+            stats = self._get_recommender().get_usage_stats()
+        except Exception as e:
+            logger.debug(f"Tool usage stats unavailable: {e}")
+            return {}
+        if not stats:
+            return {}
+        scale = math.log1p(max(stats.values()))
+        return {name: math.log1p(count) / scale for name, count in stats.items()}
 
 
 class MessagePipeline:
@@ -209,11 +391,16 @@ class MessagePipeline:
         response = await pipeline.process(context)
     """
 
+    # Max completion rounds per turn in the tool loop
+    MAX_TOOL_ITERATIONS = 10
+
     def __init__(
         self,
         ai_provider,
         tool_executor: ToolExecutor,
         memory_store=None,
+        max_tools: int | None = 24,
+        pinned_tools: Iterable[str] = DEFAULT_PINNED_TOOLS,
     ):
         """Initialize message pipeline.
 
@@ -221,10 +408,14 @@ class MessagePipeline:
             ai_provider: AI provider for completions
             tool_executor: Tool executor instance
             memory_store: Optional semantic memory store
+            max_tools: Max tools offered per turn (None offers all tools)
+            pinned_tools: Tools always offered when available
         """
         self.provider = ai_provider
         self.executor = tool_executor
         self.memory = memory_store
+        self.max_tools = max_tools
+        self.pinned_tools = tuple(pinned_tools)
         self._pre_hooks: list[Callable] = []
         self._post_hooks: list[Callable] = []
 
@@ -256,6 +447,7 @@ class MessagePipeline:
             memory storage and post-hooks execute properly.
         """
         start_time = time.time()
+        context.started_at = time.perf_counter()
         processing_error = None
 
         # Run pre-hooks
@@ -279,6 +471,7 @@ class MessagePipeline:
 
             # Yield final response for non-streaming mode
             if not stream:
+                self._mark_first_token(context)
                 yield ChatMessage.assistant(
                     content=context.response_content,
                     tokens_used=context.tokens_used,
@@ -304,6 +497,10 @@ class MessagePipeline:
                 logger.warning(f"Failed to store memory during cleanup: {e}")
 
             context.processing_time_ms = int((time.time() - start_time) * 1000)
+            logger.info(
+                f"Chat turn finished: ttft={context.time_to_first_token_ms}ms "
+                f"total={context.processing_time_ms}ms tools={len(context.tool_results)}"
+            )
 
             # Run post-hooks (with individual error handling)
             for hook in self._post_hooks:
@@ -395,14 +592,42 @@ class MessagePipeline:
         # Fixed mode - use configured model
         return config.model
 
+    def _select_tools(self, context: PipelineContext) -> list[dict[str, Any]]:
+        """Pick the tools to offer for this turn and record the token savings.
+
+        Ranks against the user message plus recent conversation history,
+        falling back to the conversation's previous selection when nothing
+        matches.
+        """
+        recent = context.conversation.messages[-TOOL_QUERY_HISTORY:]
+        query = "\n".join(
+            [msg.content for msg in recent if msg.role != MessageRole.TOOL]
+            + [context.user_message.content]
+        )
+        metadata = context.conversation.metadata
+        selection = self.executor.select_tools(
+            query,
+            max_tools=self.max_tools,
+            pinned=self.pinned_tools,
+            fallback=metadata.get("selected_tools", ()),
+        )
+        metadata["selected_tools"] = selection.names
+        context.tool_selection = selection.to_dict()
+        if selection.tokens_saved:
+            logger.debug(
+                f"Offering {len(selection.names)}/{selection.available} tools "
+                f"(~{selection.tokens_saved} schema tokens saved per call)"
+            )
+        return selection.tools
+
     async def _complete(
         self,
         context: PipelineContext,
         messages: list[dict[str, Any]],
     ) -> str:
         """Run AI completion with tool execution loop."""
-        tools = self.executor.get_available_tools()
-        max_iterations = 10
+        tools = self._select_tools(context)
+        max_iterations = self.MAX_TOOL_ITERATIONS
         iteration = 0
 
         # Get model based on mode (auto or fixed)
@@ -437,25 +662,7 @@ class MessagePipeline:
 
                 results = await self.executor.execute_parallel(tool_calls)
                 context.tool_results.extend(results)
-
-                # Add assistant message with tool calls
-                messages.append(
-                    {
-                        "role": "assistant",
-                        "content": response.content or "",
-                        "tool_calls": response.tool_calls,
-                    }
-                )
-
-                # Add tool results
-                for result in results:
-                    messages.append(
-                        {
-                            "role": "tool",
-                            "tool_call_id": result["tool_id"],
-                            "content": json.dumps(result.get("result", result.get("error"))),
-                        }
-                    )
+                self._append_tool_turn(messages, response.content, response.tool_calls, results)
 
             else:
                 # No more tool calls - return response
@@ -469,44 +676,141 @@ class MessagePipeline:
         context: PipelineContext,
         messages: list[dict[str, Any]],
     ) -> AsyncGenerator[str, None]:
-        """Stream AI completion with tool execution."""
-        tools = self.executor.get_available_tools()
+        """Stream AI completion with an overlapping tool execution loop.
+
+        Each tool call starts executing as soon as the provider finishes
+        streaming its arguments, while the rest of the response keeps
+        streaming. Once the stream ends, results are appended to the
+        conversation and the next stream starts automatically.
+        """
+        tools = self._select_tools(context)
 
         # Get model based on mode (auto or fixed)
         model = self._get_model_for_context(context)
+        config = context.session.config
 
-        async for chunk in self.provider.stream(
-            messages=messages,
-            tools=tools,
-            model=model,
-            temperature=context.session.config.temperature,
-            max_tokens=context.session.config.max_tokens,
-        ):
-            # Handle string chunks (simple streaming)
-            if isinstance(chunk, str):
-                context.response_content += chunk
-                yield chunk
-            # Handle object chunks with .content attribute
-            elif hasattr(chunk, "content") and chunk.content:
-                context.response_content += chunk.content
-                yield chunk.content
-
-                # Handle tool calls in stream
-                if hasattr(chunk, "tool_calls") and chunk.tool_calls:
-                    for tc in chunk.tool_calls:
-                        tool_call = ToolCall(
-                            tool_id=tc["id"],
-                            tool_name=tc["function"]["name"],
-                            arguments=json.loads(tc["function"]["arguments"]),
-                        )
-                        result = await self.executor.execute(
-                            tool_call.tool_name,
-                            tool_call.arguments,
+        stream_with_tools = getattr(self.provider, "stream_with_tools", None)
+        if stream_with_tools is None:
+            # Provider only streams text (and tool calls attached to chunks)
+            async for chunk in self.provider.stream(
+                messages=messages,
+                tools=tools,
+                model=model,
+                temperature=config.temperature,
+                max_tokens=config.max_tokens,
+            ):
+                text = chunk if isinstance(chunk, str) else getattr(chunk, "content", "")
+                if text:
+                    self._mark_first_token(context)
+                    context.response_content += text
+                    yield text
+
+                for tc in getattr(chunk, "tool_calls", None) or ():
+                    tool_call = ToolCall(
+                        tool_id=tc["id"],
+                        tool_name=tc["function"]["name"],
+                        arguments=json.loads(tc["function"]["arguments"]),
+                    )
+                    result = await self.executor.execute_call(tool_call)
+                    context.tool_results.append(result)
+
+                    # Yield tool result indicator
+                    yield f"\n[Tool: {tool_call.tool_name}]\n"
+            return
+
+        semaphore = asyncio.Semaphore(self.executor.max_parallel)
+
+        for _ in range(self.MAX_TOOL_ITERATIONS):
+            text_parts: list[str] = []
+            tool_calls: list[dict[str, Any]] = []
+            tasks: list[asyncio.Task] = []
+
+            try:
+                async for event in stream_with_tools(
+                    messages=messages,
+                    tools=tools,
+                    model=model,
+                    temperature=config.temperature,
+                    max_tokens=config.max_tokens,
+                ):
+                    if event.type == "text" and event.text:
+                        self._mark_first_token(context)
+                        text_parts.append(event.text)
+                        context.response_content += event.text
+                        yield event.text
+                    elif event.type == "tool_call" and event.tool_call:
+                        tool_calls.append(event.tool_call)
+                        tasks.append(
+                            asyncio.create_task(self._run_tool_call(event.tool_call, semaphore))
                         )
-                        context.tool_results.append(result)
+                        yield f"\n[Tool: {event.tool_call['function']['name']}]\n"
+                    elif event.type == "done" and event.usage:
+                        context.tokens_used += event.usage.get("total_tokens", 0)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                raise
+
+            if not tasks:
+                return
+
+            results = await asyncio.gather(*tasks)
+            context.tool_results.extend(results)
+            self._append_tool_turn(messages, "".join(text_parts), tool_calls, results)
+
+        logger.warning(f"Max iterations ({self.MAX_TOOL_ITERATIONS}) reached in tool loop")
+        notice = "I've reached the maximum number of operations. Please try a simpler request."
+        context.response_content += notice
+        yield notice
+
+    async def _run_tool_call(
+        self,
+        tool_call: dict[str, Any],
+        semaphore: asyncio.Semaphore,
+    ) -> dict[str, Any]:
+        """Parse and execute a tool call emitted by the provider."""
+        name = tool_call["function"]["name"]
+        try:
+            arguments = json.loads(tool_call["function"].get("arguments") or "{}")
+        except json.JSONDecodeError as e:
+            return {
+                "success": False,
+                "error": f"Invalid tool arguments: {e}",
+                "duration_ms": 0,
+                "tool_id": tool_call["id"],
+                "tool_name": name,
+            }
+        call = ToolCall(tool_id=tool_call["id"], tool_name=name, arguments=arguments)
+        return await self.executor.execute_call(call, semaphore)
+
+    def _append_tool_turn(
+        self,
+        messages: list[dict[str, Any]],
+        content: str | None,
+        tool_calls: list[dict[str, Any]],
+        results: list[dict[str, Any]],
+    ) -> None:
+        """Append the assistant tool-call message and its tool results."""
+        messages.append(
+            {
+                "role": "assistant",
+                "content": content or "",
+                "tool_calls": tool_calls,
+            }
+        )
+        for result in results:
+            messages.append(
+                {
+                    "role": "tool",
+                    "tool_call_id": result["tool_id"],
+                    "content": json.dumps(result.get("result", result.get("error"))),
+                }
+            )
 
-                        # Yield tool result indicator
-                        yield f"\n[Tool: {tool_call.tool_name}]\n"
+    def _mark_first_token(self, context: PipelineContext) -> None:
+        """Record time-to-first-token once per turn."""
+        if context.time_to_first_token_ms is None and context.started_at:
+            context.time_to_first_token_ms = int((time.perf_counter() - context.started_at) * 1000)
 
     async def _store_memory(self, context: PipelineContext) -> None:
         """Store conversation in memory."""
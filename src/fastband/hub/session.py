@@ -6,8 +6,8 @@ Manages hub sessions, including creation, lifecycle, and cleanup.
 Performance Optimizations (Issue #38):
 - Session pooling with LRU eviction
 - Lazy initialization of heavy resources
-- Background cleanup of idle sessions
-- Thread-safe session access
+- Background cleanup of idle sessions, driven by a timer wheel
+- Thread-safe session access through lock-striped shards
 
 ENTERPRISE: Horizontal Scaling with Redis
 ==========================================
@@ -50,16 +50,20 @@ Reference implementation pattern:
 import asyncio
 import logging
 import threading
+import time
 from collections import OrderedDict
 from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+from fastband.core.ratelimit import SlidingWindow
+from fastband.core.timer_wheel import TimerWheel
 from fastband.hub.models import (
     Conversation,
     HubSession,
     SessionConfig,
     SessionStatus,
+    SubscriptionTier,
     TierLimits,
     UsageStats,
 )
@@ -67,6 +71,24 @@ from fastband.hub.models import (
 logger = logging.getLogger(__name__)
 
 
+class _Shard:
+    """One lock-striped slice of the session store.
+
+    Sessions and conversations are sharded by session ID; usage stats and
+    the per-user session index by user ID.
+    """
+
+    __slots__ = ("lock", "sessions", "conversations", "usage", "user_sessions")
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        # Least recently active first
+        self.sessions: OrderedDict[str, HubSession] = OrderedDict()
+        self.conversations: dict[str, dict[str, Conversation]] = {}
+        self.usage: dict[str, UsageStats] = {}
+        self.user_sessions: dict[str, dict[str, None]] = {}
+
+
 class SessionManager:
     """
     Manages hub sessions with pooling and lifecycle management.
@@ -77,6 +99,11 @@ class SessionManager:
     - Usage tracking and rate limiting
     - Thread-safe operations
 
+    Sessions are spread over lock-striped shards so concurrent chat requests
+    rarely wait on each other. Each shard keeps its sessions in
+    least-recently-active order, making eviction O(1), and idle expiry runs
+    off a timer wheel instead of scanning every session.
+
     Example:
         manager = SessionManager(max_sessions=1000)
 
@@ -90,11 +117,15 @@ class SessionManager:
         await manager.cleanup_idle_sessions()
     """
 
+    # Least recently active sessions examined per shard when evicting
+    EVICTION_PROBE = 8
+
     def __init__(
         self,
         max_sessions: int = 1000,
         idle_timeout_minutes: int = 30,
         cleanup_interval_seconds: int = 60,
+        shards: int = 16,
     ):
         """Initialize session manager.
 
@@ -102,18 +133,29 @@ class SessionManager:
             max_sessions: Maximum concurrent sessions
             idle_timeout_minutes: Minutes before idle session cleanup
             cleanup_interval_seconds: Seconds between cleanup runs
+            shards: Number of lock-striped shards
         """
-        self._sessions: OrderedDict[str, HubSession] = OrderedDict()
-        self._conversations: dict[str, dict[str, Conversation]] = {}
-        self._usage_stats: dict[str, UsageStats] = {}
+        self._shards = [_Shard() for _ in range(max(1, shards))]
         self._max_sessions = max_sessions
+        self._session_count = 0
+        # Reentrant: eviction removes sessions while create_session holds it
+        self._capacity_lock = threading.RLock()
         self._idle_timeout = timedelta(minutes=idle_timeout_minutes)
         self._cleanup_interval = cleanup_interval_seconds
-        self._lock = threading.RLock()
+        # Idle deadlines (wall-clock, matching HubSession.last_activity)
+        self._expiry = TimerWheel(tick_seconds=1.0, now=time.time())
+        self._expiry_lock = threading.Lock()
+        # Per-minute message limits; each check passes the user's tier limit
+        self._message_limiter = SlidingWindow(
+            limit=TierLimits.for_tier(SubscriptionTier.FREE).messages_per_minute, period=60
+        )
         self._cleanup_task: asyncio.Task | None = None
         self._on_session_created: Callable[[HubSession], None] | None = None
         self._on_session_terminated: Callable[[HubSession], None] | None = None
 
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
     async def start(self) -> None:
         """Start the session manager background tasks."""
         if self._cleanup_task is None:
@@ -143,32 +185,40 @@ class SessionManager:
         Raises:
             ValueError: If max sessions reached
         """
-        with self._lock:
+        with self._capacity_lock:
             # Check capacity
-            if len(self._sessions) >= self._max_sessions:
+            if self._session_count >= self._max_sessions:
                 # Try to evict oldest idle session
                 evicted = self._evict_oldest_idle()
                 if not evicted:
                     raise ValueError(f"Maximum sessions ({self._max_sessions}) reached")
+            self._session_count += 1
 
-            # Create session
-            session = HubSession.create(config)
-            self._sessions[session.session_id] = session
-            self._conversations[session.session_id] = {}
-
+        # Create session
+        session = HubSession.create(config)
+        shard = self._shard(session.session_id)
+        with shard.lock:
+            shard.sessions[session.session_id] = session
+            shard.conversations[session.session_id] = {}
+
+        user_shard = self._shard(config.user_id)
+        with user_shard.lock:
+            user_shard.user_sessions.setdefault(config.user_id, {})[session.session_id] = None
             # Initialize usage stats
-            self._usage_stats[config.user_id] = UsageStats(
+            user_shard.usage[config.user_id] = UsageStats(
                 user_id=config.user_id,
                 tier=config.tier,
                 reset_at=self._get_next_reset_time(),
             )
 
-            logger.info(f"Created session {session.session_id} for user {config.user_id}")
+        self._schedule_expiry(session)
+
+        logger.info(f"Created session {session.session_id} for user {config.user_id}")
 
-            if self._on_session_created:
-                self._on_session_created(session)
+        if self._on_session_created:
+            self._on_session_created(session)
 
-            return session
+        return session
 
     def get_session(self, session_id: str) -> HubSession | None:
         """Get a session by ID.
@@ -179,12 +229,13 @@ class SessionManager:
         Returns:
             HubSession if found and active, None otherwise
         """
-        with self._lock:
-            session = self._sessions.get(session_id)
+        shard = self._shard(session_id)
+        with shard.lock:
+            session = shard.sessions.get(session_id)
             if session and session.is_active():
                 session.touch()
                 # Move to end for LRU
-                self._sessions.move_to_end(session_id)
+                shard.sessions.move_to_end(session_id)
                 return session
             return None
 
@@ -197,11 +248,19 @@ class SessionManager:
         Returns:
             Most recent active session for user, or None
         """
-        with self._lock:
-            for session in reversed(self._sessions.values()):
-                if session.config.user_id == user_id and session.is_active():
-                    return session
-            return None
+        user_shard = self._shard(user_id)
+        with user_shard.lock:
+            session_ids = list(user_shard.user_sessions.get(user_id, ()))
+
+        latest = None
+        for session_id in session_ids:
+            shard = self._shard(session_id)
+            with shard.lock:
+                session = shard.sessions.get(session_id)
+            if session and session.is_active():
+                if latest is None or session.last_activity >= latest.last_activity:
+                    latest = session
+        return latest
 
     async def terminate_session(self, session_id: str) -> bool:
         """Terminate a session.
@@ -212,20 +271,16 @@ class SessionManager:
         Returns:
             True if session was terminated
         """
-        with self._lock:
-            session = self._sessions.get(session_id)
-            if session:
-                session.status = SessionStatus.TERMINATED
-                del self._sessions[session_id]
-                del self._conversations[session_id]
+        session = self._remove_session(session_id)
+        if session is None:
+            return False
 
-                logger.info(f"Terminated session {session_id}")
+        logger.info(f"Terminated session {session_id}")
 
-                if self._on_session_terminated:
-                    self._on_session_terminated(session)
+        if self._on_session_terminated:
+            self._on_session_terminated(session)
 
-                return True
-            return False
+        return True
 
     def get_conversation(
         self,
@@ -241,8 +296,9 @@ class SessionManager:
         Returns:
             Conversation if found
         """
-        with self._lock:
-            session_convs = self._conversations.get(session_id, {})
+        shard = self._shard(session_id)
+        with shard.lock:
+            session_convs = shard.conversations.get(session_id, {})
             return session_convs.get(conversation_id)
 
     def create_conversation(
@@ -259,15 +315,17 @@ class SessionManager:
         Returns:
             Created Conversation or None if session not found
         """
-        with self._lock:
-            session = self._sessions.get(session_id)
+        shard = self._shard(session_id)
+        with shard.lock:
+            session = shard.sessions.get(session_id)
             if not session:
                 return None
 
             conv = Conversation.create(session_id, title)
-            self._conversations[session_id][conv.conversation_id] = conv
+            shard.conversations[session_id][conv.conversation_id] = conv
             session.current_conversation_id = conv.conversation_id
             session.touch()
+            shard.sessions.move_to_end(session_id)
 
             logger.debug(f"Created conversation {conv.conversation_id} in session {session_id}")
 
@@ -282,8 +340,9 @@ class SessionManager:
         Returns:
             List of conversations
         """
-        with self._lock:
-            session_convs = self._conversations.get(session_id, {})
+        shard = self._shard(session_id)
+        with shard.lock:
+            session_convs = shard.conversations.get(session_id, {})
             return list(session_convs.values())
 
     def check_rate_limit(
@@ -298,12 +357,19 @@ class SessionManager:
         Returns:
             Tuple of (allowed, reason_if_denied)
         """
-        with self._lock:
-            stats = self._usage_stats.get(user_id)
+        shard = self._shard(user_id)
+        with shard.lock:
+            stats = shard.usage.get(user_id)
             if not stats:
                 return True, None
 
             limits = TierLimits.for_tier(stats.tier)
+            self._roll_daily_usage(stats, datetime.now(timezone.utc))
+            stats.messages_this_minute = int(self._message_limiter.count(user_id))
+
+            minute = self._message_limiter.peek(user_id, limit=limits.messages_per_minute)
+            if not minute.allowed:
+                return False, "Rate limit exceeded. Please wait a moment."
             return stats.can_send_message(limits)
 
     def record_message(
@@ -317,27 +383,28 @@ class SessionManager:
             user_id: User identifier
             tokens_used: Tokens consumed
         """
-        with self._lock:
-            stats = self._usage_stats.get(user_id)
+        shard = self._shard(user_id)
+        with shard.lock:
+            stats = shard.usage.get(user_id)
             if stats:
                 now = datetime.now(timezone.utc)
+                self._roll_daily_usage(stats, now)
 
-                # Reset minute counter if new minute
-                if stats.last_message_at:
-                    if (now - stats.last_message_at).total_seconds() >= 60:
-                        stats.messages_this_minute = 0
-
-                # Reset daily counter if new day
-                if stats.reset_at and now >= stats.reset_at:
-                    stats.messages_today = 0
-                    stats.tokens_used_today = 0
-                    stats.reset_at = self._get_next_reset_time()
+                limits = TierLimits.for_tier(stats.tier)
+                self._message_limiter.hit(user_id, limit=limits.messages_per_minute)
 
                 stats.messages_today += 1
-                stats.messages_this_minute += 1
+                stats.messages_this_minute = int(self._message_limiter.count(user_id))
                 stats.tokens_used_today += tokens_used
                 stats.last_message_at = now
 
+    def _roll_daily_usage(self, stats: UsageStats, now: datetime) -> None:
+        """Reset daily counters once the reset time has passed."""
+        if stats.reset_at and now >= stats.reset_at:
+            stats.messages_today = 0
+            stats.tokens_used_today = 0
+            stats.reset_at = self._get_next_reset_time()
+
     def get_usage_stats(self, user_id: str) -> UsageStats | None:
         """Get usage stats for a user.
 
@@ -347,25 +414,35 @@ class SessionManager:
         Returns:
             UsageStats if found
         """
-        with self._lock:
-            return self._usage_stats.get(user_id)
+        shard = self._shard(user_id)
+        with shard.lock:
+            return shard.usage.get(user_id)
 
     def get_active_session_count(self) -> int:
         """Get count of active sessions."""
-        with self._lock:
-            return sum(1 for s in self._sessions.values() if s.is_active())
+        count = 0
+        for shard in self._shards:
+            with shard.lock:
+                count += sum(1 for s in shard.sessions.values() if s.is_active())
+        return count
 
     def get_stats(self) -> dict[str, Any]:
         """Get session manager statistics."""
-        with self._lock:
-            active = sum(1 for s in self._sessions.values() if s.is_active())
-            return {
-                "total_sessions": len(self._sessions),
-                "active_sessions": active,
-                "max_sessions": self._max_sessions,
-                "total_conversations": sum(len(convs) for convs in self._conversations.values()),
-                "tracked_users": len(self._usage_stats),
-            }
+        total = active = conversations = users = 0
+        for shard in self._shards:
+            with shard.lock:
+                total += len(shard.sessions)
+                active += sum(1 for s in shard.sessions.values() if s.is_active())
+                conversations += sum(len(convs) for convs in shard.conversations.values())
+                users += len(shard.usage)
+        return {
+            "total_sessions": total,
+            "active_sessions": active,
+            "max_sessions": self._max_sessions,
+            "total_conversations": conversations,
+            "tracked_users": users,
+            "shards": len(self._shards),
+        }
 
     # =========================================================================
     # LIFECYCLE CALLBACKS
@@ -389,22 +466,68 @@ class SessionManager:
     # PRIVATE METHODS
     # =========================================================================
 
+    def _remove_session(self, session_id: str) -> HubSession | None:
+        """Remove a session from every index and mark it terminated."""
+        shard = self._shard(session_id)
+        with shard.lock:
+            session = shard.sessions.pop(session_id, None)
+            if session is None:
+                return None
+            shard.conversations.pop(session_id, None)
+            session.status = SessionStatus.TERMINATED
+
+        user_id = session.config.user_id
+        user_shard = self._shard(user_id)
+        with user_shard.lock:
+            user_index = user_shard.user_sessions.get(user_id)
+            if user_index is not None:
+                user_index.pop(session_id, None)
+                if not user_index:
+                    del user_shard.user_sessions[user_id]
+
+        with self._expiry_lock:
+            self._expiry.cancel(session_id)
+        with self._capacity_lock:
+            self._session_count -= 1
+        return session
+
+    def _schedule_expiry(self, session: HubSession, deadline: float | None = None) -> None:
+        """File a session in the timer wheel at its idle deadline."""
+        if deadline is None:
+            deadline = (session.last_activity + self._idle_timeout).timestamp()
+        with self._expiry_lock:
+            self._expiry.schedule(session.session_id, deadline)
+
     def _evict_oldest_idle(self) -> bool:
         """Evict oldest idle session to make room.
 
+        Looks at the least recently active sessions of each shard; a session
+        can be evicted once it is IDLE or has been inactive for longer than
+        the idle timeout. Called with the capacity lock held.
+
         Returns:
             True if a session was evicted
         """
-        # Use list() to avoid RuntimeError from dictionary modification during iteration
-        for session_id in list(self._sessions.keys()):
-            session = self._sessions.get(session_id)
-            if session and session.status == SessionStatus.IDLE:
-                session.status = SessionStatus.TERMINATED
-                del self._sessions[session_id]
-                self._conversations.pop(session_id, None)
-                logger.info(f"Evicted idle session {session_id}")
-                return True
-        return False
+        cutoff = datetime.now(timezone.utc) - self._idle_timeout
+        oldest: HubSession | None = None
+        for shard in self._shards:
+            with shard.lock:
+                for i, session in enumerate(shard.sessions.values()):
+                    if i >= self.EVICTION_PROBE:
+                        break
+                    if session.status == SessionStatus.IDLE or (
+                        session.is_active() and session.last_activity <= cutoff
+                    ):
+                        if oldest is None or session.last_activity < oldest.last_activity:
+                            oldest = session
+
+        if oldest is None:
+            return False
+
+        if self._remove_session(oldest.session_id) is None:
+            return False
+        logger.info(f"Evicted idle session {oldest.session_id}")
+        return True
 
     def _get_next_reset_time(self) -> datetime:
         """Get next daily reset time (midnight UTC)."""
@@ -426,19 +549,31 @@ class SessionManager:
     async def cleanup_idle_sessions(self) -> int:
         """Clean up idle sessions that have timed out.
 
+        Only sessions whose idle deadline has come up on the timer wheel are
+        examined. Sessions touched since they were scheduled are filed again
+        at their new deadline.
+
         Returns:
             Number of sessions cleaned up
         """
         now = datetime.now(timezone.utc)
-        to_terminate = []
+        with self._expiry_lock:
+            due = self._expiry.advance(now.timestamp())
 
-        with self._lock:
-            # Use list() to create snapshot, avoiding RuntimeError during iteration
-            for session_id, session in list(self._sessions.items()):
-                if session.is_active():
-                    idle_time = now - session.last_activity
-                    if idle_time > self._idle_timeout:
-                        to_terminate.append(session_id)
+        to_terminate = []
+        for session_id in due:
+            shard = self._shard(session_id)
+            with shard.lock:
+                session = shard.sessions.get(session_id)
+            if session is None:
+                continue
+            if session.is_active() and now - session.last_activity > self._idle_timeout:
+                to_terminate.append(session_id)
+            elif session.is_active():
+                self._schedule_expiry(session)
+            else:
+                # Not active: check again after another timeout
+                self._schedule_expiry(session, (now + self._idle_timeout).timestamp())
 
         count = 0
         for session_id in to_terminate:
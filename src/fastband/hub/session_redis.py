@@ -6,10 +6,21 @@ Redis-backed session management for horizontal scaling and persistence.
 Features:
 - Session sharing across Hub instances
 - Automatic session expiration via Redis TTL
-- JSON serialization with Pydantic
-- Connection pooling
+- JSON serialization of the hub dataclass models
+- Connection pooling, with multi-key operations batched into pipelines
+- Atomic usage counters (Lua script over a Redis hash)
+- Local near-cache for sessions, invalidated across instances via pub/sub
 - Async Redis operations
 
+Near-cache:
+    Every chat request reads its session. Instances keep recently used
+    sessions in memory for ``near_cache_ttl`` seconds. Writes publish the
+    session ID on ``{key_prefix}:invalidate`` and other instances drop
+    their copy, so reads stay consistent across replicas without hitting
+    Redis each time. If the subscription drops, the TTL still bounds how
+    stale a cached session can get. Last-activity updates are written back
+    at most every ``touch_interval`` seconds.
+
 Configuration via environment variables:
 - FASTBAND_SESSION_STORE=redis (enable Redis sessions)
 - FASTBAND_REDIS_URL=redis://localhost:6379/0
@@ -17,25 +28,58 @@ Configuration via environment variables:
 - FASTBAND_REDIS_SSL=true (for production)
 - FASTBAND_REDIS_PREFIX=fastband:session (key prefix)
 - FASTBAND_SESSION_TTL=1800 (30 min default)
+- FASTBAND_SESSION_NEAR_CACHE_TTL=5 (seconds, 0 disables)
 """
 
 import asyncio
 import json
 import logging
 import os
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass
 from datetime import datetime, timedelta, timezone
+from enum import Enum
 from typing import Any
 
+from fastband.core.ratelimit import RedisSlidingWindow
 from fastband.hub.models import (
+    ChatMessage,
     Conversation,
+    ConversationStatus,
     HubSession,
+    MessageRole,
+    ModelMode,
     SessionConfig,
     SessionStatus,
+    SubscriptionTier,
+    TierLimits,
+    ToolCall,
     UsageStats,
 )
 
 logger = logging.getLogger(__name__)
 
+# Atomically add to a user's usage counters, rolling the daily counters
+# over first if their reset time has passed.
+# KEYS[1] = usage hash; ARGV = now (epoch), messages, tokens, next reset (epoch)
+INCREMENT_USAGE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return nil
+end
+local reset_at = tonumber(redis.call('HGET', KEYS[1], 'reset_at'))
+if reset_at and tonumber(ARGV[1]) >= reset_at then
+    redis.call('HSET', KEYS[1], 'messages_today', 0, 'tokens_used_today', 0, 'reset_at', ARGV[4])
+end
+redis.call('HINCRBY', KEYS[1], 'messages_today', ARGV[2])
+redis.call('HINCRBY', KEYS[1], 'tokens_used_today', ARGV[3])
+if tonumber(ARGV[2]) > 0 then
+    redis.call('HSET', KEYS[1], 'last_message_at', ARGV[1])
+end
+return redis.call('HGETALL', KEYS[1])
+"""
+
 
 # =============================================================================
 # CONFIGURATION
@@ -53,6 +97,9 @@ class RedisSessionConfig:
         key_prefix: str = "fastband:session",
         session_ttl: int = 1800,  # 30 minutes
         connection_pool_size: int = 10,
+        near_cache_ttl: float | None = None,
+        near_cache_size: int = 1024,
+        touch_interval: int = 60,
     ):
         """Initialize Redis config.
 
@@ -63,23 +110,25 @@ class RedisSessionConfig:
             key_prefix: Key prefix for all session keys
             session_ttl: Session TTL in seconds
             connection_pool_size: Connection pool size
+            near_cache_ttl: Seconds sessions stay in the local cache (0 disables)
+            near_cache_size: Max sessions in the local cache
+            touch_interval: Min seconds between last-activity writes per session
         """
-        self.redis_url = redis_url or os.getenv(
-            "FASTBAND_REDIS_URL", "redis://localhost:6379/0"
-        )
+        self.redis_url = redis_url or os.getenv("FASTBAND_REDIS_URL", "redis://localhost:6379/0")
         self.password = password or os.getenv("FASTBAND_REDIS_PASSWORD")
         self.use_ssl = use_ssl or os.getenv("FASTBAND_REDIS_SSL", "").lower() in (
             "true",
             "1",
             "yes",
         )
-        self.key_prefix = key_prefix or os.getenv(
-            "FASTBAND_REDIS_PREFIX", "fastband:session"
-        )
-        self.session_ttl = session_ttl or int(
-            os.getenv("FASTBAND_SESSION_TTL", "1800")
-        )
+        self.key_prefix = key_prefix or os.getenv("FASTBAND_REDIS_PREFIX", "fastband:session")
+        self.session_ttl = session_ttl or int(os.getenv("FASTBAND_SESSION_TTL", "1800"))
         self.connection_pool_size = connection_pool_size
+        if near_cache_ttl is None:
+            near_cache_ttl = float(os.getenv("FASTBAND_SESSION_NEAR_CACHE_TTL", "5"))
+        self.near_cache_ttl = near_cache_ttl
+        self.near_cache_size = near_cache_size
+        self.touch_interval = touch_interval
 
     @classmethod
     def from_env(cls) -> "RedisSessionConfig":
@@ -87,6 +136,167 @@ class RedisSessionConfig:
         return cls()
 
 
+# =============================================================================
+# SERIALIZATION
+# =============================================================================
+
+
+def _jsonable(value: Any) -> Any:
+    """Convert dataclasses, enums and datetimes to JSON-compatible values."""
+    if is_dataclass(value):
+        return {f.name: _jsonable(getattr(value, f.name)) for f in fields(value)}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _jsonable(v) for k, v in value.items()}
+    return value
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(_jsonable(value), separators=(",", ":"))
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _load_session(data: str) -> HubSession:
+    raw = json.loads(data)
+    config = raw["config"]
+    config["tier"] = SubscriptionTier(config["tier"])
+    config["model_mode"] = ModelMode(config["model_mode"])
+    return HubSession(
+        session_id=raw["session_id"],
+        config=SessionConfig(**config),
+        status=SessionStatus(raw["status"]),
+        created_at=_parse_datetime(raw["created_at"]),
+        last_activity=_parse_datetime(raw["last_activity"]),
+        current_conversation_id=raw.get("current_conversation_id"),
+        metadata=raw.get("metadata") or {},
+    )
+
+
+def _load_message(raw: dict[str, Any]) -> ChatMessage:
+    return ChatMessage(
+        message_id=raw["message_id"],
+        role=MessageRole(raw["role"]),
+        content=raw["content"],
+        created_at=_parse_datetime(raw["created_at"]),
+        tool_calls=[ToolCall(**tc) for tc in raw.get("tool_calls") or []],
+        tool_call_id=raw.get("tool_call_id"),
+        tokens_used=raw.get("tokens_used", 0),
+        metadata=raw.get("metadata") or {},
+    )
+
+
+def _load_conversation(data: str) -> Conversation:
+    raw = json.loads(data)
+    return Conversation(
+        conversation_id=raw["conversation_id"],
+        session_id=raw["session_id"],
+        title=raw.get("title", "New Conversation"),
+        status=ConversationStatus(raw["status"]),
+        messages=[_load_message(m) for m in raw.get("messages") or []],
+        created_at=_parse_datetime(raw["created_at"]),
+        updated_at=_parse_datetime(raw["updated_at"]),
+        summary=raw.get("summary"),
+        metadata=raw.get("metadata") or {},
+    )
+
+
+def _epoch(value: datetime | None) -> str:
+    return str(value.timestamp()) if value else ""
+
+
+def _from_epoch(value: str | None) -> datetime | None:
+    return datetime.fromtimestamp(float(value), tz=timezone.utc) if value else None
+
+
+def _usage_to_hash(usage: UsageStats) -> dict[str, str | int]:
+    """Flatten usage stats into Redis hash fields (times as epoch seconds)."""
+    return {
+        "user_id": usage.user_id,
+        "tier": usage.tier.value,
+        "messages_today": usage.messages_today,
+        "messages_this_minute": usage.messages_this_minute,
+        "tokens_used_today": usage.tokens_used_today,
+        "memory_entries": usage.memory_entries,
+        "last_message_at": _epoch(usage.last_message_at),
+        "reset_at": _epoch(usage.reset_at),
+    }
+
+
+def _usage_from_hash(data: dict[str, str]) -> UsageStats:
+    return UsageStats(
+        user_id=data["user_id"],
+        tier=SubscriptionTier(data["tier"]),
+        messages_today=int(data.get("messages_today") or 0),
+        messages_this_minute=int(data.get("messages_this_minute") or 0),
+        tokens_used_today=int(data.get("tokens_used_today") or 0),
+        memory_entries=int(data.get("memory_entries") or 0),
+        last_message_at=_from_epoch(data.get("last_message_at")),
+        reset_at=_from_epoch(data.get("reset_at")),
+    )
+
+
+# =============================================================================
+# NEAR-CACHE
+# =============================================================================
+
+
+@dataclass(slots=True)
+class _CachedSession:
+    session: HubSession
+    expires_at: float
+    # last_activity as last written to Redis
+    persisted_activity: datetime
+
+
+class _NearCache:
+    """Bounded LRU of sessions with a short TTL."""
+
+    __slots__ = ("ttl", "max_entries", "_entries", "hits", "misses")
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, _CachedSession] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, session_id: str) -> _CachedSession | None:
+        entry = self._entries.get(session_id)
+        if entry is not None and entry.expires_at > time.monotonic():
+            self._entries.move_to_end(session_id)
+            self.hits += 1
+            return entry
+        if entry is not None:
+            del self._entries[session_id]
+        self.misses += 1
+        return None
+
+    def put(self, session: HubSession, persisted_activity: datetime) -> _CachedSession:
+        entry = _CachedSession(session, time.monotonic() + self.ttl, persisted_activity)
+        self._entries[session.session_id] = entry
+        self._entries.move_to_end(session.session_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def discard(self, session_id: str) -> None:
+        self._entries.pop(session_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 # =============================================================================
 # REDIS SESSION MANAGER
 # =============================================================================
@@ -116,6 +326,13 @@ class RedisSessionManager:
         """
         self.config = config or RedisSessionConfig.from_env()
         self._redis = None
+        self._message_limiter: RedisSlidingWindow | None = None
+        self._increment_usage = None
+        self._near_cache: _NearCache | None = None
+        self._pubsub = None
+        self._listener: asyncio.Task | None = None
+        # Tags our own invalidation messages so we can skip them
+        self._instance_id = uuid.uuid4().hex
         self._initialized = False
 
     async def initialize(self) -> bool:
@@ -142,6 +359,22 @@ class RedisSessionManager:
             # Test connection
             await self._redis.ping()
 
+            self._message_limiter = RedisSlidingWindow(
+                self._redis,
+                limit=TierLimits.for_tier(SubscriptionTier.FREE).messages_per_minute,
+                period=60,
+                key_prefix=f"{self.config.key_prefix}:ratelimit",
+            )
+            self._increment_usage = self._redis.register_script(INCREMENT_USAGE_SCRIPT)
+
+            if self.config.near_cache_ttl > 0:
+                self._near_cache = _NearCache(
+                    self.config.near_cache_ttl, self.config.near_cache_size
+                )
+                self._pubsub = self._redis.pubsub()
+                await self._pubsub.subscribe(self._invalidation_channel())
+                self._listener = asyncio.create_task(self._listen_for_invalidations())
+
             self._initialized = True
             logger.info(f"Redis session store initialized: {self._sanitize_url()}")
             return True
@@ -163,6 +396,18 @@ class RedisSessionManager:
 
     async def close(self) -> None:
         """Close Redis connection."""
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._pubsub:
+            await self._pubsub.reset()
+            self._pubsub = None
+        if self._near_cache:
+            self._near_cache.clear()
         if self._redis:
             await self._redis.close()
             self._initialized = False
@@ -188,6 +433,56 @@ class RedisSessionManager:
         """Get Redis key for user's session list."""
         return f"{self.config.key_prefix}:user:{user_id}:sessions"
 
+    def _invalidation_channel(self) -> str:
+        """Get pub/sub channel for near-cache invalidations."""
+        return f"{self.config.key_prefix}:invalidate"
+
+    # =========================================================================
+    # NEAR-CACHE
+    # =========================================================================
+
+    async def _listen_for_invalidations(self) -> None:
+        """Drop cached sessions that other instances have changed."""
+        try:
+            async for message in self._pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                origin, _, session_id = message["data"].partition(" ")
+                if origin != self._instance_id:
+                    self._near_cache.discard(session_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Cached entries now only expire by TTL
+            logger.warning(f"Session invalidation listener stopped: {e}")
+            self._near_cache.clear()
+
+    def _invalidate(self, pipe: Any, session_id: str) -> None:
+        """Queue an invalidation for other instances and drop our copy."""
+        if self._near_cache is not None:
+            self._near_cache.discard(session_id)
+            pipe.publish(self._invalidation_channel(), f"{self._instance_id} {session_id}")
+
+    async def _touch(
+        self,
+        session: HubSession,
+        persisted_activity: datetime,
+    ) -> HubSession:
+        """Mark a session used; write back last activity and TTL when due."""
+        session.touch()
+        if session.last_activity - persisted_activity >= timedelta(
+            seconds=self.config.touch_interval
+        ):
+            await self._redis.setex(
+                self._session_key(session.session_id),
+                self.config.session_ttl,
+                _dumps(session),
+            )
+            persisted_activity = session.last_activity
+        if self._near_cache is not None:
+            self._near_cache.put(session, persisted_activity)
+        return session
+
     # =========================================================================
     # SESSION OPERATIONS
     # =========================================================================
@@ -206,30 +501,28 @@ class RedisSessionManager:
 
         # Create session
         session = HubSession.create(config)
+        usage = UsageStats(
+            user_id=config.user_id,
+            tier=config.tier,
+            reset_at=self._get_next_reset_time(),
+        )
 
-        # Serialize and store
-        session_data = session.model_dump_json()
-        await self._redis.setex(
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.setex(
             self._session_key(session.session_id),
             self.config.session_ttl,
-            session_data,
+            _dumps(session),
         )
-
         # Track user's sessions
-        await self._redis.sadd(
-            self._user_sessions_key(config.user_id),
-            session.session_id,
-        )
-
+        pipe.sadd(self._user_sessions_key(config.user_id), session.session_id)
         # Initialize usage stats if not exists
         usage_key = self._usage_key(config.user_id)
-        if not await self._redis.exists(usage_key):
-            usage = UsageStats(
-                user_id=config.user_id,
-                tier=config.tier,
-                reset_at=self._get_next_reset_time(),
-            )
-            await self._redis.set(usage_key, usage.model_dump_json())
+        for name, value in _usage_to_hash(usage).items():
+            pipe.hsetnx(usage_key, name, value)
+        await pipe.execute()
+
+        if self._near_cache is not None:
+            self._near_cache.put(session, session.last_activity)
 
         logger.info(f"Created Redis session {session.session_id} for {config.user_id}")
         return session
@@ -237,6 +530,9 @@ class RedisSessionManager:
     async def get_session(self, session_id: str) -> HubSession | None:
         """Get a session by ID.
 
+        Served from the near-cache when possible; otherwise read with GETEX,
+        which extends the TTL in the same round-trip.
+
         Args:
             session_id: Session identifier
 
@@ -246,26 +542,23 @@ class RedisSessionManager:
         if not self._initialized:
             return None
 
-        data = await self._redis.get(self._session_key(session_id))
+        if self._near_cache is not None:
+            entry = self._near_cache.get(session_id)
+            if entry is not None:
+                return await self._touch(entry.session, entry.persisted_activity)
+
+        data = await self._redis.getex(self._session_key(session_id), ex=self.config.session_ttl)
         if not data:
             return None
 
         try:
-            session = HubSession.model_validate_json(data)
-
-            # Update last activity and extend TTL
-            session.touch()
-            await self._redis.setex(
-                self._session_key(session_id),
-                self.config.session_ttl,
-                session.model_dump_json(),
-            )
-
-            return session
+            session = _load_session(data)
         except Exception as e:
             logger.error(f"Failed to deserialize session {session_id}: {e}")
             return None
 
+        return await self._touch(session, session.last_activity)
+
     async def get_session_by_user(self, user_id: str) -> HubSession | None:
         """Get most recent active session for a user.
 
@@ -278,16 +571,39 @@ class RedisSessionManager:
         if not self._initialized:
             return None
 
-        # Get user's session IDs
-        session_ids = await self._redis.smembers(self._user_sessions_key(user_id))
-
-        # Find active session (most recent)
-        for session_id in session_ids:
-            session = await self.get_session(session_id)
-            if session and session.is_active():
-                return session
+        # Get user's session IDs, then all of their sessions in one MGET
+        user_sessions_key = self._user_sessions_key(user_id)
+        session_ids = list(await self._redis.smembers(user_sessions_key))
+        if not session_ids:
+            return None
+        values = await self._redis.mget([self._session_key(sid) for sid in session_ids])
+
+        latest = None
+        expired = []
+        for session_id, data in zip(session_ids, values, strict=True):
+            if not data:
+                expired.append(session_id)
+                continue
+            try:
+                session = _load_session(data)
+            except Exception as e:
+                logger.error(f"Failed to deserialize session {session_id}: {e}")
+                continue
+            if session.is_active() and (
+                latest is None or session.last_activity > latest.last_activity
+            ):
+                latest = session
+
+        if expired:
+            await self._redis.srem(user_sessions_key, *expired)
+        if latest is None:
+            return None
 
-        return None
+        # Prefer the cached instance so callers share one object per session
+        cached = self._near_cache.get(latest.session_id) if self._near_cache else None
+        if cached is not None:
+            return await self._touch(cached.session, cached.persisted_activity)
+        return await self._touch(latest, latest.last_activity)
 
     async def update_session(self, session: HubSession) -> None:
         """Update a session.
@@ -299,11 +615,17 @@ class RedisSessionManager:
             raise RuntimeError("Redis session manager not initialized")
 
         session.touch()
-        await self._redis.setex(
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.setex(
             self._session_key(session.session_id),
             self.config.session_ttl,
-            session.model_dump_json(),
+            _dumps(session),
         )
+        self._invalidate(pipe, session.session_id)
+        await pipe.execute()
+
+        if self._near_cache is not None:
+            self._near_cache.put(session, session.last_activity)
 
     async def terminate_session(self, session_id: str) -> None:
         """Terminate a session.
@@ -319,21 +641,19 @@ class RedisSessionManager:
         if session:
             session.status = SessionStatus.TERMINATED
 
+            pipe = self._redis.pipeline(transaction=True)
             # Update with terminated status (short TTL for cleanup)
-            await self._redis.setex(
+            pipe.setex(
                 self._session_key(session_id),
                 60,  # Keep for 1 minute for cleanup
-                session.model_dump_json(),
+                _dumps(session),
             )
-
             # Remove from user's sessions
-            await self._redis.srem(
-                self._user_sessions_key(session.user_id),
-                session_id,
-            )
-
+            pipe.srem(self._user_sessions_key(session.config.user_id), session_id)
             # Delete conversations
-            await self._redis.delete(self._conversations_key(session_id))
+            pipe.delete(self._conversations_key(session_id))
+            self._invalidate(pipe, session_id)
+            await pipe.execute()
 
             logger.info(f"Terminated Redis session {session_id}")
 
@@ -341,9 +661,7 @@ class RedisSessionManager:
     # CONVERSATION OPERATIONS
     # =========================================================================
 
-    async def add_conversation(
-        self, session_id: str, conversation: Conversation
-    ) -> None:
+    async def add_conversation(self, session_id: str, conversation: Conversation) -> None:
         """Add a conversation to a session.
 
         Args:
@@ -353,20 +671,15 @@ class RedisSessionManager:
         if not self._initialized:
             raise RuntimeError("Redis session manager not initialized")
 
-        await self._redis.hset(
-            self._conversations_key(session_id),
-            conversation.conversation_id,
-            conversation.model_dump_json(),
-        )
-
-        # Extend session TTL
-        await self._redis.expire(
-            self._session_key(session_id), self.config.session_ttl
-        )
+        conversations_key = self._conversations_key(session_id)
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.hset(conversations_key, conversation.conversation_id, _dumps(conversation))
+        # Extend session TTL; conversations expire with their session
+        pipe.expire(self._session_key(session_id), self.config.session_ttl)
+        pipe.expire(conversations_key, self.config.session_ttl)
+        await pipe.execute()
 
-    async def get_conversation(
-        self, session_id: str, conversation_id: str
-    ) -> Conversation | None:
+    async def get_conversation(self, session_id: str, conversation_id: str) -> Conversation | None:
         """Get a conversation.
 
         Args:
@@ -387,14 +700,12 @@ class RedisSessionManager:
             return None
 
         try:
-            return Conversation.model_validate_json(data)
+            return _load_conversation(data)
         except Exception as e:
             logger.error(f"Failed to deserialize conversation: {e}")
             return None
 
-    async def update_conversation(
-        self, session_id: str, conversation: Conversation
-    ) -> None:
+    async def update_conversation(self, session_id: str, conversation: Conversation) -> None:
         """Update a conversation.
 
         Args:
@@ -403,9 +714,7 @@ class RedisSessionManager:
         """
         await self.add_conversation(session_id, conversation)
 
-    async def get_all_conversations(
-        self, session_id: str
-    ) -> list[Conversation]:
+    async def get_all_conversations(self, session_id: str) -> list[Conversation]:
         """Get all conversations for a session.
 
         Args:
@@ -422,7 +731,7 @@ class RedisSessionManager:
         conversations = []
         for conv_data in data.values():
             try:
-                conversations.append(Conversation.model_validate_json(conv_data))
+                conversations.append(_load_conversation(conv_data))
             except Exception as e:
                 logger.error(f"Failed to deserialize conversation: {e}")
 
@@ -444,12 +753,12 @@ class RedisSessionManager:
         if not self._initialized:
             return None
 
-        data = await self._redis.get(self._usage_key(user_id))
+        data = await self._redis.hgetall(self._usage_key(user_id))
         if not data:
             return None
 
         try:
-            return UsageStats.model_validate_json(data)
+            return _usage_from_hash(data)
         except Exception as e:
             logger.error(f"Failed to deserialize usage: {e}")
             return None
@@ -463,10 +772,7 @@ class RedisSessionManager:
         if not self._initialized:
             raise RuntimeError("Redis session manager not initialized")
 
-        await self._redis.set(
-            self._usage_key(usage.user_id),
-            usage.model_dump_json(),
-        )
+        await self._redis.hset(self._usage_key(usage.user_id), mapping=_usage_to_hash(usage))
 
     async def increment_usage(
         self,
@@ -476,20 +782,87 @@ class RedisSessionManager:
     ) -> UsageStats | None:
         """Atomically increment usage counters.
 
+        Runs as a Lua script, so concurrent increments from any instance
+        are never lost and the daily rollover happens exactly once.
+
         Args:
             user_id: User identifier
             messages: Messages to add
             tokens: Tokens to add
 
         Returns:
-            Updated UsageStats
+            Updated UsageStats, or None if the user has no usage record
         """
-        usage = await self.get_usage(user_id)
-        if usage:
-            usage.messages_used += messages
-            usage.tokens_used += tokens
-            await self.update_usage(usage)
-        return usage
+        if not self._initialized:
+            return None
+
+        result = await self._increment_usage(
+            keys=[self._usage_key(user_id)],
+            args=[
+                time.time(),
+                messages,
+                tokens,
+                self._get_next_reset_time().timestamp(),
+            ],
+        )
+        if not result:
+            return None
+        return _usage_from_hash(dict(zip(result[::2], result[1::2], strict=True)))
+
+    # =========================================================================
+    # RATE LIMITING
+    # =========================================================================
+
+    async def check_rate_limit(
+        self,
+        user_id: str,
+        tier: SubscriptionTier,
+    ) -> tuple[bool, str | None]:
+        """Check if user can send a message, across all Hub instances.
+
+        Args:
+            user_id: User identifier
+            tier: User's subscription tier
+
+        Returns:
+            Tuple of (allowed, reason_if_denied)
+        """
+        if not self._initialized:
+            return True, None
+
+        limits = TierLimits.for_tier(tier)
+        minute, usage = await asyncio.gather(
+            self._message_limiter.peek(user_id, limit=limits.messages_per_minute),
+            self.get_usage(user_id),
+        )
+        if not minute.allowed:
+            return False, "Rate limit exceeded. Please wait a moment."
+
+        if usage is None or (usage.reset_at and datetime.now(timezone.utc) >= usage.reset_at):
+            usage = UsageStats(user_id=user_id, tier=tier)
+        return usage.can_send_message(limits)
+
+    async def record_message(
+        self,
+        user_id: str,
+        tier: SubscriptionTier,
+        tokens_used: int = 0,
+    ) -> None:
+        """Record a message for rate limiting.
+
+        Args:
+            user_id: User identifier
+            tier: User's subscription tier
+            tokens_used: Tokens consumed
+        """
+        if not self._initialized:
+            raise RuntimeError("Redis session manager not initialized")
+
+        limits = TierLimits.for_tier(tier)
+        await asyncio.gather(
+            self._message_limiter.hit(user_id, limit=limits.messages_per_minute),
+            self.increment_usage(user_id, messages=1, tokens=tokens_used),
+        )
 
     # =========================================================================
     # STATS & CLEANUP
@@ -510,19 +883,20 @@ class RedisSessionManager:
         pattern = f"{self.config.key_prefix}:*"
 
         while True:
-            cursor, keys = await self._redis.scan(
-                cursor, match=pattern, count=100
-            )
-            # Only count session keys (not conversations or usage)
+            cursor, keys = await self._redis.scan(cursor, match=pattern, count=100)
+            # Only count session keys (not conversations, usage or rate limits)
             session_count += sum(
                 1
                 for k in keys
-                if ":conversations" not in k and ":usage" not in k and ":user:" not in k
+                if ":conversations" not in k
+                and ":usage" not in k
+                and ":user:" not in k
+                and ":ratelimit:" not in k
             )
             if cursor == 0:
                 break
 
-        return {
+        stats = {
             "store": "redis",
             "url": self._sanitize_url(),
             "active_sessions": session_count,
@@ -530,6 +904,13 @@ class RedisSessionManager:
             "session_ttl": self.config.session_ttl,
             "connected": self._initialized,
         }
+        if self._near_cache is not None:
+            stats["near_cache"] = {
+                "entries": len(self._near_cache),
+                "hits": self._near_cache.hits,
+                "misses": self._near_cache.misses,
+            }
+        return stats
 
     async def cleanup_expired_user_sessions(self, user_id: str) -> int:
         """Clean up expired session references for a user.
@@ -543,28 +924,31 @@ class RedisSessionManager:
         if not self._initialized:
             return 0
 
-        cleaned = 0
         user_sessions_key = self._user_sessions_key(user_id)
-        session_ids = await self._redis.smembers(user_sessions_key)
+        session_ids = list(await self._redis.smembers(user_sessions_key))
+        if not session_ids:
+            return 0
 
+        # Check every session in one round-trip
+        pipe = self._redis.pipeline(transaction=False)
         for session_id in session_ids:
-            # Check if session still exists
-            if not await self._redis.exists(self._session_key(session_id)):
-                await self._redis.srem(user_sessions_key, session_id)
-                cleaned += 1
+            pipe.exists(self._session_key(session_id))
+        exists = await pipe.execute()
 
-        return cleaned
+        expired = [sid for sid, found in zip(session_ids, exists, strict=True) if not found]
+        if expired:
+            await self._redis.srem(user_sessions_key, *expired)
+        return len(expired)
 
     # =========================================================================
     # HELPERS
     # =========================================================================
 
     def _get_next_reset_time(self) -> datetime:
-        """Get next usage reset time (start of next month)."""
+        """Get next daily usage reset time (midnight UTC)."""
         now = datetime.now(timezone.utc)
-        if now.month == 12:
-            return datetime(now.year + 1, 1, 1, tzinfo=timezone.utc)
-        return datetime(now.year, now.month + 1, 1, tzinfo=timezone.utc)
+        tomorrow = now + timedelta(days=1)
+        return tomorrow.replace(hour=0, minute=0, second=0, microsecond=0)
 
 
 # =============================================================================
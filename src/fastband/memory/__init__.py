@@ -44,6 +44,7 @@ from fastband.memory.budget import (
 from fastband.memory.tiers import (
     MemoryTier,
     MemoryItem,
+    LRUTier,
     TieredMemoryStore,
     TieredMemoryManager,
     get_tiered_memory_manager,
@@ -59,6 +60,8 @@ from fastband.memory.handoff import (
     HandoffReason,
     HandoffPriority,
     HandoffManager,
+    HandoffCatalog,
+    HandoffEntry,
     get_handoff_manager,
 )
 
@@ -77,6 +80,7 @@ __all__ = [
     # Tiered memory
     "MemoryTier",
     "MemoryItem",
+    "LRUTier",
     "TieredMemoryStore",
     "TieredMemoryManager",
     "get_tiered_memory_manager",
@@ -90,5 +94,7 @@ __all__ = [
     "HandoffReason",
     "HandoffPriority",
     "HandoffManager",
+    "HandoffCatalog",
+    "HandoffEntry",
     "get_handoff_manager",
 ]
@@ -13,14 +13,23 @@ import hmac
 import json
 import logging
 import secrets
+import sqlite3
 import threading
+import time
 import uuid
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any, Optional
 
+from fastband.core.serialization import (
+    SerializationError,
+    Serializer,
+    get_serializer,
+    load_file,
+    save_file,
+)
 from fastband.memory.budget import TokenBudget
 from fastband.memory.tiers import TieredMemoryStore, MemoryItem, MemoryTier
 
@@ -488,6 +497,218 @@ class HandoffPacket:
         return "\n".join(lines)
 
 
+@dataclass(slots=True)
+class HandoffEntry:
+    """Catalog row for a stored packet: enough to list and filter without reading it."""
+
+    packet_id: str
+    ticket_id: str
+    source_agent: str
+    target_agent: str | None
+    reason: str
+    priority: int
+    created_at: str
+    status: str  # "pending" or "archived"
+    encrypted: bool = False
+    archived_at: float | None = None  # Unix time the packet was archived
+
+    def to_dict(self) -> dict:
+        """Serialize to dictionary."""
+        return asdict(self)
+
+
+class HandoffCatalog:
+    """
+    SQLite index of stored handoff packets. Thread-safe.
+
+    Listing, filtering and archive cleanup query the catalog instead of
+    opening (and possibly decrypting) every packet file. The packet files
+    stay the source of truth; rebuild() re-indexes them.
+    """
+
+    PENDING = "pending"
+    ARCHIVED = "archived"
+
+    _COLUMNS = (
+        "packet_id, ticket_id, source_agent, target_agent, reason, priority,"
+        " created_at, status, encrypted, archived_at"
+    )
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.created = not self.path.exists()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS packets (
+                    packet_id TEXT PRIMARY KEY,
+                    ticket_id TEXT NOT NULL DEFAULT '',
+                    source_agent TEXT NOT NULL DEFAULT '',
+                    target_agent TEXT,
+                    reason TEXT NOT NULL DEFAULT '',
+                    priority INTEGER NOT NULL DEFAULT 3,
+                    created_at TEXT NOT NULL DEFAULT '',
+                    status TEXT NOT NULL,
+                    encrypted INTEGER NOT NULL DEFAULT 0,
+                    archived_at REAL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_packets_status "
+                "ON packets(status, ticket_id, created_at)"
+            )
+
+    def add(self, entry: HandoffEntry) -> None:
+        """Insert or replace a packet's entry."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO packets ({self._COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry.packet_id,
+                    entry.ticket_id,
+                    entry.source_agent,
+                    entry.target_agent,
+                    entry.reason,
+                    entry.priority,
+                    entry.created_at,
+                    entry.status,
+                    int(entry.encrypted),
+                    entry.archived_at,
+                ),
+            )
+
+    def archive(self, packet_id: str, archived_at: float | None = None) -> None:
+        """Mark a packet as archived."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE packets SET status = ?, archived_at = ? WHERE packet_id = ?",
+                (self.ARCHIVED, archived_at or time.time(), packet_id),
+            )
+
+    def remove(self, packet_ids: list[str]) -> None:
+        """Drop packets' entries."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM packets WHERE packet_id = ?", [(pid,) for pid in packet_ids]
+            )
+
+    def query(
+        self,
+        status: str = PENDING,
+        ticket_id: str | None = None,
+        target_agent: str | None = None,
+        limit: int | None = None,
+    ) -> list[HandoffEntry]:
+        """Entries with a status, newest first, optionally filtered."""
+        query = f"SELECT {self._COLUMNS} FROM packets WHERE status = ?"
+        params: list[Any] = [status]
+        if ticket_id is not None:
+            query += " AND ticket_id = ?"
+            params.append(ticket_id)
+        if target_agent is not None:
+            # Packets addressed to nobody in particular are open to any agent
+            query += " AND (target_agent IS NULL OR target_agent = ?)"
+            params.append(target_agent)
+        query += " ORDER BY created_at DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def expired(self, cutoff: float) -> list[str]:
+        """IDs of packets archived before cutoff (Unix time)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT packet_id FROM packets WHERE status = ? AND archived_at < ?",
+                (self.ARCHIVED, cutoff),
+            ).fetchall()
+        return [row["packet_id"] for row in rows]
+
+    def counts(self) -> dict[str, int]:
+        """Number of entries per status."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) AS n FROM packets GROUP BY status"
+            ).fetchall()
+        return {row["status"]: row["n"] for row in rows}
+
+    def rebuild(self, storage_path: Path) -> int:
+        """
+        Re-index the packet files under storage_path. Returns entries indexed.
+
+        Reads every pending and archived packet once; used when the catalog
+        is first created next to existing packets, or to repair it.
+        """
+        entries = []
+        for status, directory in (
+            (self.PENDING, storage_path),
+            (self.ARCHIVED, storage_path / "archive"),
+        ):
+            if not directory.exists():
+                continue
+            for file_path in directory.glob("*.json"):
+                try:
+                    data = load_file(file_path)
+                    mtime = file_path.stat().st_mtime
+                except (SerializationError, OSError):
+                    continue
+                entries.append(self._entry_from_file(file_path.stem, data, status, mtime))
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM packets")
+        for entry in entries:
+            self.add(entry)
+        return len(entries)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _entry(row: sqlite3.Row) -> HandoffEntry:
+        return HandoffEntry(
+            packet_id=row["packet_id"],
+            ticket_id=row["ticket_id"],
+            source_agent=row["source_agent"],
+            target_agent=row["target_agent"],
+            reason=row["reason"],
+            priority=row["priority"],
+            created_at=row["created_at"],
+            status=row["status"],
+            encrypted=bool(row["encrypted"]),
+            archived_at=row["archived_at"],
+        )
+
+    @staticmethod
+    def _entry_from_file(packet_id: str, data: Any, status: str, mtime: float) -> HandoffEntry:
+        """Entry for a packet file in any stored format (wrapped, legacy, archived)."""
+        encrypted = isinstance(data, dict) and bool(data.get("encrypted"))
+        if not isinstance(data, dict) or encrypted:
+            packet = {}
+        else:
+            packet = data.get("packet", data)
+        return HandoffEntry(
+            packet_id=packet_id,
+            ticket_id=str(packet.get("ticket_id", "")),
+            source_agent=str(packet.get("source_agent", "")),
+            target_agent=packet.get("target_agent"),
+            reason=str(packet.get("reason", "")),
+            priority=int(packet.get("priority", HandoffPriority.NORMAL.value)),
+            created_at=str(
+                packet.get("created_at") or datetime.utcfromtimestamp(mtime).isoformat()
+            ),
+            status=status,
+            encrypted=encrypted,
+            archived_at=mtime if status == HandoffCatalog.ARCHIVED else None,
+        )
+
+
 class HandoffManager:
     """
     Manages agent handoffs with pre-emptive triggering. Thread-safe.
@@ -495,16 +716,29 @@ class HandoffManager:
     Monitors budget usage and triggers handoffs at:
     - 60%: Warning - start preparing handoff packet
     - 80%: Critical - must handoff immediately
+
+    Stored packets are indexed in a HandoffCatalog (catalog.db in the
+    storage directory), so listing and archive cleanup never open packet
+    files; full packets are read only when retrieved.
     """
 
     # Archive retention (48 hours default)
     ARCHIVE_RETENTION_HOURS = 48
 
-    def __init__(self, storage_path: Optional[str] = None):
+    def __init__(
+        self,
+        storage_path: Optional[str] = None,
+        serializer: str | Serializer | None = None,
+    ):
         self.storage_path = Path(storage_path or ".fastband/handoffs")
+        self.serializer = get_serializer(serializer)
         self.storage_path.mkdir(parents=True, exist_ok=True, mode=0o700)
         self._pending_packets: dict[str, HandoffPacket] = {}
         self._lock = threading.Lock()
+        self.catalog = HandoffCatalog(self.storage_path / "catalog.db")
+        if self.catalog.created:
+            # Index packets stored before the catalog existed
+            self.catalog.rebuild(self.storage_path)
 
     def check_handoff_needed(self, budget: TokenBudget) -> tuple[bool, HandoffReason | None, HandoffPriority | None]:
         """
@@ -563,7 +797,7 @@ class HandoffManager:
         # Extract memory context if available
         if memory_store:
             packet.hot_context = memory_store.get_hot_context()
-            packet.hot_tokens = sum(i.token_count for i in memory_store.hot.values())
+            packet.hot_tokens = memory_store.hot.tokens
             packet.warm_references = list(memory_store.warm.keys())
             packet.budget_used = memory_store.budget.used_tokens
             packet.budget_peak = memory_store.budget.peak_usage
@@ -611,8 +845,21 @@ class HandoffManager:
             _logger.debug(f"Packet {packet.packet_id} stored with encryption")
 
         file_path = self.storage_path / f"{packet.packet_id}.json"
-        with open(file_path, "w") as f:
-            json.dump(storage_data, f, indent=2)
+        save_file(file_path, storage_data, self.serializer)
+
+        self.catalog.add(
+            HandoffEntry(
+                packet_id=packet.packet_id,
+                ticket_id=packet.ticket_id,
+                source_agent=packet.source_agent,
+                target_agent=packet.target_agent,
+                reason=packet.reason.value,
+                priority=packet.priority.value,
+                created_at=packet.created_at,
+                status=HandoffCatalog.PENDING,
+                encrypted=storage_data["encrypted"],
+            )
+        )
 
         with self._lock:
             self._pending_packets[packet.packet_id] = packet
@@ -637,8 +884,7 @@ class HandoffManager:
         if not file_path.exists():
             return None
 
-        with open(file_path, "r") as f:
-            storage_data = json.load(f)
+        storage_data = load_file(file_path)
 
         # Handle legacy format (no wrapper)
         if "packet" not in storage_data and "encrypted" not in storage_data:
@@ -671,23 +917,39 @@ class HandoffManager:
 
         return HandoffPacket.from_dict(packet_data)
 
+    def list_handoffs(
+        self,
+        ticket_id: str | None = None,
+        target_agent: str | None = None,
+        limit: int | None = None,
+        archived: bool = False,
+    ) -> list[HandoffEntry]:
+        """
+        List stored handoffs from the catalog, newest first. Reads no packet files.
+
+        Args:
+            ticket_id: Only handoffs for this ticket
+            target_agent: Only handoffs this agent may accept
+            limit: Max entries to return
+            archived: List accepted (archived) handoffs instead of pending ones
+        """
+        status = HandoffCatalog.ARCHIVED if archived else HandoffCatalog.PENDING
+        return self.catalog.query(status, ticket_id, target_agent, limit)
+
     def get_pending_handoffs(self, ticket_id: Optional[str] = None) -> list[HandoffPacket]:
         """Get all pending handoff packets, optionally filtered by ticket."""
         packets = []
 
-        for file_path in self.storage_path.glob("*.json"):
+        for entry in self.list_handoffs(ticket_id):
             try:
-                # Extract packet_id from filename
-                packet_id = file_path.stem
                 # Use retrieve_packet to handle new format with signature verification
-                packet = self.retrieve_packet(packet_id, verify_signature=False)
-
-                if packet and (ticket_id is None or packet.ticket_id == ticket_id):
+                packet = self.retrieve_packet(entry.packet_id, verify_signature=False)
+                if packet:
                     packets.append(packet)
             except Exception:
                 continue
 
-        return sorted(packets, key=lambda p: p.created_at, reverse=True)
+        return packets
 
     def accept_handoff(
         self,
@@ -725,8 +987,7 @@ class HandoffManager:
         packet_data["accepted_at"] = datetime.utcnow().isoformat()
 
         archive_file = archive_path / f"{packet_id}.json"
-        with open(archive_file, "w") as f:
-            json.dump(packet_data, f, indent=2)
+        save_file(archive_file, packet_data, self.serializer)
 
         # Remove from pending
         pending_file = self.storage_path / f"{packet_id}.json"
@@ -735,40 +996,39 @@ class HandoffManager:
 
         with self._lock:
             self._pending_packets.pop(packet_id, None)
+        self.catalog.archive(packet_id)
 
         # Cleanup old archives
         self._cleanup_old_archives()
 
         return packet
 
+    def rebuild_catalog(self) -> int:
+        """Re-index the packet files, e.g. after editing the directory by hand."""
+        return self.catalog.rebuild(self.storage_path)
+
     def _cleanup_old_archives(self) -> int:
         """Clean up archives older than retention period. Returns count deleted."""
         archive_path = self.storage_path / "archive"
-        if not archive_path.exists():
-            return 0
+        cutoff = time.time() - self.ARCHIVE_RETENTION_HOURS * 3600
+        expired = self.catalog.expired(cutoff)
 
-        cutoff = datetime.utcnow() - timedelta(hours=self.ARCHIVE_RETENTION_HOURS)
-        deleted = 0
-
-        for file_path in archive_path.glob("*.json"):
+        for packet_id in expired:
             try:
-                if file_path.stat().st_mtime < cutoff.timestamp():
-                    file_path.unlink()
-                    deleted += 1
-            except Exception:
+                (archive_path / f"{packet_id}.json").unlink(missing_ok=True)
+            except OSError:
                 continue
 
-        return deleted
+        self.catalog.remove(expired)
+        return len(expired)
 
     def get_handoff_stats(self) -> dict:
         """Get statistics about handoffs. Thread-safe."""
-        pending = list(self.storage_path.glob("*.json"))
-        archive_path = self.storage_path / "archive"
-        archived = list(archive_path.glob("*.json")) if archive_path.exists() else []
+        counts = self.catalog.counts()
 
         return {
-            "pending_handoffs": len(pending),
-            "completed_handoffs": len(archived),
+            "pending_handoffs": counts.get(HandoffCatalog.PENDING, 0),
+            "completed_handoffs": counts.get(HandoffCatalog.ARCHIVED, 0),
             "storage_path": str(self.storage_path),
         }
 
@@ -10,7 +10,6 @@ Ported from Fastband_MCP/memory_manager.py
 """
 
 import hashlib
-import json
 import logging
 import os
 import re
@@ -19,6 +18,13 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+from fastband.core.serialization import (
+    SerializationError,
+    Serializer,
+    get_serializer,
+    load_file,
+    save_file,
+)
 from fastband.memory.models import FixPattern, SessionContext, TicketMemory
 
 logger = logging.getLogger(__name__)
@@ -52,12 +58,18 @@ class MemoryManager:
     - Self-healing storage (validation & migration)
     """
 
-    def __init__(self, base_path: Optional[Path] = None):
+    def __init__(
+        self,
+        base_path: Optional[Path] = None,
+        serializer: str | Serializer | None = None,
+    ):
         """Initialize memory manager.
 
         Args:
             base_path: Path to memory storage. Defaults to .fastband/memory
+            serializer: Serializer for memory files. Defaults to FASTBAND_SERIALIZER
         """
+        self.serializer = get_serializer(serializer)
         if base_path:
             self.base_path = Path(base_path)
         else:
@@ -113,20 +125,16 @@ class MemoryManager:
         self._save_json(index_path, self.semantic_index)
 
     def _load_json(self, path: Path) -> Dict:
-        """Load JSON with error recovery."""
+        """Load a memory file (any serializer) with error recovery."""
         try:
-            with open(path, "r", encoding="utf-8", errors="replace") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError, UnicodeDecodeError) as e:
+            return load_file(path)
+        except (SerializationError, FileNotFoundError) as e:
             logger.warning(f"Error loading {path}: {e}")
             return {}
 
     def _save_json(self, path: Path, data: Dict):
-        """Save JSON with atomic write."""
-        tmp_path = path.with_suffix(".tmp")
-        with open(tmp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        tmp_path.replace(path)
+        """Save a memory file with atomic write."""
+        save_file(path, data, self.serializer)
 
     def _get_ticket_memory_path(self, app: str, ticket_id: str) -> Path:
         """Get path for a ticket memory file."""
@@ -7,15 +7,32 @@ Tier 2: Cool Memory (Semantic) - Embeddings of past solutions
 Tier 3: Cold Memory (Ticket Archive) - Compressed ticket histories
 Tier 4: Frozen Memory (Bible/Config) - Lazy-loaded reference docs
 
+Stores created by TieredMemoryManager spill the cold and frozen tiers to
+disk: their items are kept zlib-compressed in a per-session SQLite file,
+with only IDs and sizes in memory, and are paged back in when retrieved
+or promoted.
+
 "The ticket IS the memory, not the conversation."
 """
 
+import asyncio
+import hashlib
+import re
+import shutil
+import sqlite3
+import tempfile
 import threading
+import weakref
+import zlib
+from collections import OrderedDict
+from collections.abc import Iterator, MutableMapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import IntEnum
+from pathlib import Path
 from typing import Any, Optional
 
+from fastband.core.serialization import decode, encode, get_serializer
 from fastband.memory.budget import TokenBudget, get_budget_manager
 
 
@@ -29,6 +46,12 @@ class MemoryTier(IntEnum):
     FROZEN = 4  # Reference memory - lazy loaded on demand
 
 
+# Tiers whose items are kept on disk when a spill directory is configured
+SPILLED_TIERS = (MemoryTier.COLD, MemoryTier.FROZEN)
+
+# zlib level for spilled content
+SPILL_COMPRESSION_LEVEL = 6
+
 # Token costs per tier (estimated)
 TIER_TOKEN_COSTS = {
     MemoryTier.HOT: 1.0,  # Full cost - always in context
@@ -90,6 +113,176 @@ class MemoryItem:
         )
 
 
+class LRUTier(MutableMapping):
+    """
+    Items of one tier in least-recently-used order, with a running token total.
+
+    Iteration runs from least to most recently used. Storing or touching an
+    item makes it the most recent; popitem() evicts the least recent. All
+    operations are O(1). ``version`` changes whenever the contents or their
+    order change, so callers can cache derived values against it.
+    """
+
+    def __init__(self):
+        self._items: OrderedDict[str, MemoryItem] = OrderedDict()
+        self.tokens = 0
+        self.nbytes = 0  # UTF-8 size of the content held
+        self.version = 0
+
+    def __getitem__(self, item_id: str) -> MemoryItem:
+        return self._items[item_id]
+
+    def __setitem__(self, item_id: str, item: MemoryItem) -> None:
+        old = self._items.pop(item_id, None)
+        if old is not None:
+            self._account(old, -1)
+        self._items[item_id] = item
+        self._account(item, 1)
+        self.version += 1
+
+    def __delitem__(self, item_id: str) -> None:
+        self._account(self._items.pop(item_id), -1)
+        self.version += 1
+
+    def _account(self, item: MemoryItem, sign: int) -> None:
+        self.tokens += sign * item.token_count
+        self.nbytes += sign * len(item.content.encode())
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._items
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return f"LRUTier({list(self._items)!r}, tokens={self.tokens})"
+
+    def touch(self, item_id: str) -> None:
+        """Mark an item as most recently used."""
+        if item_id in self._items:
+            self._items.move_to_end(item_id)
+            self.version += 1
+
+    def popitem(self) -> tuple[str, MemoryItem]:
+        """Remove and return the least recently used item."""
+        item_id, item = self._items.popitem(last=False)
+        self._account(item, -1)
+        self.version += 1
+        return item_id, item
+
+    def clear(self) -> None:
+        self._items.clear()
+        self.tokens = 0
+        self.nbytes = 0
+        self.version += 1
+
+    def close(self) -> None:
+        """Release resources (nothing to do for in-memory tiers)."""
+
+
+class SpilledTier(LRUTier):
+    """
+    An LRUTier whose items live compressed in a SQLite file. Thread-safe.
+
+    Only item IDs, token counts and sizes stay in memory; each lookup
+    decodes a fresh MemoryItem from disk, so changes to a retrieved item
+    persist only when it is stored again. ``nbytes`` is the uncompressed
+    content size and ``disk_bytes`` the compressed size on disk.
+    """
+
+    def __init__(self, path: str | Path):
+        super().__init__()
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.disk_bytes = 0
+        self._sizes: OrderedDict[str, tuple[int, int, int]] = OrderedDict()
+        self._items = self._sizes  # LRU order, iteration and membership
+        self._serializer = get_serializer("auto")
+        self._lock = threading.Lock()
+        # Scratch data: durability isn't needed, speed is
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode = OFF")
+        self._conn.execute("PRAGMA synchronous = OFF")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS items (item_id TEXT PRIMARY KEY, data BLOB)")
+        self._conn.execute("DELETE FROM items")
+
+    def __getitem__(self, item_id: str) -> MemoryItem:
+        if item_id not in self._sizes:
+            raise KeyError(item_id)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM items WHERE item_id = ?", (item_id,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(item_id)
+        data = decode(zlib.decompress(row[0]))
+        item = MemoryItem.from_dict(data)
+        item.embedding = data.get("embedding")
+        return item
+
+    def __setitem__(self, item_id: str, item: MemoryItem) -> None:
+        data = item.to_dict()
+        data["embedding"] = item.embedding
+        blob = zlib.compress(encode(data, self._serializer), SPILL_COMPRESSION_LEVEL)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO items (item_id, data) VALUES (?, ?)", (item_id, blob)
+            )
+            self._forget(item_id)
+            self._remember(item_id, (item.token_count, len(item.content.encode()), len(blob)))
+        self.version += 1
+
+    def __delitem__(self, item_id: str) -> None:
+        with self._lock:
+            if item_id not in self._sizes:
+                raise KeyError(item_id)
+            self._conn.execute("DELETE FROM items WHERE item_id = ?", (item_id,))
+            self._forget(item_id)
+        self.version += 1
+
+    def _remember(self, item_id: str, sizes: tuple[int, int, int]) -> None:
+        self._sizes[item_id] = sizes
+        self.tokens += sizes[0]
+        self.nbytes += sizes[1]
+        self.disk_bytes += sizes[2]
+
+    def _forget(self, item_id: str) -> None:
+        sizes = self._sizes.pop(item_id, None)
+        if sizes is not None:
+            self.tokens -= sizes[0]
+            self.nbytes -= sizes[1]
+            self.disk_bytes -= sizes[2]
+
+    def popitem(self) -> tuple[str, MemoryItem]:
+        """Remove and return the least recently used item."""
+        item_id = next(iter(self._sizes))
+        item = self[item_id]
+        del self[item_id]
+        return item_id, item
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM items")
+            self._sizes.clear()
+        self.tokens = self.nbytes = self.disk_bytes = 0
+        self.version += 1
+
+    async def load(self, item_id: str) -> MemoryItem:
+        """Read an item in a worker thread. Raises KeyError if absent."""
+        return await asyncio.to_thread(self.__getitem__, item_id)
+
+    def close(self) -> None:
+        """Close and delete the spill file."""
+        with self._lock:
+            self._conn.close()
+            self._sizes.clear()
+        self.tokens = self.nbytes = self.disk_bytes = 0
+        self.path.unlink(missing_ok=True)
+
+
 @dataclass
 class TieredMemoryStore:
     """
@@ -98,22 +291,43 @@ class TieredMemoryStore:
     Key insight: "The ticket IS the memory, not the conversation."
     - Hot memory: Current working context only
     - Everything else loads on-demand from ticket/archive
+
+    With spill_dir set, the SPILLED_TIERS are SpilledTiers in files under
+    it; call close() to delete them.
     """
 
     session_id: str
     budget: TokenBudget
 
-    # Tier storage
-    hot: dict[str, MemoryItem] = field(default_factory=dict)
-    warm: dict[str, MemoryItem] = field(default_factory=dict)
-    cool: dict[str, MemoryItem] = field(default_factory=dict)
-    cold: dict[str, MemoryItem] = field(default_factory=dict)
-    frozen: dict[str, MemoryItem] = field(default_factory=dict)
-
-    # LRU tracking for eviction
-    _access_order: list[str] = field(default_factory=list)
+    # Tier storage, each in LRU order with a running token total
+    hot: LRUTier = field(default_factory=LRUTier)
+    warm: LRUTier = field(default_factory=LRUTier)
+    cool: LRUTier = field(default_factory=LRUTier)
+    cold: LRUTier = field(default_factory=LRUTier)
+    frozen: LRUTier = field(default_factory=LRUTier)
+
+    # Directory for spilled tiers (None keeps every tier in memory)
+    spill_dir: Path | None = None
+
+    # Hot context cache: (hot.version it was built at, text)
+    _hot_context: tuple[int, str] | None = field(default=None, repr=False)
+
+    def __post_init__(self):
+        if self.spill_dir is None:
+            return
+        # Readable part of the session ID, plus a hash so distinct IDs never
+        # share (and wipe) each other's spill files
+        readable = re.sub(r"[^A-Za-z0-9_-]", "_", self.session_id)[:64]
+        digest = hashlib.sha256(self.session_id.encode()).hexdigest()[:12]
+        prefix = f"{readable}-{digest}"
+        for tier in SPILLED_TIERS:
+            spilled = SpilledTier(Path(self.spill_dir) / f"{prefix}-{tier.name.lower()}.db")
+            store = self._get_tier_store(tier)
+            for item_id in store:
+                spilled[item_id] = store[item_id]
+            setattr(self, tier.name.lower(), spilled)
 
-    def _get_tier_store(self, tier: MemoryTier) -> dict[str, MemoryItem]:
+    def _get_tier_store(self, tier: MemoryTier) -> LRUTier:
         """Get the storage dict for a tier."""
         return {
             MemoryTier.HOT: self.hot,
@@ -131,41 +345,34 @@ class TieredMemoryStore:
         """
         # Hot tier items consume from budget
         if item.tier == MemoryTier.HOT:
-            if not self.budget.consume(item.token_count):
-                # Try eviction before failing
-                if not self._evict_lru(item.token_count):
-                    return False
-                if not self.budget.consume(item.token_count):
-                    return False
+            # Replacing an item releases the budget its old version held
+            old = self.hot.pop(item.item_id, None)
+            if old is not None:
+                self.budget.release(old.token_count)
+            if not self._reserve(item.token_count):
+                if old is not None and self.budget.consume(old.token_count):
+                    self.hot[item.item_id] = old
+                return False
 
         store = self._get_tier_store(item.tier)
         store[item.item_id] = item
-
-        if item.tier == MemoryTier.HOT:
-            self._access_order.append(item.item_id)
-
         return True
 
     def retrieve(self, item_id: str, tier: Optional[MemoryTier] = None) -> Optional[MemoryItem]:
         """
         Retrieve an item, optionally promoting it to hot memory.
 
-        If tier is not specified, searches all tiers.
+        If tier is not specified, searches all tiers. Retrieving an item
+        marks it as most recently used in its tier.
         """
-        if tier:
-            store = self._get_tier_store(tier)
-            item = store.get(item_id)
-            if item:
-                item.access()
-                return item
-            return None
-
-        # Search all tiers, hottest first
-        for t in MemoryTier:
+        # Search the given tier, or all tiers hottest first
+        for t in [tier] if tier is not None else MemoryTier:
             store = self._get_tier_store(t)
             item = store.get(item_id)
             if item:
                 item.access()
+                # Re-storing marks it most recent (and saves the access to disk if spilled)
+                store[item_id] = item
                 return item
         return None
 
@@ -175,34 +382,49 @@ class TieredMemoryStore:
 
         Returns False if budget doesn't allow.
         """
-        # Find the item
-        item = None
-        source_tier = None
+        source_store = self._find_cooler(item_id)
+        if source_store is None:
+            return False
+        return self._move_to_hot(source_store, source_store[item_id])
+
+    async def promote_to_hot_async(self, item_id: str) -> bool:
+        """
+        Promote an item to hot memory, reading spilled items in a worker thread.
+
+        Returns False if the item isn't found or budget doesn't allow.
+        """
+        source_store = self._find_cooler(item_id)
+        if source_store is None:
+            return False
+        if isinstance(source_store, SpilledTier):
+            try:
+                item = await source_store.load(item_id)
+            except KeyError:
+                return False
+            # It may have been moved while loading
+            if item_id not in source_store:
+                return False
+        else:
+            item = source_store[item_id]
+        return self._move_to_hot(source_store, item)
+
+    def _find_cooler(self, item_id: str) -> LRUTier | None:
+        """The non-hot tier holding item_id, searching hottest first."""
         for tier in MemoryTier:
             if tier == MemoryTier.HOT:
                 continue
             store = self._get_tier_store(tier)
             if item_id in store:
-                item = store[item_id]
-                source_tier = tier
-                break
+                return store
+        return None
 
-        if not item:
+    def _move_to_hot(self, source_store: LRUTier, item: MemoryItem) -> bool:
+        if not self._reserve(item.token_count):
             return False
 
-        # Check budget
-        if not self.budget.consume(item.token_count):
-            if not self._evict_lru(item.token_count):
-                return False
-            if not self.budget.consume(item.token_count):
-                return False
-
-        # Move to hot
-        source_store = self._get_tier_store(source_tier)
-        del source_store[item_id]
+        del source_store[item.item_id]
         item.tier = MemoryTier.HOT
-        self.hot[item_id] = item
-        self._access_order.append(item_id)
+        self.hot[item.item_id] = item
         return True
 
     def demote_from_hot(self, item_id: str, target_tier: MemoryTier = MemoryTier.WARM) -> bool:
@@ -219,65 +441,54 @@ class TieredMemoryStore:
         item.tier = target_tier
         target_store = self._get_tier_store(target_tier)
         target_store[item_id] = item
-
-        if item_id in self._access_order:
-            self._access_order.remove(item_id)
-
         return True
 
+    def _reserve(self, tokens: int) -> bool:
+        """Consume hot budget, evicting LRU items if needed."""
+        if self.budget.consume(tokens):
+            return True
+        # Try eviction before failing
+        return self._evict_lru(tokens) and self.budget.consume(tokens)
+
     def _evict_lru(self, tokens_needed: int) -> bool:
         """
         Evict least-recently-used items from hot memory.
 
         Returns True if enough space was freed.
         """
-        freed = 0
-        to_evict = []
-
-        for item_id in self._access_order:
-            if item_id in self.hot:
-                item = self.hot[item_id]
-                to_evict.append(item_id)
-                freed += item.token_count
-                if freed >= tokens_needed:
-                    break
-
-        if freed < tokens_needed:
+        if self.hot.tokens < tokens_needed:
             return False
 
-        for item_id in to_evict:
+        freed = 0
+        while freed < tokens_needed:
+            item_id = next(iter(self.hot))
+            freed += self.hot[item_id].token_count
             self.demote_from_hot(item_id, MemoryTier.WARM)
 
         return True
 
     def get_hot_context(self) -> str:
-        """Get all hot memory as a single context string."""
-        items = sorted(self.hot.values(), key=lambda x: x.access_count, reverse=True)
-        return "\n\n".join(item.content for item in items)
+        """
+        Get all hot memory as a single context string, most accessed first.
+
+        The string is cached until the hot tier changes (items stored,
+        promoted, demoted or retrieved).
+        """
+        if self._hot_context is None or self._hot_context[0] != self.hot.version:
+            items = sorted(self.hot.values(), key=lambda x: x.access_count, reverse=True)
+            text = "\n\n".join(item.content for item in items)
+            self._hot_context = (self.hot.version, text)
+        return self._hot_context[1]
 
     def get_tier_stats(self) -> dict:
         """Get statistics about memory usage per tier."""
         return {
-            "hot": {
-                "count": len(self.hot),
-                "tokens": sum(i.token_count for i in self.hot.values()),
-            },
-            "warm": {
-                "count": len(self.warm),
-                "tokens": sum(i.token_count for i in self.warm.values()),
-            },
-            "cool": {
-                "count": len(self.cool),
-                "tokens": sum(i.token_count for i in self.cool.values()),
-            },
-            "cold": {
-                "count": len(self.cold),
-                "tokens": sum(i.token_count for i in self.cold.values()),
-            },
-            "frozen": {
-                "count": len(self.frozen),
-                "tokens": sum(i.token_count for i in self.frozen.values()),
-            },
+            "hot": {"count": len(self.hot), "tokens": self.hot.tokens},
+            "warm": {"count": len(self.warm), "tokens": self.warm.tokens},
+            "cool": {"count": len(self.cool), "tokens": self.cool.tokens},
+            "cold": {"count": len(self.cold), "tokens": self.cold.tokens},
+            "frozen": {"count": len(self.frozen), "tokens": self.frozen.tokens},
+            "memory": self.memory_footprint(),
             "budget": {
                 "allocated": self.budget.allocated_tokens,
                 "used": self.budget.used_tokens,
@@ -286,6 +497,23 @@ class TieredMemoryStore:
             },
         }
 
+    def memory_footprint(self) -> dict[str, int]:
+        """Content bytes held in memory and spilled to disk."""
+        footprint = {"resident_bytes": 0, "spilled_bytes": 0, "spilled_disk_bytes": 0}
+        for tier in MemoryTier:
+            store = self._get_tier_store(tier)
+            if isinstance(store, SpilledTier):
+                footprint["spilled_bytes"] += store.nbytes
+                footprint["spilled_disk_bytes"] += store.disk_bytes
+            else:
+                footprint["resident_bytes"] += store.nbytes
+        return footprint
+
+    def close(self) -> None:
+        """Release spilled tiers' files."""
+        for tier in MemoryTier:
+            self._get_tier_store(tier).close()
+
 
 class TieredMemoryManager:
     """
@@ -301,18 +529,30 @@ class TieredMemoryManager:
     MAX_SHARED_COOL_TOKENS = 50_000  # Max tokens in shared cool
     MAX_SHARED_COLD_TOKENS = 200_000  # Max tokens in shared cold
 
-    def __init__(self):
+    def __init__(self, spill_dir: str | Path | None = None, spill: bool = True):
+        """
+        Args:
+            spill_dir: Directory for spilled tiers (default: a temporary directory)
+            spill: Spill cold and frozen tiers to disk; False keeps them in memory
+        """
         self._stores: dict[str, TieredMemoryStore] = {}
-        self._shared_cool: dict[str, MemoryItem] = {}  # Shared semantic memory
-        self._shared_cold: dict[str, MemoryItem] = {}  # Shared archive
+        self._shared_cool = LRUTier()  # Shared semantic memory
+        self._shared_cold = LRUTier()  # Shared archive
         self._lock = threading.Lock()
+        self.spill_dir: Path | None = None
+        if spill:
+            if spill_dir is None:
+                spill_dir = tempfile.mkdtemp(prefix="fastband-memory-")
+                weakref.finalize(self, shutil.rmtree, spill_dir, ignore_errors=True)
+            self.spill_dir = Path(spill_dir)
+            self._shared_cold = SpilledTier(self.spill_dir / "shared-cold.db")
 
     def _get_shared_tokens(self, tier: MemoryTier) -> int:
         """Get total tokens in a shared tier. Must hold lock."""
         if tier == MemoryTier.COOL:
-            return sum(item.token_count for item in self._shared_cool.values())
+            return self._shared_cool.tokens
         elif tier == MemoryTier.COLD:
-            return sum(item.token_count for item in self._shared_cold.values())
+            return self._shared_cold.tokens
         return 0
 
     def _evict_lru_shared(self, tier: MemoryTier, tokens_needed: int = 0) -> int:
@@ -332,24 +572,10 @@ class TieredMemoryManager:
         else:
             return 0
 
-        if not store:
-            return 0
-
-        # Sort by last_accessed (oldest first), then by access_count (lowest first)
-        sorted_items = sorted(
-            store.items(),
-            key=lambda x: (x[1].last_accessed or "", x[1].access_count)
-        )
-
+        # Evict oldest first until under limits
         evicted = 0
-        current_tokens = self._get_shared_tokens(tier)
-
-        # Evict until under limits
-        for item_id, item in sorted_items:
-            if len(store) <= max_items and current_tokens <= max_tokens - tokens_needed:
-                break
-            del store[item_id]
-            current_tokens -= item.token_count
+        while store and (len(store) > max_items or store.tokens > max_tokens - tokens_needed):
+            store.popitem()
             evicted += 1
 
         return evicted
@@ -358,7 +584,12 @@ class TieredMemoryManager:
         """Create a new tiered memory store for an agent session. Thread-safe."""
         budget_manager = get_budget_manager()
         budget = budget_manager.create_budget(agent_name, session_id)
-        store = TieredMemoryStore(session_id=session_id, budget=budget)
+        with self._lock:
+            old = self._stores.pop(session_id, None)
+        if old is not None:
+            # Its spill files have the same names
+            old.close()
+        store = TieredMemoryStore(session_id=session_id, budget=budget, spill_dir=self.spill_dir)
         with self._lock:
             self._stores[session_id] = store
         return store
@@ -392,14 +623,14 @@ class TieredMemoryManager:
             )
             for item in candidates:
                 if item.access_count >= 3 and promoted < 10:
-                    # Check limits before adding
-                    if len(self._shared_cool) >= self.MAX_SHARED_COOL_ITEMS:
-                        evicted += self._evict_lru_shared(MemoryTier.COOL, item.token_count)
                     self._shared_cool[item.item_id] = item
                     promoted += 1
+            # Enforce limits; newly promoted items are the most recent
+            evicted += self._evict_lru_shared(MemoryTier.COOL)
 
         # Get final stats
         stats = store.get_tier_stats()
+        store.close()
         stats["shared_memory"] = {
             "promoted": promoted,
             "evicted": evicted,
@@ -438,19 +669,51 @@ class TieredMemoryManager:
                 results.append(item)
                 if len(results) >= limit:
                     break
+
+        # Matches count as uses for eviction
+        with self._lock:
+            shared = self._shared_cool if tier == MemoryTier.COOL else self._shared_cold
+            for item in results:
+                shared.touch(item.item_id)
         return results
 
+    def close(self) -> None:
+        """Close all stores and shared memory, deleting spill files. Thread-safe."""
+        with self._lock:
+            stores = list(self._stores.values())
+            self._stores.clear()
+        for store in stores:
+            store.close()
+        with self._lock:
+            self._shared_cool.clear()
+            self._shared_cold.close()
+            self._shared_cold = LRUTier()
+
     def get_global_stats(self) -> dict:
         """Get aggregate statistics across all sessions. Thread-safe."""
         with self._lock:
-            stores_count = len(self._stores)
+            stores = list(self._stores.values())
             cool_count = len(self._shared_cool)
             cold_count = len(self._shared_cold)
+            shared = [self._shared_cool, self._shared_cold]
+
+        memory = {"resident_bytes": 0, "spilled_bytes": 0, "spilled_disk_bytes": 0}
+        for store in stores:
+            for key, value in store.memory_footprint().items():
+                memory[key] += value
+        for tier in shared:
+            if isinstance(tier, SpilledTier):
+                memory["spilled_bytes"] += tier.nbytes
+                memory["spilled_disk_bytes"] += tier.disk_bytes
+            else:
+                memory["resident_bytes"] += tier.nbytes
+
         budget_manager = get_budget_manager()
         return {
-            "active_sessions": stores_count,
+            "active_sessions": len(stores),
             "shared_cool_items": cool_count,
             "shared_cold_items": cold_count,
+            "memory": memory,
             "budget": budget_manager.get_total_usage(),
         }
 
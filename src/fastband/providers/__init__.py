@@ -1,6 +1,12 @@
 """AI Provider implementations."""
 
-from fastband.providers.base import AIProvider, Capability, CompletionResponse, ProviderConfig
+from fastband.providers.base import (
+    AIProvider,
+    Capability,
+    CompletionResponse,
+    ProviderConfig,
+    StreamEvent,
+)
 from fastband.providers.circuit_breaker import (
     CircuitBreaker,
     CircuitBreakerConfig,
@@ -20,6 +26,7 @@ __all__ = [
     "Capability",
     "ProviderConfig",
     "CompletionResponse",
+    "StreamEvent",
     "ProviderRegistry",
     "get_provider",
     # Circuit breaker
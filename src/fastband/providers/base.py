@@ -57,12 +57,34 @@ class CompletionResponse:
         return []
 
 
+@dataclass
+class StreamEvent:
+    """
+    Event from a tool-aware completion stream.
+
+    Types:
+        text: A chunk of response text (``text``)
+        tool_call: A complete tool call, in OpenAI format (``tool_call``)
+        done: End of the stream (``usage``, ``finish_reason``)
+    """
+
+    type: str
+    text: str = ""
+    tool_call: dict[str, Any] | None = None
+    usage: dict[str, int] | None = None
+    finish_reason: str | None = None
+
+
 class AIProvider(ABC):
     """
     Abstract base class for AI providers.
 
     All providers must implement this interface to ensure
     consistent behavior across Claude, OpenAI, Gemini, etc.
+
+    Providers that can stream tool calls may also implement
+    ``stream_with_tools(messages, tools, **kwargs)``, yielding StreamEvent
+    objects (see ClaudeProvider). Callers fall back to stream() otherwise.
     """
 
     def __init__(self, config: ProviderConfig):
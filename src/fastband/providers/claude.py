@@ -4,6 +4,7 @@ Claude AI Provider.
 Implements the AIProvider interface for Anthropic's Claude models.
 """
 
+import json
 import logging
 import os
 from collections.abc import AsyncIterator
@@ -14,6 +15,7 @@ from fastband.providers.base import (
     Capability,
     CompletionResponse,
     ProviderConfig,
+    StreamEvent,
 )
 
 logger = logging.getLogger(__name__)
@@ -194,7 +196,57 @@ class ClaudeProvider(AIProvider):
         else:
             api_messages = [{"role": "user", "content": "Hello"}]
 
-        # Convert messages from OpenAI format to Claude format
+        combined_system, claude_messages = self._convert_messages(api_messages, system_prompt)
+
+        response = await self.client.messages.create(
+            model=kwargs.get("model", self.config.model),
+            max_tokens=kwargs.get("max_tokens", self.config.max_tokens),
+            temperature=kwargs.get("temperature", self.config.temperature),
+            system=combined_system,
+            messages=claude_messages,
+            tools=claude_tools if claude_tools else None,
+        )
+
+        # Extract content (may include tool_use blocks)
+        content_parts = []
+        tool_calls = []
+
+        for block in response.content:
+            if block.type == "text":
+                content_parts.append(block.text)
+            elif block.type == "tool_use":
+                # Use OpenAI-compatible format for tool calls
+                import json as json_module
+                tool_calls.append(
+                    {
+                        "id": block.id,
+                        "function": {
+                            "name": block.name,
+                            "arguments": json_module.dumps(block.input),
+                        },
+                    }
+                )
+
+        return CompletionResponse(
+            content="\n".join(content_parts) if content_parts else "",
+            model=response.model,
+            provider=self.name,
+            usage={
+                "prompt_tokens": response.usage.input_tokens,
+                "completion_tokens": response.usage.output_tokens,
+                "total_tokens": response.usage.input_tokens + response.usage.output_tokens,
+            },
+            finish_reason=response.stop_reason or "end_turn",
+            raw_response={
+                "tool_calls": tool_calls,
+                "full_response": response.model_dump() if hasattr(response, "model_dump") else None,
+            },
+        )
+
+    def _convert_messages(
+        self, api_messages: list[dict[str, Any]], system_prompt: str | None = None
+    ) -> tuple[str, list[dict[str, Any]]]:
+        """Convert OpenAI-format messages to a Claude system prompt and message list."""
         system_parts = []
         claude_messages = []
         pending_tool_results = []
@@ -257,53 +309,16 @@ class ClaudeProvider(AIProvider):
         if system_parts:
             combined_system = "\n\n".join(filter(None, [combined_system] + system_parts))
 
-        response = await self.client.messages.create(
-            model=kwargs.get("model", self.config.model),
-            max_tokens=kwargs.get("max_tokens", self.config.max_tokens),
-            temperature=kwargs.get("temperature", self.config.temperature),
-            system=combined_system,
-            messages=claude_messages,
-            tools=claude_tools if claude_tools else None,
-        )
-
-        # Extract content (may include tool_use blocks)
-        content_parts = []
-        tool_calls = []
-
-        for block in response.content:
-            if block.type == "text":
-                content_parts.append(block.text)
-            elif block.type == "tool_use":
-                # Use OpenAI-compatible format for tool calls
-                import json as json_module
-                tool_calls.append(
-                    {
-                        "id": block.id,
-                        "function": {
-                            "name": block.name,
-                            "arguments": json_module.dumps(block.input),
-                        },
-                    }
-                )
-
-        return CompletionResponse(
-            content="\n".join(content_parts) if content_parts else "",
-            model=response.model,
-            provider=self.name,
-            usage={
-                "prompt_tokens": response.usage.input_tokens,
-                "completion_tokens": response.usage.output_tokens,
-                "total_tokens": response.usage.input_tokens + response.usage.output_tokens,
-            },
-            finish_reason=response.stop_reason or "end_turn",
-            raw_response={
-                "tool_calls": tool_calls,
-                "full_response": response.model_dump() if hasattr(response, "model_dump") else None,
-            },
-        )
+        return combined_system, claude_messages
 
     def _convert_tools(self, openai_tools: list[dict]) -> list[dict]:
         """Convert OpenAI tool format to Claude format."""
+        # Catalog lists from the tool registry carry a precomputed conversion
+        # (duck-typed, so providers don't depend on the tools package)
+        precomputed = getattr(openai_tools, "claude_schemas", None)
+        if precomputed is not None:
+            return precomputed
+
         claude_tools = []
         for tool in openai_tools:
             if tool.get("type") == "function":
@@ -373,6 +388,88 @@ class ClaudeProvider(AIProvider):
             async for text in stream.text_stream:
                 yield text
 
+    async def stream_with_tools(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        **kwargs,
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        Stream a completion, parsing tool_use blocks incrementally.
+
+        Text deltas are yielded as they arrive. Each tool_use block's
+        input JSON is accumulated from input_json_delta events and the
+        tool call is yielded as soon as its content block stops, before
+        the rest of the message has streamed.
+
+        Args:
+            messages: Message history (OpenAI format, converted)
+            tools: Tool definitions (OpenAI format, converted)
+            **kwargs: Additional parameters (model, max_tokens, temperature, system_prompt)
+
+        Yields:
+            StreamEvent objects, ending with a "done" event
+        """
+        combined_system, claude_messages = self._convert_messages(
+            messages, kwargs.get("system_prompt")
+        )
+        params: dict[str, Any] = {
+            "model": kwargs.get("model", self.config.model),
+            "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
+            "temperature": kwargs.get("temperature", self.config.temperature),
+            "system": combined_system,
+            "messages": claude_messages,
+        }
+        claude_tools = self._convert_tools(tools or [])
+        if claude_tools:
+            params["tools"] = claude_tools
+
+        blocks: dict[int, dict[str, Any]] = {}  # Content block index -> tool_use state
+        input_tokens = 0
+        output_tokens = 0
+        stop_reason = None
+
+        stream = await self.client.messages.create(stream=True, **params)
+        async for event in stream:
+            if event.type == "message_start":
+                input_tokens = event.message.usage.input_tokens
+            elif event.type == "content_block_start":
+                block = event.content_block
+                if block.type == "tool_use":
+                    blocks[event.index] = {"id": block.id, "name": block.name, "json": []}
+            elif event.type == "content_block_delta":
+                delta = event.delta
+                if delta.type == "text_delta":
+                    yield StreamEvent(type="text", text=delta.text)
+                elif delta.type == "input_json_delta" and event.index in blocks:
+                    blocks[event.index]["json"].append(delta.partial_json)
+            elif event.type == "content_block_stop":
+                block = blocks.pop(event.index, None)
+                if block is not None:
+                    yield StreamEvent(
+                        type="tool_call",
+                        tool_call={
+                            "id": block["id"],
+                            "function": {
+                                "name": block["name"],
+                                "arguments": "".join(block["json"]) or "{}",
+                            },
+                        },
+                    )
+            elif event.type == "message_delta":
+                output_tokens = event.usage.output_tokens
+                stop_reason = event.delta.stop_reason
+
+        yield StreamEvent(
+            type="done",
+            usage={
+                "prompt_tokens": input_tokens,
+                "completion_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+            },
+            finish_reason=stop_reason or "end_turn",
+        )
+
     async def analyze_image(
         self, image_data: bytes, prompt: str, image_type: str = "image/png", **kwargs
     ) -> CompletionResponse:
@@ -17,9 +17,12 @@ from fastband.tickets.models import (
     TicketHistory,
     TicketPriority,
     TicketStatus,
+    TicketSummary,
     TicketType,
+    TicketView,
 )
 from fastband.tickets.review import (
+    ReviewAggregates,
     ReviewManager,
     ReviewResult,
     ReviewStatistics,
@@ -43,6 +46,8 @@ __all__ = [
     "Agent",
     "TicketHistory",
     "TicketComment",
+    "TicketView",
+    "TicketSummary",
     # Storage
     "TicketStore",
     "JSONTicketStore",
@@ -55,4 +60,5 @@ __all__ = [
     "ReviewType",
     "ReviewStatus",
     "ReviewStatistics",
+    "ReviewAggregates",
 ]
@@ -9,8 +9,11 @@ Provides:
 - Agent: Agent model for assignments
 - TicketHistory: Change tracking
 - TicketComment: Ticket comments/notes
+- TicketView: Read-only ticket decoded lazily from stored data
+- TicketSummary: The fields of a ticket needed by list views
 """
 
+import json
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -808,3 +811,219 @@ class Ticket:
     def __repr__(self) -> str:
         num = self.ticket_number or self.id[:8]
         return f"Ticket({num}, title={self.title!r}, status={self.status.value!r})"
+
+
+def _parse_enum(enum_cls: type[Enum], value: Any, default: Enum) -> Any:
+    """Parse a stored enum value, trying the canonical value before from_string."""
+    if value is None:
+        return default
+    if isinstance(value, enum_cls):
+        return value
+    try:
+        return enum_cls(value)
+    except ValueError:
+        return enum_cls.from_string(value)
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+@dataclass(slots=True)
+class TicketSummary:
+    """
+    The fields of a ticket needed by list views.
+
+    Built straight from stored ticket data without decoding history,
+    comments or the remaining fields.
+    """
+
+    id: str
+    ticket_number: str | None
+    title: str
+    ticket_type: TicketType
+    priority: TicketPriority
+    status: TicketStatus
+    assigned_to: str | None
+    created_at: datetime
+    updated_at: datetime
+    labels: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TicketSummary":
+        """Create from stored ticket data (as produced by Ticket.to_dict)."""
+        return cls(
+            id=data.get("id", ""),
+            ticket_number=data.get("ticket_number"),
+            title=data.get("title", ""),
+            ticket_type=_parse_enum(TicketType, data.get("ticket_type"), TicketType.TASK),
+            priority=_parse_enum(TicketPriority, data.get("priority"), TicketPriority.MEDIUM),
+            status=_parse_enum(TicketStatus, data.get("status"), TicketStatus.OPEN),
+            assigned_to=data.get("assigned_to"),
+            created_at=_parse_datetime(data.get("created_at")) or datetime.now(),
+            updated_at=_parse_datetime(data.get("updated_at")) or datetime.now(),
+            labels=data.get("labels") or [],
+        )
+
+    @classmethod
+    def from_ticket(cls, ticket: "Ticket | TicketView") -> "TicketSummary":
+        """Create from a decoded ticket or ticket view."""
+        return cls(
+            id=ticket.id,
+            ticket_number=ticket.ticket_number,
+            title=ticket.title,
+            ticket_type=ticket.ticket_type,
+            priority=ticket.priority,
+            status=ticket.status,
+            assigned_to=ticket.assigned_to,
+            created_at=ticket.created_at,
+            updated_at=ticket.updated_at,
+            labels=ticket.labels,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "id": self.id,
+            "ticket_number": self.ticket_number,
+            "title": self.title,
+            "ticket_type": self.ticket_type.value,
+            "priority": self.priority.value,
+            "status": self.status.value,
+            "assigned_to": self.assigned_to,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+            "labels": self.labels,
+        }
+
+
+_UNSET = object()
+
+
+class TicketView:
+    """
+    Read-only ticket backed by its stored data, decoded on access.
+
+    Ticket.from_dict parses every timestamp, enum, history entry and
+    comment up front, which dominates the cost of scanning tickets with
+    long histories. A view keeps the raw dict (or JSON text, parsed on
+    first use) and decodes each field when it is read; history and
+    comments are decoded once and kept. Use to_ticket() for a full,
+    mutable Ticket.
+    """
+
+    __slots__ = ("_raw", "_data", "_history", "_comments", "_created_at")
+
+    def __init__(self, data: dict[str, Any] | str | bytes):
+        """
+        Args:
+            data: Stored ticket data, as a dict or JSON text
+        """
+        if isinstance(data, dict):
+            self._raw = None
+            self._data = data
+        else:
+            self._raw = data
+            self._data = None
+        self._history: list[TicketHistory] | None = None
+        self._comments: list[TicketComment] | None = None
+        self._created_at: Any = _UNSET
+
+    @property
+    def data(self) -> dict[str, Any]:
+        """The stored ticket data; must not be modified."""
+        if self._data is None:
+            self._data = json.loads(self._raw)
+            self._raw = None
+        return self._data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Raw stored value of a field."""
+        return self.data.get(key, default)
+
+    @property
+    def id(self) -> str:
+        return self.data.get("id", "")
+
+    @property
+    def ticket_number(self) -> str | None:
+        return self.data.get("ticket_number")
+
+    @property
+    def title(self) -> str:
+        return self.data.get("title", "")
+
+    @property
+    def description(self) -> str:
+        return self.data.get("description", "")
+
+    @property
+    def ticket_type(self) -> TicketType:
+        return _parse_enum(TicketType, self.data.get("ticket_type"), TicketType.TASK)
+
+    @property
+    def priority(self) -> TicketPriority:
+        return _parse_enum(TicketPriority, self.data.get("priority"), TicketPriority.MEDIUM)
+
+    @property
+    def status(self) -> TicketStatus:
+        return _parse_enum(TicketStatus, self.data.get("status"), TicketStatus.OPEN)
+
+    @property
+    def assigned_to(self) -> str | None:
+        return self.data.get("assigned_to")
+
+    @property
+    def created_by(self) -> str:
+        return self.data.get("created_by", "system")
+
+    @property
+    def created_at(self) -> datetime:
+        # Kept, since list views sort on it
+        if self._created_at is _UNSET:
+            self._created_at = _parse_datetime(self.data.get("created_at")) or datetime.now()
+        return self._created_at
+
+    @property
+    def updated_at(self) -> datetime:
+        return _parse_datetime(self.data.get("updated_at")) or datetime.now()
+
+    @property
+    def labels(self) -> list[str]:
+        return self.data.get("labels") or []
+
+    @property
+    def is_open(self) -> bool:
+        return self.status in (TicketStatus.OPEN, TicketStatus.IN_PROGRESS)
+
+    @property
+    def history(self) -> list[TicketHistory]:
+        if self._history is None:
+            self._history = [TicketHistory.from_dict(h) for h in self.data.get("history", [])]
+        return self._history
+
+    @property
+    def comments(self) -> list[TicketComment]:
+        if self._comments is None:
+            self._comments = [TicketComment.from_dict(c) for c in self.data.get("comments", [])]
+        return self._comments
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        return self.data.get("metadata") or {}
+
+    def summary(self) -> TicketSummary:
+        """Project the fields needed by list views."""
+        return TicketSummary.from_dict(self.data)
+
+    def to_ticket(self) -> Ticket:
+        """Decode the full ticket."""
+        return Ticket.from_dict(self.data)
+
+    def to_dict(self) -> dict[str, Any]:
+        """The stored ticket data, without re-encoding it."""
+        return self.data
+
+    def __repr__(self) -> str:
+        num = self.ticket_number or self.id[:8]
+        return f"TicketView({num}, title={self.title!r}, status={self.status.value!r})"
@@ -226,6 +226,7 @@ class ReviewStatistics:
 
     # Timing
     average_review_time_hours: float | None = None
+    review_time_histogram: dict[str, int] = field(default_factory=dict)
 
     # Per reviewer stats
     reviews_by_reviewer: dict[str, int] = field(default_factory=dict)
@@ -255,11 +256,219 @@ class ReviewStatistics:
             "total_bug_risks": self.total_bug_risks,
             "total_performance_concerns": self.total_performance_concerns,
             "average_review_time_hours": self.average_review_time_hours,
+            "review_time_histogram": self.review_time_histogram,
             "reviews_by_reviewer": self.reviews_by_reviewer,
             "approval_rate_by_reviewer": self.approval_rate_by_reviewer,
         }
 
 
+# Store metadata key holding the review aggregates
+REVIEW_STATS_KEY = "review_stats"
+REVIEW_STATS_VERSION = 1
+
+# Width of the time buckets used to answer ``since`` queries
+STATS_BUCKET_SECONDS = 3600
+
+# Review time histogram buckets: (label, upper bound in hours)
+REVIEW_TIME_BUCKETS: tuple[tuple[str, float], ...] = (
+    ("<15m", 0.25),
+    ("15m-1h", 1.0),
+    ("1h-4h", 4.0),
+    ("4h-1d", 24.0),
+    ("1d-3d", 72.0),
+    (">3d", float("inf")),
+)
+
+
+def _new_cell() -> dict[str, Any]:
+    """Empty set of review counters."""
+    return {
+        "total": 0,
+        "approved": 0,
+        "rejected": 0,
+        "pending": 0,
+        "issues": 0,
+        "security": 0,
+        "bugs": 0,
+        "performance": 0,
+        "timed": 0,
+        "hours": 0.0,
+        "histogram": [0] * len(REVIEW_TIME_BUCKETS),
+    }
+
+
+def _count_review(cell: dict[str, Any], review: ReviewResult) -> None:
+    """Add one review to a set of counters."""
+    cell["total"] += 1
+    if review.is_approved:
+        cell["approved"] += 1
+    elif review.is_rejected:
+        cell["rejected"] += 1
+    else:
+        cell["pending"] += 1
+
+    cell["issues"] += len(review.issues_found)
+    cell["security"] += len(review.security_issues)
+    cell["bugs"] += len(review.bug_risks)
+    cell["performance"] += len(review.performance_concerns)
+
+    if review.updated_at and review.created_at:
+        hours = (review.updated_at - review.created_at).total_seconds() / 3600
+        cell["timed"] += 1
+        cell["hours"] += hours
+        index = next(i for i, (_, bound) in enumerate(REVIEW_TIME_BUCKETS) if hours < bound)
+        cell["histogram"][index] += 1
+
+
+def _merge_cell(into: dict[str, Any], cell: dict[str, Any]) -> None:
+    """Add one set of counters to another."""
+    for key, value in cell.items():
+        if key == "histogram":
+            into[key] = [a + b for a, b in zip(into[key], value, strict=True)]
+        else:
+            into[key] += value
+
+
+class _ReviewTally:
+    """Accumulates review counters for one statistics query."""
+
+    def __init__(self):
+        self.overall = _new_cell()
+        self.by_type: dict[str, int] = {}
+        self.by_reviewer: dict[str, dict[str, Any]] = {}
+
+    def add_cell(self, review_type: str, reviewer: str, cell: dict[str, Any]) -> None:
+        _merge_cell(self.overall, cell)
+        self.by_type[review_type] = self.by_type.get(review_type, 0) + cell["total"]
+        _merge_cell(self.by_reviewer.setdefault(reviewer, _new_cell()), cell)
+
+    def add_review(self, review: ReviewResult) -> None:
+        cell = _new_cell()
+        _count_review(cell, review)
+        self.add_cell(review.review_type.value, review.reviewer_name, cell)
+
+    def to_statistics(self) -> ReviewStatistics:
+        overall = self.overall
+        stats = ReviewStatistics(
+            total_reviews=overall["total"],
+            approved_count=overall["approved"],
+            rejected_count=overall["rejected"],
+            pending_count=overall["pending"],
+            code_reviews=self.by_type.get(ReviewType.CODE.value, 0),
+            process_reviews=self.by_type.get(ReviewType.PROCESS.value, 0),
+            uiux_reviews=self.by_type.get(ReviewType.UIUX.value, 0),
+            total_issues_found=overall["issues"],
+            total_security_issues=overall["security"],
+            total_bug_risks=overall["bugs"],
+            total_performance_concerns=overall["performance"],
+            review_time_histogram={
+                label: count
+                for (label, _), count in zip(REVIEW_TIME_BUCKETS, overall["histogram"], strict=True)
+            },
+        )
+
+        if overall["timed"]:
+            stats.average_review_time_hours = overall["hours"] / overall["timed"]
+
+        for reviewer, cell in self.by_reviewer.items():
+            if not cell["total"]:
+                continue
+            stats.reviews_by_reviewer[reviewer] = cell["total"]
+            completed = cell["approved"] + cell["rejected"]
+            stats.approval_rate_by_reviewer[reviewer] = (
+                cell["approved"] / completed if completed else 0.0
+            )
+
+        return stats
+
+
+@dataclass
+class _PartialBucket:
+    """A time bucket that straddles a ``since`` filter and must be rescanned."""
+
+    start: float
+    end: float
+    ticket_ids: list[str]
+
+
+class ReviewAggregates:
+    """
+    Review statistics maintained incrementally as reviews are submitted.
+
+    Reviews are counted into hourly buckets by creation time, and within a
+    bucket by review type and reviewer. A statistics query merges the
+    matching counters instead of re-reading every ticket. A ``since``
+    filter takes whole buckets after it, and only the one bucket that
+    straddles it is rescanned, from the tickets reviewed in that hour.
+
+    The data is plain JSON so it can be persisted in the ticket store's
+    metadata.
+    """
+
+    def __init__(self, data: dict[str, Any] | None = None):
+        self.data = data or {
+            "version": REVIEW_STATS_VERSION,
+            "bucket_seconds": STATS_BUCKET_SECONDS,
+            "buckets": {},
+        }
+
+    @property
+    def bucket_seconds(self) -> int:
+        return self.data["bucket_seconds"]
+
+    def record(self, ticket_id: str, review: ReviewResult) -> None:
+        """Count a submitted review."""
+        timestamp = review.created_at.timestamp()
+        start = int(timestamp // self.bucket_seconds * self.bucket_seconds)
+        bucket = self.data["buckets"].setdefault(
+            str(start),
+            {"first": timestamp, "last": timestamp, "tickets": [], "cells": {}},
+        )
+        bucket["first"] = min(bucket["first"], timestamp)
+        bucket["last"] = max(bucket["last"], timestamp)
+        if ticket_id not in bucket["tickets"]:
+            bucket["tickets"].append(ticket_id)
+
+        key = f"{review.review_type.value}:{review.reviewer_name}"
+        _count_review(bucket["cells"].setdefault(key, _new_cell()), review)
+
+    def query(
+        self,
+        reviewer_name: str | None = None,
+        review_type: ReviewType | None = None,
+        since: datetime | None = None,
+    ) -> tuple[_ReviewTally, _PartialBucket | None]:
+        """
+        Merge the counters matching the filters.
+
+        Returns:
+            The tally, and the bucket straddling ``since`` (if any), whose
+            reviews the caller must filter and add individually
+        """
+        tally = _ReviewTally()
+        partial = None
+        since_ts = since.timestamp() if since else None
+
+        for start, bucket in self.data["buckets"].items():
+            if since_ts is not None and bucket["first"] < since_ts:
+                if bucket["last"] >= since_ts:
+                    start = int(start)
+                    partial = _PartialBucket(
+                        start, start + self.bucket_seconds, list(bucket["tickets"])
+                    )
+                continue
+
+            for key, cell in bucket["cells"].items():
+                cell_type, _, cell_reviewer = key.partition(":")
+                if reviewer_name and cell_reviewer != reviewer_name:
+                    continue
+                if review_type and cell_type != review_type.value:
+                    continue
+                tally.add_cell(cell_type, cell_reviewer, cell)
+
+        return tally, partial
+
+
 class ReviewManager:
     """
     Manages the code review workflow for tickets.
@@ -475,11 +684,27 @@ class ReviewManager:
             metadata={"review_id": result.id, "review_type": review_type.value},
         )
 
+        # Build the aggregates before the ticket is saved, so a rebuild
+        # doesn't already include this review
+        self._load_aggregates()
+
         # Handle review result
         if result.is_approved:
-            return self._handle_approval(ticket, result)
+            response = self._handle_approval(ticket, result)
         else:
-            return self._handle_rejection(ticket, result)
+            response = self._handle_rejection(ticket, result)
+
+        def record(data: dict[str, Any] | None) -> dict[str, Any]:
+            # A rebuild reads the saved ticket, which already has this review
+            if not self._aggregates_valid(data):
+                return self._count_reviews().data
+            aggregates = ReviewAggregates(data)
+            aggregates.record(ticket_id, result)
+            return aggregates.data
+
+        # Counted in one atomic update, so concurrent reviews aren't lost
+        self.store.update_metadata(REVIEW_STATS_KEY, record)
+        return response
 
     def _handle_approval(
         self,
@@ -784,6 +1009,9 @@ class ReviewManager:
         """
         Calculate review statistics.
 
+        Served from the aggregates kept up to date by submit_review, except
+        when ticket_ids is given, which counts those tickets' reviews.
+
         Args:
             ticket_ids: Filter by specific tickets (optional)
             reviewer_name: Filter by reviewer (optional)
@@ -793,79 +1021,80 @@ class ReviewManager:
         Returns:
             ReviewStatistics with aggregated stats
         """
-        stats = ReviewStatistics()
-        reviews_by_reviewer: dict[str, list[ReviewResult]] = {}
-        review_times: list[float] = []
-
-        # Get all tickets or specific ones
         if ticket_ids:
-            tickets = [self.store.get(tid) for tid in ticket_ids]
-            tickets = [t for t in tickets if t is not None]
+            aggregates = ReviewAggregates()
+            for tid in ticket_ids:
+                ticket = self.store.get(tid)
+                if ticket:
+                    for review in self._get_reviews(ticket):
+                        aggregates.record(ticket.id, review)
         else:
-            tickets = self.store.list(limit=1000)
+            aggregates = self._load_aggregates()
 
-        for ticket in tickets:
-            reviews = self._get_reviews(ticket)
+        tally, partial = aggregates.query(reviewer_name, review_type, since)
 
-            for review in reviews:
-                # Apply filters
-                if reviewer_name and review.reviewer_name != reviewer_name:
-                    continue
-                if review_type and review.review_type != review_type:
+        # Only the bucket straddling ``since`` needs its reviews read back
+        if partial:
+            for tid in partial.ticket_ids:
+                ticket = self.store.get(tid)
+                if not ticket:
                     continue
-                if since and review.created_at < since:
-                    continue
-
-                # Count totals
-                stats.total_reviews += 1
-
-                # Count by status
-                if review.is_approved:
-                    stats.approved_count += 1
-                elif review.is_rejected:
-                    stats.rejected_count += 1
-                else:
-                    stats.pending_count += 1
-
-                # Count by type
-                if review.review_type == ReviewType.CODE:
-                    stats.code_reviews += 1
-                elif review.review_type == ReviewType.PROCESS:
-                    stats.process_reviews += 1
-                elif review.review_type == ReviewType.UIUX:
-                    stats.uiux_reviews += 1
-
-                # Count issues
-                stats.total_issues_found += len(review.issues_found)
-                stats.total_security_issues += len(review.security_issues)
-                stats.total_bug_risks += len(review.bug_risks)
-                stats.total_performance_concerns += len(review.performance_concerns)
-
-                # Track by reviewer
-                if review.reviewer_name not in reviews_by_reviewer:
-                    reviews_by_reviewer[review.reviewer_name] = []
-                reviews_by_reviewer[review.reviewer_name].append(review)
-
-                # Track review time
-                if review.updated_at and review.created_at:
-                    delta = (review.updated_at - review.created_at).total_seconds() / 3600
-                    review_times.append(delta)
-
-        # Calculate per-reviewer stats
-        for reviewer, reviewer_reviews in reviews_by_reviewer.items():
-            stats.reviews_by_reviewer[reviewer] = len(reviewer_reviews)
-            approved = sum(1 for r in reviewer_reviews if r.is_approved)
-            completed = sum(1 for r in reviewer_reviews if not r.is_pending)
-            if completed > 0:
-                stats.approval_rate_by_reviewer[reviewer] = approved / completed
-            else:
-                stats.approval_rate_by_reviewer[reviewer] = 0.0
+                for review in self._get_reviews(ticket):
+                    timestamp = review.created_at.timestamp()
+                    if not partial.start <= timestamp < partial.end:
+                        continue
+                    if reviewer_name and review.reviewer_name != reviewer_name:
+                        continue
+                    if review_type and review.review_type != review_type:
+                        continue
+                    if review.created_at < since:
+                        continue
+                    tally.add_review(review)
+
+        return tally.to_statistics()
+
+    def rebuild_statistics(self) -> ReviewAggregates:
+        """
+        Recount the review aggregates from every ticket.
 
-        # Calculate average review time
-        if review_times:
-            stats.average_review_time_hours = sum(review_times) / len(review_times)
+        Reviews are counted as they are submitted, so the aggregates only
+        need rebuilding after tickets are deleted or their review comments
+        are edited outside the ReviewManager.
 
-        return stats
+        Returns:
+            The rebuilt aggregates
+        """
+        aggregates = self._count_reviews()
+        self.store.set_metadata(REVIEW_STATS_KEY, aggregates.data)
+        return aggregates
+
+    def _count_reviews(self) -> ReviewAggregates:
+        """Count the reviews on every ticket into fresh aggregates."""
+        aggregates = ReviewAggregates()
+        for ticket in self.store.list(limit=max(self.store.count(), 1)):
+            for review in self._get_reviews(ticket):
+                aggregates.record(ticket.id, review)
+        return aggregates
+
+    def _load_aggregates(self) -> ReviewAggregates:
+        """Get the persisted review aggregates, building them on first use."""
+        data = self.store.get_metadata(REVIEW_STATS_KEY)
+        if self._aggregates_valid(data):
+            return ReviewAggregates(data)
+
+        def build(data: dict[str, Any] | None) -> dict[str, Any]:
+            # Counted inside the update, so a concurrent submit can't be
+            # recorded into aggregates this rebuild then overwrites
+            if self._aggregates_valid(data):
+                return data
+            return self._count_reviews().data
+
+        return ReviewAggregates(self.store.update_metadata(REVIEW_STATS_KEY, build))
+
+    @staticmethod
+    def _aggregates_valid(data: dict[str, Any] | None) -> bool:
+        """Check persisted aggregates exist and match the current format."""
+        return bool(data) and data.get("version") == REVIEW_STATS_VERSION
 
     def approve_review(
         self,
@@ -977,7 +1206,8 @@ class ReviewManager:
             List of tickets awaiting review
         """
         # Get all tickets in UNDER_REVIEW status
-        tickets = self.store.list(status=TicketStatus.UNDER_REVIEW, limit=1000)
+        count = self.store.count(status=TicketStatus.UNDER_REVIEW)
+        tickets = self.store.list(status=TicketStatus.UNDER_REVIEW, limit=max(count, 1))
 
         pending = []
         for ticket in tickets:
@@ -22,19 +22,28 @@ import sqlite3
 import threading
 import time
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from fastband.core.serialization import (
+    SerializationError,
+    Serializer,
+    get_serializer,
+    load_file,
+    save_file,
+)
 from fastband.tickets.models import (
     Agent,
     Ticket,
     TicketPriority,
     TicketStatus,
+    TicketSummary,
     TicketType,
+    TicketView,
 )
 
 logger = logging.getLogger(__name__)
@@ -127,6 +136,11 @@ class TicketStore(ABC):
     All storage backends must implement these methods.
     """
 
+    @property
+    def revision(self) -> int:
+        """Counter bumped whenever this store changes data; keys read caches."""
+        return getattr(self, "_revision", 0)
+
     @abstractmethod
     def create(self, ticket: Ticket, prefix: str = "FB") -> Ticket:
         """Create a new ticket with auto-generated ticket_number."""
@@ -168,6 +182,28 @@ class TicketStore(ABC):
         """List tickets with optional filters."""
         pass
 
+    def list_summaries(
+        self,
+        status: TicketStatus | None = None,
+        priority: TicketPriority | None = None,
+        ticket_type: TicketType | None = None,
+        assigned_to: str | None = None,
+        labels: builtins.list[str] | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> builtins.list[TicketSummary]:
+        """List tickets like list(), projected to the fields list views need."""
+        tickets = self.list(
+            status=status,
+            priority=priority,
+            ticket_type=ticket_type,
+            assigned_to=assigned_to,
+            labels=labels,
+            limit=limit,
+            offset=offset,
+        )
+        return [TicketSummary.from_ticket(t) for t in tickets]
+
     @abstractmethod
     def search(self, query: str, fields: builtins.list[str] | None = None) -> builtins.list[Ticket]:
         """Search tickets by text query."""
@@ -213,6 +249,32 @@ class TicketStore(ABC):
         """List all agents."""
         pass
 
+    # Store-level metadata (derived indexes and aggregates kept with the tickets)
+    @abstractmethod
+    def get_metadata(self, key: str) -> Any | None:
+        """Get a JSON-serializable metadata value, or None if unset."""
+        pass
+
+    @abstractmethod
+    def set_metadata(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable metadata value."""
+        pass
+
+    def update_metadata(self, key: str, update: Callable[[Any | None], Any]) -> Any:
+        """
+        Replace a metadata value with ``update(current)``.
+
+        Stores that can be shared between threads or processes override
+        this so the read and the write happen atomically; the default is a
+        plain get followed by a set.
+
+        Returns:
+            The stored value
+        """
+        value = update(self.get_metadata(key))
+        self.set_metadata(key, value)
+        return value
+
     # Backup support
     @abstractmethod
     def backup(self, backup_path: Path) -> bool:
@@ -240,13 +302,31 @@ class JSONTicketStore(TicketStore):
     - LRU cache for frequently accessed tickets
     - Lazy ticket parsing (raw JSON stored until access)
     - Batch save optimization with auto_save toggle
+    - Pluggable serializer (see fastband.core.serialization); files written
+      with any serializer are read back transparently
     """
 
-    __slots__ = ("path", "auto_save", "_data", "_lock", "_cache", "_dirty")
-
-    def __init__(self, path: Path, auto_save: bool = True, cache_size: int = 100):
+    __slots__ = (
+        "path",
+        "auto_save",
+        "serializer",
+        "_data",
+        "_lock",
+        "_cache",
+        "_dirty",
+        "_revision",
+    )
+
+    def __init__(
+        self,
+        path: Path,
+        auto_save: bool = True,
+        cache_size: int = 100,
+        serializer: str | Serializer | None = None,
+    ):
         self.path = Path(path)
         self.auto_save = auto_save
+        self.serializer = get_serializer(serializer)
         self._data: dict[str, Any] = {
             "tickets": {},
             "agents": {},
@@ -260,6 +340,7 @@ class JSONTicketStore(TicketStore):
         self._lock = threading.RLock()
         self._cache = TicketCache(max_size=cache_size)
         self._dirty = False  # Track if data needs saving
+        self._revision = 0
         self._load()
 
     def _load(self) -> None:
@@ -267,8 +348,7 @@ class JSONTicketStore(TicketStore):
         if self.path.exists():
             with self._lock:
                 try:
-                    with open(self.path, encoding="utf-8") as f:
-                        self._data = json.load(f)
+                    self._data = load_file(self.path)
                     # Ensure required keys exist
                     self._data.setdefault("tickets", {})
                     self._data.setdefault("agents", {})
@@ -276,7 +356,8 @@ class JSONTicketStore(TicketStore):
                     # Clear cache on reload
                     self._cache.invalidate_all()
                     self._dirty = False
-                except json.JSONDecodeError:
+                    self._revision += 1
+                except SerializationError:
                     logger.warning(f"Failed to load {self.path}, starting fresh")
 
     def _save(self) -> None:
@@ -287,13 +368,13 @@ class JSONTicketStore(TicketStore):
 
             self._data["metadata"]["last_modified"] = datetime.now().isoformat()
             self.path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.path, "w", encoding="utf-8") as f:
-                json.dump(self._data, f, indent=2, ensure_ascii=False)
+            save_file(self.path, self._data, self.serializer)
             self._dirty = False
 
     def _mark_dirty(self) -> None:
         """Mark data as needing save."""
         self._dirty = True
+        self._revision += 1
         if self.auto_save:
             self._save()
 
@@ -382,33 +463,56 @@ class JSONTicketStore(TicketStore):
     ) -> list[Ticket]:
         """List tickets with optional filters."""
         with self._lock:
-            tickets = []
+            views = self._select(status, priority, ticket_type, assigned_to, labels)
+            # Only the requested page is fully decoded
+            return [view.to_ticket() for view in views[offset : offset + limit]]
 
-            for data in self._data["tickets"].values():
-                ticket = Ticket.from_dict(data)
+    def list_summaries(
+        self,
+        status: TicketStatus | None = None,
+        priority: TicketPriority | None = None,
+        ticket_type: TicketType | None = None,
+        assigned_to: str | None = None,
+        labels: builtins.list[str] | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> builtins.list[TicketSummary]:
+        """List tickets like list(), projected to the fields list views need."""
+        with self._lock:
+            views = self._select(status, priority, ticket_type, assigned_to, labels)
+            return [view.summary() for view in views[offset : offset + limit]]
 
-                # Apply filters
-                if status and ticket.status != status:
-                    continue
-                if priority and ticket.priority != priority:
-                    continue
-                if ticket_type and ticket.ticket_type != ticket_type:
-                    continue
-                if assigned_to and ticket.assigned_to != assigned_to:
+    def _select(
+        self,
+        status: TicketStatus | None,
+        priority: TicketPriority | None,
+        ticket_type: TicketType | None,
+        assigned_to: str | None,
+        labels: builtins.list[str] | None,
+    ) -> builtins.list[TicketView]:
+        """Filter and sort the stored tickets without decoding them."""
+        views = []
+        for data in self._data["tickets"].values():
+            view = TicketView(data)
+
+            # Apply filters
+            if status and view.status != status:
+                continue
+            if priority and view.priority != priority:
+                continue
+            if ticket_type and view.ticket_type != ticket_type:
+                continue
+            if assigned_to and view.assigned_to != assigned_to:
+                continue
+            if labels:
+                if not any(label in view.labels for label in labels):
                     continue
-                if labels:
-                    if not any(label in ticket.labels for label in labels):
-                        continue
 
-                tickets.append(ticket)
+            views.append(view)
 
-            # Sort by priority then created_at
-            tickets.sort(
-                key=lambda t: (t.priority.sort_order, t.created_at),
-            )
-
-            # Apply pagination
-            return tickets[offset : offset + limit]
+        # Sort by priority then created_at
+        views.sort(key=lambda v: (v.priority.sort_order, v.created_at))
+        return views
 
     def search(self, query: str, fields: builtins.list[str] | None = None) -> builtins.list[Ticket]:
         """Search tickets by text query."""
@@ -534,6 +638,25 @@ class JSONTicketStore(TicketStore):
                 agents.append(agent)
             return agents
 
+    def get_metadata(self, key: str) -> Any | None:
+        """Get a metadata value (the stored object; call set_metadata after changing it)."""
+        with self._lock:
+            return self._data["metadata"].get(key)
+
+    def set_metadata(self, key: str, value: Any) -> None:
+        """Store a metadata value."""
+        with self._lock:
+            self._data["metadata"][key] = value
+            self._mark_dirty()
+
+    def update_metadata(self, key: str, update: Callable[[Any | None], Any]) -> Any:
+        """Update a metadata value under the store lock."""
+        with self._lock:
+            value = update(self._data["metadata"].get(key))
+            self._data["metadata"][key] = value
+            self._mark_dirty()
+            return value
+
     def backup(self, backup_path: Path) -> bool:
         """Create a backup of the storage."""
         try:
@@ -591,6 +714,7 @@ class SQLiteTicketStore(TicketStore):
     def __init__(self, path: Path):
         self.path = Path(path)
         self._local = threading.local()
+        self._revision = 0
         self._init_db()
 
     @property
@@ -607,12 +731,25 @@ class SQLiteTicketStore(TicketStore):
     @contextmanager
     def _cursor(self) -> Iterator[sqlite3.Cursor]:
         """Get a cursor with automatic commit."""
-        cursor = self._conn.cursor()
+        conn = self._conn
+        if conn.in_transaction:
+            # Nested in an open transaction (e.g. update_metadata's callback):
+            # leave committing to its owner so the transaction isn't cut short
+            cursor = conn.cursor()
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+            return
+        changes = conn.total_changes
+        cursor = conn.cursor()
         try:
             yield cursor
-            self._conn.commit()
+            conn.commit()
+            if conn.total_changes != changes:
+                self._revision += 1
         except Exception:
-            self._conn.rollback()
+            conn.rollback()
             raise
         finally:
             cursor.close()
@@ -827,8 +964,54 @@ class SQLiteTicketStore(TicketStore):
         offset: int = 0,
     ) -> list[Ticket]:
         """List tickets with optional filters."""
-        query = "SELECT data FROM tickets WHERE 1=1"
-        params: list[Any] = []
+        where, params = self._where(status, priority, ticket_type, assigned_to, labels)
+        query = f"SELECT data FROM tickets WHERE {where} ORDER BY priority, created_at"
+        query += " LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+
+        with self._cursor() as cursor:
+            cursor.execute(query, params)
+            return [Ticket.from_dict(json.loads(row["data"])) for row in cursor.fetchall()]
+
+    def list_summaries(
+        self,
+        status: TicketStatus | None = None,
+        priority: TicketPriority | None = None,
+        ticket_type: TicketType | None = None,
+        assigned_to: str | None = None,
+        labels: builtins.list[str] | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> builtins.list[TicketSummary]:
+        """List tickets like list(), reading only the summary columns."""
+        where, params = self._where(status, priority, ticket_type, assigned_to, labels)
+        query = (
+            "SELECT id, ticket_number, title, ticket_type, priority, status, assigned_to,"
+            " created_at, updated_at, json_extract(data, '$.labels') AS labels"
+            f" FROM tickets WHERE {where} ORDER BY priority, created_at LIMIT ? OFFSET ?"
+        )
+        params.extend([limit, offset])
+
+        with self._cursor() as cursor:
+            cursor.execute(query, params)
+            summaries = []
+            for row in cursor.fetchall():
+                data = dict(row)
+                data["labels"] = json.loads(data["labels"]) if data["labels"] else []
+                summaries.append(TicketSummary.from_dict(data))
+            return summaries
+
+    def _where(
+        self,
+        status: TicketStatus | None,
+        priority: TicketPriority | None,
+        ticket_type: TicketType | None,
+        assigned_to: str | None,
+        labels: builtins.list[str] | None,
+    ) -> tuple[str, builtins.list[Any]]:
+        """Build the WHERE clause for list filters."""
+        query = "1=1"
+        params: builtins.list[Any] = []
 
         if status:
             query += " AND status = ?"
@@ -849,12 +1032,7 @@ class SQLiteTicketStore(TicketStore):
                 query += " AND data LIKE ?"
                 params.append(f'%"{label}"%')
 
-        query += " ORDER BY priority, created_at LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
-
-        with self._cursor() as cursor:
-            cursor.execute(query, params)
-            return [Ticket.from_dict(json.loads(row["data"])) for row in cursor.fetchall()]
+        return query, params
 
     def search(self, query: str, fields: builtins.list[str] | None = None) -> builtins.list[Ticket]:
         """Search tickets by text query."""
@@ -995,6 +1173,41 @@ class SQLiteTicketStore(TicketStore):
             cursor.execute(query)
             return [Agent.from_dict(json.loads(row["data"])) for row in cursor.fetchall()]
 
+    def get_metadata(self, key: str) -> Any | None:
+        """Get a metadata value."""
+        with self._cursor() as cursor:
+            cursor.execute("SELECT value FROM metadata WHERE key = ?", (key,))
+            row = cursor.fetchone()
+            return json.loads(row["value"]) if row else None
+
+    def set_metadata(self, key: str, value: Any) -> None:
+        """Store a metadata value."""
+        with self._cursor() as cursor:
+            cursor.execute(
+                "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+                (key, json.dumps(value)),
+            )
+
+    def update_metadata(self, key: str, update: Callable[[Any | None], Any]) -> Any:
+        """
+        Update a metadata value in one write transaction.
+
+        Store reads made by ``update`` run inside the same transaction, so
+        other writers wait until the new value is committed.
+        """
+        with self._cursor() as cursor:
+            # Take the write lock before reading, so concurrent updates
+            # from other connections wait instead of overwriting each other
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute("SELECT value FROM metadata WHERE key = ?", (key,))
+            row = cursor.fetchone()
+            value = update(json.loads(row["value"]) if row else None)
+            cursor.execute(
+                "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+                (key, json.dumps(value)),
+            )
+            return value
+
     def backup(self, backup_path: Path) -> bool:
         """Create a backup of the storage."""
         try:
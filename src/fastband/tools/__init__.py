@@ -21,6 +21,10 @@ Example of lazy registration:
     registry.load("my_tool")  # or registry.get_available("my_tool")
 """
 
+import json
+import logging
+from importlib import resources
+
 from fastband.tools.base import (
     Tool,
     ToolCategory,
@@ -39,8 +43,13 @@ from fastband.tools.recommender import (
 from fastband.tools.registry import (
     LazyToolSpec,  # For type hints
     ToolRegistry,
+    ToolSchemaCatalog,
+    ToolSchemaEntry,
     get_registry,
 )
+from fastband.tools.result_cache import ToolResultCache, register_state_source
+
+logger = logging.getLogger(__name__)
 
 # =============================================================================
 # LAZY LOADING SETUP
@@ -49,14 +58,45 @@ from fastband.tools.registry import (
 # The actual tool classes are only imported when first accessed.
 
 
-def _register_builtin_tools() -> None:
+# MCP schemas (with metadata) of the built-in tools, so the schema catalog can
+# describe them without importing their modules. Regenerate with
+# scripts/generate_tool_schemas.py after changing a built-in tool's definition.
+BUILTIN_SCHEMAS_FILE = "builtin_schemas.json"
+
+
+def _load_builtin_schemas() -> dict[str, dict]:
+    """Load the generated schemas of the built-in tools ({} if missing)."""
+    try:
+        text = resources.files(__name__).joinpath(BUILTIN_SCHEMAS_FILE).read_text("utf-8")
+        return json.loads(text)
+    except (OSError, ValueError) as e:
+        logger.debug(f"Built-in tool schemas unavailable: {e}")
+        return {}
+
+
+def _register_builtin_tools(
+    registry: ToolRegistry | None = None,
+    schemas: dict[str, dict] | None = None,
+) -> None:
     """
     Register built-in tools for lazy loading.
 
     This is called on module import but doesn't actually import the tool modules.
     Tool classes are only imported when they're first loaded.
+
+    Args:
+        registry: Registry to populate (default: the global registry)
+        schemas: MCP schemas by tool name (default: BUILTIN_SCHEMAS_FILE)
     """
-    registry = get_registry()
+    if registry is None:
+        registry = get_registry()
+    if schemas is None:
+        schemas = _load_builtin_schemas()
+
+    def register(name: str, module_path: str, class_name: str, category: ToolCategory) -> None:
+        schema = schemas.get(name)
+        definition = ToolDefinition.from_mcp_schema(schema, category) if schema else None
+        registry.register_lazy(name, module_path, class_name, category, definition=definition)
 
     # Git tools
     git_tools = [
@@ -67,7 +107,7 @@ def _register_builtin_tools() -> None:
         ("git_branch", "GitBranchTool"),
     ]
     for name, class_name in git_tools:
-        registry.register_lazy(name, "fastband.tools.git", class_name, ToolCategory.GIT)
+        register(name, "fastband.tools.git", class_name, ToolCategory.GIT)
 
     # Ticket tools
     ticket_tools = [
@@ -81,7 +121,7 @@ def _register_builtin_tools() -> None:
         ("add_ticket_comment", "AddTicketCommentTool"),
     ]
     for name, class_name in ticket_tools:
-        registry.register_lazy(name, "fastband.tools.tickets", class_name, ToolCategory.TICKETS)
+        register(name, "fastband.tools.tickets", class_name, ToolCategory.TICKETS)
 
     # Context/Semantic Search tools
     context_tools = [
@@ -90,7 +130,7 @@ def _register_builtin_tools() -> None:
         ("index_status", "IndexStatusTool"),
     ]
     for name, class_name in context_tools:
-        registry.register_lazy(name, "fastband.tools.context", class_name, ToolCategory.AI)
+        register(name, "fastband.tools.context", class_name, ToolCategory.AI)
 
     # Agent onboarding tools
     agent_tools = [
@@ -100,7 +140,7 @@ def _register_builtin_tools() -> None:
         ("get_onboarding_status", "GetOnboardingStatusTool"),
     ]
     for name, class_name in agent_tools:
-        registry.register_lazy(name, "fastband.tools.agents", class_name, ToolCategory.CORE)
+        register(name, "fastband.tools.agents", class_name, ToolCategory.CORE)
 
     # Web tools (browser automation, QA, screenshots)
     web_tools = [
@@ -113,7 +153,7 @@ def _register_builtin_tools() -> None:
         ("qa_console_sweep", "QAConsoleSweepTool"),
     ]
     for name, class_name in web_tools:
-        registry.register_lazy(name, "fastband.tools.web", class_name, ToolCategory.WEB)
+        register(name, "fastband.tools.web", class_name, ToolCategory.WEB)
 
     # Testing tools (E2E testing, validation)
     testing_tools = [
@@ -121,7 +161,7 @@ def _register_builtin_tools() -> None:
         ("screenshot_validator", "ScreenshotValidatorTool"),
     ]
     for name, class_name in testing_tools:
-        registry.register_lazy(name, "fastband.tools.testing", class_name, ToolCategory.TESTING)
+        register(name, "fastband.tools.testing", class_name, ToolCategory.TESTING)
 
     # Memory tools (cross-session learning)
     memory_tools = [
@@ -135,7 +175,19 @@ def _register_builtin_tools() -> None:
         ("memory_prune", "MemoryPruneTool"),
     ]
     for name, class_name in memory_tools:
-        registry.register_lazy(name, "fastband.tools.memory", class_name, ToolCategory.AI)
+        register(name, "fastband.tools.memory", class_name, ToolCategory.AI)
+
+
+def _build_builtin_schemas() -> dict[str, dict]:
+    """Import every built-in tool and collect its MCP schema (see BUILTIN_SCHEMAS_FILE)."""
+    registry = ToolRegistry()
+    _register_builtin_tools(registry, schemas={})
+    schemas = {}
+    for name in sorted(registry.get_available_names()):
+        tool = registry.get_available(name)
+        if tool is not None:
+            schemas[name] = tool.definition.to_mcp_schema(include_metadata=True)
+    return schemas
 
 
 # Register on import (but don't import tool modules yet)
@@ -210,6 +262,11 @@ __all__ = [
     "ToolRegistry",
     "get_registry",
     "LazyToolSpec",
+    "ToolSchemaCatalog",
+    "ToolSchemaEntry",
+    # Result cache
+    "ToolResultCache",
+    "register_state_source",
     # Recommender
     "ToolRecommender",
     "ToolRecommendation",
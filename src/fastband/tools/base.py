@@ -9,7 +9,7 @@ import logging
 import time
 from abc import ABC, abstractmethod
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from enum import Enum
 from typing import Any
 
@@ -98,10 +98,28 @@ class ToolMetadata:
     network_required: bool = False
     requires_filesystem: bool = False
 
+    # Result caching hints (see fastband.tools.result_cache)
+    cacheable: bool = False  # Result depends only on arguments and cache_state
+    side_effects: bool = False  # Successful runs invalidate cached results
+    cache_state: list[str] = field(default_factory=list)  # e.g. "files", "git", "tickets"
+    cache_ttl: float | None = None  # Seconds; None = valid until state changes
+
     # Curation status (for third-party tools)
     curated: bool = True
     curator_notes: str | None = None
 
+    def to_hints(self) -> dict[str, Any]:
+        """Non-default fields besides name, description and category, as JSON values."""
+        hints = {}
+        for f in fields(self):
+            if f.name in ("name", "description", "category"):
+                continue
+            value = getattr(self, f.name)
+            default = f.default_factory() if f.default is MISSING else f.default
+            if value != default:
+                hints[f.name] = [t.value for t in value] if f.name == "project_types" else value
+        return hints
+
 
 @dataclass
 class ToolDefinition:
@@ -110,8 +128,15 @@ class ToolDefinition:
     metadata: ToolMetadata
     parameters: list[ToolParameter]
 
-    def to_mcp_schema(self) -> dict[str, Any]:
-        """Convert to MCP tool schema format."""
+    def to_mcp_schema(self, include_metadata: bool = False) -> dict[str, Any]:
+        """
+        Convert to MCP tool schema format.
+
+        Args:
+            include_metadata: Also add the remaining metadata under
+                ``"metadata"`` (see ToolMetadata.to_hints), so
+                from_mcp_schema can restore it
+        """
         properties = {}
         required = []
 
@@ -120,7 +145,7 @@ class ToolDefinition:
             if param.required:
                 required.append(param.name)
 
-        return {
+        schema = {
             "name": self.metadata.name,
             "description": self.metadata.description,
             "inputSchema": {
@@ -129,6 +154,37 @@ class ToolDefinition:
                 "required": required,
             },
         }
+        if include_metadata:
+            schema["metadata"] = self.metadata.to_hints()
+        return schema
+
+    @classmethod
+    def from_mcp_schema(cls, schema: dict[str, Any], category: ToolCategory) -> "ToolDefinition":
+        """Rebuild a definition from its MCP schema (inverse of to_mcp_schema)."""
+        input_schema = schema.get("inputSchema", {})
+        required = set(input_schema.get("required", []))
+        hints = dict(schema.get("metadata", {}))
+        if "project_types" in hints:
+            hints["project_types"] = [ProjectType(t) for t in hints["project_types"]]
+        return cls(
+            metadata=ToolMetadata(
+                name=schema["name"],
+                description=schema.get("description", ""),
+                category=category,
+                **hints,
+            ),
+            parameters=[
+                ToolParameter(
+                    name=name,
+                    type=prop.get("type", "string"),
+                    description=prop.get("description", ""),
+                    required=name in required,
+                    default=prop.get("default"),
+                    enum=prop.get("enum"),
+                )
+                for name, prop in input_schema.get("properties", {}).items()
+            ],
+        )
 
     def to_openai_schema(self) -> dict[str, Any]:
         """Convert to OpenAI function calling schema."""
@@ -37,6 +37,8 @@ class SemanticSearchTool(Tool):
                 ),
                 category=ToolCategory.AI,
                 version="1.0.0",
+                cacheable=True,
+                cache_state=["semantic_index"],
             ),
             parameters=[
                 ToolParameter(
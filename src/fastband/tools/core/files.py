@@ -58,6 +58,9 @@ class ListFilesTool(Tool):
                 category=ToolCategory.CORE,
                 version="1.0.0",
                 requires_filesystem=True,
+                cacheable=True,
+                cache_state=["files"],
+                cache_ttl=5.0,
             ),
             parameters=[
                 ToolParameter(
@@ -216,6 +219,8 @@ class ReadFileTool(Tool):
                 category=ToolCategory.CORE,
                 version="1.0.0",
                 requires_filesystem=True,
+                cacheable=True,
+                cache_state=["files"],
             ),
             parameters=[
                 ToolParameter(
@@ -300,6 +305,7 @@ class WriteFileTool(Tool):
                 category=ToolCategory.CORE,
                 version="1.0.0",
                 requires_filesystem=True,
+                side_effects=True,
             ),
             parameters=[
                 ToolParameter(
@@ -2,10 +2,13 @@
 Git tools - Version control operations for Fastband.
 
 Provides tools for git operations including status, commit, diff, log, and branch management.
+Commands run through the async GitRunner (see runner.py) so tool calls never
+block the event loop.
 
 P1 Security: Includes secret scanning to prevent committing credentials.
 """
 
+import asyncio
 import os
 import re
 import subprocess
@@ -20,7 +23,29 @@ from fastband.tools.base import (
     ToolParameter,
     ToolResult,
 )
-
+from fastband.tools.git.runner import (
+    GitCatFile,
+    GitObject,
+    GitRunner,
+    get_git_runner,
+    reset_git_runner,
+)
+from fastband.tools.git.state import (
+    GitStateCache,
+    RepoLocation,
+    find_repository,
+    get_git_state_cache,
+    repo_fingerprint,
+    reset_git_state_cache,
+)
+from fastband.tools.git.status import (
+    GitStatus,
+    StatusEntry,
+    format_long,
+    format_short,
+    parse_porcelain_v2,
+    status_name,
+)
 
 # =============================================================================
 # P1 SECURITY: SECRET SCANNING
@@ -76,6 +101,35 @@ SENSITIVE_FILES = [
 ]
 
 
+def _scan_text_for_secrets(content: str) -> list[tuple[str, int, str]]:
+    """
+    Scan text for potential secrets.
+
+    Args:
+        content: Text to scan
+
+    Returns:
+        List of (secret_type, line_number, matched_text) tuples
+    """
+    findings = []
+    lines = content.split('\n')
+
+    for line_num, line in enumerate(lines, 1):
+        for pattern, secret_type in SECRET_PATTERNS:
+            # Truncate the match for display
+            match = pattern.search(line)
+            if match:
+                matched = match.group(0)
+                # Redact most of the secret
+                if len(matched) > 20:
+                    redacted = matched[:10] + "..." + matched[-5:]
+                else:
+                    redacted = matched[:5] + "..."
+                findings.append((secret_type, line_num, redacted))
+
+    return findings
+
+
 def _scan_file_for_secrets(file_path: Path) -> list[tuple[str, int, str]]:
     """
     Scan a file for potential secrets.
@@ -86,36 +140,35 @@ def _scan_file_for_secrets(file_path: Path) -> list[tuple[str, int, str]]:
     Returns:
         List of (secret_type, line_number, matched_text) tuples
     """
-    findings = []
-
     try:
-        content = file_path.read_text(errors='ignore')
-        lines = content.split('\n')
-
-        for line_num, line in enumerate(lines, 1):
-            for pattern, secret_type in SECRET_PATTERNS:
-                if pattern.search(line):
-                    # Truncate the match for display
-                    match = pattern.search(line)
-                    if match:
-                        matched = match.group(0)
-                        # Redact most of the secret
-                        if len(matched) > 20:
-                            redacted = matched[:10] + "..." + matched[-5:]
-                        else:
-                            redacted = matched[:5] + "..."
-                        findings.append((secret_type, line_num, redacted))
-
+        return _scan_text_for_secrets(file_path.read_text(errors='ignore'))
     except Exception:
-        pass  # Skip unreadable files
+        return []  # Skip unreadable files
+
 
+def _sensitive_file_findings(file_name: str) -> list[tuple[str, int, str]]:
+    """Findings for file names that should never be committed."""
+    findings = []
+    for sensitive in SENSITIVE_FILES:
+        if sensitive.startswith("*"):
+            if file_name.endswith(sensitive[1:]):
+                findings.append(("Sensitive file type", 0, sensitive))
+        elif file_name == sensitive or file_name.endswith("/" + sensitive):
+            findings.append(("Sensitive file", 0, sensitive))
     return findings
 
 
-def _scan_staged_files_for_secrets(repo_path: str) -> dict[str, list[tuple[str, int, str]]]:
+# Staged blobs read per cat-file request while scanning
+_SCAN_BATCH_SIZE = 64
+
+
+async def _scan_staged_files_for_secrets(repo_path: str) -> dict[str, list[tuple[str, int, str]]]:
     """
     Scan all staged files in a git repository for secrets.
 
+    Scans the staged content (what will be committed), read from the index
+    through the repository's cat-file worker.
+
     Args:
         repo_path: Path to the git repository
 
@@ -125,41 +178,33 @@ def _scan_staged_files_for_secrets(repo_path: str) -> dict[str, list[tuple[str,
     all_findings = {}
 
     try:
-        # Get list of staged files
-        result = subprocess.run(
-            ["git", "diff", "--cached", "--name-only"],
+        # Get list of staged files, paths relative to the repository root
+        result = await _run_git_command_async(
+            ["diff", "--cached", "--name-only", "-z"],
             cwd=repo_path,
-            capture_output=True,
-            text=True,
             check=False,
         )
 
         if result.returncode != 0:
             return {}
 
-        staged_files = result.stdout.strip().split('\n')
+        staged_files = [name for name in result.stdout.split('\0') if name]
 
         for file_name in staged_files:
-            if not file_name:
-                continue
-
-            file_path = Path(repo_path) / file_name
-
             # Check if it's a sensitive filename
-            for sensitive in SENSITIVE_FILES:
-                if sensitive.startswith("*"):
-                    if file_name.endswith(sensitive[1:]):
-                        all_findings.setdefault(file_name, []).append(
-                            ("Sensitive file type", 0, sensitive)
-                        )
-                elif file_name == sensitive or file_name.endswith("/" + sensitive):
-                    all_findings.setdefault(file_name, []).append(
-                        ("Sensitive file", 0, sensitive)
-                    )
-
-            # Scan file contents
-            if file_path.exists() and file_path.is_file():
-                findings = _scan_file_for_secrets(file_path)
+            findings = _sensitive_file_findings(file_name)
+            if findings:
+                all_findings.setdefault(file_name, []).extend(findings)
+
+        # Scan staged contents; deleted files have no index entry
+        cat_file = get_git_runner().cat_file(repo_path)
+        for start in range(0, len(staged_files), _SCAN_BATCH_SIZE):
+            batch = staged_files[start : start + _SCAN_BATCH_SIZE]
+            blobs = await cat_file.read_many([f":0:{name}" for name in batch])
+            for file_name, blob in zip(batch, blobs, strict=True):
+                if blob is None or blob.type != "blob":
+                    continue
+                findings = _scan_text_for_secrets(blob.data.decode(errors='ignore'))
                 if findings:
                     all_findings.setdefault(file_name, []).extend(findings)
 
@@ -199,32 +244,33 @@ def _run_git_command(
     )
 
 
+async def _run_git_command_async(
+    args: list[str],
+    cwd: str | None = None,
+    check: bool = True,
+) -> subprocess.CompletedProcess:
+    """
+    Run a git command without blocking the event loop.
+
+    Same contract as _run_git_command; runs through the shared GitRunner,
+    so it is also subject to its concurrency limit and timeout.
+
+    Raises:
+        subprocess.CalledProcessError: If check=True and command fails
+        subprocess.TimeoutExpired: If the command timed out
+        FileNotFoundError: If git is not installed
+    """
+    return await get_git_runner().run(args, cwd=cwd, check=check)
+
+
 def _is_git_repository(path: str) -> bool:
-    """Check if the given path is inside a git repository."""
-    try:
-        result = _run_git_command(
-            ["rev-parse", "--is-inside-work-tree"],
-            cwd=path,
-            check=False,
-        )
-        return result.returncode == 0 and result.stdout.strip() == "true"
-    except FileNotFoundError:
-        return False
+    """Check if the given path is inside a git repository (no git process)."""
+    return find_repository(path) is not None
 
 
 def _get_repo_root(path: str) -> str | None:
-    """Get the root directory of the git repository."""
-    try:
-        result = _run_git_command(
-            ["rev-parse", "--show-toplevel"],
-            cwd=path,
-            check=False,
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-        return None
-    except FileNotFoundError:
-        return None
+    """Get the root directory of the git repository (no git process)."""
+    return get_git_state_cache().root(path)
 
 
 class GitStatusTool(Tool):
@@ -278,24 +324,15 @@ class GitStatusTool(Tool):
             return ToolResult(success=False, error=f"Not a git repository: {path}")
 
         try:
-            # Build git status arguments
-            args = ["status", "--porcelain=v2"]
-            if branch:
-                args.append("--branch")
-
-            result = _run_git_command(args, cwd=str(target))
+            # One porcelain run, memoized while the repository is unchanged;
+            # the short and human views are rendered from it.
+            status = await get_git_state_cache().status(str(target))
+            status_data = self._status_data(status, branch)
 
-            # Parse the porcelain v2 output
-            status_data = self._parse_status_output(result.stdout)
-
-            # If short format requested, also get the short output
             if short:
-                short_result = _run_git_command(["status", "--short", "--branch"], cwd=str(target))
-                status_data["short_output"] = short_result.stdout.strip()
+                status_data["short_output"] = format_short(status)
 
-            # Get human-readable status
-            human_result = _run_git_command(["status"], cwd=str(target))
-            status_data["human_readable"] = human_result.stdout.strip()
+            status_data["human_readable"] = format_long(status)
 
             return ToolResult(
                 success=True,
@@ -304,60 +341,22 @@ class GitStatusTool(Tool):
 
         except subprocess.CalledProcessError as e:
             return ToolResult(success=False, error=f"Git status failed: {e.stderr.strip()}")
+        except subprocess.TimeoutExpired:
+            return ToolResult(success=False, error="Git status timed out")
         except FileNotFoundError:
             return ToolResult(success=False, error="Git is not installed or not in PATH")
 
-    def _parse_status_output(self, output: str) -> dict[str, Any]:
-        """Parse git status --porcelain=v2 output."""
-        staged = []
-        unstaged = []
-        untracked = []
-        branch_info = {}
-
-        for line in output.strip().split("\n"):
-            if not line:
-                continue
-
-            if line.startswith("# branch."):
-                # Branch header line
-                parts = line.split(" ", 2)
-                key = parts[1].replace("branch.", "")
-                value = parts[2] if len(parts) > 2 else ""
-                branch_info[key] = value
-
-            elif line.startswith("1 ") or line.startswith("2 "):
-                # Ordinary or rename/copy entry
-                parts = line.split(" ")
-                status = parts[1]
-                file_path = parts[-1]
-
-                # First character is staged status, second is unstaged
-                if status[0] != ".":
-                    staged.append(
-                        {
-                            "file": file_path,
-                            "status": self._status_char_to_name(status[0]),
-                        }
-                    )
-                if status[1] != ".":
-                    unstaged.append(
-                        {
-                            "file": file_path,
-                            "status": self._status_char_to_name(status[1]),
-                        }
-                    )
-
-            elif line.startswith("? "):
-                # Untracked file
-                file_path = line[2:]
-                untracked.append(file_path)
-
-            elif line.startswith("! "):
-                # Ignored file (usually not shown)
-                pass
+    def _status_data(self, status: GitStatus, branch: bool) -> dict[str, Any]:
+        """Build the tool result data from parsed status."""
+        staged = [{"file": e.path, "status": status_name(e.index)} for e in status.staged]
+        unstaged = [
+            {"file": e.path, "status": "unmerged" if e.unmerged else status_name(e.worktree)}
+            for e in status.unstaged
+        ]
+        untracked = [e.path for e in status.untracked]
 
         return {
-            "branch": branch_info,
+            "branch": dict(status.branch) if branch else {},
             "staged": staged,
             "unstaged": unstaged,
             "untracked": untracked,
@@ -365,19 +364,6 @@ class GitStatusTool(Tool):
             "total_changes": len(staged) + len(unstaged) + len(untracked),
         }
 
-    def _status_char_to_name(self, char: str) -> str:
-        """Convert status character to human-readable name."""
-        mapping = {
-            "M": "modified",
-            "T": "type_changed",
-            "A": "added",
-            "D": "deleted",
-            "R": "renamed",
-            "C": "copied",
-            "U": "unmerged",
-        }
-        return mapping.get(char, f"unknown({char})")
-
 
 class GitCommitTool(Tool):
     """Create a new commit with staged changes."""
@@ -391,6 +377,7 @@ class GitCommitTool(Tool):
                 category=ToolCategory.GIT,
                 version="1.0.0",
                 requires_filesystem=True,
+                side_effects=True,
             ),
             parameters=[
                 ToolParameter(
@@ -461,20 +448,19 @@ class GitCommitTool(Tool):
         try:
             # Stage files if specified
             if files:
-                for file in files:
-                    add_result = _run_git_command(
-                        ["add", file],
-                        cwd=str(target),
-                        check=False,
+                add_result = await _run_git_command_async(
+                    ["add", "--", *files],
+                    cwd=str(target),
+                    check=False,
+                )
+                if add_result.returncode != 0:
+                    return ToolResult(
+                        success=False,
+                        error=f"Failed to stage files {files}: {add_result.stderr.strip()}",
                     )
-                    if add_result.returncode != 0:
-                        return ToolResult(
-                            success=False,
-                            error=f"Failed to stage file '{file}': {add_result.stderr.strip()}",
-                        )
 
             # P1 SECURITY: Scan staged files for secrets BEFORE committing
-            secret_findings = _scan_staged_files_for_secrets(str(target))
+            secret_findings = await _scan_staged_files_for_secrets(str(target))
             if secret_findings:
                 error_lines = ["COMMIT BLOCKED: Potential secrets detected in staged files:"]
                 for file_path, findings in secret_findings.items():
@@ -499,7 +485,7 @@ class GitCommitTool(Tool):
 
             # Check if there are staged changes (unless allow_empty)
             if not allow_empty and not all and not files:
-                status_result = _run_git_command(
+                status_result = await _run_git_command_async(
                     ["diff", "--cached", "--quiet"],
                     cwd=str(target),
                     check=False,
@@ -511,14 +497,14 @@ class GitCommitTool(Tool):
                     )
 
             # Execute commit
-            result = _run_git_command(commit_args, cwd=str(target))
-
-            # Get the commit hash
-            hash_result = _run_git_command(["rev-parse", "HEAD"], cwd=str(target))
-            commit_hash = hash_result.stdout.strip()
+            result = await _run_git_command_async(commit_args, cwd=str(target))
+            get_git_state_cache().invalidate(str(target))
 
-            # Get short log for the commit
-            log_result = _run_git_command(["log", "-1", "--oneline"], cwd=str(target))
+            # Get the commit hash and its one-line summary
+            log_result = await _run_git_command_async(
+                ["log", "-1", "--format=%H%n%h %s"], cwd=str(target)
+            )
+            commit_hash, _, summary = log_result.stdout.strip().partition("\n")
 
             return ToolResult(
                 success=True,
@@ -526,13 +512,15 @@ class GitCommitTool(Tool):
                     "commit_hash": commit_hash,
                     "short_hash": commit_hash[:7],
                     "message": message,
-                    "summary": log_result.stdout.strip(),
+                    "summary": summary,
                     "output": result.stdout.strip(),
                 },
             )
 
         except subprocess.CalledProcessError as e:
             return ToolResult(success=False, error=f"Git commit failed: {e.stderr.strip()}")
+        except subprocess.TimeoutExpired:
+            return ToolResult(success=False, error="Git commit timed out")
         except FileNotFoundError:
             return ToolResult(success=False, error="Git is not installed or not in PATH")
 
@@ -642,11 +630,6 @@ class GitDiffTool(Tool):
                 args.append("--")
                 args.append(file)
 
-            result = _run_git_command(args, cwd=str(target))
-
-            # Parse the output
-            diff_output = result.stdout
-
             # Get summary info
             summary_args = ["diff", "--stat", "--summary"]
             if staged:
@@ -659,7 +642,12 @@ class GitDiffTool(Tool):
                 summary_args.append("--")
                 summary_args.append(file)
 
-            summary_result = _run_git_command(summary_args, cwd=str(target))
+            # Run the diff and its summary concurrently
+            result, summary_result = await asyncio.gather(
+                _run_git_command_async(args, cwd=str(target)),
+                _run_git_command_async(summary_args, cwd=str(target)),
+            )
+            diff_output = result.stdout
 
             # Count changes
             files_changed = 0
@@ -692,6 +680,8 @@ class GitDiffTool(Tool):
 
         except subprocess.CalledProcessError as e:
             return ToolResult(success=False, error=f"Git diff failed: {e.stderr.strip()}")
+        except subprocess.TimeoutExpired:
+            return ToolResult(success=False, error="Git diff timed out")
         except FileNotFoundError:
             return ToolResult(success=False, error="Git is not installed or not in PATH")
 
@@ -708,6 +698,8 @@ class GitLogTool(Tool):
                 category=ToolCategory.GIT,
                 version="1.0.0",
                 requires_filesystem=True,
+                cacheable=True,
+                cache_state=["git"],
             ),
             parameters=[
                 ToolParameter(
@@ -811,11 +803,15 @@ class GitLogTool(Tool):
                 args.append("--")
                 args.append(file)
 
-            result = _run_git_command(args, cwd=str(target))
+            if since or until:
+                # Relative dates ("2 days ago") move with the clock, so don't memoize
+                output = (await _run_git_command_async(args, cwd=str(target))).stdout
+            else:
+                output = await get_git_state_cache().run(str(target), args)
 
             if oneline:
                 # Simple output
-                lines = [l for l in result.stdout.strip().split("\n") if l]
+                lines = [l for l in output.strip().split("\n") if l]
                 return ToolResult(
                     success=True,
                     data={
@@ -826,7 +822,7 @@ class GitLogTool(Tool):
                 )
             else:
                 # Parse structured output
-                commits = self._parse_log_output(result.stdout)
+                commits = self._parse_log_output(output)
                 return ToolResult(
                     success=True,
                     data={
@@ -838,6 +834,8 @@ class GitLogTool(Tool):
 
         except subprocess.CalledProcessError as e:
             return ToolResult(success=False, error=f"Git log failed: {e.stderr.strip()}")
+        except subprocess.TimeoutExpired:
+            return ToolResult(success=False, error="Git log timed out")
         except FileNotFoundError:
             return ToolResult(success=False, error="Git is not installed or not in PATH")
 
@@ -890,6 +888,7 @@ class GitBranchTool(Tool):
                 category=ToolCategory.GIT,
                 version="1.0.0",
                 requires_filesystem=True,
+                side_effects=True,
             ),
             parameters=[
                 ToolParameter(
@@ -975,6 +974,8 @@ class GitBranchTool(Tool):
 
         except subprocess.CalledProcessError as e:
             return ToolResult(success=False, error=f"Git branch failed: {e.stderr.strip()}")
+        except subprocess.TimeoutExpired:
+            return ToolResult(success=False, error="Git branch timed out")
         except FileNotFoundError:
             return ToolResult(success=False, error="Git is not installed or not in PATH")
 
@@ -988,14 +989,12 @@ class GitBranchTool(Tool):
         if include_all:
             args.insert(1, "-a")
 
-        result = _run_git_command(args, cwd=cwd)
-
-        # Get current branch
-        current_result = _run_git_command(["rev-parse", "--abbrev-ref", "HEAD"], cwd=cwd)
-        current_branch = current_result.stdout.strip()
+        cache = get_git_state_cache()
+        output = await cache.run(cwd, args)
+        current_branch = cache.branch(cwd)
 
         branches = []
-        for line in result.stdout.strip().split("\n"):
+        for line in output.strip().split("\n"):
             if not line:
                 continue
             parts = line.split("\t")
@@ -1020,22 +1019,19 @@ class GitBranchTool(Tool):
     async def _create_branch(self, cwd: str, name: str, start_point: str | None) -> ToolResult:
         """Create a new branch."""
         # Check if branch already exists
-        check_result = _run_git_command(
-            ["branch", "--list", name],
-            cwd=cwd,
-            check=False,
-        )
-        if check_result.stdout.strip():
+        cache = get_git_state_cache()
+        if (await cache.run(cwd, ["branch", "--list", name])).strip():
             return ToolResult(success=False, error=f"Branch '{name}' already exists")
 
         args = ["branch", name]
         if start_point:
             args.append(start_point)
 
-        _run_git_command(args, cwd=cwd)
+        await _run_git_command_async(args, cwd=cwd)
+        cache.invalidate(cwd)
 
         # Get the commit hash for the new branch
-        hash_result = _run_git_command(["rev-parse", name], cwd=cwd)
+        hash_result = await _run_git_command_async(["rev-parse", name], cwd=cwd)
 
         return ToolResult(
             success=True,
@@ -1049,9 +1045,8 @@ class GitBranchTool(Tool):
 
     async def _delete_branch(self, cwd: str, name: str, force: bool) -> ToolResult:
         """Delete a branch."""
-        # Check if trying to delete current branch
-        current_result = _run_git_command(["rev-parse", "--abbrev-ref", "HEAD"], cwd=cwd)
-        current_branch = current_result.stdout.strip()
+        cache = get_git_state_cache()
+        current_branch = cache.branch(cwd)
 
         if name == current_branch:
             return ToolResult(
@@ -1060,18 +1055,13 @@ class GitBranchTool(Tool):
             )
 
         # Check if branch exists
-        check_result = _run_git_command(
-            ["branch", "--list", name],
-            cwd=cwd,
-            check=False,
-        )
-        if not check_result.stdout.strip():
+        if not (await cache.run(cwd, ["branch", "--list", name])).strip():
             return ToolResult(success=False, error=f"Branch '{name}' does not exist")
 
         # Delete the branch
         delete_flag = "-D" if force else "-d"
         try:
-            _run_git_command(["branch", delete_flag, name], cwd=cwd)
+            await _run_git_command_async(["branch", delete_flag, name], cwd=cwd)
         except subprocess.CalledProcessError as e:
             if "not fully merged" in e.stderr:
                 return ToolResult(
@@ -1107,4 +1097,23 @@ __all__ = [
     "GitLogTool",
     "GitBranchTool",
     "GIT_TOOLS",
+    # Runner
+    "GitRunner",
+    "GitCatFile",
+    "GitObject",
+    "get_git_runner",
+    "reset_git_runner",
+    # State cache
+    "GitStateCache",
+    "RepoLocation",
+    "find_repository",
+    "repo_fingerprint",
+    "get_git_state_cache",
+    "reset_git_state_cache",
+    # Status
+    "GitStatus",
+    "StatusEntry",
+    "parse_porcelain_v2",
+    "format_short",
+    "format_long",
 ]
@@ -0,0 +1,350 @@
+"""
+Git Runner - Non-blocking git execution for the git tools.
+
+Git tools run inside the MCP server and hub event loops, so they must not
+block on ``subprocess.run``. GitRunner runs git through asyncio
+subprocesses with:
+
+- a concurrency limit, so a burst of tool calls doesn't fork dozens of
+  git processes at once
+- a per-command timeout; timed-out processes are killed
+- cancellation: a cancelled call kills its git process instead of leaving
+  it running in the background
+
+Object reads go through GitCatFile, a long-lived ``git cat-file --batch``
+process per repository. Reading many blobs then costs one process instead
+of one per object.
+
+Results mirror ``subprocess.run``: calls return a CompletedProcess and
+raise CalledProcessError (``check=True``), TimeoutExpired or
+FileNotFoundError (git not installed), so callers keep their existing
+error handling.
+
+Example:
+    runner = get_git_runner()
+    result = await runner.run(["status", "--porcelain=v2"], cwd=repo)
+
+    cat_file = runner.cat_file(repo)
+    blob = await cat_file.read("HEAD:README.md")
+"""
+
+import asyncio
+import logging
+import os
+import signal
+import subprocess
+import weakref
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# Defaults for the shared runner
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_TIMEOUT = 30.0
+
+
+@dataclass(slots=True)
+class GitObject:
+    """An object read from the git object database.
+
+    Attributes:
+        oid: Full object ID
+        type: Object type (blob, tree, commit, tag)
+        size: Size of the object content in bytes
+        data: Object content; None for info-only lookups
+    """
+
+    oid: str
+    type: str
+    size: int
+    data: bytes | None = None
+
+
+async def _kill(process: asyncio.subprocess.Process) -> None:
+    """Kill a git process and anything it started (hooks, aliases), then reap it."""
+    try:
+        if hasattr(os, "killpg"):
+            # Children keep our pipes open, so the whole group has to go
+            os.killpg(process.pid, signal.SIGKILL)
+        elif process.returncode is None:
+            process.kill()
+    except ProcessLookupError:
+        pass
+    await process.wait()
+
+
+# =============================================================================
+# CAT-FILE WORKER
+# =============================================================================
+
+
+class _BatchProcess:
+    """One ``git cat-file`` batch process; requests are serialized by a lock."""
+
+    def __init__(self, repo: str, mode: str):
+        self.repo = repo
+        self.mode = mode
+        self.lock = asyncio.Lock()
+        self.process: asyncio.subprocess.Process | None = None
+
+    async def start(self) -> asyncio.subprocess.Process:
+        if self.process is None or self.process.returncode is not None:
+            self.process = await asyncio.create_subprocess_exec(
+                "git",
+                "cat-file",
+                self.mode,
+                cwd=self.repo,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                start_new_session=True,
+            )
+        return self.process
+
+    async def stop(self) -> None:
+        process, self.process = self.process, None
+        if process is None:
+            return
+        if process.returncode is None:
+            process.stdin.close()
+            try:
+                await asyncio.wait_for(process.wait(), timeout=1.0)
+            except asyncio.TimeoutError:
+                await _kill(process)
+
+
+class GitCatFile:
+    """
+    Long-lived ``git cat-file`` worker for one repository.
+
+    ``read`` returns object content via ``--batch``; ``info`` returns type
+    and size only via ``--batch-check``. Both processes start on first use
+    and are restarted if they die. A request that times out or is
+    cancelled part-way leaves the stream out of step, so the process is
+    killed and the next request starts a fresh one.
+    """
+
+    def __init__(self, repo: str, timeout: float = DEFAULT_TIMEOUT):
+        """
+        Args:
+            repo: Repository path (any directory inside the work tree)
+            timeout: Seconds allowed per request
+        """
+        self.repo = repo
+        self.timeout = timeout
+        self._batch = _BatchProcess(repo, "--batch")
+        self._check = _BatchProcess(repo, "--batch-check")
+
+    async def read(self, rev: str) -> GitObject | None:
+        """Read an object by revision (e.g. ``HEAD:path``, ``:path``, an OID).
+
+        Returns:
+            The object with its content, or None if it doesn't exist
+        """
+        return (await self.read_many([rev]))[0]
+
+    async def read_many(self, revs: list[str]) -> list[GitObject | None]:
+        """Read several objects, pipelining all requests to the process."""
+        return await self._request(self._batch, revs, with_data=True)
+
+    async def info(self, rev: str) -> GitObject | None:
+        """Look up an object's ID, type and size without reading it."""
+        return (await self._request(self._check, [rev], with_data=False))[0]
+
+    async def _request(
+        self,
+        worker: _BatchProcess,
+        revs: list[str],
+        with_data: bool,
+    ) -> list[GitObject | None]:
+        for rev in revs:
+            if "\n" in rev:
+                raise ValueError(f"Invalid revision: {rev!r}")
+        if not revs:
+            return []
+
+        async with worker.lock:
+            process = await worker.start()
+            try:
+                return await asyncio.wait_for(
+                    self._exchange(process, revs, with_data), timeout=self.timeout
+                )
+            except asyncio.TimeoutError:
+                await worker.stop()
+                raise subprocess.TimeoutExpired(["git", "cat-file", worker.mode], self.timeout)
+            except BaseException:
+                # Cancelled or broken pipe: the stream can't be trusted any more
+                if worker.process is not None:
+                    await _kill(worker.process)
+                    worker.process = None
+                raise
+
+    async def _exchange(
+        self,
+        process: asyncio.subprocess.Process,
+        revs: list[str],
+        with_data: bool,
+    ) -> list[GitObject | None]:
+        async def send() -> None:
+            process.stdin.write("".join(f"{rev}\n" for rev in revs).encode())
+            await process.stdin.drain()
+
+        # Write while reading so large requests can't fill both pipes
+        sender = asyncio.create_task(send())
+        try:
+            results = []
+            for _ in revs:
+                header = await process.stdout.readline()
+                if not header:
+                    raise BrokenPipeError("git cat-file exited")
+                parts = header.decode().split()
+                if not parts[-1].isdigit():
+                    # "<rev> missing" or "<rev> ambiguous"
+                    results.append(None)
+                    continue
+                oid, kind, size = parts[0], parts[1], int(parts[2])
+                data = None
+                if with_data:
+                    data = (await process.stdout.readexactly(size + 1))[:-1]
+                results.append(GitObject(oid=oid, type=kind, size=size, data=data))
+            await sender
+            return results
+        finally:
+            sender.cancel()
+
+    async def close(self) -> None:
+        """Stop the worker processes."""
+        for worker in (self._batch, self._check):
+            async with worker.lock:
+                await worker.stop()
+
+
+# =============================================================================
+# RUNNER
+# =============================================================================
+
+
+class GitRunner:
+    """
+    Runs git commands without blocking the event loop.
+
+    Asyncio primitives and subprocesses belong to one event loop, so the
+    concurrency limit and cat-file workers are kept per loop.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        """
+        Args:
+            max_concurrency: Max git processes running at once
+            timeout: Default seconds allowed per command
+        """
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+        self._cat_files: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, GitCatFile]
+        ] = weakref.WeakKeyDictionary()
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def run(
+        self,
+        args: list[str],
+        cwd: str | None = None,
+        check: bool = True,
+        timeout: float | None = None,
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a git command.
+
+        Args:
+            args: Git command arguments (without 'git' prefix)
+            cwd: Working directory for the command
+            check: If True, raise CalledProcessError on non-zero exit
+            timeout: Seconds before the process is killed (default: runner timeout)
+
+        Returns:
+            CompletedProcess with decoded stdout and stderr
+
+        Raises:
+            subprocess.CalledProcessError: If check=True and command fails
+            subprocess.TimeoutExpired: If the command ran past its timeout
+            FileNotFoundError: If git is not installed
+        """
+        cmd = ["git", *args]
+        timeout = timeout if timeout is not None else self.timeout
+
+        async with self._semaphore():
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=cwd,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+            except asyncio.TimeoutError:
+                await _kill(process)
+                logger.warning(f"git {args[0] if args else ''} timed out after {timeout}s")
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            except BaseException:
+                await _kill(process)
+                raise
+
+        result = subprocess.CompletedProcess(
+            cmd,
+            process.returncode,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace"),
+        )
+        if check:
+            result.check_returncode()
+        return result
+
+    def cat_file(self, repo: str) -> GitCatFile:
+        """Get the cat-file worker for a repository, starting one if needed."""
+        workers = self._cat_files.setdefault(asyncio.get_running_loop(), {})
+        worker = workers.get(repo)
+        if worker is None:
+            worker = workers[repo] = GitCatFile(repo, timeout=self.timeout)
+        return worker
+
+    async def close(self) -> None:
+        """Stop the cat-file workers of the running event loop."""
+        workers = self._cat_files.pop(asyncio.get_running_loop(), {})
+        for worker in workers.values():
+            await worker.close()
+
+
+# =============================================================================
+# GLOBAL INSTANCE
+# =============================================================================
+
+_git_runner: GitRunner | None = None
+
+
+def get_git_runner() -> GitRunner:
+    """Get the shared git runner."""
+    global _git_runner
+    if _git_runner is None:
+        _git_runner = GitRunner()
+    return _git_runner
+
+
+def reset_git_runner() -> None:
+    """Reset the shared git runner (for testing)."""
+    global _git_runner
+    _git_runner = None
@@ -0,0 +1,403 @@
+"""
+Git State Cache - Memoized repository state for the git tools.
+
+Agents call git_status, git_branch and git_log over and over on
+repositories that haven't changed, and every call used to spawn git just
+to find the repository and its current branch. GitStateCache answers
+those from memory while the repository is unchanged:
+
+- The repository root and current branch come straight from the
+  filesystem (walking up to ``.git`` and reading ``HEAD``), with no git
+  process at all.
+- Other results (HEAD commit, status, log, branch lists) are memoized per
+  repository under a fingerprint of the git directory: the contents of
+  HEAD and the mtimes of the index, packed-refs and every refs directory.
+  Commits, checkouts, staging, fetches and branch changes all alter the
+  fingerprint, which drops the repository's memoized results.
+- As with git's "racy" index check, nothing is served from memory while
+  the newest of those mtimes is within RACY_WINDOW of now, since a second
+  change in the same timestamp tick would otherwise go unnoticed.
+
+Status also depends on the working tree, which the git directory doesn't
+reflect. A memoized status is checked against the root directory and the
+changed paths and their directories (new, deleted and re-edited files),
+and kept at most STATUS_TTL seconds, which bounds how long an in-place
+edit of a clean tracked file can go unseen.
+
+Example:
+    cache = get_git_state_cache()
+    cache.root(path)                 # filesystem only
+    status = await cache.status(path)
+    log = await cache.run(path, ["log", "-10", "--oneline"])
+"""
+
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from fastband.tools.git.runner import GitRunner, get_git_runner
+from fastband.tools.git.status import GitStatus, parse_porcelain_v2
+
+# Seconds after a change during which mtimes can't be trusted
+RACY_WINDOW = 0.1
+
+# Max age of a memoized status, for edits the fingerprint can't see
+STATUS_TTL = 2.0
+
+_Token = tuple[int, int] | None
+
+
+@dataclass(slots=True, frozen=True)
+class RepoLocation:
+    """Where a repository lives on disk.
+
+    Attributes:
+        root: Work tree root
+        git_dir: Git directory holding HEAD and the index
+        common_dir: Git directory holding refs (differs for linked worktrees)
+    """
+
+    root: str
+    git_dir: str
+    common_dir: str
+
+
+def find_repository(path: str | Path) -> RepoLocation | None:
+    """Find the repository containing path without running git."""
+    start = Path(path).resolve()
+    for candidate in (start, *start.parents):
+        dot_git = candidate / ".git"
+        if dot_git.is_dir():
+            git_dir = dot_git
+        elif dot_git.is_file():
+            # Linked worktrees and submodules point at their git directory
+            try:
+                content = dot_git.read_text().strip()
+            except OSError:
+                continue
+            if not content.startswith("gitdir: "):
+                continue
+            git_dir = (candidate / content[len("gitdir: ") :]).resolve()
+        else:
+            continue
+
+        if not (git_dir / "HEAD").is_file():
+            continue
+        common_dir = git_dir
+        try:
+            common_dir = (git_dir / (git_dir / "commondir").read_text().strip()).resolve()
+        except OSError:
+            pass
+        return RepoLocation(str(candidate), str(git_dir), str(common_dir))
+    return None
+
+
+# =============================================================================
+# FINGERPRINTS
+# =============================================================================
+
+
+def _stat_token(path: str) -> _Token:
+    """Return (mtime_ns, size) for a path, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _refs_tokens(refs_dir: str) -> list[tuple[str, _Token]]:
+    """Tokens for every directory under refs; updating a loose ref renames
+    a lock file into its directory, which changes that directory's mtime."""
+    tokens = []
+    pending = [refs_dir]
+    while pending:
+        directory = pending.pop()
+        tokens.append((directory, _stat_token(directory)))
+        try:
+            with os.scandir(directory) as it:
+                pending.extend(e.path for e in it if e.is_dir(follow_symlinks=False))
+        except OSError:
+            continue
+    tokens.sort()
+    return tokens
+
+
+def _newest(tokens: list[tuple[str, _Token]]) -> int:
+    return max((token[0] for _, token in tokens if token), default=0)
+
+
+def _racy(tokens: list[tuple[str, _Token]]) -> bool:
+    return time.time_ns() - _newest(tokens) < RACY_WINDOW * 1e9
+
+
+def _git_dir_tokens(location: RepoLocation) -> tuple[str, list[tuple[str, _Token]]] | None:
+    try:
+        with open(os.path.join(location.git_dir, "HEAD")) as f:
+            head = f.read().strip()
+    except OSError:
+        return None
+
+    common = location.common_dir
+    tokens = [
+        ("index", _stat_token(os.path.join(location.git_dir, "index"))),
+        ("packed-refs", _stat_token(os.path.join(common, "packed-refs"))),
+        ("reftable", _stat_token(os.path.join(common, "reftable", "tables.list"))),
+    ]
+    tokens.extend(_refs_tokens(os.path.join(common, "refs")))
+    return head, tokens
+
+
+def repo_fingerprint(location: RepoLocation) -> tuple | None:
+    """Fingerprint of a repository's HEAD, index and refs."""
+    state = _git_dir_tokens(location)
+    if state is None:
+        return None
+    head, tokens = state
+    return (location.git_dir, head, tuple(tokens))
+
+
+def _worktree_tokens(root: str, status: GitStatus) -> list[tuple[str, _Token]]:
+    """Tokens for the work tree paths a status result depends on."""
+    paths = {root}
+    for entry in status.entries:
+        path = os.path.join(root, entry.path.rstrip("/"))
+        paths.add(path)
+        paths.add(os.path.dirname(path))
+    return sorted((path, _stat_token(path)) for path in paths)
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+
+@dataclass(slots=True)
+class _Memo:
+    value: Any
+    expires_at: float | None
+    check: list[tuple[str, _Token]] | None
+
+
+@dataclass(slots=True)
+class _RepoEntry:
+    fingerprint: tuple
+    memos: OrderedDict
+
+
+class GitStateCache:
+    """
+    Per-repository memo of git results, valid while the repository is unchanged.
+
+    Values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        runner: GitRunner | None = None,
+        max_repos: int = 64,
+        max_values: int = 128,
+    ):
+        """
+        Args:
+            runner: Git runner for misses (default: the shared runner)
+            max_repos: Repositories tracked before evicting the least recently used
+            max_values: Memoized results kept per repository
+        """
+        self._runner = runner
+        self.max_repos = max_repos
+        self.max_values = max_values
+        self._repos: OrderedDict[str, _RepoEntry] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def runner(self) -> GitRunner:
+        return self._runner or get_git_runner()
+
+    def locate(self, path: str | Path) -> RepoLocation | None:
+        """Find the repository containing path (filesystem only)."""
+        return find_repository(path)
+
+    def root(self, path: str | Path) -> str | None:
+        """Work tree root of the repository containing path."""
+        location = find_repository(path)
+        return location.root if location else None
+
+    def branch(self, path: str | Path) -> str | None:
+        """Current branch name, "HEAD" when detached, None outside a repository."""
+        location = find_repository(path)
+        if location is None:
+            return None
+        try:
+            with open(os.path.join(location.git_dir, "HEAD")) as f:
+                head = f.read().strip()
+        except OSError:
+            return None
+        if head.startswith("ref: refs/heads/"):
+            return head[len("ref: refs/heads/") :]
+        return "HEAD"
+
+    async def memoize(
+        self,
+        path: str | Path,
+        key: Any,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: float | None = None,
+        check: Callable[[RepoLocation, Any], list[tuple[str, _Token]]] | None = None,
+    ) -> Any:
+        """
+        Return the memoized value for key in path's repository, or compute it.
+
+        Args:
+            path: Any path inside the repository
+            key: Hashable key for the value within the repository
+            compute: Coroutine function producing the value; exceptions are not cached
+            ttl: Max seconds to keep the value (default: until the repository changes)
+            check: Extra validity tokens derived from the value, recomputed on lookup
+
+        Returns:
+            The value (computed directly, uncached, outside a repository)
+        """
+        location = find_repository(path)
+        state = _git_dir_tokens(location) if location else None
+        if state is None:
+            return await compute()
+
+        head, tokens = state
+        fingerprint = (head, tuple(tokens))
+        trusted = not _racy(tokens)
+
+        entry = self._repos.get(location.git_dir)
+        if entry is None or entry.fingerprint != fingerprint:
+            entry = self._repos[location.git_dir] = _RepoEntry(fingerprint, OrderedDict())
+        self._repos.move_to_end(location.git_dir)
+        while len(self._repos) > self.max_repos:
+            self._repos.popitem(last=False)
+
+        memo = entry.memos.get(key) if trusted else None
+        if (
+            memo is not None
+            and (memo.expires_at is None or memo.expires_at > time.monotonic())
+            and (check is None or check(location, memo.value) == memo.check)
+        ):
+            entry.memos.move_to_end(key)
+            self.hits += 1
+            return memo.value
+
+        self.misses += 1
+        value = await compute()
+
+        # Keep it only if the repository didn't change while computing
+        after = _git_dir_tokens(location)
+        if not trusted or after is None or (after[0], tuple(after[1])) != fingerprint:
+            return value
+        check_tokens = check(location, value) if check else None
+        if check_tokens and _racy(check_tokens):
+            return value
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        entry.memos[key] = _Memo(value, expires_at, check_tokens)
+        entry.memos.move_to_end(key)
+        while len(entry.memos) > self.max_values:
+            entry.memos.popitem(last=False)
+        return value
+
+    async def run(
+        self,
+        path: str | Path,
+        args: list[str],
+        cwd: str | None = None,
+        ttl: float | None = None,
+    ) -> str:
+        """
+        Memoized stdout of a read-only git command.
+
+        Only use this for commands whose output depends on HEAD, the index
+        and refs alone (log, rev-parse, branch listings), not the work tree.
+
+        Raises:
+            subprocess.CalledProcessError: If the command fails (not cached)
+        """
+        cwd = str(cwd or path)
+
+        async def compute() -> str:
+            return (await self.runner.run(args, cwd=cwd)).stdout
+
+        return await self.memoize(path, ("run", cwd, *args), compute, ttl=ttl)
+
+    async def head(self, path: str | Path) -> str | None:
+        """Commit ID of HEAD, or None for a repository with no commits."""
+
+        async def compute() -> str | None:
+            result = await self.runner.run(
+                ["rev-parse", "--verify", "-q", "HEAD"], cwd=str(path), check=False
+            )
+            return result.stdout.strip() or None
+
+        return await self.memoize(path, ("head",), compute)
+
+    async def status(self, path: str | Path) -> GitStatus:
+        """Parsed porcelain-v2 status (with branch headers) of the whole repository."""
+        location = find_repository(path)
+        cwd = location.root if location else str(path)
+
+        async def compute() -> GitStatus:
+            # No optional locks: status must not rewrite the index it is keyed on
+            result = await self.runner.run(
+                ["--no-optional-locks", "status", "--porcelain=v2", "--branch", "-z"],
+                cwd=cwd,
+            )
+            return parse_porcelain_v2(result.stdout)
+
+        return await self.memoize(
+            path,
+            ("status",),
+            compute,
+            ttl=STATUS_TTL,
+            check=lambda location, status: _worktree_tokens(location.root, status),
+        )
+
+    def invalidate(self, path: str | Path | None = None) -> None:
+        """Drop memoized results for path's repository, or for all repositories."""
+        if path is None:
+            self._repos.clear()
+            return
+        location = find_repository(path)
+        if location is not None:
+            self._repos.pop(location.git_dir, None)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        total = self.hits + self.misses
+        return {
+            "repositories": len(self._repos),
+            "values": sum(len(e.memos) for e in self._repos.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+# =============================================================================
+# GLOBAL INSTANCE
+# =============================================================================
+
+_git_state_cache: GitStateCache | None = None
+
+
+def get_git_state_cache() -> GitStateCache:
+    """Get the shared git state cache."""
+    global _git_state_cache
+    if _git_state_cache is None:
+        _git_state_cache = GitStateCache()
+    return _git_state_cache
+
+
+def reset_git_state_cache() -> None:
+    """Reset the shared git state cache (for testing)."""
+    global _git_state_cache
+    _git_state_cache = None
@@ -0,0 +1,278 @@
+"""
+Git Status - Parse ``git status --porcelain=v2 -z`` and render it.
+
+GitStatusTool used to run git status up to three times per call: porcelain
+for the structured data, ``--short`` and the long format for display. All
+three views now come from one porcelain-v2 run: ``format_short`` matches
+``git status --short --branch`` and ``format_long`` matches ``git status``
+without the advice hints.
+"""
+
+from dataclasses import dataclass, field
+
+# Porcelain status letters
+STATUS_NAMES = {
+    "M": "modified",
+    "T": "type_changed",
+    "A": "added",
+    "D": "deleted",
+    "R": "renamed",
+    "C": "copied",
+    "U": "unmerged",
+}
+
+# Labels used by the long format
+_LONG_LABELS = {
+    "M": "modified",
+    "T": "typechange",
+    "A": "new file",
+    "D": "deleted",
+    "R": "renamed",
+    "C": "copied",
+}
+
+_UNMERGED_LABELS = {
+    "DD": "both deleted",
+    "AU": "added by us",
+    "UD": "deleted by them",
+    "UA": "added by them",
+    "DU": "deleted by us",
+    "AA": "both added",
+    "UU": "both modified",
+}
+
+
+def status_name(char: str) -> str:
+    """Convert a porcelain status letter to a readable name."""
+    return STATUS_NAMES.get(char, f"unknown({char})")
+
+
+@dataclass(slots=True)
+class StatusEntry:
+    """One path reported by git status.
+
+    Attributes:
+        path: Path relative to the repository root
+        index: Staged status letter ("." if unchanged, "?" if untracked)
+        worktree: Unstaged status letter ("." if unchanged, "?" if untracked)
+        original_path: Source path of a rename or copy
+        unmerged: Whether the path has merge conflicts
+    """
+
+    path: str
+    index: str
+    worktree: str
+    original_path: str | None = None
+    unmerged: bool = False
+
+    @property
+    def untracked(self) -> bool:
+        return self.index == "?"
+
+
+@dataclass(slots=True)
+class GitStatus:
+    """Parsed ``git status --porcelain=v2 --branch`` output.
+
+    Attributes:
+        branch: Branch headers by name (oid, head, upstream, ab)
+        entries: Changed and untracked paths in git's order
+    """
+
+    branch: dict[str, str] = field(default_factory=dict)
+    entries: list[StatusEntry] = field(default_factory=list)
+
+    @property
+    def staged(self) -> list[StatusEntry]:
+        return [e for e in self.entries if not e.untracked and not e.unmerged and e.index != "."]
+
+    @property
+    def unstaged(self) -> list[StatusEntry]:
+        return [e for e in self.entries if e.unmerged or (not e.untracked and e.worktree != ".")]
+
+    @property
+    def untracked(self) -> list[StatusEntry]:
+        return [e for e in self.entries if e.untracked]
+
+    @property
+    def ahead_behind(self) -> tuple[int, int] | None:
+        ab = self.branch.get("ab")
+        if not ab:
+            return None
+        ahead, behind = ab.split()
+        return int(ahead), -int(behind)
+
+
+def parse_porcelain_v2(output: str) -> GitStatus:
+    """Parse NUL-separated ``git status --porcelain=v2 [--branch] -z`` output."""
+    status = GitStatus()
+    records = output.split("\0")
+    i = 0
+    while i < len(records):
+        record = records[i]
+        i += 1
+        if not record:
+            continue
+
+        if record.startswith("# branch."):
+            key, _, value = record[len("# branch.") :].partition(" ")
+            status.branch[key] = value
+        elif record.startswith("1 "):
+            parts = record.split(" ", 8)
+            status.entries.append(StatusEntry(parts[8], parts[1][0], parts[1][1]))
+        elif record.startswith("2 "):
+            # Renames and copies are followed by the original path
+            parts = record.split(" ", 9)
+            original = records[i] if i < len(records) else None
+            i += 1
+            status.entries.append(StatusEntry(parts[9], parts[1][0], parts[1][1], original))
+        elif record.startswith("u "):
+            parts = record.split(" ", 10)
+            status.entries.append(StatusEntry(parts[10], parts[1][0], parts[1][1], unmerged=True))
+        elif record.startswith("? "):
+            status.entries.append(StatusEntry(record[2:], "?", "?"))
+        # "! " (ignored) entries are only present with --ignored
+
+    return status
+
+
+def _quote(path: str, quote_spaces: bool = True) -> str:
+    """Quote a path the way git does when it has special characters."""
+    special = ' "\\' if quote_spaces else '"\\'
+    if path.isprintable() and path.isascii() and not any(c in path for c in special):
+        return path
+    escaped = []
+    for char in path:
+        if char in '"\\':
+            escaped.append("\\" + char)
+        elif char == "\t":
+            escaped.append("\\t")
+        elif char == "\n":
+            escaped.append("\\n")
+        elif char.isascii() and char.isprintable():
+            escaped.append(char)
+        else:
+            escaped.extend(f"\\{b:03o}" for b in char.encode())
+    return '"' + "".join(escaped) + '"'
+
+
+def _display_path(entry: StatusEntry, quote_spaces: bool = True) -> str:
+    path = _quote(entry.path, quote_spaces)
+    if entry.original_path is not None:
+        return f"{_quote(entry.original_path, quote_spaces)} -> {path}"
+    return path
+
+
+def format_short(status: GitStatus) -> str:
+    """Render like ``git status --short --branch``."""
+    lines = []
+    head = status.branch.get("head")
+    if head is not None:
+        if status.branch.get("oid") == "(initial)":
+            header = f"## No commits yet on {head}"
+        elif head == "(detached)":
+            header = "## HEAD (no branch)"
+        else:
+            header = f"## {head}"
+            upstream = status.branch.get("upstream")
+            if upstream:
+                header += f"...{upstream}"
+                ab = status.ahead_behind
+                if ab is None:
+                    header += " [gone]"
+                elif ab != (0, 0):
+                    parts = []
+                    if ab[0]:
+                        parts.append(f"ahead {ab[0]}")
+                    if ab[1]:
+                        parts.append(f"behind {ab[1]}")
+                    header += f" [{', '.join(parts)}]"
+        lines.append(header)
+
+    for entry in status.entries:
+        xy = (entry.index + entry.worktree).replace(".", " ")
+        lines.append(f"{xy} {_display_path(entry)}")
+    return "\n".join(lines)
+
+
+def _plural(count: int) -> str:
+    return f"{count} commit" if count == 1 else f"{count} commits"
+
+
+def _tracking_lines(status: GitStatus) -> list[str]:
+    upstream = status.branch.get("upstream")
+    if not upstream:
+        return []
+    ab = status.ahead_behind
+    if ab is None:
+        return [f"Your branch is based on '{upstream}', but the upstream is gone."]
+    ahead, behind = ab
+    if ahead and behind:
+        return [
+            f"Your branch and '{upstream}' have diverged,",
+            f"and have {ahead} and {behind} different commits each, respectively.",
+        ]
+    if ahead:
+        return [f"Your branch is ahead of '{upstream}' by {_plural(ahead)}."]
+    if behind:
+        return [
+            f"Your branch is behind '{upstream}' by {_plural(behind)}, and can be fast-forwarded."
+        ]
+    return [f"Your branch is up to date with '{upstream}'."]
+
+
+def format_long(status: GitStatus) -> str:
+    """Render like ``git status`` with advice hints turned off."""
+    lines: list[str] = []
+
+    head = status.branch.get("head")
+    if head == "(detached)":
+        lines.append(f"HEAD detached at {status.branch.get('oid', '')[:7]}")
+    elif head is not None:
+        lines.append(f"On branch {head}")
+        tracking = _tracking_lines(status)
+        if tracking:
+            lines.extend([*tracking, ""])
+    initial = status.branch.get("oid") == "(initial)"
+    if initial:
+        lines.extend(["", "No commits yet", ""])
+
+    staged, unstaged, untracked = status.staged, status.unstaged, status.untracked
+    unmerged = [e for e in unstaged if e.unmerged]
+    unstaged = [e for e in unstaged if not e.unmerged]
+
+    # The long format only quotes paths with control or non-ASCII characters
+    if staged:
+        lines.append("Changes to be committed:")
+        for e in staged:
+            label = _LONG_LABELS.get(e.index, e.index) + ":"
+            lines.append(f"\t{label:<12}{_display_path(e, quote_spaces=False)}")
+        lines.append("")
+    if unmerged:
+        lines.append("Unmerged paths:")
+        for e in unmerged:
+            label = _UNMERGED_LABELS.get(e.index + e.worktree, "unmerged") + ":"
+            lines.append(f"\t{label:<17}{_quote(e.path, quote_spaces=False)}")
+        lines.append("")
+    if unstaged:
+        lines.append("Changes not staged for commit:")
+        for e in unstaged:
+            label = _LONG_LABELS.get(e.worktree, e.worktree) + ":"
+            lines.append(f"\t{label:<12}{_quote(e.path, quote_spaces=False)}")
+        lines.append("")
+    if untracked:
+        lines.append("Untracked files:")
+        lines.extend(f"\t{_quote(e.path, quote_spaces=False)}" for e in untracked)
+        lines.append("")
+
+    if not staged and not unmerged:
+        if unstaged:
+            lines.append("no changes added to commit")
+        elif untracked:
+            lines.append("nothing added to commit but untracked files present")
+        elif initial:
+            lines.append("nothing to commit")
+        else:
+            lines.append("nothing to commit, working tree clean")
+
+    return "\n".join(lines).strip()
@@ -8,12 +8,20 @@ This module provides unified operations that leverage multiple tools together:
 - Database + Code: Schema impact analysis
 - All tools + CodebaseContext: Risk-aware unified reporting
 
+Composites run their sub-analyses concurrently through a per-request
+analysis graph (see AnalysisRun), so shared analyses such as the security
+scan run once per request and a composite takes as long as its slowest part.
+
 These integrations are what make Fastband unique - no competitor has this.
 """
 
+import asyncio
 import logging
 import os
 import subprocess
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
@@ -246,6 +254,227 @@ async def security_precommit_check(staged_files: list[str] | None = None) -> Pre
     )
 
 
+# =============================================================================
+# ANALYSIS GRAPH
+# =============================================================================
+#
+# Composite tools below combine several expensive sub-analyses (security
+# scans, quality analysis, dependency audits). Each composite declares the
+# analyses it needs as Analysis nodes and awaits them together through the
+# request's AnalysisRun, which:
+#
+# - runs independent analyses concurrently, with dependencies awaited first
+# - applies a per-node timeout
+# - runs each distinct analysis at most once per request, so composites
+#   that call each other (or run under one analysis_scope) share results
+#
+# Shared sub-analyses are declared once in ANALYSES.
+
+# Default seconds allowed for one analysis node
+DEFAULT_ANALYSIS_TIMEOUT = 120.0
+
+
+@dataclass(frozen=True)
+class Analysis:
+    """
+    A node in a composite's analysis graph.
+
+    Attributes:
+        func: Coroutine function computing the result
+        args: Positional arguments for func
+        kwargs: Keyword arguments for func, as sorted (name, value) pairs
+        deps: Nodes whose results are passed to func, as (keyword, node) pairs
+        timeout: Seconds allowed (default: DEFAULT_ANALYSIS_TIMEOUT)
+    """
+    func: Callable[..., Awaitable[Any]]
+    args: tuple = ()
+    kwargs: tuple[tuple[str, Any], ...] = ()
+    deps: tuple[tuple[str, "Analysis"], ...] = ()
+    timeout: float | None = None
+
+    @classmethod
+    def of(
+        cls,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+        deps: dict[str, "Analysis"] | None = None,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> "Analysis":
+        """Declare a node: ``Analysis.of(func, *args, deps={...}, **kwargs)``."""
+        return cls(
+            func=func,
+            args=args,
+            kwargs=tuple(sorted(kwargs.items())),
+            deps=tuple(sorted((deps or {}).items())),
+            timeout=timeout,
+        )
+
+    @property
+    def key(self) -> tuple:
+        """Identity of the computation, used to run it once per request."""
+        return (
+            self.func,
+            self.args,
+            self.kwargs,
+            tuple((name, dep.key) for name, dep in self.deps),
+        )
+
+
+class AnalysisRun:
+    """Runs analysis nodes for one request, each distinct node at most once."""
+
+    def __init__(self):
+        self._tasks: dict[tuple, asyncio.Task] = {}
+
+    def start(self, node: Analysis) -> asyncio.Task:
+        """Start a node (and its dependencies) unless it is already running."""
+        task = self._tasks.get(node.key)
+        if task is None:
+            task = self._tasks[node.key] = asyncio.create_task(self._execute(node))
+        return task
+
+    async def _execute(self, node: Analysis) -> Any:
+        dep_results = await asyncio.gather(*(self.start(dep) for _, dep in node.deps))
+        kwargs = dict(node.kwargs)
+        kwargs.update(zip((name for name, _ in node.deps), dep_results, strict=True))
+
+        timeout = node.timeout if node.timeout is not None else DEFAULT_ANALYSIS_TIMEOUT
+        try:
+            return await asyncio.wait_for(node.func(*node.args, **kwargs), timeout=timeout)
+        except asyncio.TimeoutError:
+            name = getattr(node.func, "__name__", repr(node.func))
+            logger.warning(f"Analysis {name} timed out after {timeout}s")
+            raise
+
+    async def result(self, node: Analysis) -> Any:
+        """Await one node's result, raising its exception if it failed."""
+        return await asyncio.shield(self.start(node))
+
+    async def gather(
+        self,
+        nodes: dict[str, Analysis],
+        return_exceptions: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Run nodes concurrently and return their results by name.
+
+        Args:
+            nodes: Nodes to run, by result name
+            return_exceptions: Return a failed node's exception as its result
+                instead of raising it
+
+        Returns:
+            Results in the same order as nodes
+        """
+        tasks = [asyncio.shield(self.start(node)) for node in nodes.values()]
+        results = await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        return dict(zip(nodes, results, strict=True))
+
+    async def close(self) -> None:
+        """Cancel nodes nobody waited for and reap finished ones."""
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+_analysis_run: ContextVar[AnalysisRun | None] = ContextVar("analysis_run", default=None)
+
+
+@asynccontextmanager
+async def analysis_scope() -> AsyncIterator[AnalysisRun]:
+    """
+    Share analysis results for the duration of one request.
+
+    Composites open a scope around their work; a nested scope (a composite
+    calling another, or several composites under one outer scope) reuses
+    the enclosing run.
+    """
+    run = _analysis_run.get()
+    if run is not None:
+        yield run
+        return
+
+    run = AnalysisRun()
+    token = _analysis_run.set(run)
+    try:
+        yield run
+    finally:
+        _analysis_run.reset(token)
+        await run.close()
+
+
+# Shared sub-analyses. Tool modules are imported when a node runs, as
+# elsewhere in this module, so declaring the graph stays cheap.
+#
+# Several tools are async in name only: they end in blocking subprocess
+# calls (pip-audit, npm outdated, git) without awaiting anything. Those
+# nodes run in a worker thread on their own event loop, so they overlap
+# with other nodes and their timeout fires while they are still running.
+
+async def _in_thread(func: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+    """Run a coroutine function that blocks the event loop in a worker thread."""
+    return await asyncio.to_thread(lambda: asyncio.run(func(*args)))
+
+
+async def _security_scan(scan_type: str) -> dict[str, Any]:
+    from fastband.tools.security import security_scan
+    return await security_scan(os.getcwd(), scan_type=scan_type)
+
+
+async def _code_quality() -> dict[str, Any]:
+    from fastband.tools.quality import code_quality_analyze
+    return await code_quality_analyze(os.getcwd(), mode="directory")
+
+
+async def _precommit() -> PreCommitResult:
+    return await _in_thread(security_precommit_check)
+
+
+async def _docs_check() -> dict[str, Any]:
+    from fastband.tools.documentation import docs_check
+    return await _in_thread(docs_check)
+
+
+async def _docs_coverage() -> dict[str, Any]:
+    from fastband.tools.documentation import docs_coverage
+    return await _in_thread(docs_coverage)
+
+
+async def _deps(name: str) -> dict[str, Any]:
+    from fastband.tools import dependencies
+    return await _in_thread(getattr(dependencies, f"deps_{name}"))
+
+
+async def _perf_bundle() -> dict[str, Any]:
+    from fastband.tools.performance import perf_bundle
+    return await _in_thread(perf_bundle)
+
+
+ANALYSES: dict[str, Analysis] = {
+    "security_quick": Analysis.of(_security_scan, "quick"),
+    "security_code": Analysis.of(_security_scan, "code"),
+    "security_full": Analysis.of(_security_scan, "full"),
+    "precommit": Analysis.of(_precommit),
+    "quality": Analysis.of(_code_quality),
+    "docs_check": Analysis.of(_docs_check),
+    "docs_coverage": Analysis.of(_docs_coverage),
+    "deps_audit": Analysis.of(_deps, "audit"),
+    "deps_health": Analysis.of(_deps, "health"),
+    "deps_licenses": Analysis.of(_deps, "licenses"),
+    "deps_list": Analysis.of(_deps, "list"),
+    "deps_outdated": Analysis.of(_deps, "outdated"),
+    "perf_bundle": Analysis.of(_perf_bundle),
+}
+
+
+def shared(*names: str) -> dict[str, Analysis]:
+    """Select shared analyses by name, for AnalysisRun.gather."""
+    return {name: ANALYSES[name] for name in names}
+
+
 # =============================================================================
 # CI/CD + GIT INTEGRATION (Blame Analysis)
 # =============================================================================
@@ -434,9 +663,19 @@ async def cicd_correlate_with_logs(
     from fastband.tools.cicd import cicd_logs, cicd_run_details
     from fastband.tools.logs import logs_analyze
 
-    # Get CI/CD details
-    run_details = await cicd_run_details(run_id)
-    build_logs = await cicd_logs(run_id, failed_only=True)
+    # Get CI/CD details and analyze application logs concurrently
+    nodes = {
+        "run_details": Analysis.of(cicd_run_details, run_id),
+        "build_logs": Analysis.of(cicd_logs, run_id, failed_only=True),
+    }
+    if log_path:
+        nodes["app_logs"] = Analysis.of(
+            logs_analyze, log_path, errors_only=True, correlate_code=True
+        )
+    async with analysis_scope() as run:
+        results = await run.gather(nodes)
+    run_details = results["run_details"]
+    build_logs = results["build_logs"]
 
     result = {
         "type": "cicd_log_correlation",
@@ -454,8 +693,7 @@ async def cicd_correlate_with_logs(
         result["app_logs"] = {"note": "No application log path provided"}
         return result
 
-    # Analyze application logs
-    app_log_analysis = await logs_analyze(log_path, errors_only=True, correlate_code=True)
+    app_log_analysis = results["app_logs"]
 
     result["app_logs"] = {
         "error_count": app_log_analysis.get("error_count", 0),
@@ -679,13 +917,11 @@ async def deploy_with_security_check(environment: str = "preview") -> dict[str,
     Returns:
         Security results with deployment recommendation
     """
-    from fastband.tools.security import security_scan
-
-    # Run comprehensive security scan
-    scan_result = await security_scan(os.getcwd(), scan_type="full")
-
-    # Get staged/uncommitted changes for pre-commit check
-    precommit_result = await security_precommit_check()
+    # Full security scan and pre-commit check of staged changes, concurrently
+    async with analysis_scope() as run:
+        results = await run.gather(shared("security_full", "precommit"))
+    scan_result = results["security_full"]
+    precommit_result = results["precommit"]
 
     # Determine if deployment should proceed
     critical_secrets = precommit_result.secrets_found
@@ -733,15 +969,16 @@ async def deploy_risk_assessment(from_ref: str = "", to_ref: str = "HEAD") -> di
     Returns:
         Risk assessment with score and breakdown
     """
+    from fastband.tools.git import get_git_runner
+
+    runner = get_git_runner()
+
     # If no from_ref, try to find last deployment commit
     if not from_ref:
         try:
             # Look for recent tags or use last 10 commits
-            result = subprocess.run(
-                ["git", "describe", "--tags", "--abbrev=0"],
-                capture_output=True,
-                text=True,
-                timeout=10,
+            result = await runner.run(
+                ["describe", "--tags", "--abbrev=0"], check=False, timeout=10
             )
             if result.returncode == 0:
                 from_ref = result.stdout.strip()
@@ -752,11 +989,8 @@ async def deploy_risk_assessment(from_ref: str = "", to_ref: str = "HEAD") -> di
 
     # Get changed files
     try:
-        result = subprocess.run(
-            ["git", "diff", "--name-only", f"{from_ref}..{to_ref}"],
-            capture_output=True,
-            text=True,
-            timeout=10,
+        result = await runner.run(
+            ["diff", "--name-only", f"{from_ref}..{to_ref}"], check=False, timeout=10
         )
 
         if result.returncode != 0:
@@ -1043,12 +1277,12 @@ async def deps_full_security_report() -> dict[str, Any]:
     Returns:
         Full security report with actionable insights
     """
-    from fastband.tools.dependencies import deps_audit, deps_health, deps_licenses
-
     # Get all dependency data
-    audit_result = await deps_audit()
-    license_result = await deps_licenses()
-    health_result = await deps_health()
+    async with analysis_scope() as run:
+        results = await run.gather(shared("deps_audit", "deps_licenses", "deps_health"))
+    audit_result = results["deps_audit"]
+    license_result = results["deps_licenses"]
+    health_result = results["deps_health"]
 
     # Calculate overall security score
     vuln_penalty = (
@@ -1139,10 +1373,8 @@ async def deps_update_impact_analysis(package: str = "") -> dict[str, Any]:
     Returns:
         Update impact analysis with risk assessment
     """
-    from fastband.tools.dependencies import deps_outdated, deps_health
-
-    outdated = await deps_outdated()
-    health = await deps_health()
+    async with analysis_scope() as run:
+        outdated = await run.result(ANALYSES["deps_outdated"])
 
     packages = outdated.get("packages", [])
 
@@ -1339,15 +1571,12 @@ async def perf_deps_impact() -> dict[str, Any]:
     Returns:
         Dependency performance impact analysis
     """
-    from fastband.tools.dependencies import deps_list
-    from fastband.tools.performance import perf_bundle
-
-    # Get dependencies
-    deps = await deps_list()
+    # Get dependencies and the bundle analysis
+    async with analysis_scope() as run:
+        results = await run.gather(shared("deps_list", "perf_bundle"))
+    deps = results["deps_list"]
     dep_names = [d.get("name") for d in deps.get("dependencies", [])]
-
-    # Get bundle analysis
-    bundle = await perf_bundle()
+    bundle = results["perf_bundle"]
 
     if "error" in bundle:
         return bundle
@@ -1401,8 +1630,24 @@ async def env_deploy_readiness(environment: str = "production") -> dict[str, Any
     issues = []
     warnings = []
 
+    prod_file = f".env.{environment}" if environment != "production" else ".env.production"
+    async with analysis_scope() as run:
+        results = await run.gather(
+            {
+                "missing": Analysis.of(env_missing),
+                "validation": Analysis.of(env_validate, file_path=prod_file),
+                "comparison": Analysis.of(
+                    env_compare, source=".env.development", target=prod_file
+                ),
+            },
+            return_exceptions=True,
+        )
+    for name in ("missing", "validation"):
+        if isinstance(results[name], BaseException):
+            raise results[name]
+
     # Check for missing variables in code
-    missing = await env_missing()
+    missing = results["missing"]
     if missing.get("missing_count", 0) > 0:
         issues.append({
             "type": "missing_vars",
@@ -1411,24 +1656,20 @@ async def env_deploy_readiness(environment: str = "production") -> dict[str, Any
         })
 
     # Validate production env file
-    prod_file = f".env.{environment}" if environment != "production" else ".env.production"
-    validation = await env_validate(file_path=prod_file)
+    validation = results["validation"]
 
     if not validation.get("passed"):
         issues.extend([
             {"type": "validation_failed", "details": validation.get("issues", {})}
         ])
 
-    # Compare with development
-    try:
-        comparison = await env_compare(source=".env.development", target=prod_file)
-        if comparison.get("missing_in_target"):
-            warnings.append({
-                "type": "missing_in_prod",
-                "vars": comparison.get("missing_in_target", [])[:5],
-            })
-    except Exception:
-        pass  # Dev file may not exist
+    # Compare with development (the dev file may not exist)
+    comparison = results["comparison"]
+    if not isinstance(comparison, BaseException) and comparison.get("missing_in_target"):
+        warnings.append({
+            "type": "missing_in_prod",
+            "vars": comparison.get("missing_in_target", [])[:5],
+        })
 
     ready = len(issues) == 0
 
@@ -1541,13 +1782,14 @@ async def docs_release_ready() -> dict[str, Any]:
     Returns:
         Release readiness with issues to fix
     """
-    from fastband.tools.documentation import docs_check, docs_coverage
-
     issues = []
     warnings = []
 
+    async with analysis_scope() as run:
+        results = await run.gather(shared("docs_check", "docs_coverage"))
+
     # Check required documentation files
-    file_check = await docs_check()
+    file_check = results["docs_check"]
     if not file_check.get("complete"):
         issues.extend([
             {"type": "missing_file", "file": f}
@@ -1557,7 +1799,7 @@ async def docs_release_ready() -> dict[str, Any]:
             warnings.append({"type": "recommended_file", "file": f})
 
     # Check documentation coverage
-    coverage = await docs_coverage()
+    coverage = results["docs_coverage"]
     coverage_pct = coverage.get("coverage_percentage", 0)
 
     if coverage_pct < 50:
@@ -1612,15 +1854,12 @@ async def docs_code_quality_correlation() -> dict[str, Any]:
     Returns:
         Correlation analysis with insights
     """
-    from fastband.tools.code_quality import code_quality_analyze
-    from fastband.tools.documentation import docs_coverage
-
-    # Get documentation coverage
-    doc_coverage = await docs_coverage()
+    # Get documentation coverage and code quality
+    async with analysis_scope() as run:
+        results = await run.gather(shared("docs_coverage", "quality"))
+    doc_coverage = results["docs_coverage"]
     missing_docs = doc_coverage.get("missing_docs", [])
-
-    # Get code quality
-    code_quality = await code_quality_analyze()
+    code_quality = results["quality"]
 
     if "error" in code_quality:
         return {
@@ -2139,14 +2378,11 @@ async def security_quality_hotspots() -> dict[str, Any]:
     Returns:
         Hotspots where security and quality issues overlap
     """
-    from fastband.tools.quality import code_quality_analyze
-    from fastband.tools.security import security_scan
-
-    # Get security issues
-    security_result = await security_scan(os.getcwd(), scan_type="full")
-
-    # Get code quality issues
-    quality_result = await code_quality_analyze()
+    # Get security and code quality issues
+    async with analysis_scope() as run:
+        results = await run.gather(shared("security_full", "quality"))
+    security_result = results["security_full"]
+    quality_result = results["quality"]
 
     if "error" in security_result or "error" in quality_result:
         return {
@@ -2228,11 +2464,10 @@ async def security_complexity_analysis() -> dict[str, Any]:
     Returns:
         Correlation analysis with actionable insights
     """
-    from fastband.tools.quality import code_quality_analyze
-    from fastband.tools.security import security_scan
-
-    security_result = await security_scan(os.getcwd(), scan_type="code")
-    quality_result = await code_quality_analyze()
+    async with analysis_scope() as run:
+        results = await run.gather(shared("security_code", "quality"))
+    security_result = results["security_code"]
+    quality_result = results["quality"]
 
     if "error" in security_result or "error" in quality_result:
         return {"error": "Could not analyze security or quality"}
@@ -2564,9 +2799,8 @@ async def quality_gate_check(
     Returns:
         Gate pass/fail result with details
     """
-    from fastband.tools.quality import code_quality_analyze
-
-    quality_result = await code_quality_analyze()
+    async with analysis_scope() as run:
+        quality_result = await run.result(ANALYSES["quality"])
 
     if "error" in quality_result:
         return {
@@ -2634,19 +2868,21 @@ async def quality_trend_analysis(runs: int = 10) -> dict[str, Any]:
         Trend analysis with direction indicators
     """
     from fastband.tools.cicd import cicd_runs
-    from fastband.tools.quality import code_quality_analyze
 
-    # Get current quality
-    current_quality = await code_quality_analyze()
+    # Get current quality and recent CI runs for context
+    async with analysis_scope() as run:
+        results = await run.gather({
+            "quality": ANALYSES["quality"],
+            "ci_runs": Analysis.of(cicd_runs, limit=runs),
+        })
+    current_quality = results["quality"]
 
     if "error" in current_quality:
         return {"error": current_quality.get("error")}
 
     current_score = current_quality.get("score", 0)
     current_issues = current_quality.get("total_issues", 0)
-
-    # Get recent CI runs for context
-    ci_runs = await cicd_runs(limit=runs)
+    ci_runs = results["ci_runs"]
 
     # Since we can't get historical quality data easily,
     # we'll provide current snapshot with CI context
@@ -3124,13 +3360,30 @@ async def smart_recommendations() -> dict[str, Any]:
     recommendations = []
     analyses_run = []
 
-    # Run multiple analyses in parallel would be ideal,
-    # but for now we'll run them sequentially with error handling
+    # All analyses run concurrently; one failing or timing out only drops
+    # its own section, as before
+    async with analysis_scope() as run:
+        results = await run.gather(
+            shared(
+                "security_quick",
+                "quality",
+                "docs_check",
+                "docs_coverage",
+                "deps_audit",
+                "deps_outdated",
+            ),
+            return_exceptions=True,
+        )
+
+    def outcome(name: str) -> Any:
+        result = results[name]
+        if isinstance(result, BaseException):
+            raise result
+        return result
 
     # 1. Security check
     try:
-        from fastband.tools.security import security_scan
-        security = await security_scan(os.getcwd(), scan_type="quick")
+        security = outcome("security_quick")
         analyses_run.append("security")
 
         critical = security.get("vulnerabilities", {}).get("critical", 0)
@@ -3161,8 +3414,7 @@ async def smart_recommendations() -> dict[str, Any]:
 
     # 2. Code quality check
     try:
-        from fastband.tools.quality import code_quality_analyze
-        quality = await code_quality_analyze()
+        quality = outcome("quality")
         analyses_run.append("quality")
 
         score = quality.get("score", 100)
@@ -3182,9 +3434,8 @@ async def smart_recommendations() -> dict[str, Any]:
 
     # 3. Documentation check
     try:
-        from fastband.tools.documentation import docs_check, docs_coverage
-        doc_files = await docs_check()
-        doc_coverage = await docs_coverage()
+        doc_files = outcome("docs_check")
+        doc_coverage = outcome("docs_coverage")
         analyses_run.append("documentation")
 
         if not doc_files.get("complete"):
@@ -3213,9 +3464,8 @@ async def smart_recommendations() -> dict[str, Any]:
 
     # 4. Dependencies check
     try:
-        from fastband.tools.dependencies import deps_audit, deps_outdated
-        audit = await deps_audit()
-        outdated = await deps_outdated()
+        audit = outcome("deps_audit")
+        outdated = outcome("deps_outdated")
         analyses_run.append("dependencies")
 
         vuln_count = audit.get("vulnerability_count", 0)
@@ -945,22 +945,22 @@ class MemoryHandoffListTool(Tool):
         from fastband.memory import get_handoff_manager
 
         manager = get_handoff_manager()
-        packets = manager.get_pending_handoffs(ticket_id)
+        entries = manager.list_handoffs(ticket_id)
 
         return ToolResult(
             success=True,
             data={
-                "count": len(packets),
+                "count": len(entries),
                 "packets": [
                     {
-                        "packet_id": p.packet_id,
-                        "from_agent": p.source_agent,
-                        "ticket_id": p.ticket_id,
-                        "reason": p.reason.value,
-                        "priority": p.priority.value,
-                        "created_at": p.created_at,
+                        "packet_id": e.packet_id,
+                        "from_agent": e.source_agent,
+                        "ticket_id": e.ticket_id,
+                        "reason": e.reason,
+                        "priority": e.priority,
+                        "created_at": e.created_at,
                     }
-                    for p in packets
+                    for e in entries
                 ],
             },
         )
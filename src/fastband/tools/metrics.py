@@ -0,0 +1,262 @@
+"""
+Tool Metrics - Latency histograms, error counters and in-flight gauges.
+
+Every tool execution path (MCP ``call_tool`` via ToolRegistry.execute and
+the hub ToolExecutor) records into the ToolMetrics owned by its registry.
+
+Latencies go into fixed log-linear buckets (four per doubling, 0.1ms to
+~105s), so recording is a bisect plus a few integer increments, memory is
+constant per tool, and percentiles are accurate to within one bucket
+(about 19%). Each tool keeps a cumulative histogram plus a ring of short
+time slices, merged on read for rolling-window percentiles.
+
+Updates are plain integer increments without locks; under free threading
+a racing increment may occasionally be lost, which is acceptable for
+monitoring data.
+"""
+
+import time
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+# Bucket upper bounds in milliseconds; the last bucket is unbounded
+BUCKET_BOUNDS_MS: tuple[float, ...] = tuple(0.1 * 2 ** (i / 4) for i in range(81))
+
+# Percentiles reported by snapshots and the Prometheus export
+PERCENTILES = (0.5, 0.95, 0.99)
+
+
+# =============================================================================
+# HISTOGRAM
+# =============================================================================
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram."""
+
+    __slots__ = ("counts", "count", "sum_ms", "min_ms", "max_ms")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.min_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, value_ms: float) -> None:
+        """Record one latency sample."""
+        self.counts[bisect_left(BUCKET_BOUNDS_MS, value_ms)] += 1
+        if not self.count or value_ms < self.min_ms:
+            self.min_ms = value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+        self.count += 1
+        self.sum_ms += value_ms
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's samples into this one."""
+        if not other.count:
+            return
+        for i, n in enumerate(other.counts):
+            if n:
+                self.counts[i] += n
+        self.min_ms = min(self.min_ms, other.min_ms) if self.count else other.min_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+        self.count += other.count
+        self.sum_ms += other.sum_ms
+
+    def percentile(self, q: float) -> float:
+        """
+        Estimate the q-th quantile (0.0-1.0) in milliseconds.
+
+        Interpolates linearly inside the bucket holding the target rank and
+        clamps to the observed min/max.
+        """
+        if not self.count:
+            return 0.0
+
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if not n:
+                continue
+            if seen + n >= rank:
+                lower = BUCKET_BOUNDS_MS[i - 1] if i else 0.0
+                upper = BUCKET_BOUNDS_MS[i] if i < len(BUCKET_BOUNDS_MS) else self.max_ms
+                value = lower + (upper - lower) * ((rank - seen) / n)
+                return min(max(value, self.min_ms), self.max_ms)
+            seen += n
+        return self.max_ms
+
+    @property
+    def mean_ms(self) -> float:
+        return self.sum_ms / self.count if self.count else 0.0
+
+
+# =============================================================================
+# PER-TOOL METRICS
+# =============================================================================
+
+
+class _ToolSeries:
+    """Counters and histograms for one tool."""
+
+    __slots__ = ("total", "errors", "in_flight", "slices", "slice_epochs")
+
+    def __init__(self, window_slices: int):
+        self.total = LatencyHistogram()
+        self.errors = 0
+        self.in_flight = 0
+        self.slices = [LatencyHistogram() for _ in range(window_slices)]
+        self.slice_epochs = [-1] * window_slices
+
+
+class ToolMetrics:
+    """
+    Per-tool execution metrics.
+
+    Example:
+        metrics = ToolMetrics()
+        start = metrics.begin("read_file")
+        ...
+        metrics.end("read_file", start, success=True)
+
+        metrics.snapshot("read_file")["p95_ms"]
+    """
+
+    __slots__ = ("slice_seconds", "window_slices", "_series")
+
+    def __init__(self, window_seconds: float = 300.0, window_slices: int = 10):
+        """
+        Args:
+            window_seconds: Span of the rolling window used for percentiles
+            window_slices: Number of slices the window rotates through
+        """
+        self.slice_seconds = window_seconds / window_slices
+        self.window_slices = window_slices
+        self._series: dict[str, _ToolSeries] = {}
+
+    def _get(self, name: str) -> _ToolSeries:
+        series = self._series.get(name)
+        if series is None:
+            series = self._series[name] = _ToolSeries(self.window_slices)
+        return series
+
+    def begin(self, name: str) -> float:
+        """Mark a call as in flight; returns the start time for end()."""
+        self._get(name).in_flight += 1
+        return time.perf_counter()
+
+    def end(self, name: str, start: float, success: bool = True) -> float:
+        """Finish a call started with begin(); returns its latency in ms."""
+        duration_ms = (time.perf_counter() - start) * 1000
+        series = self._get(name)
+        series.in_flight -= 1
+        self._record(series, duration_ms, success)
+        return duration_ms
+
+    @contextmanager
+    def track(self, name: str) -> Iterator[None]:
+        """Context manager recording a call; exceptions count as errors."""
+        start = self.begin(name)
+        success = False
+        try:
+            yield
+            success = True
+        finally:
+            self.end(name, start, success)
+
+    def record(self, name: str, duration_ms: float, success: bool = True) -> None:
+        """Record a completed call measured elsewhere."""
+        self._record(self._get(name), duration_ms, success)
+
+    def _record(self, series: _ToolSeries, duration_ms: float, success: bool) -> None:
+        series.total.record(duration_ms)
+        if not success:
+            series.errors += 1
+
+        epoch = int(time.monotonic() // self.slice_seconds)
+        slot = epoch % self.window_slices
+        if series.slice_epochs[slot] != epoch:
+            series.slices[slot] = LatencyHistogram()
+            series.slice_epochs[slot] = epoch
+        series.slices[slot].record(duration_ms)
+
+    def window(self, name: str) -> LatencyHistogram:
+        """Merge the slices still inside the rolling window."""
+        merged = LatencyHistogram()
+        series = self._series.get(name)
+        if series is None:
+            return merged
+        oldest = int(time.monotonic() // self.slice_seconds) - self.window_slices
+        for epoch, histogram in zip(series.slice_epochs, series.slices, strict=True):
+            if epoch > oldest:
+                merged.merge(histogram)
+        return merged
+
+    def names(self) -> list[str]:
+        return list(self._series)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._series
+
+    def snapshot(self, name: str) -> dict[str, Any]:
+        """Get counters, lifetime aggregates and rolling percentiles for a tool."""
+        series = self._series.get(name) or _ToolSeries(self.window_slices)
+        total = series.total
+        window = self.window(name)
+        snapshot = {
+            "name": name,
+            "total_executions": total.count,
+            "errors": series.errors,
+            "in_flight": series.in_flight,
+            "average_time_ms": total.mean_ms,
+            "min_time_ms": total.min_ms,
+            "max_time_ms": total.max_ms,
+            "window_executions": window.count,
+        }
+        for q in PERCENTILES:
+            snapshot[f"p{int(q * 100)}_ms"] = window.percentile(q)
+        return snapshot
+
+    def totals(self) -> tuple[int, float]:
+        """Total executions and summed latency (ms) across all tools."""
+        count = sum(s.total.count for s in self._series.values())
+        sum_ms = sum(s.total.sum_ms for s in self._series.values())
+        return count, sum_ms
+
+    def reset(self) -> None:
+        self._series.clear()
+
+    def render_prometheus(self, prefix: str = "fastband_tool") -> list[str]:
+        """Render metrics in Prometheus text format (durations in seconds)."""
+        series = sorted(self._series.items())
+        lines = [
+            f"# HELP {prefix}_duration_seconds Tool execution latency (rolling window quantiles)",
+            f"# TYPE {prefix}_duration_seconds summary",
+        ]
+        for name, s in series:
+            window = self.window(name)
+            for q in PERCENTILES:
+                lines.append(
+                    f'{prefix}_duration_seconds{{tool="{name}",quantile="{q}"}} '
+                    f"{window.percentile(q) / 1000:.6f}"
+                )
+            lines.append(
+                f'{prefix}_duration_seconds_sum{{tool="{name}"}} {s.total.sum_ms / 1000:.6f}'
+            )
+            lines.append(f'{prefix}_duration_seconds_count{{tool="{name}"}} {s.total.count}')
+        lines.append("")
+
+        for metric, kind, help_text, attr in (
+            ("errors_total", "counter", "Failed tool executions", "errors"),
+            ("in_flight", "gauge", "Tool executions in progress", "in_flight"),
+        ):
+            lines.append(f"# HELP {prefix}_{metric} {help_text}")
+            lines.append(f"# TYPE {prefix}_{metric} {kind}")
+            for name, s in series:
+                lines.append(f'{prefix}_{metric}{{tool="{name}"}} {getattr(s, attr)}')
+            lines.append("")
+        return lines
@@ -42,6 +42,7 @@ from fastband.tools.quality.runners import (
     LinterOrchestrator,
     LinterResult,
     LinterRunner,
+    LintResultCache,
     MypyRunner,
     RuffRunner,
 )
@@ -74,6 +75,7 @@ __all__ = [
     "LinterRunner",
     "LinterResult",
     "LinterOrchestrator",
+    "LintResultCache",
     "RuffRunner",
     "MypyRunner",
     "ESLintRunner",
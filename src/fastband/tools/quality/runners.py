@@ -11,9 +11,15 @@ Supported linters:
 - Generic: custom regex patterns
 
 Each runner integrates with CodebaseContext for impact analysis.
+
+LinterOrchestrator runs linters concurrently, shards large file lists
+across several linter processes, and caches per-file results keyed on
+(linter, linter version, config hash, file content hash).
 """
 
 import asyncio
+import fnmatch
+import hashlib
 import json
 import logging
 import os
@@ -22,10 +28,11 @@ import shutil
 import subprocess
 import tempfile
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from fastband.core.inventory import get_file_inventory
 from fastband.tools.quality.models import (
     FileAnalysis,
     FixConfidence,
@@ -48,6 +55,23 @@ class LinterResult:
     raw_output: str
     error_message: str | None = None
     execution_time_ms: int = 0
+    cached_files: int = 0  # Files whose issues came from the result cache
+
+    @classmethod
+    def combine(cls, results: list["LinterResult"]) -> "LinterResult":
+        """Combine results from shards of one linter into a single result."""
+        if len(results) == 1:
+            return results[0]
+        errors = [r.error_message for r in results if r.error_message]
+        return cls(
+            success=all(r.success for r in results),
+            issues=[issue for r in results for issue in r.issues],
+            raw_output="\n".join(r.raw_output for r in results if r.raw_output),
+            error_message="; ".join(errors) if errors else None,
+            # Shards run concurrently, so wall time is the slowest shard
+            execution_time_ms=max((r.execution_time_ms for r in results), default=0),
+            cached_files=sum(r.cached_files for r in results),
+        )
 
 
 class LinterRunner(ABC):
@@ -56,6 +80,13 @@ class LinterRunner(ABC):
     name: str = "base"
     file_extensions: list[str] = []
 
+    # Config files whose contents affect results (hashed into cache keys)
+    config_files: list[str] = []
+
+    # Whether results for a file depend only on that file's content
+    # (safe to cache per file and to split across processes)
+    per_file: bool = False
+
     def __init__(self, project_root: str):
         self.project_root = Path(project_root)
 
@@ -77,6 +108,10 @@ class LinterRunner(ABC):
         """Check if this runner supports the given file type."""
         return any(file_path.endswith(ext) for ext in self.file_extensions)
 
+    def version_command(self) -> list[str]:
+        """Command that prints the linter version."""
+        return [self.name, "--version"]
+
     async def _run_command(
         self,
         cmd: list[str],
@@ -118,6 +153,8 @@ class RuffRunner(LinterRunner):
 
     name = "ruff"
     file_extensions = [".py"]
+    config_files = ["pyproject.toml", "ruff.toml", ".ruff.toml"]
+    per_file = True
 
     # Mapping of ruff codes to our categories
     CATEGORY_MAP = {
@@ -192,7 +229,17 @@ class RuffRunner(LinterRunner):
                 execution_time_ms=execution_time,
             )
 
-        issues = self.parse_output(stdout)
+        try:
+            issues = self.parse_output(stdout)
+        except json.JSONDecodeError as e:
+            # Not a clean run: report it as a failure so it is never cached
+            return LinterResult(
+                success=False,
+                issues=[],
+                raw_output=stdout,
+                error_message=f"Failed to parse ruff JSON output: {e}",
+                execution_time_ms=execution_time,
+            )
 
         return LinterResult(
             success=True,
@@ -202,15 +249,16 @@ class RuffRunner(LinterRunner):
         )
 
     def parse_output(self, output: str) -> list[QualityIssue]:
-        """Parse ruff JSON output into QualityIssue objects."""
+        """
+        Parse ruff JSON output into QualityIssue objects.
+
+        Raises:
+            json.JSONDecodeError: If the output isn't valid JSON
+        """
         if not output.strip():
             return []
 
-        try:
-            data = json.loads(output)
-        except json.JSONDecodeError:
-            logger.warning("Failed to parse ruff JSON output")
-            return []
+        data = json.loads(output)
 
         issues = []
         for item in data:
@@ -300,6 +348,12 @@ class ESLintRunner(LinterRunner):
 
     name = "eslint"
     file_extensions = [".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs"]
+    config_files = [
+        "eslint.config.js", "eslint.config.mjs", "eslint.config.cjs",
+        ".eslintrc", ".eslintrc.js", ".eslintrc.cjs", ".eslintrc.json",
+        ".eslintrc.yml", ".eslintrc.yaml", "package.json", "tsconfig.json",
+    ]
+    per_file = True
 
     CATEGORY_MAP = {
         "no-unused-vars": IssueCategory.DEAD_CODE,
@@ -327,6 +381,10 @@ class ESLintRunner(LinterRunner):
             return str(local_eslint)
         return "eslint"
 
+    def version_command(self) -> list[str]:
+        """Command that prints the eslint version."""
+        return [self._get_eslint_path(), "--version"]
+
     async def run(self, files: list[str]) -> LinterResult:
         """Run eslint on specified files."""
         import time
@@ -370,7 +428,17 @@ class ESLintRunner(LinterRunner):
                 execution_time_ms=execution_time,
             )
 
-        issues = self.parse_output(stdout)
+        try:
+            issues = self.parse_output(stdout)
+        except json.JSONDecodeError as e:
+            # Not a clean run: report it as a failure so it is never cached
+            return LinterResult(
+                success=False,
+                issues=[],
+                raw_output=stdout,
+                error_message=f"Failed to parse eslint JSON output: {e}",
+                execution_time_ms=execution_time,
+            )
 
         return LinterResult(
             success=True,
@@ -380,15 +448,16 @@ class ESLintRunner(LinterRunner):
         )
 
     def parse_output(self, output: str) -> list[QualityIssue]:
-        """Parse eslint JSON output."""
+        """
+        Parse eslint JSON output.
+
+        Raises:
+            json.JSONDecodeError: If the output isn't valid JSON
+        """
         if not output.strip():
             return []
 
-        try:
-            data = json.loads(output)
-        except json.JSONDecodeError:
-            logger.warning("Failed to parse eslint JSON output")
-            return []
+        data = json.loads(output)
 
         issues = []
         for file_result in data:
@@ -710,14 +779,121 @@ class MypyRunner(LinterRunner):
         return issues
 
 
+class LintResultCache:
+    """
+    Per-file linter result cache persisted in .fastband.
+
+    Entries are keyed by linter and file path, and are valid only while the
+    linter version, config hash and file content hash all still match. Only
+    root-level config files are hashed; nested configs are not tracked.
+    """
+
+    CACHE_VERSION = 1
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: dict[str, dict[str, dict[str, Any]]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable lint cache {self.path}: {e}")
+            return
+        if data.get("version") == self.CACHE_VERSION:
+            self.entries = data.get("linters", {})
+
+    def get(
+        self,
+        linter: str,
+        file_path: str,
+        tool_key: str,
+        content_hash: str,
+    ) -> list[QualityIssue] | None:
+        """Get cached issues for a file, or None on a miss."""
+        entry = self.entries.get(linter, {}).get(file_path)
+        if not entry or entry["key"] != tool_key or entry["hash"] != content_hash:
+            return None
+        return [self._issue_from_dict(item) for item in entry["issues"]]
+
+    def put(
+        self,
+        linter: str,
+        file_path: str,
+        tool_key: str,
+        content_hash: str,
+        issues: list[QualityIssue],
+    ) -> None:
+        """Store issues for a file."""
+        self.entries.setdefault(linter, {})[file_path] = {
+            "key": tool_key,
+            "hash": content_hash,
+            "issues": [asdict(issue) for issue in issues],
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed."""
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(
+                json.dumps(
+                    {"version": self.CACHE_VERSION, "linters": self.entries},
+                    separators=(",", ":"),
+                )
+            )
+            tmp_path.replace(self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Could not write lint cache {self.path}: {e}")
+
+    @staticmethod
+    def _issue_from_dict(data: dict[str, Any]) -> QualityIssue:
+        """Rebuild a QualityIssue from its asdict() form."""
+        data = dict(data)
+        fix = data.pop("suggested_fix", None)
+        return QualityIssue(
+            **{
+                **data,
+                "severity": IssueSeverity(data["severity"]),
+                "category": IssueCategory(data["category"]),
+                "location": SourceLocation(**data["location"]),
+            },
+            suggested_fix=(
+                SuggestedFix(**{**fix, "confidence": FixConfidence(fix["confidence"])})
+                if fix
+                else None
+            ),
+        )
+
+
 class LinterOrchestrator:
     """
     Orchestrates multiple linters for comprehensive code analysis.
 
     Selects appropriate linters based on file types and combines results.
+    Linters run concurrently (bounded by CPU count), per-file linters are
+    sharded across processes for large file lists, and unchanged files are
+    served from a result cache.
     """
 
-    def __init__(self, project_root: str):
+    # Incremental lint cache, relative to the project root
+    CACHE_FILE = ".fastband/lint_cache.json"
+
+    def __init__(
+        self,
+        project_root: str,
+        max_concurrency: int | None = None,
+        shard_size: int = 200,
+        use_cache: bool = True,
+    ):
         self.project_root = Path(project_root)
         self.runners: list[LinterRunner] = [
             RuffRunner(project_root),
@@ -725,6 +901,11 @@ class LinterOrchestrator:
             ESLintRunner(project_root),
             GolangCILintRunner(project_root),
         ]
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self.shard_size = shard_size
+        self.use_cache = use_cache
+        self._cache: LintResultCache | None = None
+        self._versions: dict[str, str] = {}
 
     def get_available_linters(self) -> list[str]:
         """Get list of available linters."""
@@ -754,35 +935,150 @@ class LinterOrchestrator:
         Returns:
             Dictionary mapping linter name to its result
         """
-        results: dict[str, LinterResult] = {}
-
         # Select runners
         runners = self.get_runners_for_files(files)
         if linters:
             runners = [r for r in runners if r.name in linters]
 
-        # Run all linters in parallel
-        tasks = []
-        for runner in runners:
-            runner_files = [f for f in files if runner.supports_file(f)]
-            if runner_files:
-                tasks.append((runner.name, runner.run(runner_files)))
+        # Bounds linter processes across all runners and shards
+        semaphore = asyncio.Semaphore(self.max_concurrency)
 
-        # Gather results
-        for name, task in tasks:
+        async def run_runner(runner: LinterRunner, runner_files: list[str]) -> LinterResult:
             try:
-                results[name] = await task
+                return await self._run_cached(runner, runner_files, semaphore)
             except Exception as e:
-                logger.error(f"Linter {name} failed: {e}")
-                results[name] = LinterResult(
+                logger.error(f"Linter {runner.name} failed: {e}")
+                return LinterResult(
                     success=False,
                     issues=[],
                     raw_output="",
                     error_message=str(e),
                 )
 
+        # Run all linters in parallel
+        jobs = []
+        for runner in runners:
+            runner_files = [f for f in files if runner.supports_file(f)]
+            if runner_files:
+                jobs.append((runner.name, run_runner(runner, runner_files)))
+
+        outcomes = await asyncio.gather(*(job for _, job in jobs))
+        results = {name: result for (name, _), result in zip(jobs, outcomes, strict=True)}
+
+        if self._cache is not None:
+            self._cache.save()
+
         return results
 
+    async def _run_sharded(
+        self,
+        runner: LinterRunner,
+        files: list[str],
+        semaphore: asyncio.Semaphore,
+    ) -> LinterResult:
+        """Run a linter, splitting large file lists across processes."""
+
+        async def run_shard(shard: list[str]) -> LinterResult:
+            async with semaphore:
+                return await runner.run(shard)
+
+        if not runner.per_file or len(files) <= self.shard_size:
+            return await run_shard(files)
+
+        shards = [files[i : i + self.shard_size] for i in range(0, len(files), self.shard_size)]
+        return LinterResult.combine(await asyncio.gather(*(run_shard(s) for s in shards)))
+
+    async def _run_cached(
+        self,
+        runner: LinterRunner,
+        files: list[str],
+        semaphore: asyncio.Semaphore,
+    ) -> LinterResult:
+        """Run a linter on files, serving unchanged files from the cache."""
+        if not (self.use_cache and runner.per_file):
+            return await self._run_sharded(runner, files, semaphore)
+
+        cache = self._get_cache()
+        tool_key = await self._tool_key(runner)
+        hashes = await asyncio.to_thread(self._hash_files, files)
+
+        cached_issues: list[QualityIssue] = []
+        to_lint = []
+        for file_path in files:
+            content_hash = hashes.get(file_path)
+            hit = (
+                cache.get(runner.name, file_path, tool_key, content_hash)
+                if content_hash
+                else None
+            )
+            if hit is None:
+                to_lint.append(file_path)
+            else:
+                cached_issues.extend(hit)
+
+        if to_lint:
+            result = await self._run_sharded(runner, to_lint, semaphore)
+        else:
+            result = LinterResult(success=True, issues=[], raw_output="")
+
+        if result.success:
+            by_file = self._group_issues(to_lint, result.issues)
+            for file_path in to_lint:
+                if file_path in hashes:
+                    cache.put(
+                        runner.name, file_path, tool_key, hashes[file_path], by_file[file_path]
+                    )
+
+        result.issues = cached_issues + result.issues
+        result.cached_files = len(files) - len(to_lint)
+        return result
+
+    def _get_cache(self) -> LintResultCache:
+        if self._cache is None:
+            self._cache = LintResultCache(self.project_root / self.CACHE_FILE)
+        return self._cache
+
+    async def _tool_key(self, runner: LinterRunner) -> str:
+        """Cache key component for linter version and config contents."""
+        if runner.name not in self._versions:
+            _, stdout, _ = await runner._run_command(runner.version_command(), timeout=30)
+            self._versions[runner.name] = stdout.strip()
+
+        hasher = hashlib.sha256(f"{runner.name}|{self._versions[runner.name]}".encode())
+        for name in runner.config_files:
+            try:
+                hasher.update(name.encode() + (self.project_root / name).read_bytes())
+            except OSError:
+                continue
+        return hasher.hexdigest()
+
+    def _hash_files(self, files: list[str]) -> dict[str, str]:
+        """Content hashes for files (unreadable files are omitted)."""
+        hashes = {}
+        for file_path in files:
+            try:
+                data = (self.project_root / file_path).read_bytes()
+            except OSError:
+                continue
+            hashes[file_path] = hashlib.sha256(data).hexdigest()
+        return hashes
+
+    def _group_issues(
+        self,
+        files: list[str],
+        issues: list[QualityIssue],
+    ) -> dict[str, list[QualityIssue]]:
+        """Assign linter issues (absolute or relative paths) to input files."""
+        by_path = {
+            os.path.realpath(self.project_root / file_path): file_path for file_path in files
+        }
+        grouped: dict[str, list[QualityIssue]] = {file_path: [] for file_path in files}
+        for issue in issues:
+            file_path = by_path.get(os.path.realpath(self.project_root / issue.location.file))
+            if file_path is not None:
+                grouped[file_path].append(issue)
+        return grouped
+
     async def analyze_directory(
         self,
         directory: str = ".",
@@ -800,8 +1096,6 @@ class LinterOrchestrator:
         Returns:
             Dictionary mapping linter name to its result
         """
-        import fnmatch
-
         dir_path = self.project_root / directory
         files = []
 
@@ -819,23 +1113,33 @@ class LinterOrchestrator:
                 "**/.git/**",
             ]
 
-        # Walk directory
-        for root, dirs, filenames in os.walk(dir_path):
-            # Skip excluded directories
-            rel_root = os.path.relpath(root, self.project_root)
-            if any(fnmatch.fnmatch(f"{rel_root}/", pat) for pat in exclude_patterns):
-                continue
+        # "**/name/**" patterns exclude a directory name anywhere; those are
+        # applied per path component. Anything else is matched against paths.
+        excluded_dirs = set()
+        path_patterns = []
+        for pattern in exclude_patterns:
+            match = re.fullmatch(r"(?:\*\*/)?([^*?\[\]/]+)/\*\*", pattern)
+            if match:
+                excluded_dirs.add(match.group(1))
+            else:
+                path_patterns.append(pattern)
+
+        # Query the shared inventory instead of walking the tree again
+        inventory = get_file_inventory(self.project_root)
+        under = os.path.relpath(dir_path.resolve(), inventory.root)
 
-            for filename in filenames:
-                rel_path = os.path.relpath(os.path.join(root, filename), self.project_root)
+        for rel_path in inventory.files(under=under, exclude_names=excluded_dirs):
+            filename = rel_path.rsplit("/", 1)[-1]
 
-                # Check exclusions
-                if any(fnmatch.fnmatch(rel_path, pat) for pat in exclude_patterns):
-                    continue
+            # Check inclusions
+            if not any(fnmatch.fnmatch(filename, pat) for pat in include_patterns):
+                continue
+
+            # Check exclusions
+            if any(fnmatch.fnmatch(rel_path, pat) for pat in path_patterns):
+                continue
 
-                # Check inclusions
-                if any(fnmatch.fnmatch(filename, pat) for pat in include_patterns):
-                    files.append(rel_path)
+            files.append(rel_path)
 
         return await self.analyze_files(files)
 
@@ -8,14 +8,21 @@ Performance Optimizations (Issue #38):
 - Tool class registration: Register class paths, instantiate on demand
 - Efficient lookup: O(1) dictionary access for tool retrieval
 - Memory efficiency: Unloaded tools don't consume memory
+- Schema catalog: MCP/OpenAI/Claude schemas built once per registry version
+- Search index: BM25 keyword index over tool names/descriptions for per-turn selection
 """
 
 import importlib
+import json
 import logging
+import math
+import re
 import time
 from dataclasses import dataclass
+from typing import Any
 
-from fastband.tools.base import Tool, ToolCategory, ToolResult
+from fastband.tools.base import Tool, ToolCategory, ToolDefinition, ToolResult
+from fastband.tools.metrics import ToolMetrics
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +52,7 @@ class LazyToolSpec:
     module_path: str
     class_name: str
     category: ToolCategory
+    definition: ToolDefinition | None = None  # Known up front, or captured on first load
     _instance: Tool | None = None
 
     def get_instance(self) -> Tool:
@@ -58,6 +66,8 @@ class LazyToolSpec:
             module = importlib.import_module(self.module_path)
             tool_class = getattr(module, self.class_name)
             self._instance = tool_class()
+            if self.definition is None:
+                self.definition = self._instance.definition
         return self._instance
 
     @property
@@ -66,6 +76,186 @@ class LazyToolSpec:
         return self._instance is not None
 
 
+@dataclass(slots=True)
+class ToolSchemaEntry:
+    """Precomputed schemas for a single tool in every supported format."""
+
+    name: str
+    category: ToolCategory
+    mcp: dict[str, Any]
+    openai: dict[str, Any]
+    claude: dict[str, Any]
+    tokens: int  # Estimated prompt tokens for the OpenAI schema
+
+    @classmethod
+    def from_definition(cls, definition: ToolDefinition) -> "ToolSchemaEntry":
+        """Build all schema formats from a tool definition."""
+        mcp = definition.to_mcp_schema()
+        openai = {
+            "type": "function",
+            "function": {
+                "name": mcp["name"],
+                "description": mcp["description"],
+                "parameters": mcp["inputSchema"],
+            },
+        }
+        return cls(
+            name=mcp["name"],
+            category=definition.metadata.category,
+            mcp=mcp,
+            openai=openai,
+            claude={
+                "name": mcp["name"],
+                "description": mcp["description"],
+                "input_schema": mcp["inputSchema"],
+            },
+            tokens=estimate_tokens(json.dumps(openai, separators=(",", ":"))),
+        )
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate prompt tokens with the ~4 chars per token heuristic."""
+    return max(1, len(text) // 4)
+
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_STOP_WORDS = frozenset(
+    "a an and are as at be by can do does for from get how i in is it me my of on or "
+    "show that the this to what when where which with you your".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase index terms, dropping stop words and plural 's'."""
+    terms = []
+    for word in _WORD_RE.findall(text.lower()):
+        if word in _STOP_WORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        terms.append(word)
+    return terms
+
+
+class ToolSearchIndex:
+    """
+    BM25 keyword index over tool names and descriptions.
+
+    Built once per catalog version. Name terms are weighted above
+    description terms since tool names are short and deliberate.
+
+    Example:
+        index = registry.get_schema_catalog().index
+        for name, score in index.search("show open tickets", limit=5):
+            print(name, score)
+    """
+
+    __slots__ = ("_postings", "_idf", "_norms", "names")
+
+    NAME_WEIGHT = 3
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, entries: dict[str, ToolSchemaEntry]):
+        self.names = list(entries)
+        self._postings: dict[str, dict[str, int]] = {}
+        lengths: dict[str, int] = {}
+
+        for name, entry in entries.items():
+            terms = tokenize(name.replace("_", " ")) * self.NAME_WEIGHT
+            terms += tokenize(entry.mcp.get("description", ""))
+            lengths[name] = len(terms)
+            for term in terms:
+                postings = self._postings.setdefault(term, {})
+                postings[name] = postings.get(name, 0) + 1
+
+        count = len(entries)
+        avg_length = sum(lengths.values()) / count if count else 0.0
+        self._idf = {
+            term: math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for term, postings in self._postings.items()
+        }
+        # Per-document length normalization, precomputed for scoring
+        self._norms = {
+            name: self.K1 * (1 - self.B + self.B * length / avg_length) if avg_length else self.K1
+            for name, length in lengths.items()
+        }
+
+    def search(
+        self,
+        query: str,
+        limit: int | None = None,
+        prior: dict[str, float] | None = None,
+        prior_weight: float = 0.5,
+    ) -> list[tuple[str, float]]:
+        """
+        Rank tools against a query.
+
+        Args:
+            query: Free-text query (e.g. the user's message)
+            limit: Maximum number of results
+            prior: Optional per-tool prior in [0, 1], e.g. normalized usage
+            prior_weight: Weight of the prior relative to the keyword score
+
+        Returns:
+            (tool name, score) pairs, best first, only tools scoring above zero
+        """
+        scores: dict[str, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = self._idf[term]
+            for name, tf in postings.items():
+                score = idf * tf * (self.K1 + 1) / (tf + self._norms[name])
+                scores[name] = scores.get(name, 0.0) + score
+
+        if prior:
+            for name, weight in prior.items():
+                if name in self._norms and weight > 0:
+                    scores[name] = scores.get(name, 0.0) + prior_weight * weight
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:limit] if limit is not None else ranked
+
+
+class ToolSchemaList(list):
+    """
+    OpenAI-format tool schemas carrying their catalog version and the
+    precomputed Claude conversion.
+
+    Behaves like a plain list for providers that expect OpenAI tools;
+    providers that convert tools can reuse ``claude_schemas`` directly.
+    Shared between callers - treat as read-only.
+    """
+
+    __slots__ = ("version", "claude_schemas")
+
+
+@dataclass(slots=True)
+class ToolSchemaCatalog:
+    """Snapshot of all available tool schemas at a registry version."""
+
+    version: int
+    entries: dict[str, ToolSchemaEntry]
+    mcp: list[dict[str, Any]]
+    openai: ToolSchemaList
+    claude: list[dict[str, Any]]
+    index: ToolSearchIndex
+    total_tokens: int  # Estimated prompt tokens for all OpenAI schemas
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def subset(self, names: list[str]) -> ToolSchemaList:
+        """Build an OpenAI schema list (with Claude conversion) for selected tools."""
+        selected = [self.entries[name] for name in names if name in self.entries]
+        tools = ToolSchemaList(entry.openai for entry in selected)
+        tools.version = self.version
+        tools.claude_schemas = [entry.claude for entry in selected]
+        return tools
+
+
 @dataclass
 class PerformanceReport:
     """Performance report for the tool registry."""
@@ -128,8 +318,12 @@ class ToolRegistry:
         "_lazy_specs",
         "_max_active",
         "_load_history",
-        "_execution_stats",
+        "metrics",
+        "_cache_stats",
         "_category_cache",
+        "_schema_entries",
+        "_schema_catalog",
+        "_catalog_version",
     )
 
     def __init__(self, max_active_tools: int = 60):
@@ -138,8 +332,12 @@ class ToolRegistry:
         self._lazy_specs: dict[str, LazyToolSpec] = {}  # Lazy-loaded tool specs
         self._max_active = max_active_tools
         self._load_history: list[ToolLoadStatus] = []
-        self._execution_stats: dict[str, list[float]] = {}  # Tool -> execution times
+        self.metrics = ToolMetrics()  # Latency histograms, errors, in-flight gauges
+        self._cache_stats: dict[str, list[int]] = {}  # Tool -> [result cache hits, misses]
         self._category_cache: dict[str, int] | None = None  # Cached category counts
+        self._schema_entries: dict[str, ToolSchemaEntry] = {}  # Per-tool schema cache
+        self._schema_catalog: ToolSchemaCatalog | None = None
+        self._catalog_version = 0  # Bumped on register/unregister
 
     # =========================================================================
     # REGISTRATION
@@ -163,6 +361,7 @@ class ToolRegistry:
 
         self._available[name] = tool
         self._invalidate_cache()
+        self._invalidate_schemas(name)
         logger.info(f"Registered tool: {name} ({tool.category.value})")
 
     def register_lazy(
@@ -171,6 +370,7 @@ class ToolRegistry:
         module_path: str,
         class_name: str,
         category: ToolCategory,
+        definition: ToolDefinition | None = None,
     ) -> None:
         """
         Register a tool for lazy loading.
@@ -183,6 +383,8 @@ class ToolRegistry:
             module_path: Full module path (e.g., "fastband.tools.git")
             class_name: Class name within the module (e.g., "GitStatusTool")
             category: Tool category for organization
+            definition: Optional tool definition, lets the schema catalog
+                describe the tool without importing it
 
         Example:
             registry.register_lazy(
@@ -205,8 +407,10 @@ class ToolRegistry:
             module_path=module_path,
             class_name=class_name,
             category=category,
+            definition=definition,
         )
         self._invalidate_cache()
+        self._invalidate_schemas(name)
         logger.debug(f"Registered lazy tool: {name} ({category.value})")
 
     def register_class(self, tool_class: type[Tool]) -> None:
@@ -225,6 +429,12 @@ class ToolRegistry:
         """Invalidate cached data when registry changes."""
         self._category_cache = None
 
+    def _invalidate_schemas(self, name: str) -> None:
+        """Drop a tool's cached schemas and bump the catalog version."""
+        self._schema_entries.pop(name, None)
+        self._schema_catalog = None
+        self._catalog_version += 1
+
     def unregister(self, name: str) -> bool:
         """
         Unregister a tool (remove from garage).
@@ -249,6 +459,7 @@ class ToolRegistry:
 
         if removed:
             self._invalidate_cache()
+            self._invalidate_schemas(name)
             logger.info(f"Unregistered tool: {name}")
 
         return removed
@@ -539,13 +750,86 @@ class ToolRegistry:
     # MCP INTEGRATION
     # =========================================================================
 
+    @property
+    def catalog_version(self) -> int:
+        """Version of the tool set, bumped on every register/unregister."""
+        return self._catalog_version
+
+    def _schema_entry(self, name: str) -> ToolSchemaEntry | None:
+        """
+        Get the cached schemas for a tool, building them on first use.
+
+        Lazy tools registered with a definition are described without
+        being imported; others are instantiated once and their definition
+        kept on the spec.
+        """
+        entry = self._schema_entries.get(name)
+        if entry is not None:
+            return entry
+
+        definition = None
+        if name in self._available:
+            definition = self._available[name].definition
+        elif name in self._lazy_specs:
+            definition = self._lazy_specs[name].definition
+            if definition is None:
+                tool = self._resolve_tool(name)
+                definition = tool.definition if tool else None
+
+        if definition is None:
+            return None
+
+        entry = ToolSchemaEntry.from_definition(definition)
+        self._schema_entries[name] = entry
+        return entry
+
+    def get_schema_catalog(self) -> ToolSchemaCatalog:
+        """
+        Get precomputed schemas for all available tools.
+
+        The catalog is rebuilt only when the registry version changes, and
+        per-tool schemas survive rebuilds, so repeated calls are O(1).
+        """
+        catalog = self._schema_catalog
+        if catalog is not None and catalog.version == self._catalog_version:
+            return catalog
+
+        entries: dict[str, ToolSchemaEntry] = {}
+        for name in list(self._available) + list(self._lazy_specs):
+            if name in entries:
+                continue
+            try:
+                entry = self._schema_entry(name)
+            except Exception as e:
+                logger.warning(f"Failed to get schema for tool {name}: {e}")
+                continue
+            if entry is not None:
+                entries[name] = entry
+
+        openai = ToolSchemaList(entry.openai for entry in entries.values())
+        openai.version = self._catalog_version
+        openai.claude_schemas = [entry.claude for entry in entries.values()]
+        mcp = [entry.mcp for entry in entries.values()]
+
+        catalog = ToolSchemaCatalog(
+            version=self._catalog_version,
+            entries=entries,
+            mcp=mcp,
+            openai=openai,
+            claude=openai.claude_schemas,
+            index=ToolSearchIndex(entries),
+            total_tokens=sum(entry.tokens for entry in entries.values()),
+        )
+        self._schema_catalog = catalog
+        return catalog
+
     def get_mcp_tools(self) -> list[dict]:
         """Get MCP tool schemas for all active tools."""
-        return [tool.definition.to_mcp_schema() for tool in self._active.values()]
+        return [entry.mcp for name in self._active if (entry := self._schema_entry(name))]
 
     def get_openai_tools(self) -> list[dict]:
         """Get OpenAI function schemas for all active tools."""
-        return [tool.definition.to_openai_schema() for tool in self._active.values()]
+        return [entry.openai for name in self._active if (entry := self._schema_entry(name))]
 
     async def execute(self, name: str, **kwargs) -> ToolResult:
         """
@@ -565,18 +849,23 @@ class ToolRegistry:
                 error=f"Tool not loaded: {name}",
             )
 
-        result = await tool.safe_execute(**kwargs)
+        start = self.metrics.begin(name)
+        success = False
+        try:
+            result = await tool.safe_execute(**kwargs)
+            success = result.success
+            return result
+        finally:
+            self.metrics.end(name, start, success)
 
-        # Track execution stats
-        if name not in self._execution_stats:
-            self._execution_stats[name] = []
-        self._execution_stats[name].append(result.execution_time_ms)
+    def record_execution(self, name: str, execution_time_ms: float, success: bool = True) -> None:
+        """Record an execution time for a tool run outside execute()."""
+        self.metrics.record(name, execution_time_ms, success)
 
-        # Keep only last 100 executions per tool
-        if len(self._execution_stats[name]) > 100:
-            self._execution_stats[name] = self._execution_stats[name][-100:]
-
-        return result
+    def record_cache_lookup(self, name: str, hit: bool) -> None:
+        """Record a result cache hit or miss for a tool."""
+        counts = self._cache_stats.setdefault(name, [0, 0])
+        counts[0 if hit else 1] += 1
 
     # =========================================================================
     # PERFORMANCE MONITORING
@@ -599,9 +888,8 @@ class ToolRegistry:
         recommendation = self._get_performance_recommendation()
 
         # Calculate execution stats
-        total_executions = sum(len(times) for times in self._execution_stats.values())
-        all_times = [t for times in self._execution_stats.values() for t in times]
-        avg_time = sum(all_times) / len(all_times) if all_times else 0
+        total_executions, total_time = self.metrics.totals()
+        avg_time = total_time / total_executions if total_executions else 0
 
         return PerformanceReport(
             active_tools=active_count,
@@ -644,17 +932,23 @@ class ToolRegistry:
         return "WARNING: Tool count exceeds recommended limit. Performance may be degraded."
 
     def get_tool_stats(self, name: str) -> dict | None:
-        """Get execution statistics for a specific tool."""
-        if name not in self._execution_stats:
+        """
+        Get execution and result cache statistics for a specific tool.
+
+        Includes lifetime aggregates, error and in-flight counts, and
+        p50/p95/p99 latencies over the metrics rolling window.
+        """
+        if name not in self.metrics and name not in self._cache_stats:
             return None
 
-        times = self._execution_stats[name]
+        stats = self.metrics.snapshot(name)
+        hits, misses = self._cache_stats.get(name, (0, 0))
+        lookups = hits + misses
         return {
-            "name": name,
-            "total_executions": len(times),
-            "average_time_ms": sum(times) / len(times) if times else 0,
-            "min_time_ms": min(times) if times else 0,
-            "max_time_ms": max(times) if times else 0,
+            **stats,
+            "cache_hits": hits,
+            "cache_misses": misses,
+            "cache_hit_rate": hits / lookups if lookups else 0.0,
         }
 
 
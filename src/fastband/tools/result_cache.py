@@ -0,0 +1,266 @@
+"""
+Tool Result Cache - Memoization for idempotent tool calls.
+
+Agents often repeat identical read-only calls within one conversation
+(reading the same file, reading the git log, listing tickets). Tools that
+declare ``cacheable=True`` in their ToolMetadata have their results cached
+under a key built from:
+
+- the tool name
+- the canonicalized arguments (defaults filled in, keys sorted)
+- a version token for each state source named in ``cache_state``
+
+State sources are small callables that return a cheap fingerprint of the
+state a result depends on, e.g. file mtimes, git HEAD/index, or the ticket
+store revision. When the fingerprint changes, the key changes and the stale
+entry simply ages out.
+
+Concurrent identical calls are deduplicated: the first caller executes the
+tool and later callers await the same in-flight result (single-flight).
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from fastband.tools.base import Tool, ToolDefinition
+
+logger = logging.getLogger(__name__)
+
+# Argument names treated as filesystem paths by the "files" state source
+PATH_ARGUMENTS = ("path", "file_path", "directory")
+
+StateSource = Callable[[Tool, dict[str, Any]], Any]
+
+
+# =============================================================================
+# STATE SOURCES
+# =============================================================================
+
+
+def _stat_token(path: Path) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) for a path, or None if it does not exist."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _files_state(tool: Tool, arguments: dict[str, Any]) -> Any:
+    """Fingerprint the files named by path-like arguments."""
+    tokens = []
+    for name in PATH_ARGUMENTS:
+        value = arguments.get(name)
+        if isinstance(value, str) and value:
+            path = Path(value).resolve()
+            tokens.append((str(path), _stat_token(path)))
+    return tuple(tokens)
+
+
+def _git_state(tool: Tool, arguments: dict[str, Any]) -> Any:
+    """Fingerprint a repository via HEAD, the index and its refs."""
+    # Imported here so registering the state source doesn't load the git tools
+    from fastband.tools.git.state import find_repository, repo_fingerprint
+
+    location = find_repository(arguments.get("path") or ".")
+    if location is None:
+        return None
+    return repo_fingerprint(location)
+
+
+def _tickets_state(tool: Tool, arguments: dict[str, Any]) -> Any:
+    """Fingerprint the ticket store used by a ticket tool."""
+    store = getattr(tool, "_store", None) or getattr(tool, "store", None)
+    if store is None:
+        return None
+    path = getattr(store, "path", None)
+    revision = getattr(store, "revision", None)
+    return (id(store), revision, _stat_token(Path(path)) if path else None)
+
+
+def _semantic_index_state(tool: Tool, arguments: dict[str, Any]) -> Any:
+    """Fingerprint the semantic index database for a directory."""
+    directory = Path(arguments.get("directory") or os.getcwd()).resolve()
+    return _stat_token(directory / ".fastband" / "semantic.db")
+
+
+STATE_SOURCES: dict[str, StateSource] = {
+    "files": _files_state,
+    "git": _git_state,
+    "tickets": _tickets_state,
+    "semantic_index": _semantic_index_state,
+}
+
+
+def register_state_source(name: str, source: StateSource) -> None:
+    """
+    Register a state source usable in ToolMetadata.cache_state.
+
+    Args:
+        name: Name tools refer to in cache_state
+        source: Callable (tool, arguments) -> hashable fingerprint
+    """
+    STATE_SOURCES[name] = source
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    """A cached tool response."""
+
+    response: dict[str, Any]
+    expires_at: float | None
+
+
+class ToolResultCache:
+    """
+    LRU cache of tool responses with single-flight deduplication.
+
+    Example:
+        cache = ToolResultCache()
+        key = cache.make_key(tool, tool.definition, {"path": "README.md"})
+        response, hit = await cache.get_or_run(key, run_tool, ttl=None)
+    """
+
+    __slots__ = ("max_entries", "_entries", "_inflight", "hits", "misses")
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, _CacheEntry] = OrderedDict()
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(
+        self,
+        tool: Tool,
+        definition: ToolDefinition,
+        arguments: dict[str, Any],
+    ) -> tuple | None:
+        """
+        Build the cache key for a call.
+
+        Returns None when the call can't be keyed safely (arguments that
+        don't serialize, an unknown state source, or a failing one).
+        """
+        params = {p.name: p.default for p in definition.parameters if p.default is not None}
+        params.update(arguments)
+        try:
+            canonical = json.dumps(params, sort_keys=True, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return None
+
+        state = []
+        for name in definition.metadata.cache_state:
+            source = STATE_SOURCES.get(name)
+            if source is None:
+                logger.warning(
+                    f"Unknown cache state source '{name}' for {definition.metadata.name}"
+                )
+                return None
+            try:
+                state.append(source(tool, params))
+            except Exception as e:
+                logger.debug(f"State source '{name}' failed for {definition.metadata.name}: {e}")
+                return None
+
+        return (definition.metadata.name, canonical, tuple(state))
+
+    async def get_or_run(
+        self,
+        key: tuple,
+        run: Callable[[], Awaitable[dict[str, Any]]],
+        ttl: float | None = None,
+    ) -> tuple[dict[str, Any], bool]:
+        """
+        Return the cached response for key, or run and cache it.
+
+        Only successful responses are cached. Callers that arrive while
+        the same key is running share its result.
+
+        Returns:
+            (response, hit) where hit is True if run() was not called
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at is None or entry.expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return dict(entry.response), True
+            del self._entries[key]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.hits += 1
+            return dict(await asyncio.shield(inflight)), True
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            response = await run()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure isn't logged
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        future.set_result(response)
+        if response.get("success"):
+            expires_at = time.monotonic() + ttl if ttl is not None else None
+            self._entries[key] = _CacheEntry(dict(response), expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return dict(response), False
+
+    def invalidate(self, tool_name: str | None = None) -> int:
+        """
+        Drop cached responses.
+
+        Args:
+            tool_name: Only drop entries for this tool (default: all)
+
+        Returns:
+            Number of entries dropped
+        """
+        if tool_name is None:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+
+        keys = [k for k in self._entries if k[0] == tool_name]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
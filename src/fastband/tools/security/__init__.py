@@ -42,6 +42,7 @@ from fastband.tools.security.models import (
 )
 from fastband.tools.security.secrets import (
     SecretPattern,
+    SecretsScanCache,
     SecretsScanner,
 )
 from fastband.tools.security.tool import (
@@ -80,6 +81,7 @@ __all__ = [
     "SecretsScanner",
     "ManifestInfo",
     "SecretPattern",
+    "SecretsScanCache",
 ]
 
 
@@ -172,6 +174,8 @@ def register_tools(mcp_server):
     async def security_detect_secrets(
         path: str = ".",
         include_tests: bool = False,
+        incremental: bool = False,
+        base_ref: str | None = None,
     ) -> dict:
         """
         Scan source code for exposed secrets.
@@ -190,6 +194,10 @@ def register_tools(mcp_server):
         Args:
             path: Project path to scan
             include_tests: Include test/example files (default: false)
+            incremental: Only re-scan files whose content changed since the
+                last scan, reusing cached findings for the rest
+            base_ref: Git ref to diff against for pre-commit style scans
+                (implies incremental)
 
         Returns:
             Secrets report with:
@@ -197,13 +205,19 @@ def register_tools(mcp_server):
             - severity_counts: By severity level
             - findings: Details with remediation advice
             - high_risk_files: Files on critical paths with secrets
+            - incremental: Files rescanned vs. reused (incremental mode)
 
         Example:
             {"path": "src/", "include_tests": false}
+
+            # Pre-commit check against the last commit
+            {"path": ".", "base_ref": "HEAD"}
         """
         return await security_scan_secrets(
             path=path,
             include_tests=include_tests,
+            incremental=incremental,
+            base_ref=base_ref,
         )
 
     @mcp_server.tool()
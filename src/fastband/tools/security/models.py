@@ -261,6 +261,49 @@ class SecretFinding:
     already_rotated: bool = False
     remediation: str | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for persistence."""
+        return {
+            "secret_id": self.secret_id,
+            "secret_type": self.secret_type.value,
+            "severity": self.severity.value,
+            "file": self.location.file,
+            "line": self.location.line,
+            "column": self.location.column,
+            "line_content": self.line_content,
+            "match_text": self.match_text,
+            "entropy": self.entropy,
+            "confidence": self.confidence,
+            "is_test_file": self.is_test_file,
+            "is_example": self.is_example,
+            "is_env_file": self.is_env_file,
+            "is_gitignored": self.is_gitignored,
+            "remediation": self.remediation,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SecretFinding":
+        """Create from a dictionary produced by to_dict()."""
+        return cls(
+            secret_id=data["secret_id"],
+            secret_type=SecretType(data["secret_type"]),
+            severity=VulnerabilitySeverity(data["severity"]),
+            location=SourceLocation(
+                file=data["file"],
+                line=data["line"],
+                column=data.get("column", 0),
+            ),
+            line_content=data.get("line_content", ""),
+            match_text=data.get("match_text", ""),
+            entropy=data.get("entropy", 0.0),
+            confidence=data.get("confidence", 0.0),
+            is_test_file=data.get("is_test_file", False),
+            is_example=data.get("is_example", False),
+            is_env_file=data.get("is_env_file", False),
+            is_gitignored=data.get("is_gitignored", False),
+            remediation=data.get("remediation"),
+        )
+
     def to_vulnerability(self) -> Vulnerability:
         """Convert to unified Vulnerability format."""
         # Map secret types to vulnerability types
@@ -14,14 +14,20 @@ Supports detection of:
 - Generic passwords and secrets
 """
 
+import bisect
+import hashlib
+import json
 import logging
 import math
 import os
 import re
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from fastband.core.inventory import get_file_inventory
 from fastband.tools.security.models import (
     SecretFinding,
     SecretType,
@@ -45,6 +51,120 @@ class SecretPattern:
     max_length: int = 500
 
 
+class SecretsScanCache:
+    """
+    Persistent per-file content hashes and findings for incremental scans.
+
+    Stored as JSON in the project's .fastband directory. The whole cache is
+    discarded when its fingerprint (scanner patterns, .gitignore contents)
+    no longer matches, since cached findings would then be stale.
+    """
+
+    CACHE_VERSION = 1
+
+    def __init__(self, path: Path, fingerprint: str):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.entries: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable secrets cache {self.path}: {e}")
+            return
+        if data.get("version") != self.CACHE_VERSION or data.get("fingerprint") != self.fingerprint:
+            self._dirty = True
+            return
+        self.entries = data.get("files", {})
+
+    def get(self, file_path: str) -> dict[str, Any] | None:
+        """Get the cache entry for a file."""
+        return self.entries.get(file_path)
+
+    def put(
+        self,
+        file_path: str,
+        size: int,
+        mtime_ns: int,
+        digest: str,
+        findings: list[dict[str, Any]],
+    ) -> None:
+        """Store the scan result for a file."""
+        self.entries[file_path] = {
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "hash": digest,
+            "findings": findings,
+        }
+        self._dirty = True
+
+    def remove(self, file_path: str) -> None:
+        """Forget a file (deleted or no longer scannable)."""
+        if self.entries.pop(file_path, None) is not None:
+            self._dirty = True
+
+    def findings(self) -> list[SecretFinding]:
+        """All cached findings."""
+        return [
+            SecretFinding.from_dict(finding)
+            for entry in self.entries.values()
+            for finding in entry["findings"]
+        ]
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed."""
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(
+                json.dumps(
+                    {
+                        "version": self.CACHE_VERSION,
+                        "fingerprint": self.fingerprint,
+                        "files": self.entries,
+                    },
+                    separators=(",", ":"),
+                )
+            )
+            tmp_path.replace(self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Could not write secrets cache {self.path}: {e}")
+
+
+# Per-process scanner used by pool workers (see _init_worker)
+_worker_scanner: "SecretsScanner | None" = None
+
+
+def _init_worker(scanner: "SecretsScanner") -> None:
+    """
+    Initialize a pool worker with a copy of the parent's scanner.
+
+    The copy keeps the parent's patterns, instance settings (such as
+    MAX_FILE_SIZE) and the scan's gitignore set, so parallel results match
+    a serial scan.
+    """
+    global _worker_scanner
+    _worker_scanner = scanner
+    _worker_scanner.max_workers = 1
+
+
+def _scan_batch(file_paths: list[str]) -> list[SecretFinding]:
+    """Scan a batch of files inside a pool worker."""
+    assert _worker_scanner is not None
+    findings: list[SecretFinding] = []
+    for file_path in file_paths:
+        findings.extend(_worker_scanner._scan_file_safe(file_path))
+    return findings
+
+
 class SecretsScanner:
     """
     Scans source code for exposed secrets.
@@ -81,9 +201,30 @@ class SecretsScanner:
         "example", "sample", "demo", "dummy",
     }
 
-    def __init__(self, project_root: str):
+    # Files larger than this are skipped (generated bundles, dumps, etc.)
+    MAX_FILE_SIZE = 2 * 1024 * 1024
+
+    # Bytes sniffed from the start of a file to detect binary content
+    SNIFF_BYTES = 8192
+
+    # Below this many files a process pool costs more than it saves
+    PARALLEL_THRESHOLD = 200
+
+    # Files handed to a worker per task
+    BATCH_SIZE = 64
+
+    # Incremental scan cache, relative to the project root
+    CACHE_FILE = ".fastband/secrets_cache.json"
+
+    def __init__(self, project_root: str, max_workers: int | None = None):
         self.project_root = Path(project_root)
         self.patterns = self._build_patterns()
+        self.prefilter = self._build_prefilter(self.patterns)
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        # Gitignored paths resolved once per scan; None means "not resolved"
+        self._ignored: frozenset[str] | None = None
+        # Counters from the last scan_incremental() call
+        self.last_scan_stats: dict[str, Any] = {}
 
     def _build_patterns(self) -> list[SecretPattern]:
         """Build the list of secret detection patterns."""
@@ -266,6 +407,28 @@ class SecretsScanner:
             ),
         ]
 
+    @staticmethod
+    def _build_prefilter(patterns: list[SecretPattern]) -> re.Pattern:
+        """
+        Merge all patterns into a single alternation.
+
+        A file can only contain a finding if the combined regex matches
+        somewhere in it, so one pass over the buffer rules out the vast
+        majority of files before any individual pattern runs.
+        """
+        parts = []
+        for secret_pattern in patterns:
+            source = secret_pattern.pattern.pattern
+            # Global inline flags are only legal at the start of a regex,
+            # so rewrite them as scoped groups inside the alternation.
+            if source.startswith("(?i)"):
+                source = source[4:]
+            if secret_pattern.pattern.flags & re.IGNORECASE:
+                parts.append(f"(?i:{source})")
+            else:
+                parts.append(f"(?:{source})")
+        return re.compile("|".join(parts))
+
     def _calculate_entropy(self, text: str) -> float:
         """Calculate Shannon entropy of a string."""
         if not text:
@@ -299,6 +462,8 @@ class SecretsScanner:
     def _should_skip_file(self, file_path: str) -> bool:
         """Check if file should be skipped."""
         path_str = str(file_path)
+        if path_str == str(Path(self.CACHE_FILE)):
+            return True
         return any(skip in path_str for skip in self.SKIP_PATTERNS)
 
     def _should_scan_file(self, file_path: str) -> bool:
@@ -355,85 +520,172 @@ class SecretsScanner:
 
         return False
 
+    def _read_text(self, full_path: Path) -> str | None:
+        """Read a file for scanning, or None if it is oversized or binary."""
+        try:
+            if full_path.stat().st_size > self.MAX_FILE_SIZE:
+                return None
+            with open(full_path, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            logger.debug(f"Could not read {full_path}: {e}")
+            return None
+
+        if b"\0" in data[: self.SNIFF_BYTES]:
+            return None
+
+        return data.decode("utf-8", errors="ignore")
+
     def scan_file(self, file_path: str) -> list[SecretFinding]:
         """Scan a single file for secrets."""
         full_path = self.project_root / file_path
-        findings = []
 
-        if not full_path.exists():
-            return findings
+        if not full_path.is_file():
+            return []
 
-        try:
-            content = full_path.read_text(errors="ignore")
-        except Exception as e:
-            logger.debug(f"Could not read {file_path}: {e}")
-            return findings
+        content = self._read_text(full_path)
+        if content is None:
+            return []
 
-        lines = content.split("\n")
-        is_test = self._is_test_file(file_path)
-        is_env = self._is_env_file(file_path)
+        return self.scan_content(file_path, content)
 
-        for line_num, line in enumerate(lines, start=1):
-            for pattern in self.patterns:
-                for match in pattern.pattern.finditer(line):
-                    match_text = match.group(0)
-
-                    # Extract the actual secret if it's a capture group
-                    if match.lastindex and match.lastindex >= 1:
-                        match_text = match.group(1)
-
-                    # Length check
-                    if len(match_text) < pattern.min_length:
-                        continue
-                    if len(match_text) > pattern.max_length:
-                        continue
-
-                    # Entropy check
-                    entropy = self._calculate_entropy(match_text)
-                    if entropy < pattern.entropy_threshold:
-                        continue
-
-                    # False positive check
-                    if self._is_false_positive(match_text, line, file_path):
-                        continue
-
-                    # Calculate confidence
-                    confidence = min(1.0, entropy / 5.0)  # Normalize to 0-1
-                    if is_test:
-                        confidence *= 0.5
-                    if is_env and not self._is_gitignored(file_path):
-                        confidence = min(1.0, confidence * 1.5)
-
-                    # Adjust severity for test files
-                    severity = pattern.severity
-                    if is_test:
-                        if severity == VulnerabilitySeverity.CRITICAL:
-                            severity = VulnerabilitySeverity.MEDIUM
-                        elif severity == VulnerabilitySeverity.HIGH:
-                            severity = VulnerabilitySeverity.LOW
-
-                    finding = SecretFinding(
-                        secret_id=f"secret-{pattern.secret_type.value}-{file_path}-{line_num}",
-                        secret_type=pattern.secret_type,
-                        severity=severity,
-                        location=SourceLocation(
-                            file=file_path,
-                            line=line_num,
-                            column=match.start() + 1,
-                        ),
-                        line_content=self._redact_line(line, match_text),
-                        match_text=self._redact_secret(match_text),
-                        entropy=entropy,
-                        confidence=confidence,
-                        is_test_file=is_test,
-                        is_example=is_test,
-                        is_env_file=is_env,
-                        is_gitignored=self._is_gitignored(file_path),
-                        remediation=self._get_remediation(pattern.secret_type),
-                    )
-                    findings.append(finding)
+    def scan_content(self, file_path: str, content: str) -> list[SecretFinding]:
+        """
+        Scan an in-memory file buffer for secrets.
 
-        return findings
+        Patterns run over the whole buffer rather than line by line. Matches
+        that would span a line break are re-checked per line so results stay
+        identical to line-oriented scanning.
+        """
+        if self.prefilter.search(content) is None:
+            return []
+
+        line_starts = [0]
+        line_starts.extend(m.end() for m in re.finditer("\n", content))
+
+        is_test = self._is_test_file(file_path)
+        is_env = self._is_env_file(file_path)
+        is_gitignored = self._is_gitignored(file_path)
+
+        hits: list[tuple[int, int, int, SecretFinding]] = []
+
+        for index, pattern in enumerate(self.patterns):
+            matches: list[tuple[int, int, re.Match]] = []
+            spans_lines = False
+            for match in pattern.pattern.finditer(content):
+                if "\n" in match.group(0):
+                    spans_lines = True
+                    break
+                line_idx = bisect.bisect_right(line_starts, match.start()) - 1
+                matches.append((line_idx, line_starts[line_idx], match))
+
+            if spans_lines:
+                matches = self._match_per_line(pattern, content, line_starts)
+
+            for line_idx, line_start, match in matches:
+                line_end = content.find("\n", line_start)
+                line = content[line_start:] if line_end == -1 else content[line_start:line_end]
+                finding = self._build_finding(
+                    pattern,
+                    match,
+                    file_path=file_path,
+                    line=line,
+                    line_num=line_idx + 1,
+                    column=match.start() - line_start + 1,
+                    is_test=is_test,
+                    is_env=is_env,
+                    is_gitignored=is_gitignored,
+                )
+                if finding is not None:
+                    hits.append((line_idx, index, len(hits), finding))
+
+        hits.sort(key=lambda hit: hit[:3])
+        return [hit[3] for hit in hits]
+
+    @staticmethod
+    def _match_per_line(
+        pattern: SecretPattern,
+        content: str,
+        line_starts: list[int],
+    ) -> list[tuple[int, int, re.Match]]:
+        """Run a pattern line by line, positioning matches in the full buffer."""
+        matches = []
+        for line_idx, line_start in enumerate(line_starts):
+            line_end = content.find("\n", line_start)
+            if line_end == -1:
+                line_end = len(content)
+            for match in pattern.pattern.finditer(content, line_start, line_end):
+                matches.append((line_idx, line_start, match))
+        return matches
+
+    def _build_finding(
+        self,
+        pattern: SecretPattern,
+        match: re.Match,
+        file_path: str,
+        line: str,
+        line_num: int,
+        column: int,
+        is_test: bool,
+        is_env: bool,
+        is_gitignored: bool,
+    ) -> SecretFinding | None:
+        """Validate a regex match and turn it into a finding."""
+        match_text = match.group(0)
+
+        # Extract the actual secret if it's a capture group
+        if match.lastindex and match.lastindex >= 1:
+            match_text = match.group(1)
+
+        # Length check
+        if len(match_text) < pattern.min_length:
+            return None
+        if len(match_text) > pattern.max_length:
+            return None
+
+        # Entropy check
+        entropy = self._calculate_entropy(match_text)
+        if entropy < pattern.entropy_threshold:
+            return None
+
+        # False positive check
+        if self._is_false_positive(match_text, line, file_path):
+            return None
+
+        # Calculate confidence
+        confidence = min(1.0, entropy / 5.0)  # Normalize to 0-1
+        if is_test:
+            confidence *= 0.5
+        if is_env and not is_gitignored:
+            confidence = min(1.0, confidence * 1.5)
+
+        # Adjust severity for test files
+        severity = pattern.severity
+        if is_test:
+            if severity == VulnerabilitySeverity.CRITICAL:
+                severity = VulnerabilitySeverity.MEDIUM
+            elif severity == VulnerabilitySeverity.HIGH:
+                severity = VulnerabilitySeverity.LOW
+
+        return SecretFinding(
+            secret_id=f"secret-{pattern.secret_type.value}-{file_path}-{line_num}",
+            secret_type=pattern.secret_type,
+            severity=severity,
+            location=SourceLocation(
+                file=file_path,
+                line=line_num,
+                column=column,
+            ),
+            line_content=self._redact_line(line, match_text),
+            match_text=self._redact_secret(match_text),
+            entropy=entropy,
+            confidence=confidence,
+            is_test_file=is_test,
+            is_example=is_test,
+            is_env_file=is_env,
+            is_gitignored=is_gitignored,
+            remediation=self._get_remediation(pattern.secret_type),
+        )
 
     def _redact_line(self, line: str, secret: str) -> str:
         """Redact the secret from the line content."""
@@ -441,6 +693,37 @@ class SecretsScanner:
         return line.replace(secret, redacted)
 
     def _is_gitignored(self, file_path: str) -> bool:
+        """Check if file is gitignored, using the per-scan set when resolved."""
+        if self._ignored is not None:
+            return file_path in self._ignored
+        return self._matches_gitignore(file_path)
+
+    def _resolve_gitignored(self, file_paths: list[str]) -> frozenset[str]:
+        """
+        Resolve gitignore status for many files with one git invocation.
+
+        Falls back to basic .gitignore matching when git is unavailable or
+        the project is not a repository.
+        """
+        if file_paths:
+            try:
+                result = subprocess.run(
+                    ["git", "check-ignore", "--stdin", "-z"],
+                    cwd=self.project_root,
+                    input="\0".join(file_paths) + "\0",
+                    capture_output=True,
+                    text=True,
+                    timeout=30,
+                )
+                # 0 = some paths ignored, 1 = none ignored, 128 = fatal
+                if result.returncode in (0, 1):
+                    return frozenset(p for p in result.stdout.split("\0") if p)
+            except (OSError, subprocess.SubprocessError) as e:
+                logger.debug(f"git check-ignore unavailable: {e}")
+
+        return frozenset(p for p in file_paths if self._matches_gitignore(p))
+
+    def _matches_gitignore(self, file_path: str) -> bool:
         """Check if file is in .gitignore (basic check)."""
         gitignore_path = self.project_root / ".gitignore"
         if not gitignore_path.exists():
@@ -487,31 +770,93 @@ class SecretsScanner:
             "Rotate or revoke this credential immediately. Store secrets in environment variables or a secrets manager."
         )
 
-    def scan(self) -> list[SecretFinding]:
-        """Scan entire project for secrets."""
-        findings = []
+    def _collect_files(self) -> list[str]:
+        """Collect relative paths of scannable files from the shared inventory."""
+        # Gitignored files are still scanned (local .env files leak too).
+        # The inventory doesn't walk gitignored directories, so those are
+        # walked here, skipping only SKIP_PATTERNS.
+        inventory = get_file_inventory(self.project_root)
+        candidates = [str(Path(rel_path)) for rel_path in inventory.files(include_ignored=True)]
+        for rel_dir in inventory.ignored_dirs:
+            if not self._should_skip_file(rel_dir):
+                candidates.extend(self._walk_ignored_dir(rel_dir))
+
+        file_paths = []
+        for rel_path in candidates:
+            if self._should_skip_file(rel_path):
+                continue
+
+            if not self._should_scan_file(rel_path):
+                continue
+
+            file_paths.append(rel_path)
 
-        for root, dirs, files in os.walk(self.project_root):
+        return file_paths
+
+    def _walk_ignored_dir(self, rel_dir: str) -> list[str]:
+        """Walk a gitignored directory and return relative file paths."""
+        rel_paths = []
+        for root, dirs, files in os.walk(self.project_root / rel_dir):
             # Skip directories in SKIP_PATTERNS
             dirs[:] = [d for d in dirs if not any(skip in d for skip in self.SKIP_PATTERNS)]
 
             for filename in files:
                 full_path = Path(root) / filename
-                rel_path = full_path.relative_to(self.project_root)
+                rel_paths.append(str(full_path.relative_to(self.project_root)))
+        return rel_paths
 
-                if self._should_skip_file(str(rel_path)):
-                    continue
+    def _scan_file_safe(self, file_path: str) -> list[SecretFinding]:
+        """Scan a file, logging instead of raising on errors."""
+        try:
+            return self.scan_file(file_path)
+        except Exception as e:
+            logger.debug(f"Error scanning {file_path}: {e}")
+            return []
 
-                if not self._should_scan_file(str(rel_path)):
-                    continue
+    def _scan_paths(self, file_paths: list[str]) -> list[SecretFinding]:
+        """
+        Scan a list of files, fanning out to a process pool for large sets.
+
+        Gitignore status is resolved once up front and shared with workers.
+        """
+        self._ignored = self._resolve_gitignored(file_paths)
 
+        try:
+            if self.max_workers > 1 and len(file_paths) >= self.PARALLEL_THRESHOLD:
                 try:
-                    file_findings = self.scan_file(str(rel_path))
-                    findings.extend(file_findings)
+                    return self._scan_parallel(file_paths)
                 except Exception as e:
-                    logger.debug(f"Error scanning {rel_path}: {e}")
+                    # Pools can be unavailable (sandboxes, frozen apps)
+                    logger.debug(f"Parallel secrets scan failed, scanning serially: {e}")
 
-        # Sort by severity
+            findings = []
+            for file_path in file_paths:
+                findings.extend(self._scan_file_safe(file_path))
+            return findings
+        finally:
+            self._ignored = None
+
+    def _scan_parallel(self, file_paths: list[str]) -> list[SecretFinding]:
+        """Distribute file batches across worker processes."""
+        batches = [
+            file_paths[i : i + self.BATCH_SIZE]
+            for i in range(0, len(file_paths), self.BATCH_SIZE)
+        ]
+        workers = min(self.max_workers, len(batches))
+
+        findings = []
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self,),
+        ) as pool:
+            for batch_findings in pool.map(_scan_batch, batches):
+                findings.extend(batch_findings)
+        return findings
+
+    @staticmethod
+    def _sort_by_severity(findings: list[SecretFinding]) -> None:
+        """Sort findings in place, most severe first."""
         severity_order = {
             VulnerabilitySeverity.CRITICAL: 0,
             VulnerabilitySeverity.HIGH: 1,
@@ -521,17 +866,170 @@ class SecretsScanner:
         }
         findings.sort(key=lambda f: severity_order[f.severity])
 
+    def scan(self) -> list[SecretFinding]:
+        """Scan entire project for secrets."""
+        findings = self._scan_paths(self._collect_files())
+
+        # Sort by severity
+        self._sort_by_severity(findings)
+
         return findings
 
     def scan_files(self, file_paths: list[str]) -> list[SecretFinding]:
         """Scan specific files for secrets."""
-        findings = []
-        for file_path in file_paths:
-            if self._should_skip_file(file_path):
+        file_paths = [p for p in file_paths if not self._should_skip_file(p)]
+        return self._scan_paths(file_paths)
+
+    # =========================================================================
+    # INCREMENTAL SCANNING
+    # =========================================================================
+
+    def _cache_fingerprint(self) -> str:
+        """Fingerprint of everything that affects findings besides file content."""
+        hasher = hashlib.sha256()
+        hasher.update(f"{SecretsScanCache.CACHE_VERSION}:{self.MAX_FILE_SIZE}".encode())
+        for pattern in self.patterns:
+            hasher.update(
+                f"{pattern.secret_type.value}|{pattern.pattern.pattern}|{pattern.severity.value}|"
+                f"{pattern.entropy_threshold}|{pattern.min_length}|{pattern.max_length}\n".encode()
+            )
+        gitignore_path = self.project_root / ".gitignore"
+        try:
+            hasher.update(gitignore_path.read_bytes())
+        except OSError:
+            pass
+        return hasher.hexdigest()
+
+    def _changed_files(self, base_ref: str) -> list[str] | None:
+        """
+        Files changed relative to a git ref, plus untracked files.
+
+        Returns None if git cannot answer (not a repo, unknown ref).
+        """
+        commands = [
+            ["git", "diff", "--name-only", "--relative", "-z", base_ref],
+            ["git", "ls-files", "--others", "--exclude-standard", "-z"],
+        ]
+        changed: list[str] = []
+        for command in commands:
+            try:
+                result = subprocess.run(
+                    command,
+                    cwd=self.project_root,
+                    capture_output=True,
+                    text=True,
+                    timeout=30,
+                )
+            except (OSError, subprocess.SubprocessError) as e:
+                logger.debug(f"git unavailable for incremental scan: {e}")
+                return None
+            if result.returncode != 0:
+                logger.debug(f"{' '.join(command)} failed: {result.stderr.strip()}")
+                return None
+            changed.extend(p for p in result.stdout.split("\0") if p)
+        return [str(Path(p)) for p in changed]
+
+    @staticmethod
+    def _hash_file(full_path: Path) -> str:
+        """Content hash of a file."""
+        hasher = hashlib.sha256()
+        with open(full_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                hasher.update(block)
+        return hasher.hexdigest()
+
+    def scan_incremental(
+        self,
+        base_ref: str | None = None,
+        cache_path: str | Path | None = None,
+    ) -> list[SecretFinding]:
+        """
+        Scan only files whose content changed since the last scan.
+
+        Per-file content hashes and findings are persisted in .fastband.
+        Files whose size and mtime are unchanged are trusted without reading
+        them; otherwise the content hash decides whether to re-scan. Results
+        are merged with cached findings for all other files.
+
+        Args:
+            base_ref: Optional git ref. When given and a cache exists, only
+                files changed against it, untracked files and the files
+                already in the cache are checked, skipping the tree walk.
+            cache_path: Override the cache location
+
+        Returns:
+            All findings, sorted by severity
+        """
+        cache = SecretsScanCache(
+            Path(cache_path) if cache_path else self.project_root / self.CACHE_FILE,
+            self._cache_fingerprint(),
+        )
+
+        # The git diff shortcut needs a populated cache to merge into
+        candidates = self._changed_files(base_ref) if base_ref and cache.entries else None
+        full_walk = candidates is None
+        if candidates is None:
+            candidates = self._collect_files()
+        else:
+            # Cached files can change and still match base_ref (checkout,
+            # pull, rebase); their size and mtime are checked with a stat
+            candidates = list(dict.fromkeys([*candidates, *cache.entries]))
+
+        pending: dict[str, tuple[int, int, str]] = {}
+        checked = 0
+        unchanged = 0
+
+        for file_path in candidates:
+            if self._should_skip_file(file_path) or not self._should_scan_file(file_path):
+                cache.remove(file_path)
                 continue
+
+            checked += 1
+            full_path = self.project_root / file_path
             try:
-                file_findings = self.scan_file(file_path)
-                findings.extend(file_findings)
-            except Exception as e:
-                logger.debug(f"Error scanning {file_path}: {e}")
+                stat = full_path.stat()
+                entry = cache.get(file_path)
+                if (
+                    entry
+                    and entry["size"] == stat.st_size
+                    and entry["mtime_ns"] == stat.st_mtime_ns
+                ):
+                    unchanged += 1
+                    continue
+                digest = self._hash_file(full_path)
+            except OSError:
+                cache.remove(file_path)
+                continue
+
+            if entry and entry["hash"] == digest:
+                # Touched but not modified: refresh stat info only
+                cache.put(file_path, stat.st_size, stat.st_mtime_ns, digest, entry["findings"])
+                unchanged += 1
+                continue
+
+            pending[file_path] = (stat.st_size, stat.st_mtime_ns, digest)
+
+        if full_walk:
+            for file_path in set(cache.entries) - set(candidates):
+                cache.remove(file_path)
+
+        by_file: dict[str, list[dict[str, Any]]] = {file_path: [] for file_path in pending}
+        for finding in self._scan_paths(list(pending)):
+            by_file[finding.location.file].append(finding.to_dict())
+
+        for file_path, (size, mtime_ns, digest) in pending.items():
+            cache.put(file_path, size, mtime_ns, digest, by_file[file_path])
+
+        cache.save()
+
+        self.last_scan_stats = {
+            "mode": "full" if full_walk else "git_diff",
+            "files_checked": checked,
+            "files_rescanned": len(pending),
+            "files_unchanged": unchanged,
+            "files_cached": len(cache.entries),
+        }
+
+        findings = cache.findings()
+        self._sort_by_severity(findings)
         return findings
@@ -9,6 +9,7 @@ Provides unified security scanning with:
 """
 
 import asyncio
+import functools
 import logging
 import time
 import uuid
@@ -53,6 +54,10 @@ class SecurityConfig:
     include_dev_dependencies: bool = True
     scan_test_files: bool = True
 
+    # Incremental secrets scanning (cached per-file hashes in .fastband)
+    incremental: bool = False
+    base_ref: str | None = None  # Only check files changed against this git ref
+
     # Context integration
     use_context: bool = True
     prioritize_by_risk: bool = True
@@ -238,6 +243,11 @@ class SecurityTool:
         """Run secret detection scan."""
         # Run in thread pool since it's CPU-bound
         loop = asyncio.get_event_loop()
+        if config.incremental:
+            return await loop.run_in_executor(
+                None,
+                functools.partial(self.secrets_scanner.scan_incremental, base_ref=config.base_ref),
+            )
         return await loop.run_in_executor(None, self.secrets_scanner.scan)
 
     async def _enrich_with_context(self, report: SecurityReport) -> None:
@@ -440,6 +450,8 @@ async def security_scan_dependencies(
 async def security_scan_secrets(
     path: str = ".",
     include_tests: bool = False,
+    incremental: bool = False,
+    base_ref: str | None = None,
 ) -> dict[str, Any]:
     """
     Scan source code for exposed secrets.
@@ -450,6 +462,8 @@ async def security_scan_secrets(
     Args:
         path: Project path to scan
         include_tests: Include test files in scan
+        incremental: Only re-scan files changed since the last scan
+        base_ref: With incremental, only check files changed against this git ref
 
     Returns:
         Secret detection report
@@ -468,11 +482,13 @@ async def security_scan_secrets(
             scan_dependencies=False,
             scan_secrets=True,
             scan_test_files=include_tests,
+            incremental=incremental or base_ref is not None,
+            base_ref=base_ref,
         )
 
         report = await tool.scan(config)
 
-        return {
+        result = {
             "type": "secrets_scan",
             "secrets_found": len(report.secrets),
             "files_scanned": len(report.files_scanned),
@@ -497,6 +513,11 @@ async def security_scan_secrets(
             "scan_time_ms": report.scan_time_ms,
         }
 
+        if config.incremental:
+            result["incremental"] = tool.secrets_scanner.last_scan_stats
+
+        return result
+
     finally:
         await tool.close()
 
@@ -27,6 +27,7 @@ from fastband.tickets.models import (
     TicketComment,
     TicketPriority,
     TicketStatus,
+    TicketSummary,
     TicketType,
 )
 from fastband.tickets.storage import TicketStore, get_store
@@ -109,7 +110,7 @@ def _validate_screenshot_exists(screenshot_path: str, ticket_id: str) -> tuple[b
 # =============================================================================
 
 
-def _ticket_to_summary(ticket: Ticket) -> dict[str, Any]:
+def _ticket_to_summary(ticket: Ticket | TicketSummary) -> dict[str, Any]:
     """Convert ticket to summary dict for listing."""
     return {
         "id": ticket.id,
@@ -190,6 +191,8 @@ class ListTicketsTool(Tool):
                 description="List tickets with optional filters. Use to find available work or check status.",
                 category=ToolCategory.TICKETS,
                 version="1.0.0",
+                cacheable=True,
+                cache_state=["tickets"],
             ),
             parameters=[
                 ToolParameter(
@@ -270,8 +273,8 @@ class ListTicketsTool(Tool):
             priority_enum = TicketPriority.from_string(priority) if priority else None
             type_enum = TicketType.from_string(ticket_type) if ticket_type else None
 
-            # Get tickets from store
-            tickets = self.store.list(
+            # Get tickets from store (summary fields only)
+            tickets = self.store.list_summaries(
                 status=status_enum,
                 priority=priority_enum,
                 ticket_type=type_enum,
@@ -333,6 +336,8 @@ class GetTicketDetailsTool(Tool):
                 description="Get full details for a specific ticket including history and comments.",
                 category=ToolCategory.TICKETS,
                 version="1.0.0",
+                cacheable=True,
+                cache_state=["tickets"],
             ),
             parameters=[
                 ToolParameter(
@@ -1152,6 +1157,8 @@ class SearchTicketsTool(Tool):
                 description="Search tickets by text query across title, description, and notes.",
                 category=ToolCategory.TICKETS,
                 version="1.0.0",
+                cacheable=True,
+                cache_state=["tickets"],
             ),
             parameters=[
                 ToolParameter(
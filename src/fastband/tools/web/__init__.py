@@ -7,14 +7,21 @@ These tools provide web-related functionality including:
 - DOM querying with CSS selectors
 - Browser console log capture
 
+Screenshot, DOM query, console and QA sweep calls lease warm browser
+contexts and pages from the BrowserManager's PagePool (see pool.py)
+instead of opening a context per call.
+
 Playwright is an optional dependency - tools will gracefully handle
 its absence by returning helpful error messages.
 """
 
 import asyncio
 import base64
+import hashlib
 import json
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
@@ -27,9 +34,13 @@ from fastband.tools.base import (
     ToolParameter,
     ToolResult,
 )
+from fastband.tools.web.pool import PagePool, PooledPage
 
 logger = logging.getLogger(__name__)
 
+# Pages a QA sweep checks at once
+DEFAULT_SWEEP_CONCURRENCY = 4
+
 # Check if Playwright is available
 try:
     from playwright.async_api import Browser, BrowserContext, Page, async_playwright
@@ -62,13 +73,15 @@ class BrowserManager:
     Manages browser instances for Playwright tools.
 
     Supports both headful and headless modes, and handles
-    browser lifecycle management.
+    browser lifecycle management. Each launched browser gets a PagePool
+    of warm contexts and pages, leased through page().
     """
 
     _instance: Optional["BrowserManager"] = None
     _browser: Any | None = None  # Browser type when Playwright available
     _context: Any | None = None  # BrowserContext when Playwright available
     _playwright: Any | None = None
+    _pool: PagePool | None = None
     _headless: bool = True
 
     def __new__(cls):
@@ -87,6 +100,7 @@ class BrowserManager:
             self._headless = headless
             self._playwright = await async_playwright().start()
             self._browser = await self._playwright.chromium.launch(headless=headless)
+            self._pool = PagePool()
 
         return self._browser
 
@@ -102,8 +116,65 @@ class BrowserManager:
 
         return await browser.new_context(**context_options)
 
+    @asynccontextmanager
+    async def page(
+        self,
+        headless: bool = True,
+        viewport: dict | None = None,
+        auth: str | None = None,
+        storage_state: dict | None = None,
+    ) -> AsyncIterator[PooledPage | None]:
+        """
+        Lease a warm page from the pool for the duration of a block.
+
+        Pages are shared only between leases with the same headless mode,
+        viewport, auth label and storage state, so a new storage state
+        always gets a fresh context. An exception in the block closes the
+        page.
+
+        Args:
+            headless: Browser mode
+            viewport: Viewport size ({"width": ..., "height": ...})
+            auth: Label of the auth state; contexts with a label keep cookies
+            storage_state: Playwright storage state for new contexts (requires auth)
+
+        Yields:
+            The leased PooledPage, or None if Playwright is not available
+        """
+        if storage_state is not None and auth is None:
+            raise ValueError("storage_state requires an auth label")
+
+        browser = await self.get_browser(headless=headless)
+        if browser is None:
+            yield None
+            return
+
+        context_options: dict[str, Any] = {}
+        if viewport:
+            context_options["viewport"] = viewport
+        state_digest = None
+        if storage_state is not None:
+            context_options["storage_state"] = storage_state
+            state_digest = hashlib.sha256(
+                json.dumps(storage_state, sort_keys=True).encode()
+            ).hexdigest()
+        key = (headless, tuple(sorted(viewport.items())) if viewport else None, auth, state_digest)
+
+        async def new_context():
+            return await browser.new_context(**context_options)
+
+        async with self._pool.lease(key, new_context, keep_cookies=auth is not None) as lease:
+            yield lease
+
+    def get_pool_stats(self) -> dict[str, Any] | None:
+        """Get page pool statistics, or None before a browser is launched."""
+        return self._pool.get_stats() if self._pool else None
+
     async def close(self):
         """Close browser and cleanup resources."""
+        if self._pool:
+            await self._pool.close()
+            self._pool = None
         if self._context:
             await self._context.close()
             self._context = None
@@ -228,40 +299,35 @@ class ScreenshotTool(Tool):
         except Exception as e:
             return ToolResult(success=False, error=f"Invalid URL: {e}")
 
-        context = None
-        page = None
-
         try:
             manager = get_browser_manager()
-            context = await manager.get_context(
+            async with manager.page(
                 headless=headless, viewport={"width": width, "height": height}
-            )
-
-            if context is None:
-                return _playwright_not_installed_error()
-
-            page = await context.new_page()
+            ) as lease:
+                if lease is None:
+                    return _playwright_not_installed_error()
+                page = lease.page
 
-            # Navigate to URL
-            await page.goto(url, wait_until=wait_for, timeout=wait_timeout)
+                # Navigate to URL
+                await page.goto(url, wait_until=wait_for, timeout=wait_timeout)
 
-            # Take screenshot
-            screenshot_options = {
-                "full_page": full_page,
-                "type": "png",
-            }
+                # Take screenshot
+                screenshot_options = {
+                    "full_page": full_page,
+                    "type": "png",
+                }
 
-            if selector:
-                # Element-specific screenshot
-                element = await page.query_selector(selector)
-                if element is None:
-                    return ToolResult(
-                        success=False,
-                        error=f"Element not found: {selector}",
-                    )
-                screenshot_bytes = await element.screenshot(**screenshot_options)
-            else:
-                screenshot_bytes = await page.screenshot(**screenshot_options)
+                if selector:
+                    # Element-specific screenshot
+                    element = await page.query_selector(selector)
+                    if element is None:
+                        return ToolResult(
+                            success=False,
+                            error=f"Element not found: {selector}",
+                        )
+                    screenshot_bytes = await element.screenshot(**screenshot_options)
+                else:
+                    screenshot_bytes = await page.screenshot(**screenshot_options)
 
             # Encode as base64
             screenshot_base64 = base64.b64encode(screenshot_bytes).decode("utf-8")
@@ -286,11 +352,6 @@ class ScreenshotTool(Tool):
         except Exception as e:
             logger.exception(f"Screenshot failed for {url}")
             return ToolResult(success=False, error=str(e))
-        finally:
-            if page:
-                await page.close()
-            if context:
-                await context.close()
 
 
 class HttpRequestTool(Tool):
@@ -562,81 +623,71 @@ class DomQueryTool(Tool):
         except Exception as e:
             return ToolResult(success=False, error=f"Invalid URL: {e}")
 
-        context = None
-        page = None
-
         try:
             manager = get_browser_manager()
-            context = await manager.get_context(headless=headless)
-
-            if context is None:
-                return _playwright_not_installed_error()
-
-            page = await context.new_page()
-
-            # Navigate to URL
-            await page.goto(url, wait_until=wait_for, timeout=wait_timeout)
-
-            # Query elements
-            elements = await page.query_selector_all(selector)
-
-            results = []
-            for i, element in enumerate(elements[:max_elements]):
-                element_data = {
-                    "index": i,
-                    "tag": await element.evaluate("el => el.tagName.toLowerCase()"),
-                }
-
-                # Get text content
-                if include_text:
-                    element_data["text"] = await element.text_content()
-                    element_data["inner_text"] = await element.inner_text()
-
-                # Get inner HTML
-                if include_html:
-                    element_data["inner_html"] = await element.inner_html()
-
-                # Get attributes
-                if attributes:
-                    element_data["attributes"] = {}
-                    for attr in attributes:
-                        value = await element.get_attribute(attr)
-                        if value is not None:
-                            element_data["attributes"][attr] = value
-                else:
-                    # Get all attributes
-                    element_data["attributes"] = await element.evaluate(
-                        """el => {
-                            const attrs = {};
-                            for (const attr of el.attributes) {
-                                attrs[attr.name] = attr.value;
-                            }
-                            return attrs;
-                        }"""
-                    )
-
-                results.append(element_data)
+            async with manager.page(headless=headless) as lease:
+                if lease is None:
+                    return _playwright_not_installed_error()
+                page = lease.page
+
+                # Navigate to URL
+                await page.goto(url, wait_until=wait_for, timeout=wait_timeout)
+
+                # Query elements
+                elements = await page.query_selector_all(selector)
+
+                results = []
+                for i, element in enumerate(elements[:max_elements]):
+                    element_data = {
+                        "index": i,
+                        "tag": await element.evaluate("el => el.tagName.toLowerCase()"),
+                    }
+
+                    # Get text content
+                    if include_text:
+                        element_data["text"] = await element.text_content()
+                        element_data["inner_text"] = await element.inner_text()
+
+                    # Get inner HTML
+                    if include_html:
+                        element_data["inner_html"] = await element.inner_html()
+
+                    # Get attributes
+                    if attributes:
+                        element_data["attributes"] = {}
+                        for attr in attributes:
+                            value = await element.get_attribute(attr)
+                            if value is not None:
+                                element_data["attributes"][attr] = value
+                    else:
+                        # Get all attributes
+                        element_data["attributes"] = await element.evaluate(
+                            """el => {
+                                const attrs = {};
+                                for (const attr of el.attributes) {
+                                    attrs[attr.name] = attr.value;
+                                }
+                                return attrs;
+                            }"""
+                        )
+
+                    results.append(element_data)
 
-            return ToolResult(
-                success=True,
-                data={
-                    "url": url,
-                    "selector": selector,
-                    "elements": results,
-                    "total_found": len(elements),
-                    "returned": len(results),
-                    "truncated": len(elements) > max_elements,
-                },
-            )
+                return ToolResult(
+                    success=True,
+                    data={
+                        "url": url,
+                        "selector": selector,
+                        "elements": results,
+                        "total_found": len(elements),
+                        "returned": len(results),
+                        "truncated": len(elements) > max_elements,
+                    },
+                )
 
         except Exception as e:
             logger.exception(f"DOM query failed for {url}")
             return ToolResult(success=False, error=str(e))
-        finally:
-            if page:
-                await page.close()
-            if context:
-                await context.close()
 
 
 class VisionAnalysisTool(Tool):
@@ -840,41 +891,31 @@ class VisionAnalysisTool(Tool):
                 "  playwright install chromium"
             )
 
-        context = None
-        page = None
-
         try:
             manager = get_browser_manager()
-            context = await manager.get_context(
+            async with manager.page(
                 headless=True, viewport={"width": width, "height": height}
-            )
-
-            if context is None:
-                return None, "Failed to create browser context"
-
-            page = await context.new_page()
-            await page.goto(url, wait_until=wait_for, timeout=30000)
-
-            screenshot_options = {"full_page": full_page, "type": "png"}
-
-            if selector:
-                element = await page.query_selector(selector)
-                if element is None:
-                    return None, f"Element not found: {selector}"
-                screenshot_bytes = await element.screenshot(**screenshot_options)
-            else:
-                screenshot_bytes = await page.screenshot(**screenshot_options)
+            ) as lease:
+                if lease is None:
+                    return None, "Failed to create browser context"
+                page = lease.page
+                await page.goto(url, wait_until=wait_for, timeout=30000)
+
+                screenshot_options = {"full_page": full_page, "type": "png"}
+
+                if selector:
+                    element = await page.query_selector(selector)
+                    if element is None:
+                        return None, f"Element not found: {selector}"
+                    screenshot_bytes = await element.screenshot(**screenshot_options)
+                else:
+                    screenshot_bytes = await page.screenshot(**screenshot_options)
 
-            return screenshot_bytes, None
+                return screenshot_bytes, None
 
         except Exception as e:
             logger.exception(f"Screenshot capture failed for {url}")
             return None, str(e)
-        finally:
-            if page:
-                await page.close()
-            if context:
-                await context.close()
 
     async def execute(
         self,
@@ -1125,97 +1166,88 @@ class BrowserConsoleTool(Tool):
         if log_types is None:
             log_types = ["log", "error", "warning", "info", "debug"]
 
-        context = None
-        page = None
         console_messages = []
         network_errors = []
 
         try:
             manager = get_browser_manager()
-            context = await manager.get_context(headless=headless)
+            async with manager.page(headless=headless) as lease:
+                if lease is None:
+                    return _playwright_not_installed_error()
+                page = lease.page
 
-            if context is None:
-                return _playwright_not_installed_error()
-
-            page = await context.new_page()
-
-            # Set up console message handler
-            def handle_console(msg):
-                msg_type = msg.type
-                if msg_type in log_types:
-                    console_messages.append(
-                        {
-                            "type": msg_type,
-                            "text": msg.text,
-                            "location": {
-                                "url": msg.location.get("url", ""),
-                                "line": msg.location.get("lineNumber", 0),
-                                "column": msg.location.get("columnNumber", 0),
+                # Set up console message handler
+                def handle_console(msg):
+                    msg_type = msg.type
+                    if msg_type in log_types:
+                        console_messages.append(
+                            {
+                                "type": msg_type,
+                                "text": msg.text,
+                                "location": {
+                                    "url": msg.location.get("url", ""),
+                                    "line": msg.location.get("lineNumber", 0),
+                                    "column": msg.location.get("columnNumber", 0),
+                                }
+                                if hasattr(msg, "location") and msg.location
+                                else None,
                             }
-                            if hasattr(msg, "location") and msg.location
-                            else None,
-                        }
-                    )
+                        )
 
-            page.on("console", handle_console)
+                lease.on("console", handle_console)
 
-            # Set up network error handler
-            if include_network_errors:
+                # Set up network error handler
+                if include_network_errors:
 
-                def handle_request_failed(request):
-                    network_errors.append(
-                        {
-                            "url": request.url,
-                            "method": request.method,
-                            "failure": request.failure,
-                            "resource_type": request.resource_type,
-                        }
-                    )
+                    def handle_request_failed(request):
+                        network_errors.append(
+                            {
+                                "url": request.url,
+                                "method": request.method,
+                                "failure": request.failure,
+                                "resource_type": request.resource_type,
+                            }
+                        )
 
-                page.on("requestfailed", handle_request_failed)
+                    lease.on("requestfailed", handle_request_failed)
 
-            # Navigate to URL
-            await page.goto(url, wait_until=wait_for, timeout=wait_timeout)
+                # Navigate to URL
+                await page.goto(url, wait_until=wait_for, timeout=wait_timeout)
 
-            # Execute custom script if provided
-            if execute_script:
-                try:
-                    await page.evaluate(execute_script)
-                except Exception as e:
-                    console_messages.append(
-                        {
-                            "type": "error",
-                            "text": f"Script execution error: {e}",
-                            "location": None,
-                        }
-                    )
+                # Execute custom script if provided
+                if execute_script:
+                    try:
+                        await page.evaluate(execute_script)
+                    except Exception as e:
+                        console_messages.append(
+                            {
+                                "type": "error",
+                                "text": f"Script execution error: {e}",
+                                "location": None,
+                            }
+                        )
 
-            # Wait for additional messages
-            await asyncio.sleep(wait_time / 1000)
+                # Wait for additional messages
+                await asyncio.sleep(wait_time / 1000)
 
-            return ToolResult(
-                success=True,
-                data={
-                    "url": url,
-                    "console_messages": console_messages,
-                    "network_errors": network_errors if include_network_errors else [],
-                    "total_messages": len(console_messages),
-                    "total_network_errors": len(network_errors),
-                    "message_counts": {
-                        msg_type: len([m for m in console_messages if m["type"] == msg_type])
-                        for msg_type in {m["type"] for m in console_messages}
+                return ToolResult(
+                    success=True,
+                    data={
+                        "url": url,
+                        "console_messages": console_messages,
+                        "network_errors": network_errors if include_network_errors else [],
+                        "total_messages": len(console_messages),
+                        "total_network_errors": len(network_errors),
+                        "message_counts": {
+                            msg_type: len([m for m in console_messages if m["type"] == msg_type])
+                            for msg_type in {m["type"] for m in console_messages}
+                        },
                     },
-                },
-            )
+                )
 
         except Exception as e:
             logger.exception(f"Browser console capture failed for {url}")
             return ToolResult(success=False, error=str(e))
-        finally:
-            if page:
-                await page.close()
-            if context:
-                await context.close()
 
 
 class BrowserAutomationTool(Tool):
@@ -1647,6 +1679,16 @@ class QAConsoleSweepTool(Tool):
                     required=False,
                     default=True,
                 ),
+                ToolParameter(
+                    name="concurrency",
+                    type="integer",
+                    description=(
+                        "Pages checked in parallel, each in its own browser context "
+                        f"(default: {DEFAULT_SWEEP_CONCURRENCY}; 1 checks one at a time)"
+                    ),
+                    required=False,
+                    default=DEFAULT_SWEEP_CONCURRENCY,
+                ),
             ],
         )
 
@@ -1658,6 +1700,7 @@ class QAConsoleSweepTool(Tool):
         wait_time: int = 3000,
         ignore_patterns: list[str] = None,
         headless: bool = True,
+        concurrency: int = DEFAULT_SWEEP_CONCURRENCY,
         **kwargs,
     ) -> ToolResult:
         """Execute QA console sweep across multiple pages."""
@@ -1671,135 +1714,38 @@ class QAConsoleSweepTool(Tool):
         default_ignores = ["favicon.ico", "chrome-extension", "extensions::"]
         ignore_patterns = (ignore_patterns or []) + default_ignores
 
-        context = None
-        page = None
-        results: list[dict] = []
+        viewport = {"width": 1920, "height": 1080}
 
         try:
             manager = get_browser_manager()
-            context = await manager.get_context(
-                headless=headless, viewport={"width": 1920, "height": 1080}
-            )
-
-            if context is None:
+            if await manager.get_browser(headless=headless) is None:
                 return _playwright_not_installed_error()
 
-            page = await context.new_page()
-
-            # Handle login if provided
+            # Log in once on a clean page; pages then share the session
+            # through its storage state
+            auth = None
+            storage_state = None
             if login:
-                try:
-                    login_url = f"{base_url}{login.get('url', '/login')}"
-                    await page.goto(login_url, wait_until="networkidle", timeout=30000)
-
-                    if login.get("email_selector") and login.get("email"):
-                        await page.fill(login["email_selector"], login["email"])
-                    if login.get("password_selector") and login.get("password"):
-                        await page.fill(login["password_selector"], login["password"])
-                    if login.get("submit_selector"):
-                        await page.click(login["submit_selector"])
-                        await page.wait_for_load_state("networkidle", timeout=10000)
-
-                except Exception as e:
-                    logger.warning(f"Login failed: {e}")
-
-            # Check each page
-            for page_config in pages:
-                if isinstance(page_config, str):
-                    path = page_config
-                    name = page_config.strip("/").replace("/", "_") or "home"
-                else:
-                    path = page_config.get("path", "/")
-                    name = page_config.get("name", path)
-
-                full_url = f"{base_url}{path}"
-
-                page_result = {
-                    "name": name,
-                    "path": path,
-                    "url": full_url,
-                    "status": "PASS",
-                    "page_loaded": False,
-                    "console_errors": [],
-                    "console_warnings": [],
-                    "network_failures": [],
-                    "js_errors": [],
-                }
-
-                # Collectors
-                console_messages = []
-                network_failures = []
-                page_errors = []
-
-                def handle_console(msg):
-                    console_messages.append({"type": msg.type, "text": msg.text})
-
-                def handle_response(response):
-                    if response.status >= 400:
-                        network_failures.append({
-                            "url": response.url,
-                            "status": response.status,
-                            "method": response.request.method,
-                        })
-
-                def handle_page_error(exc):
-                    page_errors.append(str(exc))
-
-                page.on("console", handle_console)
-                page.on("response", handle_response)
-                page.on("pageerror", handle_page_error)
-
-                try:
-                    response = await page.goto(full_url, wait_until="domcontentloaded", timeout=30000)
-
-                    if response and response.status >= 400:
-                        page_result["status"] = "FAIL"
-                        page_result["http_status"] = response.status
-                    else:
-                        try:
-                            await page.wait_for_load_state("networkidle", timeout=10000)
-                        except Exception:
-                            pass
-
-                        await asyncio.sleep(wait_time / 1000)
-                        page_result["page_loaded"] = True
-
-                except Exception as e:
-                    page_result["status"] = "ERROR"
-                    page_result["error"] = str(e)
-
-                # Remove listeners
-                page.remove_listener("console", handle_console)
-                page.remove_listener("response", handle_response)
-                page.remove_listener("pageerror", handle_page_error)
-
-                # Process collected data
-                for msg in console_messages:
-                    text = msg.get("text", "")
-                    # Check ignore patterns
-                    if any(pattern.lower() in text.lower() for pattern in ignore_patterns):
-                        continue
-
-                    if msg["type"] == "error":
-                        page_result["console_errors"].append(text)
-                    elif msg["type"] == "warning":
-                        page_result["console_warnings"].append(text)
-
-                page_result["network_failures"] = network_failures
-                page_result["js_errors"] = page_errors
-
-                # Determine status
-                has_500_error = any(f["status"] >= 500 for f in network_failures)
-                has_console_errors = len(page_result["console_errors"]) > 0
-                has_js_errors = len(page_errors) > 0
-
-                if page_result["status"] != "ERROR":
-                    if has_500_error or has_console_errors or has_js_errors:
-                        page_result["status"] = "FAIL"
-                    elif any(f["status"] == 404 for f in network_failures):
-                        page_result["status"] = "WARNING"
-
-                results.append(page_result)
+                auth = f"{base_url}|{login.get('email', '')}"
+                async with manager.page(headless, viewport) as lease:
+                    await self._login(lease.page, base_url, login)
+                    storage_state = await lease.context.storage_state()
+
+            limit = asyncio.Semaphore(max(1, concurrency))
+
+            async def check(page_config) -> dict:
+                async with limit:
+                    async with manager.page(
+                        headless, viewport, auth=auth, storage_state=storage_state
+                    ) as lease:
+                        return await self._check_page(
+                            lease, base_url, page_config, wait_time, ignore_patterns
+                        )
+
+            # Results keep the order of pages
+            results: list[dict] = list(
+                await asyncio.gather(*(check(page_config) for page_config in pages))
+            )
 
             # Calculate summary
             passed = sum(1 for r in results if r["status"] == "PASS")
@@ -1828,11 +1774,124 @@ class QAConsoleSweepTool(Tool):
         except Exception as e:
             logger.exception(f"QA console sweep failed")
             return ToolResult(success=False, error=str(e))
-        finally:
-            if page:
-                await page.close()
-            if context:
-                await context.close()
+
+    async def _login(self, page: Any, base_url: str, login: dict) -> None:
+        """Fill and submit the login form; failures are logged, not raised."""
+        try:
+            login_url = f"{base_url}{login.get('url', '/login')}"
+            await page.goto(login_url, wait_until="networkidle", timeout=30000)
+
+            if login.get("email_selector") and login.get("email"):
+                await page.fill(login["email_selector"], login["email"])
+            if login.get("password_selector") and login.get("password"):
+                await page.fill(login["password_selector"], login["password"])
+            if login.get("submit_selector"):
+                await page.click(login["submit_selector"])
+                await page.wait_for_load_state("networkidle", timeout=10000)
+
+        except Exception as e:
+            logger.warning(f"Login failed: {e}")
+
+    async def _check_page(
+        self,
+        lease: PooledPage,
+        base_url: str,
+        page_config: str | dict,
+        wait_time: int,
+        ignore_patterns: list[str],
+    ) -> dict:
+        """Visit one page on a leased browser page and grade it."""
+        page = lease.page
+        if isinstance(page_config, str):
+            path = page_config
+            name = page_config.strip("/").replace("/", "_") or "home"
+        else:
+            path = page_config.get("path", "/")
+            name = page_config.get("name", path)
+
+        full_url = f"{base_url}{path}"
+
+        page_result = {
+            "name": name,
+            "path": path,
+            "url": full_url,
+            "status": "PASS",
+            "page_loaded": False,
+            "console_errors": [],
+            "console_warnings": [],
+            "network_failures": [],
+            "js_errors": [],
+        }
+
+        # Collectors (listeners are removed when the lease ends)
+        console_messages = []
+        network_failures = []
+        page_errors = []
+
+        def handle_console(msg):
+            console_messages.append({"type": msg.type, "text": msg.text})
+
+        def handle_response(response):
+            if response.status >= 400:
+                network_failures.append({
+                    "url": response.url,
+                    "status": response.status,
+                    "method": response.request.method,
+                })
+
+        def handle_page_error(exc):
+            page_errors.append(str(exc))
+
+        lease.on("console", handle_console)
+        lease.on("response", handle_response)
+        lease.on("pageerror", handle_page_error)
+
+        try:
+            response = await page.goto(full_url, wait_until="domcontentloaded", timeout=30000)
+
+            if response and response.status >= 400:
+                page_result["status"] = "FAIL"
+                page_result["http_status"] = response.status
+            else:
+                try:
+                    await page.wait_for_load_state("networkidle", timeout=10000)
+                except Exception:
+                    pass
+
+                await asyncio.sleep(wait_time / 1000)
+                page_result["page_loaded"] = True
+
+        except Exception as e:
+            page_result["status"] = "ERROR"
+            page_result["error"] = str(e)
+
+        # Process collected data
+        for msg in console_messages:
+            text = msg.get("text", "")
+            # Check ignore patterns
+            if any(pattern.lower() in text.lower() for pattern in ignore_patterns):
+                continue
+
+            if msg["type"] == "error":
+                page_result["console_errors"].append(text)
+            elif msg["type"] == "warning":
+                page_result["console_warnings"].append(text)
+
+        page_result["network_failures"] = network_failures
+        page_result["js_errors"] = page_errors
+
+        # Determine status
+        has_500_error = any(f["status"] >= 500 for f in network_failures)
+        has_console_errors = len(page_result["console_errors"]) > 0
+        has_js_errors = len(page_errors) > 0
+
+        if page_result["status"] != "ERROR":
+            if has_500_error or has_console_errors or has_js_errors:
+                page_result["status"] = "FAIL"
+            elif any(f["status"] == 404 for f in network_failures):
+                page_result["status"] = "WARNING"
+
+        return page_result
 
 
 # All web tools
@@ -1858,4 +1917,6 @@ __all__ = [
     "PLAYWRIGHT_AVAILABLE",
     "get_browser_manager",
     "BrowserManager",
+    "PagePool",
+    "PooledPage",
 ]
@@ -0,0 +1,306 @@
+"""
+Browser Page Pool - Warm Playwright contexts and pages for the web tools.
+
+Opening a browser context and a page costs tens of milliseconds, and the
+screenshot, DOM query and console tools used to pay it on every call.
+PagePool keeps a bounded set of (context, page) pairs warm, keyed by what
+makes a context reusable: headless mode, viewport and auth state.
+
+- acquire() hands out an idle pair with the same key after a health check
+  (a trivial evaluate), or opens a new one. At most max_size pairs are
+  leased at once; further callers wait.
+- release() detaches the listeners added through the lease, navigates to
+  about:blank and returns the pair to the idle list. Contexts without
+  auth state also drop their cookies and the origin's storage (local and
+  session storage, IndexedDB, caches, service workers), so anonymous
+  leases don't share a session. Storage can only be cleared from the
+  origin itself, so an anonymous page that visited more than one origin
+  is closed instead.
+- Pairs are closed after max_uses leases, after max_idle seconds idle,
+  when a lease ends with an exception, and, when the pool is full, to
+  make room for a different key (least recently used first).
+
+Example:
+    pool = PagePool(max_size=4)
+    async with pool.lease(key, lambda: browser.new_context()) as lease:
+        lease.on("console", handler)
+        await lease.page.goto(url)
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Pairs leased at once
+DEFAULT_POOL_SIZE = 4
+
+# Leases before a pair is closed and replaced
+DEFAULT_MAX_USES = 50
+
+# Seconds an idle pair is kept
+DEFAULT_MAX_IDLE = 300.0
+
+# Seconds a reused page gets to answer the health check
+HEALTH_CHECK_TIMEOUT = 2.0
+
+# Clears the current origin's storage on anonymous pages before reuse
+CLEAR_STORAGE_SCRIPT = """async () => {
+    try { localStorage.clear(); } catch (e) {}
+    try { sessionStorage.clear(); } catch (e) {}
+    if (navigator.serviceWorker) {
+        const registrations = await navigator.serviceWorker.getRegistrations();
+        await Promise.all(registrations.map((r) => r.unregister()));
+    }
+    if (window.caches) {
+        const names = await caches.keys();
+        await Promise.all(names.map((name) => caches.delete(name)));
+    }
+    if (window.indexedDB && indexedDB.databases) {
+        const databases = await indexedDB.databases();
+        await Promise.all(databases.map((db) => new Promise((resolve) => {
+            const request = indexedDB.deleteDatabase(db.name);
+            request.onsuccess = request.onerror = request.onblocked = resolve;
+        })));
+    }
+}"""
+
+
+@dataclass(slots=True, eq=False)
+class PooledPage:
+    """A leased browser context and its page.
+
+    Attributes:
+        key: Pool key the context was created for
+        context: Playwright BrowserContext
+        page: Playwright Page
+        uses: Completed leases
+        keep_cookies: Keep cookies between leases (contexts with auth state)
+        origins: Origins the page navigated to since its storage was cleared
+    """
+
+    key: tuple
+    context: Any
+    page: Any
+    uses: int = 0
+    keep_cookies: bool = False
+    idle_since: float = 0.0
+    origins: set[str] = field(default_factory=set)
+    _listeners: list[tuple[str, Callable]] = field(default_factory=list)
+
+    def on(self, event: str, handler: Callable) -> None:
+        """Add a page listener that is removed when the lease ends."""
+        self.page.on(event, handler)
+        self._listeners.append((event, handler))
+
+    def _record_origin(self, frame: Any) -> None:
+        """framenavigated handler: remember origins the main frame visits."""
+        if frame.parent_frame is None and (origin := _origin(frame.url)):
+            self.origins.add(origin)
+
+
+class PagePool:
+    """Bounded pool of warm browser contexts and pages."""
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_POOL_SIZE,
+        max_uses: int = DEFAULT_MAX_USES,
+        max_idle: float = DEFAULT_MAX_IDLE,
+    ):
+        """
+        Args:
+            max_size: Max pairs leased at once (and kept open)
+            max_uses: Leases before a pair is recycled
+            max_idle: Seconds an idle pair is kept
+        """
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.max_idle = max_idle
+        self._slots = asyncio.Semaphore(max_size)
+        self._idle: list[PooledPage] = []  # Least recently released first
+        self._open = 0
+        self._closed = False
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+
+    async def acquire(
+        self,
+        key: tuple,
+        new_context: Callable[[], Awaitable[Any]],
+        keep_cookies: bool = False,
+    ) -> PooledPage:
+        """
+        Lease a page for key, waiting while the pool is fully leased.
+
+        Args:
+            key: Hashable description of the context (e.g. headless, viewport, auth)
+            new_context: Coroutine function opening a context for key
+            keep_cookies: Keep cookies when the page is released
+
+        Returns:
+            The leased pair; pass it to release() when done
+        """
+        if self._closed:
+            raise RuntimeError("Page pool is closed")
+        await self._slots.acquire()
+        try:
+            await self._prune()
+
+            while (entry := self._take_idle(key)) is not None:
+                if await self._healthy(entry):
+                    self.reused += 1
+                    return entry
+                await self._discard(entry)
+
+            # Make room by closing idle pairs of other keys
+            while self._open >= self.max_size and self._idle:
+                await self._discard(self._idle.pop(0))
+
+            self._open += 1
+            context = None
+            try:
+                context = await new_context()
+                page = await context.new_page()
+            except BaseException:
+                self._open -= 1
+                if context is not None:
+                    await _close_quietly(context)
+                raise
+            self.created += 1
+            entry = PooledPage(key, context, page, keep_cookies=keep_cookies)
+            if not keep_cookies:
+                page.on("framenavigated", entry._record_origin)
+            return entry
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def release(self, entry: PooledPage, reusable: bool = True) -> None:
+        """
+        Return a leased pair to the pool.
+
+        Args:
+            entry: Pair from acquire()
+            reusable: False to close it (e.g. after an error)
+        """
+        try:
+            for event, handler in entry._listeners:
+                try:
+                    entry.page.remove_listener(event, handler)
+                except Exception:
+                    reusable = False
+            entry._listeners.clear()
+            entry.uses += 1
+
+            if self._closed or not reusable or entry.uses >= self.max_uses:
+                await self._discard(entry)
+                return
+
+            try:
+                if not entry.keep_cookies and not await self._clear_storage(entry):
+                    await self._discard(entry)
+                    return
+                await entry.page.goto("about:blank")
+                if not entry.keep_cookies:
+                    await entry.context.clear_cookies()
+            except Exception as e:
+                logger.debug(f"Discarding pooled page after failed reset: {e}")
+                await self._discard(entry)
+                return
+
+            entry.idle_since = time.monotonic()
+            self._idle.append(entry)
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def lease(
+        self,
+        key: tuple,
+        new_context: Callable[[], Awaitable[Any]],
+        keep_cookies: bool = False,
+    ) -> AsyncIterator[PooledPage]:
+        """Lease a page for the duration of a block; an exception discards it."""
+        entry = await self.acquire(key, new_context, keep_cookies)
+        reusable = False
+        try:
+            yield entry
+            reusable = True
+        finally:
+            await self.release(entry, reusable)
+
+    async def close(self) -> None:
+        """Close idle pairs; leased pairs are closed when released."""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for entry in idle:
+            await self._discard(entry)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get pool statistics."""
+        return {
+            "open": self._open,
+            "idle": len(self._idle),
+            "leased": self._open - len(self._idle),
+            "max_size": self.max_size,
+            "created": self.created,
+            "reused": self.reused,
+            "discarded": self.discarded,
+        }
+
+    def _take_idle(self, key: tuple) -> PooledPage | None:
+        """Most recently released idle pair for key."""
+        for i in range(len(self._idle) - 1, -1, -1):
+            if self._idle[i].key == key:
+                return self._idle.pop(i)
+        return None
+
+    async def _prune(self) -> None:
+        cutoff = time.monotonic() - self.max_idle
+        while self._idle and self._idle[0].idle_since < cutoff:
+            await self._discard(self._idle.pop(0))
+
+    async def _clear_storage(self, entry: PooledPage) -> bool:
+        """Clear storage of the origin an anonymous page visited; False if it can't be."""
+        if not entry.origins:
+            return True
+        if entry.origins != {_origin(entry.page.url)}:
+            return False
+        await entry.page.evaluate(CLEAR_STORAGE_SCRIPT)
+        entry.origins.clear()
+        return True
+
+    async def _healthy(self, entry: PooledPage) -> bool:
+        try:
+            await asyncio.wait_for(entry.page.evaluate("1"), HEALTH_CHECK_TIMEOUT)
+            return True
+        except Exception:
+            return False
+
+    async def _discard(self, entry: PooledPage) -> None:
+        self._open -= 1
+        self.discarded += 1
+        await _close_quietly(entry.context)
+
+
+def _origin(url: str) -> str | None:
+    """scheme://host[:port] of an http(s) URL, None for about:blank and the like."""
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+async def _close_quietly(context: Any) -> None:
+    try:
+        await context.close()
+    except Exception as e:
+        logger.debug(f"Error closing browser context: {e}")
@@ -19,6 +19,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from fastband.core.inventory import get_file_inventory
+
 # Try to import AI providers
 try:
     import anthropic
@@ -186,15 +188,12 @@ class CodebaseAnalyzer:
 
     def _collect_files(self) -> list[Path]:
         """Collect all files in the project."""
-        files = []
-        for path in self.project_path.rglob('*'):
-            if path.is_file():
-                # Skip hidden and ignored directories
-                parts = path.relative_to(self.project_path).parts
-                if any(p in self.SKIP_DIRS or p.startswith('.') for p in parts):
-                    continue
-                files.append(path)
-        return files
+        # Skip hidden and ignored directories
+        inventory = get_file_inventory(self.project_path)
+        return [
+            self.project_path / rel_path
+            for rel_path in inventory.files(exclude_names=self.SKIP_DIRS, include_hidden=False)
+        ]
 
     def _detect_languages(self, files: list[Path]) -> list[str]:
         """Detect programming languages used."""
@@ -7,6 +7,8 @@ from pathlib import Path
 import pytest
 
 from fastband.core.detection import (
+    EXTENSION_LANGUAGES,
+    LANGUAGE_PATTERNS,
     BuildTool,
     DetectedFramework,
     DetectedLanguage,
@@ -16,8 +18,10 @@ from fastband.core.detection import (
     ProjectDetector,
     ProjectInfo,
     ProjectType,
+    clear_detection_cache,
     detect_project,
 )
+from fastband.core.inventory import get_file_inventory
 
 # =============================================================================
 # FIXTURES
@@ -444,6 +448,128 @@ class TestConvenienceFunction:
         assert info.path.exists()
 
 
+class TestManifestParsing:
+    """Tests for parsed manifests and compiled lookup tables."""
+
+    def test_extension_table_covers_language_patterns(self):
+        """Every declared extension resolves through the compiled table."""
+        for lang, patterns in LANGUAGE_PATTERNS.items():
+            for ext in patterns["extensions"]:
+                assert lang in EXTENSION_LANGUAGES[ext]
+
+    def test_poetry_dependencies(self, temp_dir):
+        """Test framework detection from Poetry dependency tables."""
+        (temp_dir / "pyproject.toml").write_text("""
+[tool.poetry]
+name = "poetry-app"
+version = "2.1.0"
+
+[tool.poetry.dependencies]
+python = "^3.11"
+FastAPI = "^0.110"
+
+[tool.poetry.group.dev.dependencies]
+pytest = "^8.0"
+""")
+        info = detect_project(temp_dir)
+
+        assert (info.name, info.version) == ("poetry-app", "2.1.0")
+        fastapi = next(f for f in info.frameworks if f.framework == Framework.FASTAPI)
+        assert fastapi.version == "^0.110"
+
+    def test_go_module(self, temp_dir):
+        """Test go.mod parsing for metadata and language."""
+        (temp_dir / "go.mod").write_text(
+            "module example.com/svc\n\ngo 1.22\n\n"
+            "require (\n\tgithub.com/gin-gonic/gin v1.9.1 // indirect\n)\n"
+        )
+        (temp_dir / "main.go").write_text("package main\n")
+
+        info = detect_project(temp_dir)
+
+        assert info.name == "example.com/svc"
+        assert info.primary_language == Language.GO
+        assert PackageManager.GO_MOD in info.package_managers
+
+    def test_invalid_manifest_is_ignored(self, temp_dir):
+        """Test that an unparseable manifest does not break detection."""
+        (temp_dir / "package.json").write_text("{not json")
+        (temp_dir / "Cargo.toml").write_text('[package]\nname = "crate"\n')
+
+        info = detect_project(temp_dir)
+
+        assert info.name == "crate"
+
+
+class TestDetectionCache:
+    """Tests for memoized detection results."""
+
+    def _settle(self, path):
+        # Freshly written test trees are within the inventory's racy window
+        detector = ProjectDetector()
+        get_file_inventory(
+            path,
+            max_depth=detector.max_depth,
+            skip_names=detector.SKIP_NAMES,
+            skip_hidden=True,
+            max_files=detector.max_files,
+        )._racy = False
+
+    def test_repeated_detection_is_memoized(self, python_project, monkeypatch):
+        """Test that an unchanged project is not re-detected."""
+        detect_project(python_project)
+        self._settle(python_project)
+        detect_project(python_project)
+
+        calls = []
+        original = ProjectDetector._detect
+        monkeypatch.setattr(
+            ProjectDetector,
+            "_detect",
+            lambda self, *args: calls.append(args) or original(self, *args),
+        )
+
+        info = detect_project(python_project)
+
+        assert calls == []
+        assert info.name == "test-project"
+
+    def test_manifest_change_invalidates(self, python_project):
+        """Test that editing a manifest triggers re-detection."""
+        detect_project(python_project)
+        self._settle(python_project)
+
+        pyproject = python_project / "pyproject.toml"
+        pyproject.write_text(pyproject.read_text().replace("test-project", "renamed"))
+
+        assert detect_project(python_project).name == "renamed"
+
+    def test_results_are_independent_copies(self, python_project):
+        """Test that callers cannot mutate the memoized result."""
+        first = detect_project(python_project)
+        self._settle(python_project)
+        first.frameworks.clear()
+
+        assert detect_project(python_project).frameworks
+
+    def test_clear_detection_cache(self, python_project, monkeypatch):
+        """Test explicit cache invalidation."""
+        detect_project(python_project)
+        self._settle(python_project)
+        clear_detection_cache(python_project)
+
+        calls = []
+        original = ProjectDetector._detect
+        monkeypatch.setattr(
+            ProjectDetector,
+            "_detect",
+            lambda self, *args: calls.append(args) or original(self, *args),
+        )
+        detect_project(python_project)
+
+        assert len(calls) == 1
+
+
 # =============================================================================
 # EDGE CASE TESTS
 # =============================================================================
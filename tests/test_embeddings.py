@@ -8,8 +8,11 @@ Tests cover:
 - SemanticIndex orchestration
 """
 
+import asyncio
 import tempfile
+import time
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -24,6 +27,12 @@ from fastband.embeddings.base import (
 from fastband.embeddings.chunkers.base import ChunkerConfig
 from fastband.embeddings.chunkers.fixed import FixedChunker
 from fastband.embeddings.chunkers.semantic import SemanticChunker
+from fastband.embeddings.scheduler import (
+    EmbeddingScheduler,
+    SchedulerConfig,
+    is_retryable,
+    retry_after,
+)
 from fastband.embeddings.storage.sqlite import SQLiteVectorStore
 
 # =============================================================================
@@ -625,6 +634,180 @@ class TestSemanticIndex:
             index.close()
 
 
+# =============================================================================
+# EMBEDDING SCHEDULER TESTS
+# =============================================================================
+
+
+class RateLimitError(Exception):
+    """Stand-in for a provider 429 error carrying a Retry-After header."""
+
+    status_code = 429
+
+    def __init__(self, retry_after: str = "0.01"):
+        super().__init__("rate limited")
+        self.response = SimpleNamespace(headers={"retry-after": retry_after})
+
+
+class ScriptedProvider(EmbeddingProvider):
+    """Provider that fails selected calls and tracks concurrency."""
+
+    def __init__(self, fail_texts: dict[str, list[Exception]] | None = None):
+        super().__init__(EmbeddingConfig(batch_size=100))
+        self.fail_texts = fail_texts or {}
+        self.batches: list[list[str]] = []
+        self.active = 0
+        self.max_active = 0
+
+    def _validate_config(self):
+        pass
+
+    @property
+    def name(self) -> str:
+        return "scripted"
+
+    @property
+    def default_model(self) -> str:
+        return "scripted"
+
+    @property
+    def dimensions(self) -> int:
+        return 1
+
+    async def embed(self, texts):
+        self.batches.append(list(texts))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            for text in texts:
+                if self.fail_texts.get(text):
+                    raise self.fail_texts[text].pop(0)
+            return EmbeddingResult(
+                embeddings=[[float(len(t))] for t in texts],
+                model="scripted",
+                provider="scripted",
+                dimensions=1,
+                usage={},
+            )
+        finally:
+            self.active -= 1
+
+
+class TestEmbeddingScheduler:
+    """Tests for token packing, concurrency and retries."""
+
+    def test_packs_by_estimated_tokens(self):
+        scheduler = EmbeddingScheduler(
+            ScriptedProvider(), SchedulerConfig(max_batch_tokens=10, max_batch_items=3)
+        )
+        texts = ["a b c d", "e f g h", "i j", "k", "l", "m", "n " * 20]
+
+        batches = scheduler.pack(texts)
+
+        # Token cap closes the first batch, item cap the second; oversized texts go alone
+        assert [(b.start, len(b.texts)) for b in batches] == [(0, 3), (3, 3), (6, 1)]
+        assert [b.tokens for b in batches] == [10, 3, 20]
+
+    async def test_runs_batches_concurrently_in_order(self):
+        provider = ScriptedProvider()
+        scheduler = EmbeddingScheduler(
+            provider, SchedulerConfig(max_batch_items=2, max_concurrency=3)
+        )
+        texts = [f"t{'x' * i}" for i in range(12)]
+
+        outcome = await scheduler.embed(texts)
+
+        assert outcome.embeddings == [[float(len(t))] for t in texts]
+        assert outcome.failed == []
+        assert provider.max_active == 3
+
+    async def test_retries_only_failed_batch(self):
+        provider = ScriptedProvider({"bad": [RateLimitError()]})
+        scheduler = EmbeddingScheduler(
+            provider, SchedulerConfig(max_batch_items=2, max_concurrency=2)
+        )
+
+        outcome = await scheduler.embed(["a", "b", "bad", "c", "d", "e"])
+
+        assert outcome.failed == []
+        assert outcome.retries == 1
+        assert sum(1 for batch in provider.batches if "bad" in batch) == 2
+        assert sum(1 for batch in provider.batches if "a" in batch) == 1
+
+    async def test_rate_limit_halves_concurrency(self):
+        scheduler = EmbeddingScheduler(ScriptedProvider(), SchedulerConfig(max_concurrency=4))
+        batch = scheduler.pack(["a"])[0]
+        batch.attempts = 1
+
+        delay = scheduler._on_failure(batch, RateLimitError("3"))
+
+        assert delay == 3.0
+        assert scheduler.concurrency == 2
+
+    async def test_permanent_failure_keeps_other_chunks(self):
+        provider = ScriptedProvider({"bad": [ValueError("invalid input")]})
+        scheduler = EmbeddingScheduler(provider, SchedulerConfig(max_batch_items=2))
+
+        outcome = await scheduler.embed(["a", "b", "bad", "c", "d"])
+
+        assert outcome.failed == [2, 3]
+        assert outcome.embeddings[2:4] == [None, None]
+        assert outcome.embeddings[4] == [1.0]
+        assert "invalid input" in outcome.errors[0]
+        assert outcome.retries == 0
+
+    async def test_token_budget_paces_requests(self):
+        provider = ScriptedProvider()
+        scheduler = EmbeddingScheduler(
+            provider, SchedulerConfig(max_batch_items=1, tokens_per_minute=600)
+        )
+        # Drain the initial burst so the refill rate (10 tokens/s) is what counts
+        scheduler._budget.hit("tokens", 600)
+
+        start = time.monotonic()
+        await scheduler.embed(["one", "two"])
+
+        assert time.monotonic() - start >= 0.15
+
+    def test_retry_after_parsing(self):
+        assert retry_after(RateLimitError("2")) == 2.0
+        error = RateLimitError()
+        error.response.headers = {"retry-after-ms": "250"}
+        assert retry_after(error) == 0.25
+        assert retry_after(ValueError()) is None
+        assert is_retryable(RateLimitError())
+        assert not is_retryable(ValueError())
+
+    async def test_index_keeps_chunks_from_successful_batches(self, temp_dir):
+        from fastband.embeddings.index import SemanticIndex
+
+        for i in range(3):
+            (temp_dir / f"mod{i}.py").write_text(f"def f{i}():\n    return {i}\n")
+        provider = ScriptedProvider()
+        index = SemanticIndex(
+            provider=provider,
+            storage_path=temp_dir / "test.db",
+            scheduler=EmbeddingScheduler(provider, SchedulerConfig(max_batch_items=1)),
+        )
+        original = provider.embed
+
+        async def fail_mod1(texts):
+            if any("return 1" in t for t in texts):
+                raise ValueError("rejected")
+            return await original(texts)
+
+        provider.embed = fail_mod1
+        try:
+            result = await index.index_directory(temp_dir)
+        finally:
+            index.close()
+
+        assert not result.success
+        assert result.chunks_indexed == 2
+        assert len(result.errors) == 1
+
+
 # =============================================================================
 # CONTEXT TOOLS TESTS
 # =============================================================================
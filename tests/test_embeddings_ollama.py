@@ -0,0 +1,164 @@
+"""Tests for the Ollama embedding provider against a local stand-in server."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from fastband.embeddings.base import EmbeddingConfig
+from fastband.embeddings.providers.ollama import OllamaEmbeddings
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+class FakeOllama(ThreadingHTTPServer):
+    """Minimal Ollama embedding API: /api/embed (batch) and /api/embeddings."""
+
+    daemon_threads = True
+
+    def __init__(self, batch_api: bool = True, delay: float = 0.0):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.batch_api = batch_api
+        self.delay = delay
+        self.requests: list[tuple[str, dict]] = []
+        self.connections: set[int] = set()
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+def _vector(text: str) -> list[float]:
+    return [float(len(text)), 1.0, 0.0]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        server: FakeOllama = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.requests.append((self.path, body))
+            server.connections.add(self.client_address[1])
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            time.sleep(server.delay)
+            if self.path == "/api/embed" and server.batch_api:
+                self._reply(200, {"embeddings": [_vector(t) for t in body["input"]]})
+            elif self.path == "/api/embeddings":
+                self._reply(200, {"embedding": _vector(body["prompt"])})
+            else:
+                self._reply(404, {"error": "not found"})
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def _reply(self, status: int, payload: dict):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def serve():
+    """Start fake Ollama servers; shut them down after the test."""
+    servers = []
+
+    def start(**kwargs) -> FakeOllama:
+        server = FakeOllama(**kwargs)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def make_provider(server: FakeOllama, **extra) -> OllamaEmbeddings:
+    return OllamaEmbeddings(
+        EmbeddingConfig(base_url=server.url, model="all-minilm", batch_size=64, extra=extra)
+    )
+
+
+TEXTS = [f"text {'x' * i}" for i in range(40)]
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+class TestOllamaEmbeddings:
+    """Batching, fallback and batch-size tuning."""
+
+    async def test_batches_preserve_order(self, serve):
+        server = serve()
+        provider = make_provider(server)
+
+        result = await provider.embed(TEXTS)
+        await provider.aclose()
+
+        assert result.embeddings == [_vector(t) for t in TEXTS]
+        assert result.dimensions == 3
+        assert provider.supports_batch is True
+        assert all(path == "/api/embed" for path, _ in server.requests)
+        assert len(server.requests) < len(TEXTS)
+        # Requests reuse pooled keep-alive connections
+        assert len(server.connections) == 1
+
+    async def test_fast_batches_grow(self, serve):
+        server = serve()
+        provider = make_provider(server)
+
+        await provider.embed(TEXTS * 3)
+        await provider.aclose()
+
+        sizes = [len(body["input"]) for _, body in server.requests]
+        assert sizes[:3] == [16, 32, 64]
+
+    async def test_slow_batches_shrink(self, serve):
+        server = serve(delay=0.05)
+        provider = make_provider(server, target_batch_seconds=0.01)
+
+        await provider.embed(TEXTS)
+        await provider.aclose()
+
+        sizes = [len(body["input"]) for _, body in server.requests]
+        assert sizes[:3] == [16, 8, 4]
+
+    async def test_falls_back_to_concurrent_single_requests(self, serve):
+        server = serve(batch_api=False, delay=0.02)
+        provider = make_provider(server, concurrency=4)
+
+        result = await provider.embed(TEXTS[:12])
+        second = await provider.embed(TEXTS[:2])
+        await provider.aclose()
+
+        assert result.embeddings == [_vector(t) for t in TEXTS[:12]]
+        assert second.embeddings == [_vector(t) for t in TEXTS[:2]]
+        assert provider.supports_batch is False
+        # One probe of /api/embed, then only legacy requests
+        assert [p for p, _ in server.requests].count("/api/embed") == 1
+        assert 1 < server.max_active <= 4
+
+    async def test_empty_input(self, serve):
+        provider = make_provider(serve())
+        result = await provider.embed([])
+        assert result.embeddings == []
@@ -1,5 +1,6 @@
 """Tests for git tools."""
 
+import asyncio
 import os
 import subprocess
 import tempfile
@@ -7,6 +8,7 @@ from pathlib import Path
 
 import pytest
 
+from fastband.hub.chat import ToolExecutor
 from fastband.tools.base import ToolCategory
 from fastband.tools.git import (
     GIT_TOOLS,
@@ -14,11 +16,22 @@ from fastband.tools.git import (
     GitCommitTool,
     GitDiffTool,
     GitLogTool,
+    GitRunner,
+    GitStateCache,
     GitStatusTool,
     _get_repo_root,
     _is_git_repository,
     _run_git_command,
+    _scan_staged_files_for_secrets,
+    find_repository,
+    format_long,
+    format_short,
+    get_git_runner,
+    parse_porcelain_v2,
+    reset_git_state_cache,
 )
+from fastband.tools.git import state as git_state
+from fastband.tools.registry import ToolRegistry
 
 # =============================================================================
 # TEST FIXTURES
@@ -61,6 +74,14 @@ def temp_git_repo():
         yield repo_path
 
 
+@pytest.fixture(autouse=True)
+async def close_git_runner():
+    """Stop cat-file workers and drop cached repository state after a test."""
+    yield
+    await get_git_runner().close()
+    reset_git_state_cache()
+
+
 @pytest.fixture
 def temp_non_git_dir():
     """Create a temporary directory that is not a git repository."""
@@ -621,6 +642,347 @@ class TestGitBranchTool:
         assert "Not a git repository" in result.error
 
 
+# =============================================================================
+# GIT RUNNER TESTS
+# =============================================================================
+
+
+class TestGitRunner:
+    """Tests for the async git runner and cat-file worker."""
+
+    @pytest.mark.asyncio
+    async def test_run_returns_completed_process(self, temp_git_repo):
+        """Test run mirrors subprocess.run results and errors."""
+        runner = GitRunner()
+
+        result = await runner.run(["rev-parse", "--is-inside-work-tree"], cwd=str(temp_git_repo))
+        assert result.returncode == 0
+        assert result.stdout.strip() == "true"
+
+        with pytest.raises(subprocess.CalledProcessError) as excinfo:
+            await runner.run(["rev-parse", "no-such-ref"], cwd=str(temp_git_repo))
+        assert excinfo.value.stderr
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self, temp_git_repo, monkeypatch):
+        """Test no more than max_concurrency git processes run at once."""
+        runner = GitRunner(max_concurrency=2)
+        running = peak = 0
+        spawn = asyncio.create_subprocess_exec
+
+        async def tracked_spawn(*args, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            process = await spawn(*args, **kwargs)
+            original_communicate = process.communicate
+
+            async def communicate():
+                nonlocal running
+                try:
+                    return await original_communicate()
+                finally:
+                    running -= 1
+
+            process.communicate = communicate
+            return process
+
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", tracked_spawn)
+        await asyncio.gather(*(runner.run(["status"], cwd=str(temp_git_repo)) for _ in range(6)))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_process(self, temp_git_repo):
+        """Test a command past its timeout is killed and raises TimeoutExpired."""
+        runner = GitRunner()
+        with pytest.raises(subprocess.TimeoutExpired):
+            await runner.run(
+                ["-c", "alias.wait=!sleep 5", "wait"], cwd=str(temp_git_repo), timeout=0.2
+            )
+
+    @pytest.mark.asyncio
+    async def test_cancellation_releases_slot(self, temp_git_repo):
+        """Test cancelling a call frees its concurrency slot."""
+        runner = GitRunner(max_concurrency=1)
+        task = asyncio.create_task(
+            runner.run(["-c", "alias.wait=!sleep 5", "wait"], cwd=str(temp_git_repo))
+        )
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        result = await asyncio.wait_for(runner.run(["status"], cwd=str(temp_git_repo)), 5)
+        assert result.returncode == 0
+
+    @pytest.mark.asyncio
+    async def test_cat_file_reads_objects(self, temp_git_repo):
+        """Test the cat-file worker reads, looks up and batches objects."""
+        cat_file = GitRunner().cat_file(str(temp_git_repo))
+        try:
+            blob = await cat_file.read("HEAD:README.md")
+            assert blob.type == "blob"
+            assert blob.data == b"# Test Repository\n"
+            assert blob.size == len(blob.data)
+
+            info = await cat_file.info("HEAD")
+            assert info.type == "commit"
+            assert info.data is None
+
+            results = await cat_file.read_many(
+                ["HEAD:README.md", "HEAD:missing", "HEAD:a b", "HEAD"]
+            )
+            assert results[0].data == blob.data
+            assert results[1] is None
+            assert results[2] is None
+            assert results[3].type == "commit"
+        finally:
+            await cat_file.close()
+
+    @pytest.mark.asyncio
+    async def test_cat_file_restarts_after_exit(self, temp_git_repo):
+        """Test the worker starts a new process if the old one died."""
+        cat_file = GitRunner().cat_file(str(temp_git_repo))
+        try:
+            assert await cat_file.read("HEAD:README.md") is not None
+            cat_file._batch.process.kill()
+            await cat_file._batch.process.wait()
+
+            assert (await cat_file.read("HEAD:README.md")).data == b"# Test Repository\n"
+        finally:
+            await cat_file.close()
+
+    @pytest.mark.asyncio
+    async def test_cat_file_rejects_newlines(self, temp_git_repo):
+        """Test revisions can't inject extra requests."""
+        cat_file = GitRunner().cat_file(str(temp_git_repo))
+        with pytest.raises(ValueError):
+            await cat_file.read("HEAD\nHEAD")
+
+    @pytest.mark.asyncio
+    async def test_secret_scan_reads_staged_content(self, temp_git_repo):
+        """Test the secret scan checks what will be committed, not the working tree."""
+        config = temp_git_repo / "config.py"
+        config.write_text('API_KEY = "abcdefghijklmnopqrstuvwxyz123456"\n')
+        subprocess.run(["git", "add", "config.py"], cwd=str(temp_git_repo), check=True)
+        config.write_text("API_KEY = os.environ['API_KEY']\n")
+
+        findings = await _scan_staged_files_for_secrets(str(temp_git_repo))
+
+        assert findings["config.py"][0][0] == "API key"
+
+
+class TestStatusRendering:
+    """Tests for rendering status views from one porcelain run."""
+
+    def _status(self, repo):
+        output = subprocess.run(
+            ["git", "status", "--porcelain=v2", "--branch", "-z"],
+            cwd=str(repo),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        return parse_porcelain_v2(output)
+
+    def _git(self, repo, *args):
+        return subprocess.run(
+            ["git", *args], cwd=str(repo), capture_output=True, text=True, check=True
+        ).stdout.strip()
+
+    def test_matches_git_output(self, temp_git_repo):
+        """Test short and long views match git's own output."""
+        (temp_git_repo / "README.md").write_text("changed\n")
+        (temp_git_repo / "with space.txt").write_text("new\n")
+        (temp_git_repo / "staged.txt").write_text("staged\n")
+        subprocess.run(["git", "add", "staged.txt"], cwd=str(temp_git_repo), check=True)
+        (temp_git_repo / "untracked").mkdir()
+        (temp_git_repo / "untracked" / "file").write_text("x")
+
+        status = self._status(temp_git_repo)
+
+        assert format_short(status) == self._git(temp_git_repo, "status", "--short", "--branch")
+        assert format_long(status) == self._git(
+            temp_git_repo, "-c", "advice.statusHints=false", "status"
+        )
+
+    def test_renames(self, temp_git_repo):
+        """Test renames keep both paths."""
+        subprocess.run(["git", "mv", "README.md", "DOCS.md"], cwd=str(temp_git_repo), check=True)
+
+        status = self._status(temp_git_repo)
+
+        assert status.staged[0].path == "DOCS.md"
+        assert status.staged[0].original_path == "README.md"
+        assert "R  README.md -> DOCS.md" in format_short(status)
+
+    @pytest.mark.asyncio
+    async def test_status_tool_runs_git_once(self, temp_git_repo, monkeypatch):
+        """Test the status tool derives every view from a single git call."""
+        runner = get_git_runner()
+        calls = []
+        original_run = runner.run
+
+        async def counting_run(args, **kwargs):
+            calls.append(args)
+            return await original_run(args, **kwargs)
+
+        monkeypatch.setattr(runner, "run", counting_run)
+        result = await GitStatusTool().execute(path=str(temp_git_repo), short=True)
+
+        assert result.success is True
+        assert result.data["short_output"].startswith("## ")
+        assert result.data["human_readable"].endswith("nothing to commit, working tree clean")
+        assert len(calls) == 1
+
+
+class TestGitStateCache:
+    """Tests for the repository state cache."""
+
+    @pytest.fixture
+    def calls(self, monkeypatch):
+        """Record git commands run through the shared runner."""
+        runner = get_git_runner()
+        calls = []
+        original_run = runner.run
+
+        async def counting_run(args, **kwargs):
+            calls.append(args)
+            return await original_run(args, **kwargs)
+
+        monkeypatch.setattr(runner, "run", counting_run)
+        # Trust mtimes straight away instead of waiting out the racy window
+        monkeypatch.setattr(git_state, "RACY_WINDOW", 0)
+        return calls
+
+    def _git(self, repo, *args):
+        subprocess.run(["git", *args], cwd=str(repo), check=True, capture_output=True)
+
+    def test_find_repository(self, temp_git_repo, temp_non_git_dir):
+        """Test the repository is found from a subdirectory without running git."""
+        subdir = temp_git_repo / "src" / "pkg"
+        subdir.mkdir(parents=True)
+
+        location = find_repository(subdir)
+
+        assert location.root == str(temp_git_repo.resolve())
+        assert location.git_dir == str(temp_git_repo.resolve() / ".git")
+        assert find_repository(temp_non_git_dir) is None
+
+    def test_find_repository_linked_worktree(self, temp_git_repo):
+        """Test a linked worktree's .git file resolves to the shared refs."""
+        worktree = temp_git_repo.parent / "linked"
+        self._git(temp_git_repo, "worktree", "add", "-q", str(worktree), "-b", "linked")
+
+        location = find_repository(worktree)
+
+        assert location.root == str(worktree.resolve())
+        assert location.common_dir == str(temp_git_repo.resolve() / ".git")
+        assert GitStateCache().branch(worktree) == "linked"
+
+    @pytest.mark.asyncio
+    async def test_idle_repository_served_from_memory(self, temp_git_repo, calls):
+        """Test repeated calls on an unchanged repository don't run git."""
+        tool = GitStatusTool()
+        first = await tool.execute(path=str(temp_git_repo))
+        second = await tool.execute(path=str(temp_git_repo))
+        await GitLogTool().execute(path=str(temp_git_repo))
+        await GitLogTool().execute(path=str(temp_git_repo))
+        await GitBranchTool().execute(path=str(temp_git_repo))
+        await GitBranchTool().execute(path=str(temp_git_repo))
+
+        assert first.data == second.data
+        assert [args[0] for args in calls] == ["--no-optional-locks", "log", "branch"]
+
+    @pytest.mark.asyncio
+    async def test_changes_invalidate(self, temp_git_repo, calls):
+        """Test staging, committing and branching are seen immediately."""
+        cache = GitStateCache()
+        repo = str(temp_git_repo)
+
+        (temp_git_repo / "new.txt").write_text("new\n")
+        assert (await cache.status(repo)).untracked[0].path == "new.txt"
+
+        self._git(temp_git_repo, "add", "new.txt")
+        assert (await cache.status(repo)).staged[0].path == "new.txt"
+
+        head = await cache.head(repo)
+        self._git(temp_git_repo, "commit", "-q", "-m", "Add new")
+        assert await cache.head(repo) != head
+        assert (await cache.status(repo)).entries == []
+
+        assert "topic" not in await cache.run(repo, ["branch", "--list"])
+        self._git(temp_git_repo, "branch", "topic")
+        assert "topic" in await cache.run(repo, ["branch", "--list"])
+
+        self._git(temp_git_repo, "checkout", "-q", "topic")
+        assert cache.branch(repo) == "topic"
+
+    @pytest.mark.asyncio
+    async def test_working_tree_edits_invalidate_status(self, temp_git_repo, calls):
+        """Test new files and edits to changed files are seen by status."""
+        cache = GitStateCache()
+        repo = str(temp_git_repo)
+        (temp_git_repo / "README.md").write_text("changed\n")
+        (temp_git_repo / "docs").mkdir()
+        (temp_git_repo / "docs" / "a.md").write_text("a\n")
+        assert len((await cache.status(repo)).entries) == 2
+
+        # Reverting an edit only touches the file itself
+        (temp_git_repo / "README.md").write_text("# Test Repository\n")
+        assert [e.path for e in (await cache.status(repo)).entries] == ["docs/"]
+
+        (temp_git_repo / "docs" / "b.md").write_text("b\n")
+        (temp_git_repo / "other.txt").write_text("other\n")
+        assert [e.path for e in (await cache.status(repo)).entries] == ["docs/", "other.txt"]
+
+    @pytest.mark.asyncio
+    async def test_racy_window_not_cached(self, temp_git_repo, monkeypatch):
+        """Test nothing is memoized while the repository was just modified."""
+        monkeypatch.setattr(git_state, "RACY_WINDOW", 3600)
+        cache = GitStateCache()
+
+        await cache.head(str(temp_git_repo))
+        await cache.head(str(temp_git_repo))
+
+        assert cache.get_stats()["hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_outside_repository_not_cached(self, temp_non_git_dir):
+        """Test values outside a repository are computed every time."""
+        cache = GitStateCache()
+        computed = []
+
+        async def compute():
+            computed.append(1)
+            return len(computed)
+
+        assert await cache.memoize(temp_non_git_dir, "key", compute) == 1
+        assert await cache.memoize(temp_non_git_dir, "key", compute) == 2
+
+    @pytest.mark.asyncio
+    async def test_executor_sees_worktree_edits(self, temp_git_repo):
+        """Test status and diff through the tool executor aren't served stale."""
+        registry = ToolRegistry()
+        registry.register(GitStatusTool())
+        registry.register(GitDiffTool())
+        executor = ToolExecutor()
+        executor._tool_registry = registry
+        repo = str(temp_git_repo)
+
+        assert (await executor.execute("git_status", {"path": repo}))["result"]["is_clean"]
+        empty = await executor.execute("git_diff", {"path": repo})
+
+        (temp_git_repo / "README.md").write_text("# Edited\n")
+
+        status = await executor.execute("git_status", {"path": repo})
+        diff = await executor.execute("git_diff", {"path": repo})
+        assert not status["result"]["is_clean"]
+        assert diff["result"] != empty["result"]
+        assert "cached" not in status and "cached" not in diff
+
+
 # =============================================================================
 # TOOL EXPORTS TESTS
 # =============================================================================
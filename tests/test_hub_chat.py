@@ -0,0 +1,539 @@
+"""Tests for the Fastband Hub chat pipeline."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from fastband.hub.chat import MessagePipeline, PipelineContext, ToolExecutor
+from fastband.hub.models import ChatMessage, Conversation, HubSession, SessionConfig
+from fastband.providers.base import (
+    CompletionResponse,
+    ProviderConfig,
+    StreamEvent,
+)
+from fastband.providers.claude import ClaudeProvider
+from fastband.tools.base import (
+    Tool,
+    ToolCategory,
+    ToolDefinition,
+    ToolMetadata,
+    ToolParameter,
+    ToolResult,
+)
+from fastband.tools.recommender import ToolRecommender
+from fastband.tools.registry import ToolRegistry
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+class EchoTool(Tool):
+    """Tool that echoes its arguments."""
+
+    def __init__(self, name: str = "echo", description: str = "Echo the input back"):
+        self._name = name
+        self._description = description
+
+    @property
+    def definition(self) -> ToolDefinition:
+        return ToolDefinition(
+            metadata=ToolMetadata(
+                name=self._name,
+                description=self._description,
+                category=ToolCategory.CORE,
+            ),
+            parameters=[],
+        )
+
+    async def execute(self, **kwargs) -> ToolResult:
+        return ToolResult(success=True, data=kwargs)
+
+
+class FakeProvider:
+    """Provider that records the tools it was offered."""
+
+    def __init__(self, responses: list[CompletionResponse] | None = None):
+        self.responses = list(responses or [])
+        self.tool_batches: list[list[dict]] = []
+
+    async def complete_with_tools(self, messages, tools, **kwargs) -> CompletionResponse:
+        self.tool_batches.append(tools)
+        if self.responses:
+            return self.responses.pop(0)
+        return text_response("done")
+
+
+class StreamingProvider:
+    """Provider that replays scripted stream events, one script per round."""
+
+    def __init__(self, rounds: list[list[StreamEvent | float]]):
+        self.rounds = list(rounds)
+        self.messages: list[list[dict]] = []
+
+    async def stream_with_tools(self, messages, tools=None, **kwargs):
+        self.messages.append(list(messages))
+        for event in self.rounds.pop(0):
+            if isinstance(event, float):
+                await asyncio.sleep(event)
+            else:
+                yield event
+
+
+class SlowTool(EchoTool):
+    """Echo tool that records when it started running."""
+
+    def __init__(self, name: str = "slow"):
+        super().__init__(name, "Slow echo")
+        self.started = asyncio.Event()
+
+    async def execute(self, **kwargs) -> ToolResult:
+        self.started.set()
+        await asyncio.sleep(0.01)
+        return ToolResult(success=True, data=kwargs)
+
+
+class CountingTool(Tool):
+    """Tool that counts its runs; caching behavior set via metadata."""
+
+    def __init__(self, name: str = "counter", delay: float = 0.0, **metadata):
+        self._name = name
+        self._metadata = metadata
+        self.delay = delay
+        self.runs = 0
+
+    @property
+    def definition(self) -> ToolDefinition:
+        return ToolDefinition(
+            metadata=ToolMetadata(
+                name=self._name,
+                description="Count runs",
+                category=ToolCategory.CORE,
+                **self._metadata,
+            ),
+            parameters=[
+                ToolParameter(name="path", type="string", description="Path", required=False),
+                ToolParameter(
+                    name="limit", type="integer", description="Limit", required=False, default=5
+                ),
+            ],
+        )
+
+    async def execute(self, **kwargs) -> ToolResult:
+        self.runs += 1
+        await asyncio.sleep(self.delay)
+        if kwargs.get("path") == "fail":
+            return ToolResult(success=False, error="boom")
+        return ToolResult(success=True, data={"runs": self.runs})
+
+
+def tool_call_event(tool_id: str, name: str, arguments: str = "{}") -> StreamEvent:
+    return StreamEvent(
+        type="tool_call",
+        tool_call={
+            "id": tool_id,
+            "type": "function",
+            "function": {"name": name, "arguments": arguments},
+        },
+    )
+
+
+def text_response(content: str, tool_calls: list[dict] | None = None) -> CompletionResponse:
+    return CompletionResponse(
+        content=content,
+        model="fake",
+        provider="fake",
+        usage={"total_tokens": 10},
+        finish_reason="end_turn",
+        raw_response={"tool_calls": tool_calls} if tool_calls else None,
+    )
+
+
+@pytest.fixture
+def registry():
+    """Create a registry with a few tools."""
+    registry = ToolRegistry()
+    for i in range(3):
+        registry.register(EchoTool(f"echo_{i}"))
+    return registry
+
+
+@pytest.fixture
+def executor(registry):
+    """Create an executor bound to the test registry."""
+    executor = ToolExecutor()
+    executor._tool_registry = registry
+    return executor
+
+
+def make_context(content: str = "hello") -> PipelineContext:
+    config = SessionConfig(user_id="user", memory_enabled=False)
+    session = HubSession.create(config)
+    return PipelineContext(
+        session=session,
+        conversation=Conversation.create(session.session_id),
+        user_message=ChatMessage.user(content),
+    )
+
+
+async def run_turn(pipeline: MessagePipeline, content: str = "hello") -> ChatMessage:
+    async for message in pipeline.process(make_context(content)):
+        return message
+
+
+# =============================================================================
+# TOOL CATALOG TESTS
+# =============================================================================
+
+
+class TestToolCatalog:
+    """The pipeline reuses the registry's cached schema catalog."""
+
+    async def test_schemas_reused_across_turns(self, registry, executor):
+        provider = FakeProvider()
+        pipeline = MessagePipeline(provider, executor)
+
+        await run_turn(pipeline)
+        await run_turn(pipeline)
+
+        first, second = provider.tool_batches
+        assert first is second
+        assert [t["function"]["name"] for t in first] == ["echo_0", "echo_1", "echo_2"]
+
+    async def test_registration_refreshes_schemas(self, registry, executor):
+        provider = FakeProvider()
+        pipeline = MessagePipeline(provider, executor)
+
+        await run_turn(pipeline)
+        registry.register(EchoTool("echo_new"))
+        await run_turn(pipeline)
+
+        assert len(provider.tool_batches[1]) == 4
+
+    async def test_executions_recorded_in_registry_metrics(self, registry, executor):
+        registry.register(CountingTool())
+
+        await executor.execute("counter", {})
+        await executor.execute("counter", {"path": "fail"})
+
+        stats = registry.get_tool_stats("counter")
+        assert stats["total_executions"] == 2
+        assert stats["errors"] == 1
+        assert stats["in_flight"] == 0
+
+    async def test_tool_loop_executes_calls(self, executor):
+        provider = FakeProvider(
+            [
+                text_response(
+                    "",
+                    [{"id": "t1", "function": {"name": "echo_0", "arguments": '{"x": 1}'}}],
+                ),
+                text_response("final"),
+            ]
+        )
+        pipeline = MessagePipeline(provider, executor)
+
+        message = await run_turn(pipeline)
+
+        assert message.content == "final"
+        assert message.tokens_used == 20
+
+
+# =============================================================================
+# TOOL SELECTION TESTS
+# =============================================================================
+
+
+class TestToolSelection:
+    """Large tool sets are narrowed to the most relevant tools per turn."""
+
+    @pytest.fixture
+    def large_registry(self):
+        registry = ToolRegistry()
+        registry.register(EchoTool("read_file", "Read a file from disk"))
+        registry.register(EchoTool("list_tickets", "List open tickets"))
+        registry.register(EchoTool("git_log", "Show commit history"))
+        for i in range(20):
+            registry.register(EchoTool(f"misc_{i}", f"Unrelated helper number {i}"))
+        return registry
+
+    @pytest.fixture
+    def large_executor(self, large_registry):
+        executor = ToolExecutor()
+        executor._tool_registry = large_registry
+        executor._recommender = ToolRecommender(registry=large_registry)
+        return executor
+
+    async def test_selects_relevant_and_pinned_tools(self, large_executor):
+        provider = FakeProvider()
+        pipeline = MessagePipeline(
+            provider, large_executor, max_tools=3, pinned_tools=("read_file", "missing")
+        )
+        context = make_context("which tickets are still open?")
+
+        async for _ in pipeline.process(context):
+            pass
+
+        offered = [t["function"]["name"] for t in provider.tool_batches[0]]
+        assert offered[:2] == ["read_file", "list_tickets"]
+        assert len(offered) <= 3
+        assert context.tool_selection["tools_available"] == 23
+        assert context.tool_selection["tokens_saved"] > 0
+
+    async def test_usage_prior_fills_remaining_slots(self, large_executor):
+        await large_executor.execute("misc_7", {})
+
+        selection = large_executor.select_tools("tickets", max_tools=2)
+
+        assert selection.names == ["list_tickets", "misc_7"]
+
+    async def test_follow_up_ranks_against_history(self, large_executor):
+        provider = FakeProvider()
+        pipeline = MessagePipeline(provider, large_executor, max_tools=3, pinned_tools=())
+        context = make_context("yes, go ahead")
+        context.conversation.add_message(ChatMessage.user("which tickets are still open?"))
+
+        async for _ in pipeline.process(context):
+            pass
+
+        offered = [t["function"]["name"] for t in provider.tool_batches[0]]
+        assert offered[0] == "list_tickets"
+        assert len(offered) <= 3
+
+    async def test_no_match_falls_back(self, large_executor):
+        selection = large_executor.select_tools("yes, please go ahead", max_tools=3)
+        assert len(selection.names) == 23
+
+        selection = large_executor.select_tools(
+            "yes, please go ahead", max_tools=3, fallback=["git_log", "missing"]
+        )
+        assert selection.names == ["git_log"]
+
+    async def test_small_tool_sets_are_sent_whole(self, executor):
+        selection = executor.select_tools("anything", max_tools=10)
+
+        assert selection.tools is executor.get_available_tools()
+        assert selection.tokens_saved == 0
+
+
+# =============================================================================
+# STREAMING TESTS
+# =============================================================================
+
+
+class TestStreamingToolLoop:
+    """Tool calls run while the provider is still streaming."""
+
+    async def test_tool_starts_before_stream_ends(self, registry, executor):
+        slow = SlowTool()
+        registry.register(slow)
+        seen_during_stream = []
+
+        class ObservingProvider(StreamingProvider):
+            async def stream_with_tools(self, messages, tools=None, **kwargs):
+                async for event in super().stream_with_tools(messages, tools, **kwargs):
+                    if event.type == "done":
+                        seen_during_stream.append(slow.started.is_set())
+                    yield event
+
+        provider = ObservingProvider(
+            [
+                [
+                    StreamEvent(type="text", text="Checking. "),
+                    tool_call_event("t1", "slow", '{"x": 1}'),
+                    0.05,
+                    StreamEvent(type="done", usage={"total_tokens": 5}),
+                ],
+                [
+                    StreamEvent(type="text", text="All good."),
+                    StreamEvent(type="done", usage={"total_tokens": 7}),
+                ],
+            ]
+        )
+        pipeline = MessagePipeline(provider, executor)
+        context = make_context()
+
+        chunks = [chunk async for chunk in pipeline.process(context, stream=True)]
+
+        assert seen_during_stream[0] is True
+        assert "".join(chunks) == "Checking. \n[Tool: slow]\nAll good."
+        assert context.tokens_used == 12
+        assert context.time_to_first_token_ms is not None
+        assert context.time_to_first_token_ms <= context.processing_time_ms
+
+        follow_up = provider.messages[1]
+        assert follow_up[-2]["tool_calls"][0]["id"] == "t1"
+        assert follow_up[-1] == {"role": "tool", "tool_call_id": "t1", "content": '{"x": 1}'}
+
+    async def test_invalid_arguments_reported_to_model(self, executor):
+        provider = StreamingProvider(
+            [
+                [tool_call_event("t1", "echo_0", "{not json"), StreamEvent(type="done")],
+                [StreamEvent(type="text", text="ok"), StreamEvent(type="done")],
+            ]
+        )
+        pipeline = MessagePipeline(provider, executor)
+        context = make_context()
+
+        async for _ in pipeline.process(context, stream=True):
+            pass
+
+        assert context.tool_results[0]["success"] is False
+        assert "Invalid tool arguments" in context.tool_results[0]["error"]
+
+    async def test_providers_without_tool_streaming_use_stream(self, executor):
+        class TextStreamingProvider:
+            async def stream(self, messages, tools=None, **kwargs):
+                yield "Hel"
+                yield SimpleNamespace(
+                    content="lo",
+                    tool_calls=[{"id": "t1", "function": {"name": "echo_0", "arguments": "{}"}}],
+                )
+
+        pipeline = MessagePipeline(TextStreamingProvider(), executor)
+        context = make_context()
+
+        chunks = [chunk async for chunk in pipeline.process(context, stream=True)]
+
+        assert chunks[:2] == ["Hel", "lo"]
+        assert context.response_content == "Hello"
+        assert context.tool_results[0]["tool_name"] == "echo_0"
+        assert context.time_to_first_token_ms is not None
+
+
+class FakeStream:
+    """Async iterator over raw Anthropic stream events."""
+
+    def __init__(self, events):
+        self.events = iter(events)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self.events)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+class TestClaudeStreaming:
+    """Claude stream events are parsed into text and tool calls."""
+
+    async def test_tool_use_parsed_incrementally(self):
+        ns = SimpleNamespace
+        events = [
+            ns(type="message_start", message=ns(usage=ns(input_tokens=11))),
+            ns(type="content_block_start", index=0, content_block=ns(type="text")),
+            ns(type="content_block_delta", index=0, delta=ns(type="text_delta", text="Hi")),
+            ns(type="content_block_stop", index=0),
+            ns(
+                type="content_block_start",
+                index=1,
+                content_block=ns(type="tool_use", id="tu1", name="read_file"),
+            ),
+            ns(
+                type="content_block_delta",
+                index=1,
+                delta=ns(type="input_json_delta", partial_json='{"path": '),
+            ),
+            ns(
+                type="content_block_delta",
+                index=1,
+                delta=ns(type="input_json_delta", partial_json='"a.py"}'),
+            ),
+            ns(type="content_block_stop", index=1),
+            ns(type="message_delta", delta=ns(stop_reason="tool_use"), usage=ns(output_tokens=4)),
+        ]
+        requests = []
+
+        async def create(**params):
+            requests.append(params)
+            return FakeStream(events)
+
+        provider = ClaudeProvider(ProviderConfig(name="claude", api_key="test"))
+        provider._client = ns(messages=ns(create=create))
+
+        received = [
+            e async for e in provider.stream_with_tools([{"role": "user", "content": "hi"}])
+        ]
+
+        assert [e.type for e in received] == ["text", "tool_call", "done"]
+        assert received[1].tool_call["function"] == {
+            "name": "read_file",
+            "arguments": '{"path": "a.py"}',
+        }
+        assert received[2].usage == {
+            "prompt_tokens": 11,
+            "completion_tokens": 4,
+            "total_tokens": 15,
+        }
+        assert requests[0]["stream"] is True
+
+
+# =============================================================================
+# RESULT CACHE TESTS
+# =============================================================================
+
+
+class TestResultCache:
+    """Cacheable tools are memoized per executor."""
+
+    @pytest.fixture
+    def cached_tool(self, registry):
+        tool = CountingTool(cacheable=True, cache_state=["files"])
+        registry.register(tool)
+        return tool
+
+    async def test_repeat_call_is_served_from_cache(self, registry, executor, cached_tool):
+        first = await executor.execute("counter", {"path": "a.txt"})
+        # Defaults are filled in before keying
+        second = await executor.execute("counter", {"limit": 5, "path": "a.txt"})
+
+        assert cached_tool.runs == 1
+        assert second["result"] == first["result"]
+        assert second["cached"] is True
+        stats = registry.get_tool_stats("counter")
+        assert (stats["cache_hits"], stats["cache_misses"]) == (1, 1)
+        assert stats["total_executions"] == 1
+
+    async def test_file_change_busts_cache(self, executor, cached_tool, tmp_path):
+        target = tmp_path / "notes.txt"
+        target.write_text("one")
+        await executor.execute("counter", {"path": str(target)})
+
+        target.write_text("one two")
+        await executor.execute("counter", {"path": str(target)})
+
+        assert cached_tool.runs == 2
+
+    async def test_concurrent_calls_share_one_run(self, registry, executor):
+        tool = CountingTool(delay=0.02, cacheable=True)
+        registry.register(tool)
+
+        results = await asyncio.gather(*(executor.execute("counter", {}) for _ in range(5)))
+
+        assert tool.runs == 1
+        assert all(r["success"] for r in results)
+        assert registry.get_tool_stats("counter")["cache_hits"] == 4
+
+    async def test_failures_and_uncacheable_tools_rerun(self, registry, executor, cached_tool):
+        registry.register(CountingTool("plain"))
+
+        await executor.execute("counter", {"path": "fail"})
+        await executor.execute("counter", {"path": "fail"})
+        await executor.execute("plain", {})
+        await executor.execute("plain", {})
+
+        assert cached_tool.runs == 2
+        assert registry.get_available("plain").runs == 2
+
+    async def test_side_effects_invalidate(self, registry, executor, cached_tool):
+        registry.register(CountingTool("writer", side_effects=True))
+
+        await executor.execute("counter", {})
+        await executor.execute("writer", {})
+        await executor.execute("counter", {})
+
+        assert cached_tool.runs == 2
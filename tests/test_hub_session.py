@@ -4,6 +4,7 @@ from datetime import datetime, timedelta, timezone
 
 import pytest
 
+from fastband.core.timer_wheel import TimerWheel
 from fastband.hub.models import (
     ConversationStatus,
     SessionConfig,
@@ -114,15 +115,34 @@ class TestSessionManager:
         config = SessionConfig(user_id="user123", tier=SubscriptionTier.FREE)
         await manager.create_session(config)
 
-        # Manually set usage to exceed limits
-        if "user123" in manager._usage_stats:
-            manager._usage_stats["user123"].messages_this_minute = 100
-            manager._usage_stats["user123"].last_message_at = datetime.now(timezone.utc)
+        # Use up the FREE tier's per-minute allowance
+        for _ in range(5):
+            manager.record_message("user123")
 
         allowed, message = manager.check_rate_limit("user123")
         assert allowed is False
         assert message is not None
         assert "rate limit" in message.lower() or "limit" in message.lower()
+        assert manager.get_usage_stats("user123").messages_this_minute == 5
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_does_not_reset_on_minute_boundary(self, manager):
+        """Bursts straddling a minute boundary still count against the limit."""
+        config = SessionConfig(user_id="user123", tier=SubscriptionTier.FREE)
+        await manager.create_session(config)
+
+        clock = [59.0]
+        manager._message_limiter._clock = lambda: clock[0]
+        for _ in range(5):
+            manager.record_message("user123")
+
+        clock[0] = 61.0  # Next fixed window, but only 2s later
+        allowed, _ = manager.check_rate_limit("user123")
+        assert allowed is False
+
+        clock[0] = 119.0  # A full minute after the burst
+        allowed, _ = manager.check_rate_limit("user123")
+        assert allowed is True
 
 
 class TestSessionManagerConversations:
@@ -252,6 +272,106 @@ class TestCleanupIdleSessions:
         assert count >= 1
         assert manager.get_session(session_id) is None
 
+    @pytest.mark.asyncio
+    async def test_cleanup_reschedules_touched_sessions(self):
+        """Sessions active since they were scheduled are not terminated."""
+        manager = SessionManager(max_sessions=10, idle_timeout_minutes=1)
+        stale = await manager.create_session(SessionConfig(user_id="stale"))
+        fresh = await manager.create_session(SessionConfig(user_id="fresh"))
+        stale.last_activity -= timedelta(minutes=5)
+
+        # Pretend the wheel reached both deadlines
+        manager._expiry.schedule(stale.session_id, 0)
+        manager._expiry.schedule(fresh.session_id, 0)
+
+        assert await manager.cleanup_idle_sessions() == 1
+        assert manager.get_session(stale.session_id) is None
+        assert manager.get_session(fresh.session_id) is fresh
+        assert fresh.session_id in manager._expiry
+
+
+class TestShardedSessions:
+    """Test sharding, capacity and eviction."""
+
+    @pytest.mark.asyncio
+    async def test_capacity_is_global_across_shards(self):
+        """Test max_sessions counts sessions in every shard."""
+        manager = SessionManager(max_sessions=3, shards=4)
+        sessions = [await manager.create_session(SessionConfig(user_id=f"u{i}")) for i in range(3)]
+
+        with pytest.raises(ValueError, match="Maximum sessions"):
+            await manager.create_session(SessionConfig(user_id="overflow"))
+
+        await manager.terminate_session(sessions[1].session_id)
+        await manager.create_session(SessionConfig(user_id="overflow"))
+        assert manager.get_stats()["total_sessions"] == 3
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_active(self):
+        """Test eviction takes the longest-inactive session past the timeout."""
+        manager = SessionManager(max_sessions=3, idle_timeout_minutes=5, shards=4)
+        sessions = [await manager.create_session(SessionConfig(user_id=f"u{i}")) for i in range(3)]
+        sessions[1].last_activity -= timedelta(minutes=10)
+        sessions[2].last_activity -= timedelta(minutes=20)
+
+        await manager.create_session(SessionConfig(user_id="new"))
+
+        assert manager.get_session(sessions[2].session_id) is None
+        assert manager.get_session(sessions[1].session_id) is sessions[1]
+        assert sessions[2].status == SessionStatus.TERMINATED
+
+    @pytest.mark.asyncio
+    async def test_get_session_by_user_returns_latest(self):
+        """Test the per-user index finds the most recently active session."""
+        manager = SessionManager(shards=4)
+        first = await manager.create_session(SessionConfig(user_id="user1"))
+        second = await manager.create_session(SessionConfig(user_id="user1"))
+        first.touch()
+
+        assert manager.get_session_by_user("user1") is first
+        await manager.terminate_session(first.session_id)
+        assert manager.get_session_by_user("user1") is second
+        await manager.terminate_session(second.session_id)
+        assert manager.get_session_by_user("user1") is None
+
+
+class TestTimerWheel:
+    """Test the hierarchical timer wheel."""
+
+    def test_fires_at_deadline(self):
+        wheel = TimerWheel(tick_seconds=1.0, slots=4, levels=3, now=0)
+        wheel.schedule("a", 2.5)
+        wheel.schedule("b", 30)  # Two levels up
+
+        assert wheel.advance(1) == []
+        assert wheel.advance(2) == ["a"]
+        assert wheel.advance(29) == []
+        assert wheel.advance(30) == ["b"]
+        assert len(wheel) == 0
+
+    def test_deadlines_beyond_range_are_kept(self):
+        wheel = TimerWheel(tick_seconds=1.0, slots=4, levels=2, now=0)
+        wheel.schedule("far", 100)  # Wheel covers 16 ticks
+
+        assert wheel.advance(99) == []
+        assert wheel.advance(100) == ["far"]
+
+    def test_cancel_and_reschedule(self):
+        wheel = TimerWheel(tick_seconds=1.0, now=0)
+        wheel.schedule("a", 5)
+        wheel.schedule("b", 5)
+        assert wheel.cancel("a")
+        assert not wheel.cancel("a")
+        wheel.schedule("b", 10)
+
+        assert wheel.advance(5) == []
+        assert wheel.advance(10) == ["b"]
+
+    def test_past_deadline_fires_on_next_advance(self):
+        wheel = TimerWheel(tick_seconds=1.0, now=10)
+        wheel.schedule("late", 3)
+        assert wheel.advance(10) == ["late"]
+
 
 class TestGetSessionManager:
     """Test global session manager singleton."""
@@ -0,0 +1,517 @@
+"""Tests for the Redis session store, run against an in-memory fake Redis."""
+
+import asyncio
+import fnmatch
+import sys
+import types
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from fastband.hub.models import (
+    ChatMessage,
+    Conversation,
+    HubSession,
+    MessageRole,
+    ModelMode,
+    SessionConfig,
+    SessionStatus,
+    SubscriptionTier,
+    ToolCall,
+    UsageStats,
+)
+from fastband.hub.session_redis import (
+    INCREMENT_USAGE_SCRIPT,
+    RedisSessionConfig,
+    RedisSessionManager,
+    _dumps,
+    _load_conversation,
+    _load_session,
+    _usage_from_hash,
+    _usage_to_hash,
+)
+
+# =============================================================================
+# FAKE REDIS
+# =============================================================================
+
+
+class FakeServer:
+    """Shared keyspace and pub/sub bus for several FakeRedis clients."""
+
+    def __init__(self):
+        self.data: dict = {}
+        self.ttls: dict[str, int] = {}
+        self.subscribers: dict[str, list[asyncio.Queue]] = {}
+
+
+class FakeRedis:
+    """The subset of redis.asyncio (decode_responses=True) used by the store."""
+
+    def __init__(self, server: FakeServer | None = None):
+        self.server = server or FakeServer()
+        self.commands: list[str] = []
+
+    @property
+    def data(self) -> dict:
+        return self.server.data
+
+    def _log(self, name: str) -> None:
+        self.commands.append(name)
+
+    async def ping(self):
+        return True
+
+    # Strings
+
+    async def get(self, key):
+        self._log("get")
+        value = self.data.get(key)
+        return None if value is None else str(value)
+
+    async def getex(self, key, ex=None):
+        self._log("getex")
+        if key in self.data and ex is not None:
+            self.server.ttls[key] = ex
+        return await self.get(key)
+
+    async def mget(self, *keys):
+        self._log("mget")
+        if len(keys) == 1 and isinstance(keys[0], list):
+            keys = keys[0]
+        return [None if self.data.get(k) is None else str(self.data[k]) for k in keys]
+
+    async def setex(self, key, seconds, value):
+        self._log("setex")
+        self.data[key] = value
+        self.server.ttls[key] = seconds
+        return True
+
+    async def incrby(self, key, amount):
+        self.data[key] = int(self.data.get(key, 0)) + amount
+        return self.data[key]
+
+    async def incr(self, key):
+        return await self.incrby(key, 1)
+
+    async def decrby(self, key, amount):
+        return await self.incrby(key, -amount)
+
+    # Keys
+
+    async def expire(self, key, seconds):
+        self.server.ttls[key] = seconds
+        return key in self.data
+
+    async def exists(self, *keys):
+        return sum(1 for k in keys if k in self.data)
+
+    async def delete(self, *keys):
+        removed = 0
+        for key in keys:
+            removed += self.data.pop(key, None) is not None
+        return removed
+
+    async def scan(self, cursor, match="*", count=10):
+        return 0, [k for k in self.data if fnmatch.fnmatch(k, match)]
+
+    # Sets
+
+    async def sadd(self, key, *members):
+        self.data.setdefault(key, set()).update(members)
+
+    async def srem(self, key, *members):
+        self.data.get(key, set()).difference_update(members)
+
+    async def smembers(self, key):
+        self._log("smembers")
+        return set(self.data.get(key, set()))
+
+    # Hashes
+
+    async def hset(self, key, field=None, value=None, mapping=None):
+        h = self.data.setdefault(key, {})
+        if field is not None:
+            h[field] = str(value)
+        for k, v in (mapping or {}).items():
+            h[k] = str(v)
+
+    async def hsetnx(self, key, field, value):
+        h = self.data.setdefault(key, {})
+        if field in h:
+            return 0
+        h[field] = str(value)
+        return 1
+
+    async def hget(self, key, field):
+        return self.data.get(key, {}).get(field)
+
+    async def hgetall(self, key):
+        self._log("hgetall")
+        return dict(self.data.get(key, {}))
+
+    # Scripts
+
+    def register_script(self, script):
+        assert script == INCREMENT_USAGE_SCRIPT
+
+        async def run(keys, args):
+            self._log("evalsha")
+            # Python rendering of INCREMENT_USAGE_SCRIPT
+            h = self.data.get(keys[0])
+            if h is None:
+                return None
+            now, messages, tokens, next_reset = args
+            if h.get("reset_at") and float(now) >= float(h["reset_at"]):
+                h.update(messages_today="0", tokens_used_today="0", reset_at=str(next_reset))
+            h["messages_today"] = str(int(h.get("messages_today", 0)) + int(messages))
+            h["tokens_used_today"] = str(int(h.get("tokens_used_today", 0)) + int(tokens))
+            if int(messages) > 0:
+                h["last_message_at"] = str(now)
+            return [x for kv in h.items() for x in kv]
+
+        return run
+
+    # Pub/sub
+
+    async def publish(self, channel, message):
+        queues = self.server.subscribers.get(channel, [])
+        for queue in queues:
+            queue.put_nowait({"type": "message", "channel": channel, "data": message})
+        return len(queues)
+
+    def pubsub(self):
+        return FakePubSub(self.server)
+
+    def pipeline(self, transaction=True):
+        self._log("pipeline")
+        return FakePipeline(self)
+
+    async def close(self):
+        pass
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        # Queued commands are not round-trips of their own
+        commands = self.redis.commands
+        self.redis.commands = []
+        try:
+            return [
+                await getattr(self.redis, name)(*args, **kwargs)
+                for name, args, kwargs in self.calls
+            ]
+        finally:
+            self.redis.commands = commands
+
+
+class FakePubSub:
+    def __init__(self, server: FakeServer):
+        self.server = server
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.channels: list[str] = []
+
+    async def subscribe(self, channel):
+        self.channels.append(channel)
+        self.server.subscribers.setdefault(channel, []).append(self.queue)
+
+    async def listen(self):
+        while True:
+            yield await self.queue.get()
+
+    async def reset(self):
+        for channel in self.channels:
+            self.server.subscribers[channel].remove(self.queue)
+        self.channels.clear()
+
+
+@pytest.fixture
+def fake_redis_module(monkeypatch):
+    """Route redis.asyncio.from_url to FakeRedis clients on one server."""
+    server = FakeServer()
+    module = types.ModuleType("redis.asyncio")
+    module.from_url = lambda *args, **kwargs: FakeRedis(server)
+    monkeypatch.setitem(sys.modules, "redis", types.ModuleType("redis"))
+    monkeypatch.setitem(sys.modules, "redis.asyncio", module)
+    return server
+
+
+async def make_manager(**kwargs) -> RedisSessionManager:
+    manager = RedisSessionManager(RedisSessionConfig(redis_url="redis://fake", **kwargs))
+    assert await manager.initialize()
+    return manager
+
+
+async def settle() -> None:
+    """Let pub/sub listeners process queued messages."""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+# =============================================================================
+# SERIALIZATION
+# =============================================================================
+
+
+class TestSerialization:
+    """Dataclass models survive the JSON and hash codecs."""
+
+    def test_session_round_trip(self):
+        config = SessionConfig(
+            user_id="u1",
+            tier=SubscriptionTier.PRO,
+            model_mode=ModelMode.FIXED,
+            tools_enabled=["read"],
+        )
+        session = HubSession.create(config)
+        session.metadata["k"] = "v"
+
+        restored = _load_session(_dumps(session))
+
+        assert restored == session
+        assert restored.config.tier is SubscriptionTier.PRO
+        assert isinstance(restored.status, SessionStatus)
+
+    def test_conversation_round_trip(self):
+        conversation = Conversation.create("s1", title="Chat")
+        conversation.messages.append(
+            ChatMessage(
+                message_id="m1",
+                role=MessageRole.ASSISTANT,
+                content="hi",
+                tool_calls=[ToolCall(tool_id="t1", tool_name="read", arguments={"p": 1})],
+            )
+        )
+
+        assert _load_conversation(_dumps(conversation)) == conversation
+
+    def test_usage_hash_round_trip(self):
+        usage = UsageStats(
+            user_id="u1",
+            tier=SubscriptionTier.FREE,
+            messages_today=3,
+            reset_at=datetime(2030, 1, 1, tzinfo=timezone.utc),
+        )
+
+        encoded = {k: str(v) for k, v in _usage_to_hash(usage).items()}
+
+        assert _usage_from_hash(encoded) == usage
+
+
+# =============================================================================
+# SESSIONS
+# =============================================================================
+
+
+class TestRedisSessions:
+    """Session CRUD over the fake Redis."""
+
+    async def test_create_and_get(self, fake_redis_module):
+        manager = await make_manager(near_cache_ttl=0)
+        session = await manager.create_session(SessionConfig(user_id="u1"))
+
+        fetched = await manager.get_session(session.session_id)
+
+        assert fetched.session_id == session.session_id
+        assert fetched.config.user_id == "u1"
+        assert await manager.get_usage("u1") is not None
+        await manager.close()
+
+    async def test_get_session_by_user_uses_one_mget(self, fake_redis_module):
+        manager = await make_manager(near_cache_ttl=0)
+        first = await manager.create_session(SessionConfig(user_id="u1"))
+        second = await manager.create_session(SessionConfig(user_id="u1"))
+        for session, minutes in ((first, 5), (second, 1)):
+            session.status = SessionStatus.ACTIVE
+            await manager.update_session(session)
+            raw = _load_session(fake_redis_module.data[manager._session_key(session.session_id)])
+            raw.last_activity -= timedelta(minutes=minutes)
+            fake_redis_module.data[manager._session_key(session.session_id)] = _dumps(raw)
+        fake_redis_module.data[manager._user_sessions_key("u1")].add("gone")
+
+        manager._redis.commands.clear()
+        latest = await manager.get_session_by_user("u1")
+
+        assert latest.session_id == second.session_id
+        assert manager._redis.commands.count("mget") == 1
+        assert "get" not in manager._redis.commands
+        # Expired references are pruned
+        assert "gone" not in fake_redis_module.data[manager._user_sessions_key("u1")]
+        await manager.close()
+
+    async def test_terminate_session(self, fake_redis_module):
+        manager = await make_manager()
+        session = await manager.create_session(SessionConfig(user_id="u1"))
+        await manager.add_conversation(session.session_id, Conversation.create(session.session_id))
+
+        await manager.terminate_session(session.session_id)
+
+        assert fake_redis_module.ttls[manager._session_key(session.session_id)] == 60
+        terminated = await manager.get_session(session.session_id)
+        assert terminated.status == SessionStatus.TERMINATED
+        assert not fake_redis_module.data[manager._user_sessions_key("u1")]
+        assert await manager.get_all_conversations(session.session_id) == []
+        await manager.close()
+
+    async def test_conversations(self, fake_redis_module):
+        manager = await make_manager()
+        session = await manager.create_session(SessionConfig(user_id="u1"))
+        conversation = Conversation.create(session.session_id, title="First")
+        conversation.add_message(
+            ChatMessage(message_id="m1", role=MessageRole.USER, content="hello")
+        )
+
+        await manager.add_conversation(session.session_id, conversation)
+
+        fetched = await manager.get_conversation(session.session_id, conversation.conversation_id)
+        assert fetched == conversation
+        assert len(await manager.get_all_conversations(session.session_id)) == 1
+        await manager.close()
+
+    async def test_cleanup_expired_user_sessions(self, fake_redis_module):
+        manager = await make_manager()
+        session = await manager.create_session(SessionConfig(user_id="u1"))
+        await manager.create_session(SessionConfig(user_id="u1"))
+        del fake_redis_module.data[manager._session_key(session.session_id)]
+
+        assert await manager.cleanup_expired_user_sessions("u1") == 1
+        assert len(fake_redis_module.data[manager._user_sessions_key("u1")]) == 1
+        await manager.close()
+
+
+class TestNearCache:
+    """Local session cache and cross-instance invalidation."""
+
+    async def test_cached_reads_skip_redis(self, fake_redis_module):
+        manager = await make_manager()
+        session = await manager.create_session(SessionConfig(user_id="u1"))
+
+        manager._redis.commands.clear()
+        for _ in range(5):
+            assert (await manager.get_session(session.session_id)) is not None
+
+        assert manager._redis.commands == []
+        stats = await manager.get_stats()
+        assert stats["near_cache"]["hits"] == 5
+        assert stats["active_sessions"] == 1
+        await manager.close()
+
+    async def test_activity_is_written_back_after_touch_interval(self, fake_redis_module):
+        manager = await make_manager(touch_interval=60)
+        session = await manager.create_session(SessionConfig(user_id="u1"))
+        entry = manager._near_cache.get(session.session_id)
+        entry.persisted_activity -= timedelta(minutes=2)
+
+        manager._redis.commands.clear()
+        await manager.get_session(session.session_id)
+        await manager.get_session(session.session_id)
+
+        assert manager._redis.commands == ["setex"]
+        await manager.close()
+
+    async def test_updates_invalidate_other_instances(self, fake_redis_module):
+        a = await make_manager()
+        b = await make_manager()
+        session = await a.create_session(SessionConfig(user_id="u1"))
+        assert (await b.get_session(session.session_id)).metadata == {}
+
+        session.metadata["title"] = "renamed"
+        await a.update_session(session)
+        await settle()
+
+        assert (await b.get_session(session.session_id)).metadata == {"title": "renamed"}
+        # The writer's own cache stays warm
+        assert session.session_id in a._near_cache._entries
+        await a.close()
+        await b.close()
+
+    async def test_termination_invalidates_other_instances(self, fake_redis_module):
+        a = await make_manager()
+        b = await make_manager()
+        session = await a.create_session(SessionConfig(user_id="u1"))
+        await b.get_session(session.session_id)
+
+        await a.terminate_session(session.session_id)
+        await settle()
+
+        fetched = await b.get_session(session.session_id)
+        assert fetched.status == SessionStatus.TERMINATED
+        await a.close()
+        await b.close()
+
+    async def test_close_unsubscribes(self, fake_redis_module):
+        manager = await make_manager()
+        await manager.close()
+
+        assert manager._listener is None
+        assert not any(fake_redis_module.subscribers.values())
+
+
+# =============================================================================
+# USAGE & RATE LIMITING
+# =============================================================================
+
+
+class TestUsage:
+    """Atomic usage counters."""
+
+    async def test_increment_usage(self, fake_redis_module):
+        manager = await make_manager()
+        await manager.create_session(SessionConfig(user_id="u1"))
+
+        await manager.increment_usage("u1", messages=1, tokens=100)
+        usage = await manager.increment_usage("u1", messages=1, tokens=50)
+
+        assert usage.messages_today == 2
+        assert usage.tokens_used_today == 150
+        assert usage.last_message_at is not None
+        await manager.close()
+
+    async def test_increment_rolls_over_daily_counters(self, fake_redis_module):
+        manager = await make_manager()
+        await manager.create_session(SessionConfig(user_id="u1"))
+        await manager.increment_usage("u1", messages=3, tokens=300)
+        usage = await manager.get_usage("u1")
+        usage.reset_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        await manager.update_usage(usage)
+
+        usage = await manager.increment_usage("u1", messages=1, tokens=10)
+
+        assert usage.messages_today == 1
+        assert usage.tokens_used_today == 10
+        assert usage.reset_at > datetime.now(timezone.utc)
+        await manager.close()
+
+    async def test_increment_unknown_user(self, fake_redis_module):
+        manager = await make_manager()
+        assert await manager.increment_usage("nobody", messages=1) is None
+        await manager.close()
+
+    async def test_session_manager_limits_messages(self, fake_redis_module):
+        manager = await make_manager()
+        await manager.create_session(SessionConfig(user_id="user1"))
+
+        for _ in range(5):
+            allowed, _ = await manager.check_rate_limit("user1", SubscriptionTier.FREE)
+            assert allowed
+            await manager.record_message("user1", SubscriptionTier.FREE)
+
+        allowed, reason = await manager.check_rate_limit("user1", SubscriptionTier.FREE)
+        assert allowed is False
+        assert "rate limit" in reason.lower()
+        # A higher tier has more room
+        allowed, _ = await manager.check_rate_limit("user1", SubscriptionTier.PRO)
+        assert allowed is True
+        assert (await manager.get_usage("user1")).messages_today == 5
+        await manager.close()
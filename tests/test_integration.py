@@ -0,0 +1,266 @@
+"""Tests for the cross-tool integration analysis graph."""
+
+import asyncio
+import time
+
+import pytest
+
+import fastband.tools.documentation as documentation
+import fastband.tools.integration as integration
+import fastband.tools.quality as quality
+import fastband.tools.security as security
+from fastband.tools.integration import (
+    ANALYSES,
+    Analysis,
+    AnalysisRun,
+    analysis_scope,
+    deploy_with_security_check,
+    security_quality_hotspots,
+    smart_recommendations,
+)
+
+
+def _counted(calls: list, name: str, result, delay: float = 0.0):
+    """Build a coroutine function that records calls and sleeps for delay."""
+
+    async def func(*args, **kwargs):
+        calls.append(name)
+        await asyncio.sleep(delay)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    return func
+
+
+# =============================================================================
+# ANALYSIS RUN TESTS
+# =============================================================================
+
+
+class TestAnalysisRun:
+    """Tests for running analysis nodes."""
+
+    @pytest.mark.asyncio
+    async def test_gather_runs_concurrently(self):
+        """Test independent nodes take as long as the slowest one."""
+        calls = []
+        run = AnalysisRun()
+        start = time.monotonic()
+
+        results = await run.gather(
+            {
+                "a": Analysis.of(_counted(calls, "a", 1, delay=0.2)),
+                "b": Analysis.of(_counted(calls, "b", 2, delay=0.2)),
+                "c": Analysis.of(_counted(calls, "c", 3, delay=0.2)),
+            }
+        )
+
+        assert results == {"a": 1, "b": 2, "c": 3}
+        assert time.monotonic() - start < 0.5
+        await run.close()
+
+    @pytest.mark.asyncio
+    async def test_same_node_runs_once(self):
+        """Test equal declarations share one execution."""
+        calls = []
+        func = _counted(calls, "scan", {"ok": True}, delay=0.05)
+        run = AnalysisRun()
+
+        first, second = await asyncio.gather(
+            run.result(Analysis.of(func, "full")),
+            run.result(Analysis.of(func, "full")),
+        )
+        await run.result(Analysis.of(func, "quick"))
+
+        assert first is second
+        assert calls == ["scan", "scan"]
+        await run.close()
+
+    @pytest.mark.asyncio
+    async def test_dependencies_passed_as_keywords(self):
+        """Test a node receives its dependencies' results."""
+
+        async def base():
+            return 20
+
+        async def total(offset, value):
+            return value + offset
+
+        run = AnalysisRun()
+        node = Analysis.of(total, 1, deps={"value": Analysis.of(base)})
+
+        assert await run.result(node) == 21
+        await run.close()
+
+    @pytest.mark.asyncio
+    async def test_timeout(self):
+        """Test a slow node fails with TimeoutError without holding up others."""
+        calls = []
+        run = AnalysisRun()
+
+        results = await run.gather(
+            {
+                "slow": Analysis.of(_counted(calls, "slow", 1, delay=5), timeout=0.05),
+                "fast": Analysis.of(_counted(calls, "fast", 2)),
+            },
+            return_exceptions=True,
+        )
+
+        assert isinstance(results["slow"], asyncio.TimeoutError)
+        assert results["fast"] == 2
+        await run.close()
+
+    @pytest.mark.asyncio
+    async def test_failure_raised_or_returned(self):
+        """Test failures raise by default and are returned on request."""
+        run = AnalysisRun()
+        node = Analysis.of(_counted([], "bad", ValueError("boom")))
+
+        with pytest.raises(ValueError):
+            await run.gather({"bad": node})
+        results = await run.gather({"bad": node}, return_exceptions=True)
+
+        assert isinstance(results["bad"], ValueError)
+        await run.close()
+
+    @pytest.mark.asyncio
+    async def test_blocking_nodes_run_in_threads(self, monkeypatch):
+        """Test shared nodes that block overlap and still time out."""
+
+        def blocking(result, delay):
+            async def func():
+                time.sleep(delay)
+                return result
+
+            return func
+
+        monkeypatch.setattr(documentation, "docs_check", blocking({"complete": True}, 0.3))
+        monkeypatch.setattr(documentation, "docs_coverage", blocking({"coverage": 80}, 0.3))
+        run = AnalysisRun()
+
+        start = time.monotonic()
+        results = await run.gather(integration.shared("docs_check", "docs_coverage"))
+        assert time.monotonic() - start < 0.5
+        assert results == {"docs_check": {"complete": True}, "docs_coverage": {"coverage": 80}}
+
+        monkeypatch.setattr(documentation, "docs_check", blocking({}, 1.0))
+        start = time.monotonic()
+        with pytest.raises(asyncio.TimeoutError):
+            await AnalysisRun().result(Analysis.of(integration._docs_check, timeout=0.1))
+        assert time.monotonic() - start < 0.5
+        await run.close()
+
+
+# =============================================================================
+# SCOPE TESTS
+# =============================================================================
+
+
+class TestAnalysisScope:
+    """Tests for request-scoped memoization."""
+
+    @pytest.mark.asyncio
+    async def test_nested_scopes_share_run(self):
+        """Test a nested scope reuses the enclosing run."""
+        async with analysis_scope() as outer:
+            async with analysis_scope() as inner:
+                assert inner is outer
+
+        async with analysis_scope() as later:
+            assert later is not outer
+
+    @pytest.mark.asyncio
+    async def test_scope_cancels_unfinished_nodes(self):
+        """Test nodes still running when the request ends are cancelled."""
+        cancelled = asyncio.Event()
+
+        async def hang():
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async with analysis_scope() as run:
+            run.start(Analysis.of(hang))
+            await asyncio.sleep(0)
+
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_composites_share_analyses(self, monkeypatch):
+        """Test composites under one scope run the shared security scan once."""
+        calls = []
+        monkeypatch.setattr(
+            security,
+            "security_scan",
+            _counted(calls, "security_scan", {"vulnerabilities": {}}, delay=0.05),
+        )
+        monkeypatch.setattr(
+            quality, "code_quality_analyze", _counted(calls, "quality", {"issues": []})
+        )
+
+        async def no_staged_files():
+            return await integration.security_precommit_check(staged_files=[])
+
+        monkeypatch.setitem(ANALYSES, "precommit", Analysis.of(no_staged_files))
+
+        async with analysis_scope():
+            deploy = await deploy_with_security_check()
+            hotspots = await security_quality_hotspots()
+
+        assert deploy["can_deploy"] is True
+        assert hotspots["total_hotspots"] == 0
+        assert calls.count("security_scan") == 1
+        assert calls.count("quality") == 1
+
+
+# =============================================================================
+# COMPOSITE TESTS
+# =============================================================================
+
+
+class TestSmartRecommendations:
+    """Tests for smart_recommendations on the analysis graph."""
+
+    @pytest.mark.asyncio
+    async def test_runs_analyses_concurrently(self, monkeypatch):
+        """Test the call takes as long as its slowest analysis, not the sum."""
+        calls = []
+        delay = 0.2
+        monkeypatch.setattr(
+            security,
+            "security_scan",
+            _counted(calls, "security", {"vulnerabilities": {}, "secrets_found": 2}, delay),
+        )
+        monkeypatch.setattr(
+            quality, "code_quality_analyze", _counted(calls, "quality", {"score": 90}, delay)
+        )
+        monkeypatch.setattr(
+            documentation, "docs_check", _counted(calls, "docs", {"complete": True}, delay)
+        )
+        monkeypatch.setattr(
+            documentation,
+            "docs_coverage",
+            _counted(calls, "coverage", {"coverage_percentage": 80}, delay),
+        )
+        monkeypatch.setitem(
+            ANALYSES,
+            "deps_audit",
+            Analysis.of(_counted(calls, "audit", {"vulnerability_count": 0}, delay)),
+        )
+        monkeypatch.setitem(
+            ANALYSES,
+            "deps_outdated",
+            Analysis.of(_counted(calls, "outdated", RuntimeError("no network"), delay)),
+        )
+
+        start = time.monotonic()
+        result = await smart_recommendations()
+        elapsed = time.monotonic() - start
+
+        assert elapsed < delay * 3
+        assert len(calls) == 6
+        assert result["analyses_run"] == ["security", "quality", "documentation"]
+        assert result["next_action"] == "Remove exposed secrets"
@@ -0,0 +1,140 @@
+"""Tests for the shared file inventory."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from fastband.core.inventory import (
+    FileInventory,
+    get_file_inventory,
+    invalidate_file_inventory,
+)
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for testing."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture
+def project(temp_dir):
+    """Create a small project tree with a .gitignore."""
+    (temp_dir / ".gitignore").write_text("build/\n*.log\n!keep.log\n/local.cfg\n")
+    (temp_dir / "src" / "pkg").mkdir(parents=True)
+    (temp_dir / "src" / "app.py").write_text("print('hi')\n")
+    (temp_dir / "src" / "pkg" / "util.py").write_text("x = 1\n")
+    (temp_dir / "src" / "pkg" / "index.ts").write_text("export {}\n")
+    (temp_dir / "src" / "local.cfg").write_text("nested, not anchored\n")
+    (temp_dir / "build").mkdir()
+    (temp_dir / "build" / "out.py").write_text("x = 2\n")
+    (temp_dir / "debug.log").write_text("log\n")
+    (temp_dir / "keep.log").write_text("log\n")
+    (temp_dir / "local.cfg").write_text("anchored\n")
+    (temp_dir / ".github").mkdir()
+    (temp_dir / ".github" / "ci.yml").write_text("on: push\n")
+    (temp_dir / ".git").mkdir()
+    (temp_dir / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+    yield temp_dir
+    invalidate_file_inventory()
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+class TestWalk:
+    """Tests for building the inventory."""
+
+    def test_honors_gitignore(self, project):
+        inventory = FileInventory(project)
+        files = set(inventory.files())
+
+        assert "src/app.py" in files
+        assert "keep.log" in files
+        assert "src/local.cfg" in files
+        assert "debug.log" not in files
+        assert "local.cfg" not in files
+        # Ignored directories and VCS metadata are never walked
+        assert not any(f.startswith(("build/", ".git/")) for f in inventory.paths)
+
+    def test_ignored_files_are_flagged(self, project):
+        inventory = FileInventory(project)
+        ignored = {e.path for e in inventory.entries(include_ignored=True) if e.ignored}
+        assert ignored == {"debug.log", "local.cfg"}
+
+    def test_gitignore_can_be_disabled(self, project):
+        inventory = FileInventory(project, respect_gitignore=False)
+        assert "build/out.py" in inventory.files()
+
+    def test_records_ignored_dirs(self, project):
+        assert FileInventory(project).ignored_dirs == ["build"]
+
+    def test_bounded_walk_prunes(self, project):
+        inventory = FileInventory(project, max_depth=1, skip_names={"pkg"}, skip_hidden=True)
+        assert sorted(inventory.files()) == ["keep.log", "src/app.py", "src/local.cfg"]
+        assert not any(p.startswith(".") for p in inventory.paths)
+
+        limited = FileInventory(project, max_files=2)
+        assert len(limited) == 2
+        assert limited.truncated
+
+    def test_records_size_and_extension(self, project):
+        inventory = FileInventory(project)
+        entry = next(inventory.entries(predicate=lambda p: p == "src/app.py"))
+        assert entry.size == len("print('hi')\n")
+        assert entry.extension == ".py"
+        assert entry.name == "app.py"
+
+
+class TestQueries:
+    """Tests for inventory filters."""
+
+    def test_filter_by_extension_and_directory(self, project):
+        inventory = FileInventory(project)
+        assert sorted(inventory.files(extensions={".py"})) == ["src/app.py", "src/pkg/util.py"]
+        assert inventory.files(under="src/pkg", extensions={".TS"}) == ["src/pkg/index.ts"]
+
+    def test_exclude_names_and_hidden(self, project):
+        inventory = FileInventory(project)
+        assert "src/pkg/util.py" not in inventory.files(exclude_names={"pkg"})
+        assert ".github/ci.yml" in inventory.files()
+        assert ".github/ci.yml" not in inventory.files(include_hidden=False)
+
+    def test_max_depth_and_limit(self, project):
+        inventory = FileInventory(project)
+        assert all("/" not in f for f in inventory.files(max_depth=0))
+        assert len(inventory.files(limit=2)) == 2
+
+    def test_extension_counts(self, project):
+        counts = FileInventory(project).extension_counts(under="src")
+        assert counts == {".py": 2, ".ts": 1, ".cfg": 1}
+
+
+class TestSharedInventory:
+    """Tests for caching and invalidation."""
+
+    def test_reused_until_stale(self, project):
+        first = get_file_inventory(project)
+        first._racy = False  # Freshly created test dirs are within the racy window
+        assert get_file_inventory(project) is first
+
+        (project / "src" / "new.py").write_text("y = 1\n")
+        second = get_file_inventory(project)
+
+        assert second is not first
+        assert "src/new.py" in second.files()
+
+    def test_invalidate_drops_cached_inventory(self, project):
+        first = get_file_inventory(project)
+        first._racy = False
+
+        invalidate_file_inventory(project / "src" / "app.py")
+        assert get_file_inventory(project) is not first
@@ -0,0 +1,117 @@
+"""Tests for the handoff packet catalog."""
+
+import os
+import time
+
+import pytest
+
+from fastband.core.serialization import save_file
+from fastband.memory.handoff import (
+    HandoffCatalog,
+    HandoffManager,
+    HandoffPriority,
+    HandoffReason,
+)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = HandoffManager(storage_path=str(tmp_path / "handoffs"))
+    yield manager
+    manager.catalog.close()
+
+
+def _store(manager, ticket_id, target_agent=None, created_at=None):
+    packet = manager.create_handoff_packet(
+        agent_name="Agent1",
+        session_id="session1",
+        reason=HandoffReason.BUDGET_WARNING,
+        priority=HandoffPriority.NORMAL,
+        ticket_data={"ticket_id": ticket_id, "status": "in_progress"},
+        target_agent=target_agent,
+    )
+    if created_at:
+        packet.created_at = created_at
+    manager.store_packet(packet)
+    return packet
+
+
+# =============================================================================
+# CATALOG TESTS
+# =============================================================================
+
+
+class TestHandoffCatalog:
+    """Tests for listing handoffs through the catalog."""
+
+    def test_list_filters_and_sorts(self, manager):
+        """Test listing filters by ticket and target agent, newest first."""
+        old = _store(manager, "T1", created_at="2026-01-01T00:00:00")
+        new = _store(manager, "T1", target_agent="Agent2", created_at="2026-01-02T00:00:00")
+        _store(manager, "T2", target_agent="Agent3")
+
+        assert [e.packet_id for e in manager.list_handoffs("T1")] == [new.packet_id, old.packet_id]
+        assert {e.ticket_id for e in manager.list_handoffs(target_agent="Agent2")} == {"T1"}
+        assert len(manager.list_handoffs(limit=1)) == 1
+
+    def test_listing_reads_no_packet_files(self, manager):
+        """Test listing answers from the catalog alone."""
+        packet = _store(manager, "T1")
+        (manager.storage_path / f"{packet.packet_id}.json").write_text("not a packet")
+
+        entries = manager.list_handoffs()
+
+        assert [e.packet_id for e in entries] == [packet.packet_id]
+        assert entries[0].reason == "budget_warning"
+        assert entries[0].priority == HandoffPriority.NORMAL.value
+
+    def test_pending_handoffs_filtered_by_ticket(self, manager):
+        """Test get_pending_handoffs retrieves only the matching packets."""
+        packet = _store(manager, "T1")
+        _store(manager, "T2")
+
+        assert [p.packet_id for p in manager.get_pending_handoffs("T1")] == [packet.packet_id]
+
+    def test_accept_archives_and_cleanup(self, manager):
+        """Test accepting moves the entry to archived and cleanup expires it."""
+        packet = _store(manager, "T1")
+        manager.accept_handoff(packet.packet_id, "Agent2", packet.access_token)
+
+        assert manager.list_handoffs() == []
+        assert [e.packet_id for e in manager.list_handoffs(archived=True)] == [packet.packet_id]
+        assert manager.get_handoff_stats()["completed_handoffs"] == 1
+
+        manager.catalog.archive(packet.packet_id, archived_at=time.time() - 49 * 3600)
+        assert manager._cleanup_old_archives() == 1
+        assert not (manager.storage_path / "archive" / f"{packet.packet_id}.json").exists()
+        assert manager.get_handoff_stats()["completed_handoffs"] == 0
+
+    def test_indexes_existing_packets(self, tmp_path):
+        """Test a new catalog indexes packets stored before it existed."""
+        storage = tmp_path / "handoffs"
+        storage.mkdir()
+        (storage / "archive").mkdir()
+        legacy = {
+            "packet_id": "ho_legacy",
+            "created_at": "2026-01-01T00:00:00",
+            "source_agent": "Agent1",
+            "source_session": "s1",
+            "reason": "scheduled",
+            "priority": 2,
+            "ticket_id": "T9",
+        }
+        save_file(storage / "ho_legacy.json", legacy)
+        save_file(storage / "archive" / "ho_old.json", dict(legacy, packet_id="ho_old"))
+        old = time.time() - 49 * 3600
+        os.utime(storage / "archive" / "ho_old.json", (old, old))
+
+        manager = HandoffManager(storage_path=str(storage))
+
+        assert [e.ticket_id for e in manager.list_handoffs()] == ["T9"]
+        assert manager.get_pending_handoffs("T9")[0].packet_id == "ho_legacy"
+        assert manager.catalog.counts() == {
+            HandoffCatalog.PENDING: 1,
+            HandoffCatalog.ARCHIVED: 1,
+        }
+        assert manager._cleanup_old_archives() == 1
+        manager.catalog.close()
@@ -0,0 +1,200 @@
+"""Tests for the tiered memory LRU and token accounting."""
+
+import pytest
+
+from fastband.memory.budget import TokenBudget
+from fastband.memory.tiers import (
+    LRUTier,
+    MemoryItem,
+    MemoryTier,
+    SpilledTier,
+    TieredMemoryManager,
+    TieredMemoryStore,
+)
+
+
+def _item(item_id, tokens=10, tier=MemoryTier.HOT, content=None):
+    return MemoryItem(item_id, tier, content or item_id, tokens)
+
+
+def _store(allocated=100, spill_dir=None):
+    budget = TokenBudget(agent_name="Agent1", session_id="s1", allocated_tokens=allocated)
+    return TieredMemoryStore(session_id="s1", budget=budget, spill_dir=spill_dir)
+
+
+# =============================================================================
+# LRU TIER TESTS
+# =============================================================================
+
+
+class TestLRUTier:
+    """Tests for the LRU tier mapping."""
+
+    def test_order_and_tokens(self):
+        """Test touch moves an item to the end and totals follow changes."""
+        tier = LRUTier()
+        for name in ("a", "b", "c"):
+            tier[name] = _item(name)
+        tier.touch("a")
+        tier["b"] = _item("b", tokens=25)
+
+        assert list(tier) == ["c", "a", "b"]
+        assert tier.tokens == 45
+        assert tier.popitem()[0] == "c"
+        del tier["a"]
+        assert tier.tokens == 25
+
+
+# =============================================================================
+# STORE TESTS
+# =============================================================================
+
+
+class TestTieredMemoryStore:
+    """Tests for hot-tier LRU eviction and token accounting."""
+
+    def test_retrieve_updates_recency(self):
+        """Test the least recently retrieved hot item is evicted first."""
+        store = _store(allocated=30)
+        for name in ("a", "b", "c"):
+            assert store.store(_item(name))
+        store.retrieve("a")
+
+        assert store.store(_item("d"))
+        assert list(store.hot) == ["c", "a", "d"]
+        assert "b" in store.warm
+        assert store.budget.used_tokens == 30
+
+    def test_restore_does_not_double_count(self):
+        """Test storing an item again replaces its tokens instead of adding them."""
+        store = _store()
+        store.store(_item("a", tokens=10))
+        store.store(_item("a", tokens=15))
+
+        assert store.budget.used_tokens == 15
+        assert store.get_tier_stats()["hot"] == {"count": 1, "tokens": 15}
+
+    def test_demote_and_promote_totals(self):
+        """Test per-tier totals follow items between tiers."""
+        store = _store()
+        store.store(_item("a", tokens=10))
+        store.store(_item("b", tokens=5, tier=MemoryTier.COLD))
+
+        store.demote_from_hot("a")
+        store.promote_to_hot("b")
+        stats = store.get_tier_stats()
+
+        assert stats["hot"]["tokens"] == 5
+        assert stats["warm"]["tokens"] == 10
+        assert stats["cold"]["tokens"] == 0
+        assert store.budget.used_tokens == 5
+
+    def test_hot_context_cached(self):
+        """Test the hot context is rebuilt only after the hot tier changes."""
+        store = _store()
+        store.store(_item("a", content="alpha"))
+        first = store.get_hot_context()
+
+        assert store.get_hot_context() is first
+
+        store.store(_item("b", content="beta"))
+        store.retrieve("b")
+        assert store.get_hot_context() == "beta\n\nalpha"
+
+
+# =============================================================================
+# SPILL TESTS
+# =============================================================================
+
+
+class TestSpilledTier:
+    """Tests for cold and frozen tiers kept on disk."""
+
+    def test_round_trip(self, tmp_path):
+        """Test spilled items decode with their stats and embedding."""
+        tier = SpilledTier(tmp_path / "cold.db")
+        item = _item("a", tokens=7, tier=MemoryTier.COLD, content="x" * 1000)
+        item.embedding = [0.5, 0.25]
+        tier["a"] = item
+
+        loaded = tier["a"]
+        assert loaded.content == item.content
+        assert loaded.embedding == [0.5, 0.25]
+        assert (tier.tokens, tier.nbytes) == (7, 1000)
+        assert 0 < tier.disk_bytes < 1000
+
+        tier.close()
+        assert not (tmp_path / "cold.db").exists()
+
+    def test_store_spills_cooler_tiers(self, tmp_path):
+        """Test a store with a spill directory keeps cold items off the heap."""
+        store = _store(spill_dir=tmp_path)
+        store.store(_item("a", tier=MemoryTier.COLD, content="archived"))
+        store.store(_item("b", tier=MemoryTier.WARM, content="warm"))
+
+        assert isinstance(store.cold, SpilledTier)
+        assert store.retrieve("a").access_count == 1
+        assert store.retrieve("a").access_count == 2
+        assert store.memory_footprint()["spilled_bytes"] == len("archived")
+        assert store.memory_footprint()["resident_bytes"] == len("warm")
+        store.close()
+
+    def test_similar_session_ids_spill_separately(self, tmp_path):
+        """Test session IDs that sanitize alike don't share spill files."""
+        budget = TokenBudget(agent_name="Agent1", session_id="a/b", allocated_tokens=100)
+        first = TieredMemoryStore(session_id="a/b", budget=budget, spill_dir=tmp_path)
+        first.store(_item("a", tier=MemoryTier.COLD, content="first"))
+        second = TieredMemoryStore(session_id="a.b", budget=budget, spill_dir=tmp_path)
+
+        assert first.retrieve("a").content == "first"
+        assert len(second.cold) == 0
+        first.close()
+        second.close()
+
+    @pytest.mark.asyncio
+    async def test_promote_async(self, tmp_path):
+        """Test promotion pages a spilled item back into hot memory."""
+        store = _store(spill_dir=tmp_path)
+        store.store(_item("a", tier=MemoryTier.FROZEN, content="reference"))
+
+        assert await store.promote_to_hot_async("a")
+        assert await store.promote_to_hot_async("missing") is False
+        assert store.hot["a"].content == "reference"
+        assert len(store.frozen) == 0
+        assert store.budget.used_tokens == 10
+        store.close()
+
+    def test_manager_reports_and_cleans_up(self, tmp_path):
+        """Test global stats report spilled bytes and closing deletes spill files."""
+        manager = TieredMemoryManager(spill_dir=tmp_path)
+        store = manager.create_store("session/1", "Agent1")
+        store.store(_item("a", tier=MemoryTier.COLD, content="cold content"))
+
+        memory = manager.get_global_stats()["memory"]
+        assert memory["spilled_bytes"] == len("cold content")
+
+        manager.close_store("session/1")
+        manager.close()
+        assert list(tmp_path.iterdir()) == []
+
+
+# =============================================================================
+# MANAGER TESTS
+# =============================================================================
+
+
+class TestSharedEviction:
+    """Tests for cross-session shared memory limits."""
+
+    def test_evicts_least_recently_used(self):
+        """Test shared cool memory evicts the least recently used items."""
+        manager = TieredMemoryManager()
+        manager.MAX_SHARED_COOL_ITEMS = 2
+        for name in ("a", "b"):
+            manager._shared_cool[name] = _item(name, tier=MemoryTier.COOL)
+        manager.query_shared_memory("a")
+        manager._shared_cool["c"] = _item("c", tier=MemoryTier.COOL)
+
+        assert manager._evict_lru_shared(MemoryTier.COOL) == 1
+        assert list(manager._shared_cool) == ["a", "c"]
+        assert manager._get_shared_tokens(MemoryTier.COOL) == 20
@@ -598,6 +598,19 @@ class TestOpsLogWriteRead:
         )
         assert len(entries) == 1
 
+    def test_write_rate_limited_per_agent(self, ops_log):
+        """Test agents are limited to RATE_LIMIT_ENTRIES writes per window."""
+        ops_log.RATE_LIMIT_ENTRIES = 3
+        ops_log._rate_limiter.limit = 3
+        for i in range(3):
+            ops_log.write_entry("agent-1", EventType.STATUS_UPDATE, f"Update {i}")
+
+        with pytest.raises(ValueError, match="RATE LIMIT EXCEEDED"):
+            ops_log.write_entry("agent-1", EventType.STATUS_UPDATE, "One too many")
+
+        # Other agents are unaffected
+        ops_log.write_entry("agent-2", EventType.STATUS_UPDATE, "Update")
+
 
 # =============================================================================
 # OPS LOG EXPIRATION TESTS
@@ -0,0 +1,192 @@
+"""Tests for linter orchestration."""
+
+import asyncio
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from fastband.tools.quality.models import IssueCategory, IssueSeverity, QualityIssue, SourceLocation
+from fastband.tools.quality.runners import (
+    LinterOrchestrator,
+    LinterResult,
+    LinterRunner,
+    RuffRunner,
+)
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+class FakeRunner(LinterRunner):
+    """Runner that reports one issue per file and records its invocations."""
+
+    file_extensions = [".py"]
+    per_file = True
+
+    def __init__(self, project_root: str, name: str = "fake", delay: float = 0.0):
+        super().__init__(project_root)
+        self.name = name
+        self.delay = delay
+        self.calls: list[list[str]] = []
+        self.active = 0
+        self.max_active = 0
+
+    def is_available(self) -> bool:
+        return True
+
+    def version_command(self) -> list[str]:
+        return ["python", "--version"]
+
+    async def run(self, files: list[str]) -> LinterResult:
+        self.calls.append(list(files))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        issues = [
+            QualityIssue(
+                issue_id=f"{self.name}-{f}",
+                rule_id="X1",
+                severity=IssueSeverity.WARNING,
+                category=IssueCategory.LOGIC,
+                location=SourceLocation(file=str(self.project_root / f), line=1),
+                message="fake issue",
+                source=self.name,
+            )
+            for f in files
+        ]
+        return LinterResult(success=True, issues=issues, raw_output="")
+
+    def parse_output(self, output: str) -> list[QualityIssue]:
+        return []
+
+
+@pytest.fixture
+def project():
+    """Create a project with a handful of Python files."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        (root / "src").mkdir()
+        for i in range(6):
+            (root / "src" / f"m{i}.py").write_text(f"x = {i}\n")
+        yield root
+
+
+def make_orchestrator(root: Path, runners: list[LinterRunner], **kwargs) -> LinterOrchestrator:
+    orchestrator = LinterOrchestrator(str(root), **kwargs)
+    orchestrator.runners = runners
+    return orchestrator
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+class TestConcurrency:
+    """Linters and shards run concurrently."""
+
+    async def test_linters_run_concurrently(self, project):
+        a = FakeRunner(str(project), "a", delay=0.2)
+        b = FakeRunner(str(project), "b", delay=0.2)
+        orchestrator = make_orchestrator(project, [a, b], use_cache=False, max_concurrency=2)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        results = await orchestrator.analyze_files(["src/m0.py"])
+        elapsed = loop.time() - start
+
+        assert set(results) == {"a", "b"}
+        assert elapsed < 0.35
+
+    async def test_large_file_lists_are_sharded(self, project):
+        runner = FakeRunner(str(project), delay=0.05)
+        orchestrator = make_orchestrator(
+            project, [runner], use_cache=False, shard_size=2, max_concurrency=2
+        )
+
+        files = [f"src/m{i}.py" for i in range(6)]
+        results = await orchestrator.analyze_files(files)
+
+        assert len(runner.calls) == 3
+        assert runner.max_active == 2
+        assert len(results["fake"].issues) == 6
+
+
+class TestResultCache:
+    """Unchanged files are served from the per-file cache."""
+
+    async def test_unchanged_files_skip_relinting(self, project):
+        files = [f"src/m{i}.py" for i in range(3)]
+
+        first = FakeRunner(str(project))
+        await make_orchestrator(project, [first]).analyze_files(files)
+        assert first.calls == [files]
+
+        second = FakeRunner(str(project))
+        results = await make_orchestrator(project, [second]).analyze_files(files)
+
+        assert second.calls == []
+        assert results["fake"].cached_files == 3
+        assert len(results["fake"].issues) == 3
+        assert results["fake"].issues[0].severity == IssueSeverity.WARNING
+
+    async def test_modified_file_is_relinted(self, project):
+        files = [f"src/m{i}.py" for i in range(3)]
+        await make_orchestrator(project, [FakeRunner(str(project))]).analyze_files(files)
+
+        (project / "src" / "m1.py").write_text("x = 'changed'\n")
+        runner = FakeRunner(str(project))
+        results = await make_orchestrator(project, [runner]).analyze_files(files)
+
+        assert runner.calls == [["src/m1.py"]]
+        assert results["fake"].cached_files == 2
+
+    async def test_config_change_invalidates_cache(self, project):
+        files = ["src/m0.py"]
+        runner = FakeRunner(str(project))
+        runner.config_files = ["ruff.toml"]
+        await make_orchestrator(project, [runner]).analyze_files(files)
+
+        (project / "ruff.toml").write_text("line-length = 80\n")
+        runner = FakeRunner(str(project))
+        runner.config_files = ["ruff.toml"]
+        await make_orchestrator(project, [runner]).analyze_files(files)
+
+        assert runner.calls == [files]
+
+    async def test_unparseable_output_is_a_failure(self, project, monkeypatch):
+        runner = RuffRunner(str(project))
+
+        async def fake_command(cmd, cwd=None, timeout=120):
+            if "--version" in cmd:
+                return 0, "ruff 0.1.0", ""
+            return 1, "error: not json", ""
+
+        monkeypatch.setattr(runner, "is_available", lambda: True)
+        monkeypatch.setattr(runner, "_run_command", fake_command)
+        orchestrator = make_orchestrator(project, [runner])
+        results = await orchestrator.analyze_files(["src/m0.py"])
+
+        assert results["ruff"].success is False
+        assert "Failed to parse ruff JSON output" in results["ruff"].error_message
+        assert not orchestrator._get_cache().entries.get("ruff")
+
+
+class TestAnalyzeDirectory:
+    """Directory walking prunes excluded directories."""
+
+    async def test_excluded_directories_are_pruned(self, project):
+        for excluded in ("node_modules/pkg", "lib/build", ".venv"):
+            (project / excluded).mkdir(parents=True)
+            (project / excluded / "skip.py").write_text("x = 1\n")
+
+        runner = FakeRunner(str(project))
+        orchestrator = make_orchestrator(project, [runner], use_cache=False)
+        await orchestrator.analyze_directory(".")
+
+        linted = [f for call in runner.calls for f in call]
+        assert len(linted) == 6
+        assert all(f.startswith("src") for f in linted)
@@ -0,0 +1,188 @@
+"""Tests for the shared rate limiters."""
+
+import pytest
+
+from fastband.core.ratelimit import RedisSlidingWindow, SlidingWindow, TokenBucket
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeRedis:
+    """The subset of redis.asyncio used by the limiters."""
+
+    def __init__(self):
+        self.data: dict[str, int] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def ping(self):
+        return True
+
+    async def get(self, key):
+        value = self.data.get(key)
+        return None if value is None else str(value)
+
+    async def mget(self, *keys):
+        return [await self.get(key) for key in keys]
+
+    async def incrby(self, key, amount):
+        self.data[key] = self.data.get(key, 0) + amount
+        return self.data[key]
+
+    async def incr(self, key):
+        return await self.incrby(key, 1)
+
+    async def decrby(self, key, amount):
+        return await self.incrby(key, -amount)
+
+    async def expire(self, key, seconds):
+        self.ttls[key] = seconds
+        return True
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args):
+            self.calls.append((name, args))
+            return self
+
+        return queue
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args) for name, args in self.calls]
+
+
+# =============================================================================
+# IN-PROCESS LIMITERS
+# =============================================================================
+
+
+class TestTokenBucket:
+    """Token bucket refill and burst behavior."""
+
+    def test_burst_then_refill(self):
+        clock = FakeClock()
+        bucket = TokenBucket(limit=60, period=60, burst=3, clock=clock)
+
+        assert [bucket.hit("a").allowed for _ in range(4)] == [True, True, True, False]
+        denied = bucket.hit("a")
+        assert denied.retry_after == pytest.approx(1.0)
+
+        clock.now = 1.0
+        assert bucket.hit("a").allowed
+        assert not bucket.hit("a").allowed
+
+    def test_peek_does_not_consume(self):
+        bucket = TokenBucket(limit=2, period=1, clock=FakeClock())
+        assert bucket.peek("a").remaining == 1
+        assert bucket.peek("a").remaining == 1
+        assert bucket.hit("a").remaining == 1
+
+    def test_keys_are_independent(self):
+        bucket = TokenBucket(limit=1, period=60, clock=FakeClock())
+        assert bucket.hit("a").allowed
+        assert not bucket.hit("a").allowed
+        assert bucket.hit("b").allowed
+
+
+class TestSlidingWindow:
+    """Sliding-window counter accuracy and bounded state."""
+
+    def test_blocks_burst_across_window_boundary(self):
+        clock = FakeClock(59.0)
+        limiter = SlidingWindow(limit=10, period=60, clock=clock)
+        for _ in range(10):
+            assert limiter.hit("a").allowed
+
+        # A fixed window would allow 10 more here
+        clock.now = 61.0
+        result = limiter.hit("a")
+        assert not result.allowed
+        assert 0 < result.retry_after <= 60
+
+        clock.now += result.retry_after + 1e-6
+        assert limiter.hit("a").allowed
+
+    def test_previous_window_fades(self):
+        clock = FakeClock(0.0)
+        limiter = SlidingWindow(limit=10, period=60, clock=clock)
+        for _ in range(10):
+            limiter.hit("a")
+
+        clock.now = 90.0  # Halfway into the next window
+        assert limiter.count("a") == pytest.approx(5.0)
+        assert limiter.peek("a").remaining == 4
+
+        clock.now = 200.0  # Two windows later, nothing left
+        assert limiter.count("a") == 0.0
+
+    def test_per_call_limit(self):
+        limiter = SlidingWindow(limit=100, period=60, clock=FakeClock())
+        assert limiter.hit("a", limit=1).allowed
+        assert not limiter.hit("a", limit=1).allowed
+        assert limiter.hit("a").allowed
+
+    def test_state_is_bounded(self):
+        limiter = SlidingWindow(limit=1, period=60, max_keys=3, clock=FakeClock())
+        for key in "abcd":
+            limiter.hit(key)
+
+        assert len(limiter) == 3
+        assert "a" not in limiter
+        limiter.reset("b")
+        assert "b" not in limiter
+
+
+# =============================================================================
+# REDIS
+# =============================================================================
+
+
+class TestRedisSlidingWindow:
+    """Redis-backed sliding window."""
+
+    async def test_limit_is_enforced_and_rolled_back(self):
+        redis = FakeRedis()
+        limiter = RedisSlidingWindow(redis, limit=3, period=60, clock=FakeClock(10.0))
+
+        results = [await limiter.hit("a") for _ in range(4)]
+
+        assert [r.allowed for r in results] == [True, True, True, False]
+        # The rejected hit is given back
+        assert redis.data["fastband:ratelimit:a:0"] == 3
+        assert redis.ttls["fastband:ratelimit:a:0"] == 120
+        assert not (await limiter.peek("a")).allowed
+
+    async def test_previous_window_counts(self):
+        redis = FakeRedis()
+        clock = FakeClock(59.0)
+        limiter = RedisSlidingWindow(redis, limit=3, period=60, clock=clock)
+        for _ in range(3):
+            await limiter.hit("a")
+
+        clock.now = 61.0
+        assert not (await limiter.hit("a")).allowed
+        clock.now = 119.0
+        assert (await limiter.hit("a")).allowed
@@ -0,0 +1,149 @@
+"""Tests for the pluggable store serializers."""
+
+import json
+
+import pytest
+
+import fastband.core.serialization as serialization
+from fastband.agents.ops_log import OpsLog
+from fastband.core.serialization import (
+    HEADER_MAGIC,
+    SerializationError,
+    available_serializers,
+    decode,
+    encode,
+    get_serializer,
+    load_file,
+    save_file,
+)
+from fastband.memory.manager import MemoryManager
+from fastband.tickets.models import Ticket
+from fastband.tickets.storage import JSONTicketStore
+
+DOCUMENT = {
+    "tickets": {"t1": {"title": "Café ☕", "labels": ["a", "b"], "score": 1.5}},
+    "metadata": {"next_id": 2, "last": None, "flag": True},
+}
+
+
+@pytest.fixture(autouse=True)
+def reset(monkeypatch):
+    """Start each test with no default override and no cached serializers."""
+    monkeypatch.delenv(serialization.SERIALIZER_ENV, raising=False)
+    serialization.reset_serializers()
+    yield
+    serialization.reset_serializers()
+
+
+# =============================================================================
+# SERIALIZER TESTS
+# =============================================================================
+
+
+class TestSerializers:
+    """Tests for selecting and using serializers."""
+
+    @pytest.mark.parametrize("name", available_serializers())
+    def test_round_trip(self, name):
+        """Test every available serializer decodes what it encodes."""
+        assert decode(encode(DOCUMENT, name)) == DOCUMENT
+
+    def test_default_is_indented_json(self):
+        """Test the default output matches the previous json.dump format."""
+        data = encode(DOCUMENT)
+
+        assert get_serializer().name == "json"
+        assert data.decode() == json.dumps(DOCUMENT, indent=2, ensure_ascii=False)
+
+    def test_compact_json(self):
+        """Test json-compact has no indentation."""
+        data = encode(DOCUMENT, "json-compact")
+
+        assert b"\n" not in data
+        assert json.loads(data) == DOCUMENT
+
+    def test_env_default(self, monkeypatch):
+        """Test FASTBAND_SERIALIZER picks the default."""
+        monkeypatch.setenv(serialization.SERIALIZER_ENV, "json-compact")
+
+        assert get_serializer().name == "json-compact"
+
+    def test_auto(self):
+        """Test auto picks orjson when installed, else compact JSON."""
+        expected = "orjson" if serialization.ORJSON_AVAILABLE else "json-compact"
+
+        assert get_serializer("auto").name == expected
+
+    def test_unavailable_falls_back_to_json(self, monkeypatch):
+        """Test a missing optional backend falls back to stdlib JSON."""
+        monkeypatch.setattr(serialization, "MSGPACK_AVAILABLE", False)
+
+        assert get_serializer("msgpack").name == "json"
+        assert get_serializer("nonsense").name == "json"
+
+    def test_malformed_data(self):
+        """Test malformed data raises SerializationError (a ValueError)."""
+        with pytest.raises(SerializationError):
+            decode(b"{not json")
+        with pytest.raises(ValueError):
+            decode(HEADER_MAGIC + b"unknown:1\n...")
+
+
+class TestMsgpack:
+    """Tests for the binary format header."""
+
+    def test_header_and_detection(self):
+        """Test msgpack output carries a header and decodes without a hint."""
+        pytest.importorskip("msgpack")
+        data = encode(DOCUMENT, "msgpack")
+
+        assert data.startswith(HEADER_MAGIC + b"msgpack:1\n")
+        assert decode(data) == DOCUMENT
+
+
+# =============================================================================
+# STORE MIGRATION TESTS
+# =============================================================================
+
+
+class TestMigration:
+    """Tests for switching serializers on existing files."""
+
+    def test_file_round_trip(self, tmp_path):
+        """Test save_file writes atomically and load_file reads any format."""
+        path = tmp_path / "doc.json"
+        for name in available_serializers():
+            save_file(path, DOCUMENT, name)
+            assert load_file(path) == DOCUMENT
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_ticket_store_migrates(self, tmp_path):
+        """Test a store reopened with another serializer reads the old file."""
+        path = tmp_path / "tickets.json"
+        created = JSONTicketStore(path).create(Ticket(title="Migrate me"))
+
+        store = JSONTicketStore(path, serializer="json-compact")
+        assert store.get(created.id).title == "Migrate me"
+
+        store.save()
+        assert b"\n" not in path.read_bytes()
+        assert JSONTicketStore(path).get(created.id).title == "Migrate me"
+
+    def test_ops_log_uses_serializer(self, tmp_path):
+        """Test the ops log persists through its serializer."""
+        path = tmp_path / "ops_log.json"
+        log = OpsLog(log_path=path, archive_dir=tmp_path / "archive", serializer="json-compact")
+        log.write_entry(agent="Agent1", event_type="status_update", message="hello")
+
+        assert b"\n" not in path.read_bytes()
+        reopened = OpsLog(log_path=path, archive_dir=tmp_path / "archive")
+        assert [e.message for e in reopened.read_entries()] == ["hello"]
+
+    def test_memory_manager_uses_serializer(self, tmp_path):
+        """Test memory files are written through the serializer."""
+        manager = MemoryManager(base_path=tmp_path, serializer="json-compact")
+
+        metadata = (tmp_path / "index" / "metadata.json").read_bytes()
+        assert b"\n" not in metadata
+        assert MemoryManager(base_path=tmp_path)._load_json(tmp_path / "index" / "metadata.json")
+        assert manager.serializer.name == "json-compact"
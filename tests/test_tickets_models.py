@@ -1,5 +1,6 @@
 """Tests for ticket data models."""
 
+import json
 from datetime import datetime, timedelta
 
 import pytest
@@ -11,7 +12,9 @@ from fastband.tickets.models import (
     TicketHistory,
     TicketPriority,
     TicketStatus,
+    TicketSummary,
     TicketType,
+    TicketView,
 )
 
 # =============================================================================
@@ -699,6 +702,96 @@ class TestTicketSerialization:
         assert len(restored.comments) == len(original.comments)
 
 
+# =============================================================================
+# TICKET VIEW TESTS
+# =============================================================================
+
+
+@pytest.fixture
+def worked_ticket():
+    """A ticket with history and comments."""
+    ticket = Ticket(
+        title="Lazy",
+        ticket_type=TicketType.BUG,
+        priority=TicketPriority.HIGH,
+        labels=["backend"],
+        metadata={"sprint": 4},
+    )
+    ticket.claim("Agent1")
+    ticket.add_comment("First note", author="Agent1")
+    return ticket
+
+
+class TestTicketView:
+    """Tests for the lazily decoded ticket view."""
+
+    def test_fields_match_ticket(self, worked_ticket):
+        """Test a view reads the same values as the decoded ticket."""
+        view = TicketView(worked_ticket.to_dict())
+
+        assert view.id == worked_ticket.id
+        assert view.title == "Lazy"
+        assert view.ticket_type == TicketType.BUG
+        assert view.priority == TicketPriority.HIGH
+        assert view.status == TicketStatus.IN_PROGRESS
+        assert view.assigned_to == "Agent1"
+        assert view.created_at == worked_ticket.created_at
+        assert view.labels == ["backend"]
+        assert view.metadata == {"sprint": 4}
+        assert view.is_open is True
+
+    def test_from_json(self, worked_ticket):
+        """Test a view over JSON text parses it on first access."""
+        view = TicketView(json.dumps(worked_ticket.to_dict()))
+
+        assert view.title == "Lazy"
+        assert view.to_ticket().to_dict() == worked_ticket.to_dict()
+
+    def test_history_decoded_once(self, worked_ticket):
+        """Test history and comments are decoded on access and kept."""
+        view = TicketView(worked_ticket.to_dict())
+
+        assert view._history is None
+        assert view._comments is None
+        assert view.history is view.history
+        assert [h.action for h in view.history] == [h.action for h in worked_ticket.history]
+        assert view.comments[0].content == "First note"
+
+    def test_unparseable_history_not_touched(self):
+        """Test reading summary fields never decodes history."""
+        view = TicketView({"id": "t1", "title": "T", "history": [{"timestamp": "garbage"}]})
+
+        assert view.summary().title == "T"
+        with pytest.raises(ValueError):
+            _ = view.history
+
+    def test_to_dict_returns_stored_data(self, worked_ticket):
+        """Test to_dict returns the stored dict without re-encoding."""
+        data = worked_ticket.to_dict()
+
+        assert TicketView(data).to_dict() is data
+
+
+class TestTicketSummary:
+    """Tests for the list view projection."""
+
+    def test_from_dict(self, worked_ticket):
+        """Test projecting stored data."""
+        summary = TicketSummary.from_dict(worked_ticket.to_dict())
+
+        assert summary == TicketSummary.from_ticket(worked_ticket)
+        assert summary.status == TicketStatus.IN_PROGRESS
+        assert summary.to_dict()["priority"] == "high"
+
+    def test_legacy_values(self):
+        """Test display-style stored values still parse."""
+        summary = TicketSummary.from_dict({"id": "t1", "status": "In Progress"})
+
+        assert summary.status == TicketStatus.IN_PROGRESS
+        assert summary.priority == TicketPriority.MEDIUM
+        assert summary.labels == []
+
+
 # =============================================================================
 # TICKET TESTS - EDGE CASES
 # =============================================================================
@@ -1,6 +1,8 @@
 """Tests for the code review workflow."""
 
 import tempfile
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -8,18 +10,20 @@ import pytest
 
 from fastband.tickets.models import (
     Ticket,
+    TicketComment,
     TicketPriority,
     TicketStatus,
     TicketType,
 )
 from fastband.tickets.review import (
+    REVIEW_STATS_KEY,
     ReviewManager,
     ReviewResult,
     ReviewStatistics,
     ReviewStatus,
     ReviewType,
 )
-from fastband.tickets.storage import JSONTicketStore
+from fastband.tickets.storage import JSONTicketStore, SQLiteTicketStore
 
 # =============================================================================
 # FIXTURES
@@ -998,6 +1002,162 @@ class TestReviewManagerStatistics:
         assert abs(stats.approval_rate_by_reviewer["Reviewer_A"] - 0.666) < 0.01
 
 
+class TestReviewAggregates:
+    """Tests for the incrementally maintained review statistics."""
+
+    @staticmethod
+    def _submit(manager, store, ticket_id, reviewer, status, created_at=None, **kwargs):
+        result = ReviewResult(status=status, **kwargs)
+        if created_at:
+            result.created_at = created_at
+        manager.submit_review(
+            ticket_id=ticket_id,
+            reviewer_name=reviewer,
+            review_type=ReviewType.CODE,
+            result=result,
+        )
+        ticket = store.get(ticket_id)
+        ticket.status = TicketStatus.UNDER_REVIEW
+        store.update(ticket)
+
+    def test_persisted_in_store_metadata(self, review_manager, ticket_under_review, store):
+        """Test submitted reviews are counted into the store's metadata."""
+        self._submit(review_manager, store, ticket_under_review.id, "A", ReviewStatus.APPROVED)
+
+        data = store.get_metadata(REVIEW_STATS_KEY)
+        assert data is not None
+        assert len(data["buckets"]) == 1
+
+        stats = ReviewManager(JSONTicketStore(store.path)).get_statistics()
+        assert stats.total_reviews == 1
+
+    def test_submit_during_first_rebuild(self, temp_dir, monkeypatch):
+        """Test a review submitted while the aggregates are first built is counted."""
+        store = SQLiteTicketStore(temp_dir / "tickets.db")
+        manager = ReviewManager(store)
+        tickets = [
+            store.create(Ticket(title=f"T{i}", status=TicketStatus.UNDER_REVIEW)) for i in range(2)
+        ]
+
+        count_reviews = manager._count_reviews
+        others = []
+
+        def slow_count():
+            # Another reviewer submits while the first rebuild is being written
+            aggregates = count_reviews()
+            if not others:
+                other = threading.Thread(
+                    target=self._submit,
+                    args=(ReviewManager(store), store, tickets[1].id, "B", ReviewStatus.APPROVED),
+                )
+                others.append(other)
+                other.start()
+                time.sleep(0.1)
+            return aggregates
+
+        monkeypatch.setattr(manager, "_count_reviews", slow_count)
+        self._submit(manager, store, tickets[0].id, "A", ReviewStatus.APPROVED)
+        others[0].join()
+
+        stats = ReviewManager(store).get_statistics()
+        assert stats.total_reviews == 2
+
+    def test_statistics_without_reading_tickets(
+        self, review_manager, ticket_under_review, store, monkeypatch
+    ):
+        """Test statistics are served without listing or loading tickets."""
+        self._submit(review_manager, store, ticket_under_review.id, "A", ReviewStatus.APPROVED)
+        self._submit(
+            review_manager,
+            store,
+            ticket_under_review.id,
+            "B",
+            ReviewStatus.CHANGES_REQUESTED,
+            bug_risks=["race"],
+        )
+
+        def fail(*args, **kwargs):
+            raise AssertionError("tickets were read")
+
+        monkeypatch.setattr(store, "list", fail)
+        monkeypatch.setattr(store, "get", fail)
+        stats = review_manager.get_statistics()
+
+        assert stats.total_reviews == 2
+        assert stats.total_bug_risks == 1
+        assert stats.approval_rate_by_reviewer == {"A": 1.0, "B": 0.0}
+
+    def test_since_and_histogram(self, review_manager, ticket_under_review, store):
+        """Test since filters by bucket and review times fill the histogram."""
+        now = datetime.now()
+        for hours in (50, 5, 2):
+            self._submit(
+                review_manager,
+                store,
+                ticket_under_review.id,
+                "A",
+                ReviewStatus.APPROVED,
+                created_at=now - timedelta(hours=hours),
+            )
+        self._submit(review_manager, store, ticket_under_review.id, "A", ReviewStatus.APPROVED)
+
+        stats = review_manager.get_statistics()
+        assert stats.total_reviews == 4
+        assert stats.review_time_histogram == {
+            "<15m": 1,
+            "15m-1h": 0,
+            "1h-4h": 1,
+            "4h-1d": 1,
+            "1d-3d": 1,
+            ">3d": 0,
+        }
+
+        assert review_manager.get_statistics(since=now - timedelta(hours=3)).total_reviews == 2
+        assert review_manager.get_statistics(since=now - timedelta(hours=6)).total_reviews == 3
+        assert review_manager.get_statistics(since=now - timedelta(minutes=1)).total_reviews == 1
+
+    def test_rebuilt_when_missing(self, review_manager, ticket_under_review, store):
+        """Test aggregates are rebuilt from the tickets when not stored."""
+        self._submit(review_manager, store, ticket_under_review.id, "A", ReviewStatus.APPROVED)
+        store.set_metadata(REVIEW_STATS_KEY, None)
+
+        stats = review_manager.get_statistics()
+
+        assert stats.total_reviews == 1
+        assert store.get_metadata(REVIEW_STATS_KEY) is not None
+
+    def test_rebuild_after_delete(self, review_manager, ticket_under_review, store):
+        """Test rebuild_statistics drops reviews of deleted tickets."""
+        self._submit(review_manager, store, ticket_under_review.id, "A", ReviewStatus.APPROVED)
+        store.delete(ticket_under_review.id)
+
+        assert review_manager.get_statistics().total_reviews == 1
+        review_manager.rebuild_statistics()
+        assert review_manager.get_statistics().total_reviews == 0
+
+    def test_no_ticket_limit(self, review_manager, store):
+        """Test statistics and pending reviews cover more than 1000 tickets."""
+        store.auto_save = False
+        for i in range(1005):
+            ticket = Ticket(title=f"T{i}", status=TicketStatus.UNDER_REVIEW)
+            ticket.comments.append(
+                TicketComment(
+                    ticket_id=ticket.id,
+                    author="A",
+                    content="ok",
+                    comment_type="review",
+                    review_result="changes_requested",
+                    metadata=ReviewResult(
+                        reviewer_name="A", status=ReviewStatus.CHANGES_REQUESTED
+                    ).to_dict(),
+                )
+            )
+            store.create(ticket)
+
+        assert review_manager.get_statistics().rejected_count == 1005
+        assert len(review_manager.get_pending_reviews()) == 1005
+
+
 # =============================================================================
 # REVIEW MANAGER - CONVENIENCE METHODS TESTS
 # =============================================================================
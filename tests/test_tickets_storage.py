@@ -1,6 +1,8 @@
 """Tests for ticket storage backends."""
 
 import tempfile
+import threading
+import time
 from pathlib import Path
 
 import pytest
@@ -222,6 +224,16 @@ class TestTicketCRUD:
         result = store.delete("nonexistent-id")
         assert result is False
 
+    def test_revision_tracks_writes(self, store, sample_ticket):
+        start = store.revision
+        store.create(sample_ticket)
+        after_create = store.revision
+        store.list()
+        store.get(sample_ticket.id)
+
+        assert after_create > start
+        assert store.revision == after_create
+
 
 # =============================================================================
 # LIST AND FILTER TESTS
@@ -300,6 +312,27 @@ class TestTicketListing:
         assert len(urgent) == 1
         assert urgent[0].title == "Urgent"
 
+    def test_list_summaries_match_list(self, store):
+        """Test summaries follow list()'s filters, order and pagination."""
+        for i in range(6):
+            store.create(
+                Ticket(
+                    title=f"Ticket {i}",
+                    priority=TicketPriority.HIGH if i % 2 else TicketPriority.LOW,
+                    labels=["even"] if i % 2 == 0 else [],
+                )
+            )
+
+        for kwargs in ({}, {"limit": 2, "offset": 1}, {"labels": ["even"]}):
+            tickets = store.list(**kwargs)
+            summaries = store.list_summaries(**kwargs)
+            assert [s.id for s in summaries] == [t.id for t in tickets]
+            assert [s.labels for s in summaries] == [t.labels for t in tickets]
+
+        high = store.list_summaries(priority=TicketPriority.HIGH)
+        assert {s.priority for s in high} == {TicketPriority.HIGH}
+        assert len(high) == 3
+
 
 # =============================================================================
 # SEARCH TESTS
@@ -457,6 +490,77 @@ class TestAgentManagement:
         assert len(all_agents) == 3
 
 
+# =============================================================================
+# METADATA TESTS
+# =============================================================================
+
+
+class TestMetadata:
+    """Tests for store metadata values."""
+
+    def test_missing_key(self, store):
+        """Test an unset key returns None."""
+        assert store.get_metadata("nonexistent") is None
+
+    def test_round_trip(self, store):
+        """Test values are stored and replaced."""
+        store.set_metadata("stats", {"buckets": {"0": [1, 2]}, "version": 1})
+        assert store.get_metadata("stats") == {"buckets": {"0": [1, 2]}, "version": 1}
+
+        store.set_metadata("stats", {"version": 2})
+        assert store.get_metadata("stats") == {"version": 2}
+
+    def test_persisted(self, store):
+        """Test values survive reopening the store."""
+        store.set_metadata("stats", {"total": 3})
+        reopened = type(store)(store.path)
+
+        assert reopened.get_metadata("stats") == {"total": 3}
+
+    def test_concurrent_updates(self, store):
+        """Test concurrent read-modify-write updates don't lose increments."""
+
+        def increment(value):
+            return {"total": (value or {"total": 0})["total"] + 1}
+
+        def worker():
+            for _ in range(25):
+                store.update_metadata("stats", increment)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert store.get_metadata("stats") == {"total": 100}
+
+    def test_update_holds_lock_during_reads(self, store, sample_ticket):
+        """Test a writer waits while an update's callback reads the store."""
+        store.create(sample_ticket)
+        reading = threading.Event()
+
+        def rebuild(value):
+            total = len(store.list())
+            reading.set()
+            time.sleep(0.1)
+            return {"total": total}
+
+        def increment(value):
+            return {"total": (value or {"total": 0})["total"] + 1}
+
+        def writer():
+            reading.wait()
+            store.update_metadata("stats", increment)
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        store.update_metadata("stats", rebuild)
+        thread.join()
+
+        assert store.get_metadata("stats") == {"total": 2}
+
+
 # =============================================================================
 # BACKUP AND RESTORE TESTS
 # =============================================================================
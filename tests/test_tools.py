@@ -1,8 +1,12 @@
 """Tests for the tool system."""
 
+import json
+import os
+
 import pytest
 
 from fastband.tools.base import (
+    ProjectType,
     Tool,
     ToolCategory,
     ToolDefinition,
@@ -11,6 +15,7 @@ from fastband.tools.base import (
     ToolResult,
     tool,
 )
+from fastband.tools.metrics import LatencyHistogram, ToolMetrics
 from fastband.tools.registry import ToolRegistry, reset_registry
 
 # =============================================================================
@@ -107,6 +112,20 @@ class TestToolDefinition:
         assert "message" in schema["inputSchema"]["required"]
         assert "count" not in schema["inputSchema"]["required"]
 
+    def test_from_mcp_schema_round_trip(self, sample_tool):
+        """Test a definition rebuilt from its schema keeps parameters and metadata."""
+        definition = sample_tool.definition
+        definition.metadata.cacheable = True
+        definition.metadata.cache_state = ["files"]
+        definition.metadata.project_types = [ProjectType.WEB_APP]
+
+        schema = json.loads(json.dumps(definition.to_mcp_schema(include_metadata=True)))
+        rebuilt = ToolDefinition.from_mcp_schema(schema, definition.metadata.category)
+
+        assert rebuilt.metadata == definition.metadata
+        assert rebuilt.to_mcp_schema() == definition.to_mcp_schema()
+        assert "metadata" not in definition.to_mcp_schema()
+
     def test_to_openai_schema(self, sample_tool):
         """Test OpenAI function schema generation."""
         schema = sample_tool.definition.to_openai_schema()
@@ -336,6 +355,217 @@ class TestToolRegistry:
 # =============================================================================
 
 
+class TestToolSchemaCatalog:
+    """Tests for the cached schema catalog."""
+
+    def test_catalog_has_all_formats(self, registry, sample_tool):
+        """Test that the catalog precomputes every schema format."""
+        registry.register(sample_tool)
+        catalog = registry.get_schema_catalog()
+
+        assert len(catalog) == 1
+        assert catalog.openai == [sample_tool.definition.to_openai_schema()]
+        assert catalog.mcp == [sample_tool.definition.to_mcp_schema()]
+        assert catalog.claude[0]["input_schema"] == catalog.mcp[0]["inputSchema"]
+        assert catalog.openai.claude_schemas is catalog.claude
+
+    def test_catalog_reused_until_registry_changes(self, registry, sample_tool, failing_tool):
+        """Test that the catalog is rebuilt only on register/unregister."""
+        registry.register(sample_tool)
+        first = registry.get_schema_catalog()
+        assert registry.get_schema_catalog() is first
+
+        # Loading does not change the available tool set
+        registry.load("sample_tool")
+        assert registry.get_schema_catalog() is first
+
+        registry.register(failing_tool)
+        second = registry.get_schema_catalog()
+        assert second is not first
+        assert second.version > first.version
+        assert set(second.entries) == {"sample_tool", "failing_tool"}
+
+        registry.unregister("failing_tool")
+        assert set(registry.get_schema_catalog().entries) == {"sample_tool"}
+
+    def test_lazy_tool_with_definition_is_not_imported(self, registry, sample_tool):
+        """Test that lazy tools registered with a definition stay unloaded."""
+        registry.register_lazy(
+            "sample_tool",
+            "fastband.tools.nonexistent_module",
+            "SampleTool",
+            ToolCategory.CORE,
+            definition=sample_tool.definition,
+        )
+
+        catalog = registry.get_schema_catalog()
+
+        assert catalog.entries["sample_tool"].name == "sample_tool"
+        assert registry.is_lazy("sample_tool")
+
+    def test_broken_lazy_tool_is_skipped(self, registry, sample_tool):
+        """Test that a tool that fails to load is left out of the catalog."""
+        registry.register(sample_tool)
+        registry.register_lazy(
+            "broken", "fastband.tools.nonexistent_module", "Missing", ToolCategory.CORE
+        )
+
+        assert list(registry.get_schema_catalog().entries) == ["sample_tool"]
+
+    def test_builtin_tools_described_without_loading(self, registry):
+        """Test that built-in lazy tools are described from their static schemas."""
+        from fastband.tools import _load_builtin_schemas, _register_builtin_tools
+
+        schemas = _load_builtin_schemas()
+        _register_builtin_tools(registry, schemas)
+        catalog = registry.get_schema_catalog()
+
+        assert [entry.mcp for name, entry in catalog.entries.items() if name in schemas] == [
+            {key: value for key, value in schemas[name].items() if key != "metadata"}
+            for name in catalog.entries
+            if name in schemas
+        ]
+        assert not any(registry._lazy_specs[name].is_loaded for name in schemas)
+
+        # Caching hints are carried without loading the tools
+        git_log = registry._lazy_specs["git_log"].definition.metadata
+        git_commit = registry._lazy_specs["git_commit"].definition.metadata
+        assert git_log.cacheable and git_log.cache_state == ["git"]
+        assert git_commit.side_effects
+
+    def test_builtin_schemas_up_to_date(self):
+        """Test the static schemas match the tools (regenerate with the script if not)."""
+        from fastband.tools import BUILTIN_SCHEMAS_FILE, _build_builtin_schemas
+        from fastband.tools import __file__ as tools_init
+
+        path = os.path.join(os.path.dirname(tools_init), BUILTIN_SCHEMAS_FILE)
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f) == _build_builtin_schemas(), "Run scripts/generate_tool_schemas.py"
+
+    def test_claude_provider_reuses_precomputed_schemas(self, registry, sample_tool):
+        """Test that the Claude conversion is taken from the catalog."""
+        pytest.importorskip("anthropic")
+        from fastband.providers.claude import ClaudeProvider
+
+        registry.register(sample_tool)
+        tools = registry.get_schema_catalog().openai
+
+        assert ClaudeProvider._convert_tools(None, tools) is tools.claude_schemas
+        assert ClaudeProvider._convert_tools(None, list(tools)) == tools.claude_schemas
+
+
+class TestToolSearchIndex:
+    """Tests for the keyword index used for per-turn tool selection."""
+
+    def _tool(self, name, description):
+        class _Tool(Tool):
+            @property
+            def definition(self) -> ToolDefinition:
+                return ToolDefinition(
+                    metadata=ToolMetadata(
+                        name=name, description=description, category=ToolCategory.CORE
+                    ),
+                    parameters=[],
+                )
+
+            async def execute(self, **kwargs) -> ToolResult:
+                return ToolResult(success=True)
+
+        return _Tool()
+
+    @pytest.fixture
+    def catalog(self, registry):
+        for name, description in [
+            ("list_tickets", "List tickets filtered by status or assignee"),
+            ("create_ticket", "Create a new ticket"),
+            ("git_status", "Show the working tree status of the repository"),
+            ("git_commit", "Commit staged changes to the repository"),
+            ("screenshot", "Capture a screenshot of a web page"),
+        ]:
+            registry.register(self._tool(name, description))
+        return registry.get_schema_catalog()
+
+    def test_ranks_by_relevance(self, catalog):
+        results = catalog.index.search("list the tickets assigned to me")
+        assert [name for name, _ in results] == ["list_tickets", "create_ticket"]
+
+    def test_name_terms_outweigh_description(self, catalog):
+        results = catalog.index.search("commit my changes")
+        assert results[0][0] == "git_commit"
+
+    def test_no_match_returns_empty(self, catalog):
+        assert catalog.index.search("kubernetes") == []
+
+    def test_prior_breaks_ties_and_fills(self, catalog):
+        results = catalog.index.search("kubernetes", prior={"screenshot": 1.0})
+        assert results[0][0] == "screenshot"
+
+    def test_token_estimates(self, catalog):
+        assert catalog.total_tokens == sum(e.tokens for e in catalog.entries.values())
+        subset = catalog.subset(["git_status"])
+        assert subset == [catalog.entries["git_status"].openai]
+        assert subset.claude_schemas == [catalog.entries["git_status"].claude]
+
+
+class TestToolMetrics:
+    """Tests for latency histograms and execution counters."""
+
+    def test_percentiles_within_bucket_error(self):
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(float(ms))
+
+        assert histogram.count == 1000
+        assert (histogram.min_ms, histogram.max_ms) == (1.0, 1000.0)
+        for q, expected in ((0.5, 500), (0.95, 950), (0.99, 990)):
+            assert abs(histogram.percentile(q) - expected) / expected < 0.2
+
+    def test_rolling_window_drops_old_slices(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("fastband.tools.metrics.time.monotonic", lambda: now[0])
+        metrics = ToolMetrics(window_seconds=60, window_slices=6)
+
+        metrics.record("slow", 500.0)
+        now[0] += 120
+        metrics.record("slow", 5.0)
+        snapshot = metrics.snapshot("slow")
+
+        assert snapshot["total_executions"] == 2
+        assert snapshot["window_executions"] == 1
+        assert snapshot["p99_ms"] == 5.0
+
+    async def test_registry_execute_records_errors(self, registry, sample_tool, failing_tool):
+        registry.register(sample_tool)
+        registry.register(failing_tool)
+        registry.load("sample_tool")
+        registry.load("failing_tool")
+
+        await registry.execute("sample_tool", message="hi")
+        await registry.execute("failing_tool")
+
+        assert registry.get_tool_stats("sample_tool")["errors"] == 0
+        failed = registry.get_tool_stats("failing_tool")
+        assert failed["total_executions"] == 1
+        assert failed["errors"] == 1
+        assert failed["in_flight"] == 0
+        assert registry.get_performance_report().total_executions == 2
+
+    def test_prometheus_export(self):
+        metrics = ToolMetrics()
+        metrics.record("read_file", 20.0)
+        metrics.record("read_file", 40.0, success=False)
+        metrics.begin("git_status")
+
+        text = "\n".join(metrics.render_prometheus())
+
+        assert "# TYPE fastband_tool_duration_seconds summary" in text
+        assert 'fastband_tool_duration_seconds{tool="read_file",quantile="0.95"}' in text
+        assert 'fastband_tool_duration_seconds_count{tool="read_file"} 2' in text
+        assert 'fastband_tool_duration_seconds_sum{tool="read_file"} 0.060000' in text
+        assert 'fastband_tool_errors_total{tool="read_file"} 1' in text
+        assert 'fastband_tool_in_flight{tool="git_status"} 1' in text
+
+
 class TestToolDecorator:
     """Tests for the @tool decorator."""
 
@@ -1039,7 +1039,7 @@ class TestErrorHandling:
     async def test_store_exception_handling(self):
         """Test handling of store exceptions."""
         mock_store = MagicMock(spec=TicketStore)
-        mock_store.list.side_effect = Exception("Database error")
+        mock_store.list_summaries.side_effect = Exception("Database error")
 
         tool = ListTicketsTool(store=mock_store)
         result = await tool.execute()
@@ -0,0 +1,390 @@
+"""Tests for the pooled browser pages behind the web tools."""
+
+import asyncio
+import functools
+import http.server
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+import fastband.tools.web as web_module
+from fastband.tools.web import BrowserManager, QAConsoleSweepTool, get_browser_manager
+from fastband.tools.web.pool import CLEAR_STORAGE_SCRIPT, PagePool
+
+
+class FakeResponse:
+    def __init__(self, status):
+        self.status = status
+
+
+class FakePage:
+    """Minimal stand-in for a Playwright page."""
+
+    def __init__(self, context):
+        self.context = context
+        self.listeners = []
+        self.visited = []
+        self.scripts = []
+        self.healthy = True
+        self.url = "about:blank"
+
+    async def goto(self, url, **kwargs):
+        self.visited.append(url)
+        self.url = url
+        frame = SimpleNamespace(url=url, parent_frame=None)
+        for event, handler in list(self.listeners):
+            if event == "framenavigated":
+                handler(frame)
+        if url != "about:blank":
+            await asyncio.sleep(self.context.browser.delay)
+        return FakeResponse(404 if url.endswith("/missing") else 200)
+
+    async def wait_for_load_state(self, *args, **kwargs):
+        pass
+
+    async def evaluate(self, script):
+        if not self.healthy:
+            raise RuntimeError("Target closed")
+        self.scripts.append(script)
+        return 1
+
+    def on(self, event, handler):
+        self.listeners.append((event, handler))
+
+    def remove_listener(self, event, handler):
+        self.listeners.remove((event, handler))
+
+
+class FakeContext:
+    def __init__(self, browser, options):
+        self.browser = browser
+        self.options = options
+        self.closed = False
+        self.cookies_cleared = 0
+        self.pages = []
+
+    async def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def clear_cookies(self):
+        self.cookies_cleared += 1
+
+    async def storage_state(self):
+        return {"cookies": [{"name": "session", "value": "1"}], "origins": []}
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.contexts = []
+
+    async def new_context(self, **options):
+        context = FakeContext(self, options)
+        self.contexts.append(context)
+        return context
+
+
+def _factory(browser, **options):
+    async def new_context():
+        return await browser.new_context(**options)
+
+    return new_context
+
+
+@pytest.fixture
+def fake_browser(reset_browser_manager):
+    """Route the browser manager to a FakeBrowser."""
+    browser = FakeBrowser()
+
+    async def get_browser(self, headless=True):
+        if self._pool is None:
+            self._pool = PagePool()
+        return browser
+
+    with patch.object(web_module, "PLAYWRIGHT_AVAILABLE", True):
+        with patch.object(BrowserManager, "get_browser", get_browser):
+            yield browser
+
+
+@pytest.fixture
+def reset_browser_manager():
+    """Start and end each test without a shared browser manager."""
+    BrowserManager._instance = None
+    web_module._browser_manager = None
+    yield
+    BrowserManager._instance = None
+    web_module._browser_manager = None
+
+
+# =============================================================================
+# PAGE POOL TESTS
+# =============================================================================
+
+
+class TestPagePool:
+    """Tests for leasing, reuse and recycling of pooled pages."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_page_for_same_key(self):
+        """Test a released page is reused for the same key only."""
+        browser = FakeBrowser()
+        pool = PagePool()
+
+        async with pool.lease(("a",), _factory(browser)) as first:
+            first.on("console", print)
+        async with pool.lease(("a",), _factory(browser)) as second:
+            pass
+        async with pool.lease(("b",), _factory(browser)):
+            pass
+
+        assert second.page is first.page
+        assert [event for event, _ in first.page.listeners] == ["framenavigated"]
+        assert first.page.visited == ["about:blank", "about:blank"]
+        assert len(browser.contexts) == 2
+        assert pool.get_stats()["reused"] == 1
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency(self):
+        """Test no more than max_size pages are leased at once."""
+        pool = PagePool(max_size=2)
+        browser = FakeBrowser()
+        leased = peak = 0
+
+        async def use():
+            nonlocal leased, peak
+            async with pool.lease(("a",), _factory(browser)):
+                leased += 1
+                peak = max(peak, leased)
+                await asyncio.sleep(0.02)
+                leased -= 1
+
+        await asyncio.gather(*(use() for _ in range(6)))
+
+        assert peak == 2
+        assert len(browser.contexts) == 2
+        assert pool.get_stats()["open"] == 2
+
+    @pytest.mark.asyncio
+    async def test_full_pool_evicts_idle_other_key(self):
+        """Test a new key closes the least recently used idle page when full."""
+        pool = PagePool(max_size=1)
+        browser = FakeBrowser()
+
+        async with pool.lease(("a",), _factory(browser)):
+            pass
+        async with pool.lease(("b",), _factory(browser)):
+            pass
+
+        assert browser.contexts[0].closed
+        assert not browser.contexts[1].closed
+
+    @pytest.mark.asyncio
+    async def test_recycles_after_max_uses(self):
+        """Test a page is closed after max_uses leases."""
+        pool = PagePool(max_uses=2)
+        browser = FakeBrowser()
+
+        for _ in range(3):
+            async with pool.lease(("a",), _factory(browser)):
+                pass
+
+        assert [c.closed for c in browser.contexts] == [True, False]
+
+    @pytest.mark.asyncio
+    async def test_discards_unhealthy_and_failed(self):
+        """Test failed health checks and exceptions close the page."""
+        pool = PagePool()
+        browser = FakeBrowser()
+
+        async with pool.lease(("a",), _factory(browser)) as lease:
+            lease.page.healthy = False
+        async with pool.lease(("a",), _factory(browser)):
+            pass
+        with pytest.raises(ValueError):
+            async with pool.lease(("a",), _factory(browser)):
+                raise ValueError("boom")
+
+        assert len(browser.contexts) == 2
+        assert all(c.closed for c in browser.contexts)
+        assert pool.get_stats()["open"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cookies_cleared_without_auth(self):
+        """Test anonymous contexts drop cookies on release and auth contexts keep them."""
+        pool = PagePool()
+        browser = FakeBrowser()
+
+        async with pool.lease(("anon",), _factory(browser)) as anonymous:
+            pass
+        async with pool.lease(("auth",), _factory(browser), keep_cookies=True) as authed:
+            pass
+
+        assert anonymous.context.cookies_cleared == 1
+        assert authed.context.cookies_cleared == 0
+
+    @pytest.mark.asyncio
+    async def test_anonymous_storage_cleared_or_discarded(self):
+        """Test anonymous pages clear their origin's storage, or close after several origins."""
+        pool = PagePool()
+        browser = FakeBrowser()
+
+        async with pool.lease(("anon",), _factory(browser)) as lease:
+            await lease.page.goto("http://one.test/a")
+        assert lease.page.scripts[-1] == CLEAR_STORAGE_SCRIPT
+        assert not lease.context.closed
+
+        async with pool.lease(("anon",), _factory(browser)) as reused:
+            await reused.page.goto("http://one.test/b")
+            await reused.page.goto("http://two.test/")
+        assert reused.page is lease.page
+        assert reused.context.closed
+
+
+# =============================================================================
+# QA SWEEP TESTS
+# =============================================================================
+
+
+class TestConcurrentSweep:
+    """Tests for the concurrent QA console sweep."""
+
+    @pytest.mark.asyncio
+    async def test_checks_pages_in_parallel(self, fake_browser):
+        """Test pages are checked concurrently and reported in order."""
+        fake_browser.delay = 0.2
+        tool = QAConsoleSweepTool()
+
+        start = time.monotonic()
+        result = await tool.execute(
+            base_url="http://app.test",
+            pages=["/", "/a", "/b", "/missing"],
+            wait_time=0,
+            concurrency=4,
+        )
+        elapsed = time.monotonic() - start
+
+        assert result.success is True
+        assert [r["path"] for r in result.data["results"]] == ["/", "/a", "/b", "/missing"]
+        assert result.data["results"][3]["status"] == "FAIL"
+        assert elapsed < 0.2 * 3
+        assert get_browser_manager().get_pool_stats()["open"] == 4
+
+    @pytest.mark.asyncio
+    async def test_login_shared_through_storage_state(self, fake_browser):
+        """Test pages after login open contexts with the session's storage state."""
+        tool = QAConsoleSweepTool()
+
+        result = await tool.execute(
+            base_url="http://app.test",
+            pages=["/a", "/b"],
+            login={"url": "/login", "email": "qa@example.com"},
+            wait_time=0,
+            concurrency=2,
+        )
+
+        assert result.success is True
+        login_context, *page_contexts = fake_browser.contexts
+        assert "storage_state" not in login_context.options
+        assert login_context.cookies_cleared == 1
+        assert all("storage_state" in c.options for c in page_contexts)
+        assert all(c.cookies_cleared == 0 for c in page_contexts)
+
+    @pytest.mark.asyncio
+    async def test_new_storage_state_gets_fresh_context(self, fake_browser):
+        """Test a lease with a different storage state never reuses an old session."""
+        manager = get_browser_manager()
+
+        async with manager.page(auth="app", storage_state={"cookies": [1]}) as first:
+            pass
+        async with manager.page(auth="app", storage_state={"cookies": [1]}) as same:
+            pass
+        async with manager.page(auth="app", storage_state={"cookies": [2]}) as fresh:
+            pass
+
+        assert same.context is first.context
+        assert fresh.context is not first.context
+        assert fresh.context.options["storage_state"] == {"cookies": [2]}
+
+
+# =============================================================================
+# PLAYWRIGHT TESTS (local static server)
+# =============================================================================
+
+PAGES = {
+    "index.html": "<html><body><h1>Home</h1></body></html>",
+    "broken.html": "<html><body><script>console.error('boom')</script></body></html>",
+}
+
+
+class QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def static_server(tmp_path):
+    """Serve a few static pages from a local HTTP server."""
+    for name, content in PAGES.items():
+        (tmp_path / name).write_text(content)
+    handler = functools.partial(QuietHandler, directory=str(tmp_path))
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+async def real_browser(reset_browser_manager):
+    """A real browser manager, skipping when Playwright or Chromium is missing."""
+    pytest.importorskip("playwright")
+    manager = get_browser_manager()
+    try:
+        await manager.get_browser(headless=True)
+    except Exception as e:
+        pytest.skip(f"Chromium not available: {e}")
+    yield manager
+    await manager.close()
+
+
+class TestPlaywrightPool:
+    """Pool and sweep against a real browser and a local static server."""
+
+    @pytest.mark.asyncio
+    async def test_sweep_against_static_server(self, real_browser, static_server):
+        """Test a concurrent sweep grades static pages correctly."""
+        tool = QAConsoleSweepTool()
+
+        result = await tool.execute(
+            base_url=static_server,
+            pages=["/index.html", "/broken.html", "/missing.html"],
+            wait_time=0,
+            concurrency=3,
+        )
+
+        statuses = [r["status"] for r in result.data["results"]]
+        assert statuses == ["PASS", "FAIL", "FAIL"]
+        assert result.data["results"][1]["console_errors"] == ["boom"]
+
+    @pytest.mark.asyncio
+    async def test_dom_queries_reuse_context(self, real_browser, static_server):
+        """Test consecutive tool calls reuse a warm page."""
+        from fastband.tools.web import DomQueryTool
+
+        tool = DomQueryTool()
+        for _ in range(3):
+            result = await tool.execute(url=f"{static_server}/index.html", selector="h1")
+            assert result.data["elements"][0]["text"] == "Home"
+
+        stats = real_browser.get_pool_stats()
+        assert stats["created"] == 1
+        assert stats["reused"] == 2
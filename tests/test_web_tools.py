@@ -28,6 +28,7 @@ def mock_playwright():
             mock_page.evaluate = AsyncMock()
             mock_page.close = AsyncMock()
             mock_page.on = MagicMock()
+            mock_page.remove_listener = MagicMock()
 
             mock_context = AsyncMock()
             mock_context.new_page = AsyncMock(return_value=mock_page)
@@ -265,7 +266,8 @@ class TestScreenshotTool:
         # Should have added https://
         assert result.success is True
         mock_playwright["page"].goto.assert_called()
-        call_args = mock_playwright["page"].goto.call_args
+        # First navigation is the tool's; the pool then resets the page to about:blank
+        call_args = mock_playwright["page"].goto.call_args_list[0]
         assert call_args[0][0] == "https://example.com"
 
 
@@ -1060,7 +1062,7 @@ class TestVisionAnalysisTool:
             # Should have added https:// and succeeded
             assert result.success is True
             mock_playwright["page"].goto.assert_called()
-            call_args = mock_playwright["page"].goto.call_args
+            call_args = mock_playwright["page"].goto.call_args_list[0]
             assert call_args[0][0] == "https://example.com"
 
     @pytest.mark.asyncio